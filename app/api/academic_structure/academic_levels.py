@@ -1,7 +1,8 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.academic_structure.factories.classes import ClassFactory
 from app.core.academic_structure.schemas.classes import (
     ClassResponse,
@@ -194,7 +195,7 @@ def archive_level(
     return factory.archive_academic_level(level_id, reason.reason)
 
 
-@router.post("levels/{level_id}", response_class=FileResponse, status_code=204)
+@router.post("levels/{level_id}", response_class=StreamingResponse)
 def export_level_audit(
     level_id: UUID,
     export_format: ExportFormat,
@@ -202,13 +203,7 @@ def export_level_audit(
         get_authenticated_service(AcademicStructureService)
     ),
 ):
-    file_path = service.export_academic_level(level_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_academic_level(level_id, export_format))
 
 
 @router.delete("levels/{level_id}", status_code=204)
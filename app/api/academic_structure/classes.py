@@ -1,7 +1,8 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.identity.factories.student import StudentFactory
 from app.core.identity.schemas.student import StudentFilterParams, StudentResponse
 from app.core.shared.schemas.enums import ExportFormat
@@ -202,7 +203,7 @@ def archive_class(
     return factory.archive_class(class_id, reason.reason)
 
 
-@router.post("/classes/{class_id}", response_class=FileResponse, status_code=204)
+@router.post("/classes/{class_id}", response_class=StreamingResponse)
 def export_class(
     class_id: UUID,
     export_format: ExportFormat,
@@ -210,13 +211,7 @@ def export_class(
         get_authenticated_service(AcademicStructureService)
     ),
 ):
-    file_path = service.export_class_audit(class_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_class_audit(class_id, export_format))
 
 
 @router.delete("/classes/{class_id}", status_code=204)
@@ -1,7 +1,8 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.identity.schemas.student import StudentFilterParams, StudentResponse
 from app.core.shared.schemas.enums import ExportFormat
 from app.core.shared.schemas.shared_models import ArchiveRequest
@@ -234,9 +235,7 @@ def archive_department(
     return factory.archive_student_department(department_id, reason.reason)
 
 
-@router.post(
-    "/departments/{department_id}/audit", response_class=FileResponse, status_code=204
-)
+@router.post("/departments/{department_id}/audit", response_class=StreamingResponse)
 def export_department_audit(
     department_id: UUID,
     export_format: ExportFormat,
@@ -244,13 +243,7 @@ def export_department_audit(
         get_authenticated_service(AcademicStructureService)
     ),
 ):
-    file_path = service.export_department(department_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_department(department_id, export_format))
 
 
 @router.delete("/departments/{department_id}", status_code=204)
@@ -0,0 +1,69 @@
+from uuid import UUID
+from fastapi import Depends, APIRouter
+
+from app.core.assessment.schemas.analytics import GradeStatisticsResponse
+from app.core.assessment.services.analytics_service import AssessmentAnalyticsService
+from app.core.shared.schemas.enums import Semester
+from app.core.auth.services.token_service import TokenService
+from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
+from app.core.auth.services.dependencies.current_user_deps import (
+    get_authenticated_service,
+)
+
+token_service = TokenService()
+access = AccessTokenBearer()
+router = APIRouter()
+
+
+@router.get("/subjects/{level_subject_id}", response_model=GradeStatisticsResponse)
+def get_subject_statistics(
+    level_subject_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    include_rankings: bool = True,
+    service: AssessmentAnalyticsService = Depends(
+        get_authenticated_service(AssessmentAnalyticsService)
+    ),
+):
+    return service.generate_statistics(
+        academic_session,
+        semester,
+        academic_level_subject_id=level_subject_id,
+        include_rankings=include_rankings,
+    )
+
+
+@router.get("/classes/{class_id}", response_model=GradeStatisticsResponse)
+def get_class_statistics(
+    class_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    include_rankings: bool = True,
+    service: AssessmentAnalyticsService = Depends(
+        get_authenticated_service(AssessmentAnalyticsService)
+    ),
+):
+    return service.generate_statistics(
+        academic_session,
+        semester,
+        class_id=class_id,
+        include_rankings=include_rankings,
+    )
+
+
+@router.get("/levels/{level_id}", response_model=GradeStatisticsResponse)
+def get_level_statistics(
+    level_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    include_rankings: bool = True,
+    service: AssessmentAnalyticsService = Depends(
+        get_authenticated_service(AssessmentAnalyticsService)
+    ),
+):
+    return service.generate_statistics(
+        academic_session,
+        semester,
+        level_id=level_id,
+        include_rankings=include_rankings,
+    )
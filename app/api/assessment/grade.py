@@ -1,8 +1,9 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import UploadFile, File
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.assessment.services.assessment_file_service import AssessmentFileService
 from app.core.assessment.services.assessment_service import AssessmentService
 from app.core.identity.factories.student import StudentFactory
@@ -127,6 +128,16 @@ def get_grades(
     return factory.get_all_grades(filters)
 
 
+@router.get("/grades/export", response_class=StreamingResponse)
+def export_grades(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: GradeFilterParams = Depends(),
+    factory: GradeFactory = Depends(get_authenticated_factory(GradeFactory)),
+):
+    return export_response(factory.export_grades(filters, export_format, compress))
+
+
 @router.get("/grades/student-subject/{grade_id}/audit", response_model=GradeAudit)
 def get_grade_audit(
     grade_id: UUID,
@@ -163,20 +174,14 @@ def archive_grade(
 
 
 @router.get(
-    "/grades/{grade_id}/audit/export", response_class=FileResponse, status_code=200
+    "/grades/{grade_id}/audit/export", response_class=StreamingResponse, status_code=200
 )
 def export_grade_audit(
     grade_id: UUID,
     export_format: ExportFormat,
     service: AssessmentService = Depends(get_authenticated_service(AssessmentService)),
 ):
-    file_path = service.export_grade_audit(grade_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_grade_audit(grade_id, export_format))
 
 
 @router.delete("/grades/{grade_id}", status_code=204)
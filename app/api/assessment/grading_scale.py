@@ -0,0 +1,36 @@
+from fastapi import Depends, APIRouter
+
+from app.core.assessment.schemas.grading_scale import (
+    GradingScaleUpdate,
+    GradingScaleResponse,
+)
+from app.core.assessment.services.grading_scale_service import GradingScaleService
+from app.core.auth.services.token_service import TokenService
+from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
+from app.core.auth.services.dependencies.current_user_deps import (
+    get_authenticated_service,
+)
+
+token_service = TokenService()
+access = AccessTokenBearer()
+router = APIRouter()
+
+
+@router.get("/", response_model=GradingScaleResponse)
+def get_grading_scale(
+    service: GradingScaleService = Depends(
+        get_authenticated_service(GradingScaleService)
+    ),
+):
+    return service.get_scale()
+
+
+@router.put("/", response_model=GradingScaleResponse)
+def replace_grading_scale(
+    payload: GradingScaleUpdate,
+    service: GradingScaleService = Depends(
+        get_authenticated_service(GradingScaleService)
+    ),
+):
+    bands = [band.model_dump() for band in payload.bands]
+    return service.replace_scale(bands)
@@ -0,0 +1,77 @@
+import io
+from uuid import UUID
+from fastapi import Depends, APIRouter
+from starlette.responses import StreamingResponse
+
+from app.core.assessment.services.assessment_service import AssessmentService
+from app.core.shared.schemas.enums import Semester
+from app.core.shared.services.pdf_service.reportlab_base import ReportLabService
+from app.core.auth.services.token_service import TokenService
+from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
+from app.core.auth.services.dependencies.current_user_deps import (
+    get_authenticated_service,
+)
+
+token_service = TokenService()
+access = AccessTokenBearer()
+router = APIRouter()
+
+
+@router.get("/students/{student_id}/download")
+def download_student_results(
+    student_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    service: AssessmentService = Depends(get_authenticated_service(AssessmentService)),
+):
+    pdf_bytes, filename = service.generate_assessment_pdf(
+        student_id, academic_session, semester
+    )
+
+    return StreamingResponse(
+        io.BytesIO(pdf_bytes),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/classes/{class_id}/download")
+def download_class_results(
+    class_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    service: AssessmentService = Depends(get_authenticated_service(AssessmentService)),
+):
+    archive = service.stream_cohort_results_zip(
+        academic_session, semester, class_id=class_id
+    )
+    filename = ReportLabService.slugify_filename(
+        f"class {class_id} {academic_session} {semester.value} results.zip"
+    )
+
+    return StreamingResponse(
+        archive,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/levels/{level_id}/download")
+def download_level_results(
+    level_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    service: AssessmentService = Depends(get_authenticated_service(AssessmentService)),
+):
+    archive = service.stream_cohort_results_zip(
+        academic_session, semester, level_id=level_id
+    )
+    filename = ReportLabService.slugify_filename(
+        f"level {level_id} {academic_session} {semester.value} results.zip"
+    )
+
+    return StreamingResponse(
+        archive,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
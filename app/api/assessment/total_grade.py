@@ -1,8 +1,9 @@
 from fastapi import Depends, APIRouter
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.assessment.services.assessment_service import AssessmentService
 from app.core.shared.schemas.enums import ExportFormat
 
@@ -90,6 +91,18 @@ def get_total_grades(
     return factory.get_all_total_grades(filters)
 
 
+@router.get("/total-grades/export", response_class=StreamingResponse)
+def export_total_grades(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: TotalGradeFilterParams = Depends(),
+    factory: TotalGradeFactory = Depends(get_authenticated_factory(TotalGradeFactory)),
+):
+    return export_response(
+        factory.export_total_grades(filters, export_format, compress)
+    )
+
+
 @router.get("/total-grades//{grade_id}/audit", response_model=TotalGradeAudit)
 def get_total_grade_audit(
     grade_id: UUID,
@@ -132,7 +145,7 @@ def delete_total_grade(
 
 @router.get(
     "/total-grades/{total_grade_id}/audit/export",
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     status_code=200,
 )
 def export_total_grade_audit(
@@ -140,10 +153,6 @@ def export_total_grade_audit(
     export_format: ExportFormat,
     service: AssessmentService = Depends(get_authenticated_service(AssessmentService)),
 ):
-    file_path = service.export_total_grade_audit(total_grade_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
+    return export_response(
+        service.export_total_grade_audit(total_grade_id, export_format)
     )
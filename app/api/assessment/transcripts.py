@@ -0,0 +1,32 @@
+from uuid import UUID
+from fastapi import Depends, APIRouter
+
+from app.core.assessment.schemas.transcript import (
+    TranscriptResponse,
+    TranscriptRebuildResponse,
+)
+from app.core.assessment.services.transcript_service import TranscriptService
+from app.core.auth.services.token_service import TokenService
+from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
+from app.core.auth.services.dependencies.current_user_deps import (
+    get_authenticated_service,
+)
+
+token_service = TokenService()
+access = AccessTokenBearer()
+router = APIRouter()
+
+
+@router.get("/students/{student_id}", response_model=TranscriptResponse)
+def get_student_transcript(
+    student_id: UUID,
+    service: TranscriptService = Depends(get_authenticated_service(TranscriptService)),
+):
+    return service.get_transcript(student_id)
+
+
+@router.post("/rebuild", response_model=TranscriptRebuildResponse)
+def rebuild_transcripts(
+    service: TranscriptService = Depends(get_authenticated_service(TranscriptService)),
+):
+    return {"rows": service.rebuild_transcripts()}
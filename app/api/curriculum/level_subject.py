@@ -1,7 +1,8 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.curriculum.factories.academic_level_subject import (
     AcademicLevelSubjectFactory,
 )
@@ -161,22 +162,14 @@ def archive_level_subject(
     return factory.archive_academic_level_subject(level_subject_id, reason.reason)
 
 
-@router.post(
-    "/level-subjects/{level_subject_id}", response_class=FileResponse, status_code=204
-)
+@router.post("/level-subjects/{level_subject_id}", response_class=StreamingResponse)
 def export_level_subject_audit(
     level_subject_id: UUID,
     export_format: ExportFormat,
     service: CurriculumService = Depends(get_authenticated_service(CurriculumService)),
 ):
-    file_path = service.export_level_subject_audit(
-        level_subject_id, export_format.value
-    )
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
+    return export_response(
+        service.export_level_subject_audit(level_subject_id, export_format)
     )
 
 
@@ -10,6 +10,7 @@ from app.core.curriculum.schemas.curriculum import CourseListRequest, CourseList
 from app.core.curriculum.services.curriculum_service import CurriculumService
 
 from app.core.shared.schemas.enums import ExportFormat
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.shared.schemas.shared_models import ArchiveRequest
 from fastapi import Depends, APIRouter
 
@@ -144,6 +145,20 @@ def get_student_subjects(
     return factory.get_all_student_subjects(filters)
 
 
+@router.get("/enrollments/export", response_class=StreamingResponse)
+def export_student_subjects(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: StudentSubjectFilterParams = Depends(),
+    factory: StudentSubjectFactory = Depends(
+        get_authenticated_factory(StudentSubjectFactory)
+    ),
+):
+    return export_response(
+        factory.export_student_subjects(filters, export_format, compress)
+    )
+
+
 @router.get("/{student_subject_id}/audit", response_model=StudentSubjectAudit)
 def get_student_subject_audit(
     student_subject_id: UUID,
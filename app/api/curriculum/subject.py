@@ -1,7 +1,8 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.curriculum.factories.subject import SubjectFactory
 from app.core.curriculum.services.curriculum_service import CurriculumService
 from app.core.shared.schemas.enums import ExportFormat
@@ -110,21 +111,13 @@ def get_subject(
     return factory.get_subject(subject_id)
 
 
-@router.post(
-    "/subjects/{subject_id}/audit", response_class=FileResponse, status_code=204
-)
+@router.post("/subjects/{subject_id}/audit", response_class=StreamingResponse)
 def export_subject_audit(
     subject_id: UUID,
     export_format: ExportFormat,
     service: CurriculumService = Depends(get_authenticated_service(CurriculumService)),
 ):
-    file_path = service.export_subject_audit(subject_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_subject_audit(subject_id, export_format))
 
 
 @router.put("/subjects/{subject_id}", response_model=SubjectResponse)
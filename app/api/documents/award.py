@@ -1,14 +1,20 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import UploadFile, File
 
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.documents.factories.award_factory import AwardFactory
 from app.core.documents.services.document_service import DocumentService
 from app.core.identity.factories.student import StudentFactory
 from app.core.shared.schemas.enums import ExportFormat
-from app.core.shared.schemas.shared_models import ArchiveRequest, UploadResponse
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    PresignedUrlBatchRequest,
+    PresignedUrlResponse,
+    UploadResponse,
+)
 from fastapi import Depends, APIRouter
 from app.core.documents.schemas.student_award import (
     AwardFilterParams,
@@ -24,6 +30,7 @@ from app.core.auth.services.dependencies.current_user_deps import (
     get_authenticated_service,
 )
 from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.core.documents.models.documents import StudentAward
 
 
 token_service = TokenService()
@@ -95,6 +102,14 @@ def upload_award_file(
     return UploadResponse(**result)
 
 
+@router.post("/awards/files/urls", response_model=List[PresignedUrlResponse])
+def get_award_files(
+    data: PresignedUrlBatchRequest,
+    service: S3Upload = Depends(get_authenticated_service(S3Upload)),
+):
+    return service.presigned_urls_for(StudentAward, "award_s3_key", data.ids)
+
+
 @router.get("/awards/{award_id}/file")
 def get_award_file(
     award_id: UUID,
@@ -168,19 +183,13 @@ def archive_award(
     return factory.archive_award(award_id, reason.reason)
 
 
-@router.post("/awards/{award_id}/audit", response_class=FileResponse, status_code=204)
+@router.post("/awards/{award_id}/audit", response_class=StreamingResponse)
 def export_award_audit(
     award_id: UUID,
     export_format: ExportFormat,
     service: DocumentService = Depends(get_authenticated_service(DocumentService)),
 ):
-    file_path = service.export_award_audit(award_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_award_audit(award_id, export_format))
 
 
 @router.delete("/awards/{award_id}", status_code=204)
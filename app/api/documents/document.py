@@ -1,11 +1,17 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import UploadFile, File
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.identity.factories.student import StudentFactory
 from app.core.shared.schemas.enums import ExportFormat
-from app.core.shared.schemas.shared_models import ArchiveRequest, UploadResponse
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    PresignedUrlBatchRequest,
+    PresignedUrlResponse,
+    UploadResponse,
+)
 from fastapi import Depends, APIRouter
 from app.core.documents.factories.document_factory import DocumentFactory
 from app.core.documents.services.document_service import DocumentService
@@ -24,6 +30,7 @@ from app.core.auth.services.dependencies.current_user_deps import (
 )
 
 from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.core.documents.models.documents import StudentDocument
 
 
 token_service = TokenService()
@@ -95,6 +102,14 @@ def upload_document_file(
     return UploadResponse(**result)
 
 
+@router.post("/documents/files/urls", response_model=List[PresignedUrlResponse])
+def get_document_files(
+    data: PresignedUrlBatchRequest,
+    service: S3Upload = Depends(get_authenticated_service(S3Upload)),
+):
+    return service.presigned_urls_for(StudentDocument, "document_s3_key", data.ids)
+
+
 @router.get("/documents/{document_id}/file")
 def get_document_file(
     document_id: UUID,
@@ -170,21 +185,13 @@ def archive_document(
     return factory.archive_document(document_id, reason.reason)
 
 
-@router.post(
-    "/documents/{document_id}/audit", response_class=FileResponse, status_code=204
-)
+@router.post("/documents/{document_id}/audit", response_class=StreamingResponse)
 def export_document_audit(
     document_id: UUID,
     export_format: ExportFormat,
     service: DocumentService = Depends(get_authenticated_service(DocumentService)),
 ):
-    file_path = service.export_document_audit(document_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_document_audit(document_id, export_format))
 
 
 @router.delete("/documents/{document_id}", status_code=204)
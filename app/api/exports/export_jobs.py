@@ -0,0 +1,159 @@
+from uuid import UUID
+from fastapi import Depends, APIRouter
+
+from app.core.assessment.schemas.grade import GradeFilterParams
+from app.core.assessment.schemas.total_grade import TotalGradeFilterParams
+from app.core.curriculum.schemas.student_subject import StudentSubjectFilterParams
+from app.core.identity.schemas.guardian import GuardianFilterParams
+from app.core.identity.schemas.staff import StaffFilterParams
+from app.core.identity.schemas.student import StudentFilterParams
+from app.core.shared.schemas.enums import ExportFormat, Semester
+from app.core.shared.schemas.export_jobs import ExportJobDownload, ExportJobResponse
+from app.core.shared.services.export_service.job_service import ExportJobService
+from app.core.shared.services.export_service.jobs import set_export_params
+from app.core.auth.services.token_service import TokenService
+from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
+from app.core.auth.services.dependencies.current_user_deps import (
+    get_authenticated_service,
+)
+
+token_service = TokenService()
+access = AccessTokenBearer()
+router = APIRouter()
+
+
+@router.post("/students", response_model=ExportJobResponse, status_code=202)
+def queue_students_export(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: StudentFilterParams = Depends(),
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.enqueue(
+        "students", set_export_params(filters, export_format, compress)
+    )
+
+
+@router.post("/guardians", response_model=ExportJobResponse, status_code=202)
+def queue_guardians_export(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: GuardianFilterParams = Depends(),
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.enqueue(
+        "guardians", set_export_params(filters, export_format, compress)
+    )
+
+
+@router.post("/staff", response_model=ExportJobResponse, status_code=202)
+def queue_staff_export(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: StaffFilterParams = Depends(),
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.enqueue("staff", set_export_params(filters, export_format, compress))
+
+
+@router.post("/grades", response_model=ExportJobResponse, status_code=202)
+def queue_grades_export(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: GradeFilterParams = Depends(),
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.enqueue(
+        "grades", set_export_params(filters, export_format, compress)
+    )
+
+
+@router.post("/total-grades", response_model=ExportJobResponse, status_code=202)
+def queue_total_grades_export(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: TotalGradeFilterParams = Depends(),
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.enqueue(
+        "total_grades", set_export_params(filters, export_format, compress)
+    )
+
+
+@router.post("/student-subjects", response_model=ExportJobResponse, status_code=202)
+def queue_student_subjects_export(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: StudentSubjectFilterParams = Depends(),
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.enqueue(
+        "student_subjects", set_export_params(filters, export_format, compress)
+    )
+
+
+@router.post(
+    "/results/students/{student_id}", response_model=ExportJobResponse, status_code=202
+)
+def queue_student_results(
+    student_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    params = {
+        "student_id": str(student_id),
+        "academic_session": academic_session,
+        "semester": semester.value,
+    }
+    return service.enqueue("student_results", params)
+
+
+@router.post(
+    "/results/classes/{class_id}", response_model=ExportJobResponse, status_code=202
+)
+def queue_class_results(
+    class_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    params = {
+        "class_id": str(class_id),
+        "academic_session": academic_session,
+        "semester": semester.value,
+    }
+    return service.enqueue("class_results", params)
+
+
+@router.post(
+    "/results/levels/{level_id}", response_model=ExportJobResponse, status_code=202
+)
+def queue_level_results(
+    level_id: UUID,
+    academic_session: str,
+    semester: Semester,
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    params = {
+        "level_id": str(level_id),
+        "academic_session": academic_session,
+        "semester": semester.value,
+    }
+    return service.enqueue("level_results", params)
+
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+def get_export_job(
+    job_id: UUID,
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.get_job(job_id)
+
+
+@router.get("/{job_id}/download", response_model=ExportJobDownload)
+def download_export_job(
+    job_id: UUID,
+    service: ExportJobService = Depends(get_authenticated_service(ExportJobService)),
+):
+    return service.get_download(job_id)
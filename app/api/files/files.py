@@ -0,0 +1,32 @@
+import mimetypes
+
+from fastapi import APIRouter
+from fastapi.responses import FileResponse
+
+from app.core.shared.exceptions import StoredObjectNotFoundError
+from app.core.shared.services.file_storage.backends import (
+    LocalBackend,
+    get_storage_backend,
+)
+
+router = APIRouter()
+
+
+@router.get("/{key:path}")
+def download_file(key: str, expires: int, signature: str):
+    """
+    Serve a file from local storage through a URL signed by LocalBackend.presign.
+    The signature stands in for authentication, as a presigned S3 URL does.
+    """
+    backend = get_storage_backend()
+    if not isinstance(backend, LocalBackend):
+        raise StoredObjectNotFoundError(key=key)
+
+    path = backend.verified_path(key, expires, signature)
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=path.name,
+        content_disposition_type="inline",
+    )
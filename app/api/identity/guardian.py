@@ -1,12 +1,13 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import Depends, APIRouter, UploadFile, File
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.identity.factories.student import StudentFactory
 from app.core.identity.schemas.student import StudentFilterParams, StudentResponse
 from app.core.shared.services.file_storage.s3_upload import S3Upload
-from app.core.shared.schemas.enums import ExportFormat
+from app.core.shared.schemas.enums import ExportFormat, ThumbnailSize
 from app.core.identity.schemas.guardian import (
     GuardianCreate,
     GuardianUpdate,
@@ -18,7 +19,11 @@ from app.core.identity.schemas.guardian import (
 from app.core.identity.factories.guardian import GuardianFactory
 from app.core.identity.services.profile_picture_service import ProfilePictureService
 from app.core.identity.services.gaurdian_service import GuardianService
-from app.core.shared.schemas.shared_models import ArchiveRequest, UploadResponse
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    BulkLifecycleResponse,
+    UploadResponse,
+)
 from app.core.auth.services.token_service import TokenService
 from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
 from app.core.auth.services.dependencies.current_user_deps import (
@@ -104,11 +109,12 @@ def upload_profile_pic(
 @router.get("/{guardian_id}/profile/profile-picture")
 def get_guardian_profile_pic(
     guardian_id: UUID,
+    size: ThumbnailSize | None = None,
     service: S3Upload = Depends(get_authenticated_service(S3Upload)),
     factory: GuardianFactory = Depends(get_authenticated_factory(GuardianFactory)),
 ):
     guardian = factory.get_guardian(guardian_id)
-    key = guardian.profile_s3_key
+    key = ProfilePictureService.profile_pic_key(guardian, size)
     return service.generate_presigned_url(key)
 
 
@@ -142,6 +148,24 @@ def get_guardians(
     return factory.get_all_guardians(filters)
 
 
+@router.get("/export", response_class=StreamingResponse)
+def export_guardians(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: GuardianFilterParams = Depends(),
+    factory: GuardianFactory = Depends(get_authenticated_factory(GuardianFactory)),
+):
+    return export_response(factory.export_guardians(filters, export_format, compress))
+
+
+@router.post("/archive-orphaned", response_model=BulkLifecycleResponse)
+def archive_orphaned_guardians(
+    reason: ArchiveRequest,
+    service: GuardianService = Depends(get_authenticated_service(GuardianService)),
+):
+    return service.archive_orphaned_guardians(reason.reason)
+
+
 @router.get("/{guardian_id}/audit", response_model=GuardianAudit)
 def get_guardian_audit(
     guardian_id: UUID,
@@ -177,19 +201,13 @@ def archive_guardian(
     return factory.archive_guardian(guardian_id, reason.reason)
 
 
-@router.post("/{guardian_id}", response_class=FileResponse, status_code=204)
+@router.post("/{guardian_id}", response_class=StreamingResponse)
 def export_guardian(
     guardian_id: UUID,
     export_format: ExportFormat,
     service: GuardianService = Depends(get_authenticated_service(GuardianService)),
 ):
-    file_path = service.export_guardian_audit(guardian_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_guardian_audit(guardian_id, export_format))
 
 
 @router.delete("/{guardian_id}", status_code=204)
@@ -1,8 +1,9 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import UploadFile, File
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.rbac.factories.role_history import RoleHistoryFactory
 from app.core.rbac.schemas.role_history import (
     RoleHistoryCreate,
@@ -12,7 +13,12 @@ from app.core.rbac.schemas.role_history import (
 from app.core.identity.factories.staff import StaffFactory
 from app.core.identity.services.profile_picture_service import ProfilePictureService
 from app.core.identity.services.staff_service import StaffService
-from app.core.shared.schemas.enums import ExportFormat, StaffAvailability, ArchiveReason
+from app.core.shared.schemas.enums import (
+    ExportFormat,
+    StaffAvailability,
+    ArchiveReason,
+    ThumbnailSize,
+)
 from app.core.identity.schemas.staff import (
     StaffCreate,
     StaffUpdate,
@@ -21,7 +27,11 @@ from app.core.identity.schemas.staff import (
     StaffAudit,
 )
 from fastapi import Depends, APIRouter
-from app.core.shared.schemas.shared_models import ArchiveRequest, UploadResponse
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    CascadeArchiveResponse,
+    UploadResponse,
+)
 from app.core.auth.services.token_service import TokenService
 from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
 from app.core.auth.services.dependencies.current_user_deps import (
@@ -111,11 +121,12 @@ def upload_profile_pic(
 @router.get("/staff/{staff_id}/profile/profile-picture")
 def get_staff_profile_pic(
     staff_id: UUID,
+    size: ThumbnailSize | None = None,
     service: S3Upload = Depends(get_authenticated_service(S3Upload)),
     factory: StaffFactory = Depends(get_authenticated_factory(StaffFactory)),
 ):
     staff = factory.get_staff(staff_id)
-    key = staff.profile_s3_key
+    key = ProfilePictureService.profile_pic_key(staff, size)
     return service.generate_presigned_url(key)
 
 
@@ -162,6 +173,16 @@ def get_staff(
     return factory.get_all_staff(filters)
 
 
+@router.get("/staff/export", response_class=StreamingResponse)
+def export_staff_records(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: StaffFilterParams = Depends(),
+    factory: StaffFactory = Depends(get_authenticated_factory(StaffFactory)),
+):
+    return export_response(factory.export_staff(filters, export_format, compress))
+
+
 @router.get("/staff/{staff_id}/audit", response_model=StaffAudit)
 def get_staff_audit(
     staff_id: UUID,
@@ -197,7 +218,7 @@ def archive_staff(
     return factory.archive_staff(staff_id, reason.reason)
 
 
-@router.patch("/staff/{staff_id}/deep_archive", status_code=204)
+@router.patch("/staff/{staff_id}/deep_archive", response_model=CascadeArchiveResponse)
 def cascade_archive_staff(
     staff_id: UUID,
     reason: ArchiveReason,
@@ -269,19 +290,13 @@ def archive_staff(
     return factory.archive_staff(staff_id, reason.reason)
 
 
-@router.post("/{staff_id}", response_class=FileResponse, status_code=204)
+@router.post("/{staff_id}", response_class=StreamingResponse)
 def export_staff(
     staff_id: UUID,
     export_format: ExportFormat,
     service: StaffService = Depends(get_authenticated_service(StaffService)),
 ):
-    file_path = service.export_staff(staff_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_staff(staff_id, export_format))
 
 
 @router.delete("/{staff_id}", status_code=204)
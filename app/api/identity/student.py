@@ -1,9 +1,10 @@
 from uuid import UUID
-from typing import List
+from typing import Any, Dict, List
 from fastapi import Depends, APIRouter
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import UploadFile, File
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.assessment.factories.grade import GradeFactory
 from app.core.assessment.factories.total_grade import TotalGradeFactory
 from app.core.assessment.schemas.grade import GradeResponse, GradeFilterParams
@@ -35,8 +36,9 @@ from app.core.progression.schemas.repetition import (
     RepetitionFilterParams,
 )
 from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.core.identity.models.student import Student
 from app.core.identity.services.student_service import StudentService
-from app.core.shared.schemas.enums import ExportFormat, ArchiveReason
+from app.core.shared.schemas.enums import ExportFormat, ArchiveReason, ThumbnailSize
 
 from app.core.identity.schemas.student import (
     StudentCreate,
@@ -44,9 +46,20 @@ from app.core.identity.schemas.student import (
     StudentResponse,
     StudentFilterParams,
     StudentAudit,
+    BulkOnboardingResponse,
 )
+from app.core.identity.services.onboarding_service import StudentOnboardingService
 from app.core.identity.services.profile_picture_service import ProfilePictureService
-from app.core.shared.schemas.shared_models import ArchiveRequest, UploadResponse
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    BulkArchiveRequest,
+    BulkLifecycleResponse,
+    BulkSelection,
+    CascadeArchiveResponse,
+    PresignedUrlBatchRequest,
+    PresignedUrlResponse,
+    UploadResponse,
+)
 from app.core.auth.services.token_service import TokenService
 from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
 from app.core.auth.services.dependencies.current_user_deps import (
@@ -97,6 +110,15 @@ def restore_student(
     return factory.restore_student(student_id)
 
 
+@router.post("/archive/students/bulk-restore", response_model=BulkLifecycleResponse)
+def bulk_restore_students(
+    selection: BulkSelection,
+    filters: StudentFilterParams = Depends(),
+    service: StudentService = Depends(get_authenticated_service(StudentService)),
+):
+    return service.bulk_restore_students(selection, filters)
+
+
 @router.delete("/archive/students/{student_id}", status_code=204)
 def delete_archived_student(
     student_id: UUID,
@@ -137,14 +159,28 @@ def remove_profile_pic(
     return service.remove_profile_pic(student)
 
 
+@router.post(
+    "/students/profile-pictures/urls", response_model=List[PresignedUrlResponse]
+)
+def get_students_profile_pics(
+    data: PresignedUrlBatchRequest,
+    size: ThumbnailSize | None = None,
+    service: ProfilePictureService = Depends(
+        get_authenticated_service(ProfilePictureService)
+    ),
+):
+    return service.profile_pic_urls(Student, data.ids, size)
+
+
 @router.get("/students/{student_id}/profile/profile-picture")
 def get_student_profile_pic(
     student_id: UUID,
+    size: ThumbnailSize | None = None,
     service: S3Upload = Depends(get_authenticated_service(S3Upload)),
     factory: StudentFactory = Depends(get_authenticated_factory(StudentFactory)),
 ):
     student = factory.get_student(student_id)
-    key = student.profile_s3_key
+    key = ProfilePictureService.profile_pic_key(student, size)
     return service.generate_presigned_url(key)
 
 
@@ -156,6 +192,29 @@ def create_student(
     return factory.create_student(payload)
 
 
+@router.post("/students/bulk", response_model=BulkOnboardingResponse, status_code=201)
+def onboard_students(
+    payload: List[Dict[str, Any]],
+    service: StudentOnboardingService = Depends(
+        get_authenticated_service(StudentOnboardingService)
+    ),
+):
+    return service.onboard(payload)
+
+
+@router.post(
+    "/students/bulk/upload", response_model=BulkOnboardingResponse, status_code=201
+)
+def onboard_students_from_file(
+    file: UploadFile = File(...),
+    service: StudentOnboardingService = Depends(
+        get_authenticated_service(StudentOnboardingService)
+    ),
+):
+    rows = service.read_rows(file.filename, service.read_upload(file.file))
+    return service.onboard(rows)
+
+
 @router.get("/students/{student_id}/audit", response_model=StudentAudit)
 def get_student_audit(
     student_id: UUID,
@@ -250,6 +309,16 @@ def get_student_repetitions(
     return factory.get_all_repetitions(filters)
 
 
+@router.get("/students/export", response_class=StreamingResponse)
+def export_students(
+    export_format: ExportFormat,
+    compress: bool = False,
+    filters: StudentFilterParams = Depends(),
+    factory: StudentFactory = Depends(get_authenticated_factory(StudentFactory)),
+):
+    return export_response(factory.export_students(filters, export_format, compress))
+
+
 @router.get("/students/{student_id}", response_model=StudentResponse)
 def get_student(
     student_id: UUID,
@@ -266,6 +335,15 @@ def get_students(
     return factory.get_all_students(filters)
 
 
+@router.post("/students/bulk-archive", response_model=BulkLifecycleResponse)
+def bulk_archive_students(
+    payload: BulkArchiveRequest,
+    filters: StudentFilterParams = Depends(),
+    service: StudentService = Depends(get_authenticated_service(StudentService)),
+):
+    return service.bulk_archive_students(payload, filters)
+
+
 @router.put("/students/{student_id}", response_model=StudentResponse)
 def update_student(
     payload: StudentUpdate,
@@ -276,7 +354,9 @@ def update_student(
     return factory.update_student(student_id, payload)
 
 
-@router.patch("/students/{student_id}/deep_archive", status_code=204)
+@router.patch(
+    "/students/{student_id}/deep_archive", response_model=CascadeArchiveResponse
+)
 def cascade_archive_student(
     student_id: UUID,
     reason: ArchiveReason,
@@ -342,21 +422,13 @@ def remove_class(
     return service.assign_class(student_id)
 
 
-@router.post(
-    "/students/{student_id}/export", response_class=FileResponse, status_code=204
-)
+@router.post("/students/{student_id}/export", response_class=StreamingResponse)
 def export_student(
     student_id: UUID,
     export_format: ExportFormat,
     service: StudentService = Depends(get_authenticated_service(StudentService)),
 ):
-    file_path = service.export_student_audit(student_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_student_audit(student_id, export_format))
 
 
 @router.delete("/students/{student_id}", status_code=204)
@@ -14,9 +14,21 @@ from app.core.progression.schemas.promotion import (
     PromotionReview,
     PromotionDecision,
     GraduationCreate,
+    BatchPromotionCreate,
+    BatchPromotionApproval,
+    BatchPromotionResponse,
+)
+from app.core.progression.schemas.proposal import (
+    ProgressionProposalRequest,
+    ProgressionProposalReport,
 )
 from app.core.progression.services.promotion_service import PromotionService
-from app.core.shared.schemas.shared_models import ArchiveRequest
+from app.core.progression.services.proposal_service import ProgressionProposalService
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    BatchDecision,
+    BatchDecisionResponse,
+)
 from app.core.auth.services.token_service import TokenService
 from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
 from app.core.auth.services.dependencies.current_user_deps import (
@@ -51,6 +63,40 @@ def create_promotion(
     return factory.create_promotion(student_id, payload)
 
 
+@router.post("/batch", response_model=BatchPromotionResponse, status_code=201)
+def create_batch_promotion(
+    payload: BatchPromotionCreate,
+    service: PromotionService = Depends(get_authenticated_service(PromotionService)),
+):
+    return service.create_batch_promotion(payload)
+
+
+@router.post("/batch/approve", response_model=BatchPromotionResponse)
+def approve_batch_promotion(
+    payload: BatchPromotionApproval,
+    service: PromotionService = Depends(get_authenticated_service(PromotionService)),
+):
+    return service.approve_batch_promotion(payload)
+
+
+@router.post("/proposals", response_model=ProgressionProposalReport)
+def propose_progression(
+    payload: ProgressionProposalRequest,
+    service: ProgressionProposalService = Depends(
+        get_authenticated_service(ProgressionProposalService)
+    ),
+):
+    return service.propose(payload)
+
+
+@router.post("/batch/action", response_model=BatchDecisionResponse)
+def action_promotions(
+    payload: BatchDecision,
+    service: PromotionService = Depends(get_authenticated_service(PromotionService)),
+):
+    return service.action_promotion_records(payload)
+
+
 @router.get("/", response_model=List[PromotionResponse])
 def get_all_promotions(
     filters: PromotionFilterParams = Depends(),
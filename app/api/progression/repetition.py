@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from uuid import UUID
 from typing import List
 
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.progression.factories.repetition import RepetitionFactory
 from app.core.progression.schemas.repetition import (
     RepetitionCreate,
@@ -11,10 +12,14 @@ from app.core.progression.schemas.repetition import (
     RepetitionReview,
     RepetitionDecision,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from app.core.shared.schemas.enums import ExportFormat
 from app.core.progression.services.repetition_service import RepetitionService
-from app.core.shared.schemas.shared_models import ArchiveRequest
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    BatchDecision,
+    BatchDecisionResponse,
+)
 from app.core.auth.services.token_service import TokenService
 from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
 from app.core.auth.services.dependencies.current_user_deps import (
@@ -39,6 +44,14 @@ def create_repetition(
     return factory.create_repetition(student_id, payload)
 
 
+@router.post("/batch/action", response_model=BatchDecisionResponse)
+def action_repetitions(
+    payload: BatchDecision,
+    service: RepetitionService = Depends(get_authenticated_service(RepetitionService)),
+):
+    return service.action_repetition_records(payload)
+
+
 @router.get("/", response_model=List[RepetitionResponse])
 def get_all_repetitions(
     filters: RepetitionFilterParams = Depends(),
@@ -100,16 +113,12 @@ def delete_repetition(
     return factory.delete_repetition(repetition_id)
 
 
-@router.post("/{repetition_id}", response_class=FileResponse, status_code=204)
+@router.post("/{repetition_id}", response_class=StreamingResponse)
 def export_repetition_audit(
     repetition_id: UUID,
     export_format: ExportFormat,
     service: RepetitionService = Depends(get_authenticated_service(RepetitionService)),
 ):
-    file_path = service.export_repetition_audit(repetition_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
+    return export_response(
+        service.export_repetition_audit(repetition_id, export_format)
     )
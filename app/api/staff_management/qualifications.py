@@ -1,7 +1,8 @@
 from uuid import UUID
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
 from fastapi import Depends, APIRouter
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.shared.schemas.enums import ExportFormat
 from app.core.staff_management.factories.qualification import QualificationFactory
 from app.core.shared.schemas.shared_models import ArchiveRequest
@@ -126,9 +127,7 @@ def archive_qualification(
     return factory.archive_qualification(qualification_id, reason.reason)
 
 
-@router.post(
-    "/qualifications/{qualification_id}", response_class=FileResponse, status_code=204
-)
+@router.post("/qualifications/{qualification_id}", response_class=StreamingResponse)
 def export_qualification(
     qualification_id: UUID,
     export_format: ExportFormat,
@@ -136,14 +135,8 @@ def export_qualification(
         get_authenticated_service(StaffManagementService)
     ),
 ):
-    file_path = service.export_qualification_audit(
-        qualification_id, export_format.value
-    )
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
+    return export_response(
+        service.export_qualification_audit(qualification_id, export_format)
     )
 
 
@@ -1,7 +1,8 @@
 from uuid import UUID
 from typing import List
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import Depends, APIRouter
+from app.core.shared.services.export_service.export_service import export_response
 from app.core.shared.schemas.enums import ExportFormat
 from app.core.shared.schemas.shared_models import ArchiveRequest
 from app.core.staff_management.factories.department import StaffDepartmentFactory
@@ -108,7 +109,7 @@ def update_staff_department(
     return factory.update_staff_department(department_id, update_data)
 
 
-@router.post("/{department_id}/export", response_class=FileResponse)
+@router.post("/{department_id}/export", response_class=StreamingResponse)
 def export_department(
     department_id: UUID,
     export_format: ExportFormat,
@@ -117,13 +118,7 @@ def export_department(
     ),
 ):
     """Export department data."""
-    file_path = service.export_department(department_id, export_format.value)
-
-    return FileResponse(
-        path=file_path,
-        filename=file_path.split("/")[-1],
-        media_type="application/octet-stream",
-    )
+    return export_response(service.export_department(department_id, export_format))
 
 
 @router.patch("/{department_id}/archive", status_code=204)
@@ -11,7 +11,11 @@ from app.core.transfer.schemas.department_transfer import (
     DepartmentTransferUpdate,
     DepartmentTransferDecision,
 )
-from app.core.shared.schemas.shared_models import ArchiveRequest
+from app.core.shared.schemas.shared_models import (
+    ArchiveRequest,
+    BatchDecision,
+    BatchDecisionResponse,
+)
 from app.core.auth.services.token_service import TokenService
 from app.core.auth.services.dependencies.token_deps import AccessTokenBearer
 from app.core.auth.services.dependencies.current_user_deps import (
@@ -75,6 +79,14 @@ def create_transfer(
     return factory.create_transfer(student_id, payload)
 
 
+@router.post("/transfers/batch/action", response_model=BatchDecisionResponse)
+def action_transfers(
+    payload: BatchDecision,
+    service: TransferService = Depends(get_authenticated_service(TransferService)),
+):
+    return service.action_transfer_records(payload)
+
+
 @router.get("/transfers/", response_model=List[DepartmentTransferResponse])
 def get_transfers(
     filters: DepartmentTransferFilterParams = Depends(),
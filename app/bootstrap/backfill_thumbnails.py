@@ -0,0 +1,44 @@
+from uuid import UUID
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.identity.models.staff import System
+from app.core.identity.services.profile_picture_service import ProfilePictureService
+from app.core.shared.services.export_service.jobs import PROFILE_PICTURE_MODELS
+from app.settings import config
+from app.infra.db.db_config import engine
+
+KADEMIA_ID = UUID(config.KADEMIA_ID)
+
+
+def backfill_profile_thumbnails():
+    """
+    Add the profile_thumbnails_ready column to existing user tables and queue
+    thumbnails for every picture that has none. Safe to run more than once;
+    pictures are served at full size until their thumbnails job completes.
+    """
+    try:
+        with Session(engine) as session:
+            for model in PROFILE_PICTURE_MODELS:
+                session.execute(
+                    text(
+                        f"ALTER TABLE {model.__tablename__} ADD COLUMN IF NOT EXISTS "
+                        "profile_thumbnails_ready BOOLEAN NOT NULL DEFAULT FALSE"
+                    )
+                )
+            session.commit()
+
+            system_user = session.get(System, KADEMIA_ID)
+            queued = ProfilePictureService(
+                session, system_user
+            ).queue_missing_thumbnails()
+            print(
+                f"Queued thumbnails for {queued} profile pictures.\n ========================"
+            )
+
+    except Exception as e:
+        print(f"Error: {e} \n xxxxxxxxxxxxxxxxxxxxxxxxx")
+
+
+if __name__ == "__main__":
+    backfill_profile_thumbnails()
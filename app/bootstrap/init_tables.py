@@ -16,9 +16,15 @@ from app.core.staff_management.models import (
 )
 from app.core.academic_structure.models import StudentDepartment, Classes, AcademicLevel
 from app.core.transfer.models.transfer import DepartmentTransfer
-from app.core.assessment.models.assessment import Grade, TotalGrade
+from app.core.assessment.models.assessment import (
+    Grade,
+    TotalGrade,
+    GradingBand,
+    StudentTranscript,
+)
 from app.core.identity.models.student import Student
 from app.core.identity.models.guardian import Guardian
+from app.core.shared.models.storage import StoredBlob
 
 
 def create_tables():
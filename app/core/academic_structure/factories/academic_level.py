@@ -19,7 +19,6 @@ from app.core.shared.exceptions.decorators.resolve_fk_violation import (
 from app.core.shared.exceptions import (
     EntityNotFoundError,
     ArchiveDependencyError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.maps.error_map import error_map
 
@@ -182,17 +181,9 @@ class AcademicLevelFactory(BaseFactory):
             level_id (UUID): ID of academic_level to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, level_id
+            self.delete_service.check_safe_delete(
+                self.model, level_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=level_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             return self.repository.delete(level_id)
 
         except EntityNotFoundError as e:
@@ -237,17 +228,9 @@ class AcademicLevelFactory(BaseFactory):
             level_id: ID of academic_level to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, level_id
+            self.delete_service.check_safe_delete(
+                self.model, level_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=level_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete_archive(level_id)
 
         except EntityNotFoundError as e:
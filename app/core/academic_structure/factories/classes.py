@@ -19,7 +19,6 @@ from app.core.shared.exceptions.decorators.resolve_fk_violation import (
 from app.core.shared.exceptions import (
     EntityNotFoundError,
     ArchiveDependencyError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.maps.error_map import error_map
 
@@ -171,17 +170,9 @@ class ClassFactory(BaseFactory):
             class_id (UUID): ID of class to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, class_id
+            self.delete_service.check_safe_delete(
+                self.model, class_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=class_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete(class_id)
 
         except EntityNotFoundError as e:
@@ -226,17 +217,9 @@ class ClassFactory(BaseFactory):
             class_id: ID of class to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, class_id
+            self.delete_service.check_safe_delete(
+                self.model, class_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=class_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete_archive(class_id)
 
         except EntityNotFoundError as e:
@@ -19,7 +19,6 @@ from app.core.shared.exceptions.decorators.resolve_fk_violation import (
 from app.core.shared.exceptions import (
     EntityNotFoundError,
     ArchiveDependencyError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.maps.error_map import error_map
 
@@ -180,17 +179,9 @@ class StudentDepartmentFactory(BaseFactory):
             is_archived: Whether to check archived or active entities
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, department_id
+            self.delete_service.check_safe_delete(
+                self.model, department_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=department_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete(department_id)
 
         except EntityNotFoundError as e:
@@ -235,17 +226,9 @@ class StudentDepartmentFactory(BaseFactory):
             department_id: ID of department to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, department_id
+            self.delete_service.check_safe_delete(
+                self.model, department_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=department_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete_archive(department_id)
 
         except EntityNotFoundError as e:
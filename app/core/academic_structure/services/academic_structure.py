@@ -11,6 +11,10 @@ from app.core.identity.factories.student import StudentFactory
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
 from app.core.academic_structure.services.validators import AcademicStructureValidator
 from app.core.academic_structure.models import AcademicLevel, Classes, StudentDepartment
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 
 
 class AcademicStructureService:
@@ -27,6 +31,7 @@ class AcademicStructureService:
         self.class_repository = SQLAlchemyRepository(Classes, session)
         self.entity_validator = EntityValidator(session)
         self.validator = AcademicStructureValidator()
+        self.export_service = ExportService(session, current_user)
 
     def return_default_level_order(self) -> int:
         """Create a new order value by getting the max order + 1 for the given level"""
@@ -122,3 +127,19 @@ class AcademicStructureService:
         return self.department_factory.update_student_department(
             department_id, {"assistant_rep_id": asst_rep_id}
         )
+
+    def export_class_audit(self, class_id: UUID, export_format: str) -> ExportStream:
+        """Export a class record together with its students."""
+        return self.export_service.export_audit(Classes, class_id, export_format)
+
+    def export_academic_level(self, level_id: UUID, export_format: str) -> ExportStream:
+        """Export an academic level with its classes, subjects and students."""
+        return self.export_service.export_audit(AcademicLevel, level_id, export_format)
+
+    def export_department(
+        self, department_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a student department with its students, subjects and transfers."""
+        return self.export_service.export_audit(
+            StudentDepartment, department_id, export_format
+        )
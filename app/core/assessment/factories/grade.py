@@ -3,12 +3,17 @@ from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 from app.core.assessment.models.assessment import Grade
 from app.core.assessment.services.assessment_file_service import AssessmentFileService
+from app.core.assessment.services.result_cache import invalidate_after_commit
 from app.core.assessment.services.validators import AssessmentValidator
 from app.core.shared.factory.base_factory import BaseFactory
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
 from app.core.shared.services.lifecycle_service.delete_service import DeleteService
 from app.core.shared.validators.entity_validators import EntityValidator
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 from app.core.shared.exceptions.decorators.resolve_fk_violation import (
     resolve_fk_on_create,
     resolve_fk_on_update,
@@ -21,6 +26,14 @@ from app.core.shared.exceptions.maps.error_map import error_map
 class GradeFactory(BaseFactory):
     """Factory class for managing Grade operations."""
 
+    FILTER_FIELDS = [
+        "student_id",
+        "student_subject_id",
+        "graded_by",
+        "graded_on",
+        "type",
+    ]
+
     def __init__(self, session: Session, model=Grade, current_user=None):
         super().__init__(current_user)
         """Initialize factory with db session, model and current user.
@@ -37,6 +50,7 @@ class GradeFactory(BaseFactory):
         self.validator = AssessmentValidator(session)
         self.delete_service = DeleteService(self.model, session)
         self.archive_service = ArchiveService(session, current_user)
+        self.export_service = ExportService(session, current_user)
         self.error_details = error_map.get(self.model)
         self.entity_model, self.display_name = self.error_details
         self.actor_id: UUID = self.get_actor_id()
@@ -50,6 +64,10 @@ class GradeFactory(BaseFactory):
             display_name=self.display_name,
         )
 
+    def invalidate_results(self, grade: Grade) -> None:
+        """Drop the cached result summaries affected by a grade write."""
+        invalidate_after_commit(self.session, [grade.student_id])
+
     @resolve_fk_on_create()
     def create_grade(self, student_id: UUID, student_subject_id: UUID, data) -> Grade:
         """Create a new Grade.
@@ -78,7 +96,9 @@ class GradeFactory(BaseFactory):
             created_by=self.actor_id,
             last_modified_by=self.actor_id,
         )
-        return self.repository.create(new_grade)
+        created = self.repository.create(new_grade)
+        self.invalidate_results(created)
+        return created
 
     def get_grade(self, grade_id: UUID) -> Grade:
         """Get a specific Grade by ID.
@@ -97,8 +117,23 @@ class GradeFactory(BaseFactory):
         Returns:
             List[Grade]: List of active Grades
         """
-        fields = ["student_id", "student_subject_id", "graded_by", "graded_on", "type"]
-        return self.repository.execute_query(fields, filters)
+        return self.repository.execute_query(self.FILTER_FIELDS, filters)
+
+    def export_grades(
+        self, filters, export_format: str, compress: bool = False
+    ) -> ExportStream:
+        """Export all grades matching filters, ignoring pagination.
+        Args:
+            filters: Same filter params as the list endpoint
+            export_format: csv, excel or pdf
+            compress: Gzip the export
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        stmt = self.repository.filtered_query(self.FILTER_FIELDS, filters)
+        return self.export_service.export_set(
+            self.model, stmt, export_format, "Grades", compress
+        )
 
     @resolve_fk_on_update()
     def update_grade(self, grade_id: UUID, data: dict) -> Grade:
@@ -116,7 +151,11 @@ class GradeFactory(BaseFactory):
                 if hasattr(existing, key):
                     setattr(existing, key, value)
 
-            return self.repository.update(grade_id, existing, modified_by=self.actor_id)
+            updated = self.repository.update(
+                grade_id, existing, modified_by=self.actor_id
+            )
+            self.invalidate_results(updated)
+            return updated
 
         except EntityNotFoundError as e:
             self.raise_not_found(grade_id, e)
@@ -130,7 +169,9 @@ class GradeFactory(BaseFactory):
             Grade: Archived Grade record
         """
         try:
-            return self.repository.archive(grade_id, self.actor_id, reason)
+            archived = self.repository.archive(grade_id, self.actor_id, reason)
+            self.invalidate_results(archived)
+            return archived
 
         except EntityNotFoundError as e:
             self.raise_not_found(grade_id, e)
@@ -146,7 +187,11 @@ class GradeFactory(BaseFactory):
         grade = self.get_grade(grade_id)
         service.remove_assessment_file(grade)
         try:
-            return self.repository.delete(grade_id)
+            self.delete_service.check_safe_delete(
+                self.model, grade_id, self.display_name
+            )
+            self.repository.delete(grade_id)
+            self.invalidate_results(grade)
 
         except EntityNotFoundError as e:
             self.raise_not_found(grade_id, e)
@@ -179,7 +224,9 @@ class GradeFactory(BaseFactory):
             Grade: Restored Grade record
         """
         try:
-            return self.repository.restore(grade_id)
+            restored = self.repository.restore(grade_id)
+            self.invalidate_results(restored)
+            return restored
         except EntityNotFoundError as e:
             self.raise_not_found(grade_id, e)
 
@@ -194,7 +241,11 @@ class GradeFactory(BaseFactory):
         grade = self.get_archived_grade(grade_id)
         service.remove_assessment_file(grade)
         try:
+            self.delete_service.check_safe_delete(
+                self.model, grade_id, self.display_name
+            )
             self.repository.delete_archive(grade_id)
+            self.invalidate_results(grade)
 
         except EntityNotFoundError as e:
             self.raise_not_found(grade_id, e)
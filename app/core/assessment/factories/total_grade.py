@@ -3,10 +3,16 @@ from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 from app.core.assessment.models.assessment import TotalGrade
 from app.core.assessment.services.validators import AssessmentValidator
+from app.core.assessment.services.transcript_service import TranscriptService
+from app.core.assessment.services.result_cache import invalidate_after_commit
 from app.core.shared.factory.base_factory import BaseFactory
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
 from app.core.shared.services.lifecycle_service.delete_service import DeleteService
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 from app.core.shared.exceptions.decorators.resolve_fk_violation import (
     resolve_fk_on_create,
     resolve_fk_on_delete,
@@ -19,6 +25,11 @@ from app.core.shared.exceptions.maps.error_map import error_map
 class TotalGradeFactory(BaseFactory):
     """Factory class for managing TotalGrade operations."""
 
+    FILTER_FIELDS = [
+        "student_id",
+        "student_subject_id",
+    ]
+
     def __init__(self, session: Session, model=TotalGrade, current_user=None):
         super().__init__(current_user)
         """Initialize factory with db session, model and current user.
@@ -33,6 +44,8 @@ class TotalGradeFactory(BaseFactory):
         self.validator = AssessmentValidator(session)
         self.delete_service = DeleteService(self.model, session)
         self.archive_service = ArchiveService(session, current_user)
+        self.export_service = ExportService(session, current_user)
+        self.transcript_service = TranscriptService(session, current_user)
         self.error_details = error_map.get(self.model)
         self.entity_model, self.display_name = self.error_details
         self.actor_id: UUID = self.get_actor_id()
@@ -46,6 +59,13 @@ class TotalGradeFactory(BaseFactory):
             display_name=self.display_name,
         )
 
+    def refresh_results(self, total_grade: TotalGrade) -> None:
+        """Refresh the transcript term and cached summaries affected by a total grade write."""
+        self.transcript_service.refresh_for_student_subject(
+            total_grade.student_id, total_grade.student_subject_id
+        )
+        invalidate_after_commit(self.session, [total_grade.student_id])
+
     @resolve_fk_on_create()
     def create_total_grade(
         self, student_id: UUID, student_subject_id: UUID
@@ -69,7 +89,9 @@ class TotalGradeFactory(BaseFactory):
             last_modified_by=self.actor_id,
         )
 
-        return self.repository.create(new_total_grade)
+        created = self.repository.create(new_total_grade)
+        self.refresh_results(created)
+        return created
 
     def get_total_grade(self, total_grade_id: UUID) -> TotalGrade:
         """Get a specific TotalGrade by ID.
@@ -88,8 +110,23 @@ class TotalGradeFactory(BaseFactory):
         Returns:
             List[TotalGrade]: List of active TotalGrades
         """
-        fields = ["student_id", "student_subject_id"]
-        return self.repository.execute_query(fields, filters)
+        return self.repository.execute_query(self.FILTER_FIELDS, filters)
+
+    def export_total_grades(
+        self, filters, export_format: str, compress: bool = False
+    ) -> ExportStream:
+        """Export all total grades matching filters, ignoring pagination.
+        Args:
+            filters: Same filter params as the list endpoint
+            export_format: csv, excel or pdf
+            compress: Gzip the export
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        stmt = self.repository.filtered_query(self.FILTER_FIELDS, filters)
+        return self.export_service.export_set(
+            self.model, stmt, export_format, "Total grades", compress
+        )
 
     @resolve_fk_on_update()
     def update_total_grade(self, total_grade_id: UUID, data: dict) -> TotalGrade:
@@ -106,9 +143,11 @@ class TotalGradeFactory(BaseFactory):
                 if hasattr(existing, key):
                     setattr(existing, key, value)
 
-            return self.repository.update(
+            updated = self.repository.update(
                 total_grade_id, existing, modified_by=self.actor_id
             )
+            self.refresh_results(updated)
+            return updated
 
         except EntityNotFoundError as e:
             self.raise_not_found(total_grade_id, e)
@@ -122,7 +161,9 @@ class TotalGradeFactory(BaseFactory):
             TotalGrade: Archived TotalGrade record
         """
         try:
-            return self.repository.archive(total_grade_id, self.actor_id, reason)
+            archived = self.repository.archive(total_grade_id, self.actor_id, reason)
+            self.refresh_results(archived)
+            return archived
 
         except EntityNotFoundError as e:
             self.raise_not_found(total_grade_id, e)
@@ -133,8 +174,13 @@ class TotalGradeFactory(BaseFactory):
         Args:
             total_grade_id (UUID): ID of TotalGrade to delete
         """
+        total_grade = self.get_total_grade(total_grade_id)
         try:
-            return self.repository.delete(total_grade_id)
+            self.delete_service.check_safe_delete(
+                self.model, total_grade_id, self.display_name
+            )
+            self.repository.delete(total_grade_id)
+            self.refresh_results(total_grade)
 
         except EntityNotFoundError as e:
             self.raise_not_found(total_grade_id, e)
@@ -167,7 +213,9 @@ class TotalGradeFactory(BaseFactory):
             TotalGrade: Restored TotalGrade record
         """
         try:
-            return self.repository.restore(total_grade_id)
+            restored = self.repository.restore(total_grade_id)
+            self.refresh_results(restored)
+            return restored
         except EntityNotFoundError as e:
             self.raise_not_found(total_grade_id, e)
 
@@ -177,8 +225,13 @@ class TotalGradeFactory(BaseFactory):
         Args:
             total_grade_id: ID of TotalGrade to delete
         """
+        total_grade = self.get_archived_total_grade(total_grade_id)
         try:
+            self.delete_service.check_safe_delete(
+                self.model, total_grade_id, self.display_name
+            )
             self.repository.delete_archive(total_grade_id)
+            self.refresh_results(total_grade)
 
         except EntityNotFoundError as e:
             self.raise_not_found(total_grade_id, e)
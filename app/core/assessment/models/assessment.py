@@ -88,6 +88,69 @@ class TotalGrade(Base, AuditMixins, TimeStampMixins, ArchiveMixins):
     __table_args__ = (Index("idx_total_grade_score", "total_score"),)
 
 
+class GradingBand(Base, AuditMixins, TimeStampMixins):
+    """Represents a band of the grading scale: the minimum total score for a grade"""
+
+    __tablename__ = "grading_bands"
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    grade: Mapped[str] = mapped_column(String(2), unique=True)
+    min_score: Mapped[float] = mapped_column(Float, unique=True)
+    description: Mapped[str] = mapped_column(String(100), nullable=True)
+
+
+class StudentTranscript(Base, TimeStampMixins):
+    """
+    Represents a student's aggregated results for one semester of a session.
+    Rows are maintained from total grades and are never edited directly.
+    """
+
+    __tablename__ = "student_transcripts"
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    student_id: Mapped[UUID] = mapped_column(
+        ForeignKey(
+            "students.id",
+            ondelete="CASCADE",
+            name="fk_student_transcripts_students_student_id",
+        )
+    )
+    class_id: Mapped[UUID] = mapped_column(
+        ForeignKey(
+            "classes.id",
+            ondelete="SET NULL",
+            name="fk_student_transcripts_classes_class_id",
+        ),
+        nullable=True,
+    )
+    academic_session: Mapped[str] = mapped_column(String(9))
+    semester: Mapped[Semester] = mapped_column(Enum(Semester, name="semester"))
+    subject_count: Mapped[int] = mapped_column(Integer)
+    total_score: Mapped[float] = mapped_column(Float)
+    average: Mapped[float] = mapped_column(Float)
+    cumulative_average: Mapped[float] = mapped_column(Float, nullable=True)
+    class_position: Mapped[int] = mapped_column(Integer, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "student_id",
+            "academic_session",
+            "semester",
+            name="uq_student_transcripts_student_term",
+        ),
+        Index(
+            "idx_student_transcripts_class_term",
+            "class_id",
+            "academic_session",
+            "semester",
+        ),
+    )
+
+
 from app.core.identity.models.student import Student
 from app.core.identity.models.staff import Educator
 from app.core.curriculum.models.curriculum import StudentSubject
@@ -0,0 +1,61 @@
+from typing import Dict, List
+from app.core.shared.schemas.enums import Semester
+from app.core.shared.schemas.common_imports import *
+
+
+class StudentRanking(BaseModel):
+    """A student's standing within the analysed group"""
+
+    student_id: UUID
+    score: float
+    position: int
+    percentile_rank: float
+    grading: str
+
+
+class GradeStatisticsResponse(BaseModel):
+    """Summary statistics and rankings for a subject, class or level"""
+
+    academic_session: str
+    semester: Semester
+    count: int
+    mean: float | None = None
+    median: float | None = None
+    std_dev: float | None = None
+    min: float | None = None
+    max: float | None = None
+    grade_distribution: Dict[str, int]
+    rankings: List[StudentRanking] = []
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "academic_session": "2025/2026",
+                "semester": "FIRST",
+                "count": 3,
+                "mean": 61.67,
+                "median": 60.0,
+                "std_dev": 10.27,
+                "min": 50.0,
+                "max": 75.0,
+                "grade_distribution": {
+                    "A": 1,
+                    "B": 1,
+                    "C": 1,
+                    "D": 0,
+                    "E": 0,
+                    "F": 0,
+                },
+                "rankings": [
+                    {
+                        "student_id": "00000000-0000-0000-0000-000000000005",
+                        "score": 75.0,
+                        "position": 1,
+                        "percentile_rank": 83.33,
+                        "grading": "A",
+                    }
+                ],
+            }
+        },
+    )
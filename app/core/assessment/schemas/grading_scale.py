@@ -0,0 +1,41 @@
+from typing import List
+from app.core.shared.schemas.common_imports import *
+
+
+class GradingBandBase(BaseModel):
+    """Base model for a band of the grading scale"""
+
+    grade: str = Field(min_length=1, max_length=2)
+    min_score: float
+    description: str | None = None
+
+
+class GradingScaleUpdate(BaseModel):
+    """Used for replacing the grading scale"""
+
+    bands: List[GradingBandBase]
+
+    model_config = ConfigDict(
+        extra="ignore",
+        json_schema_extra={
+            "example": {
+                "bands": [
+                    {"grade": "A", "min_score": 70, "description": "Excellent"},
+                    {"grade": "B", "min_score": 60, "description": "Very good"},
+                    {"grade": "C", "min_score": 50, "description": "Good"},
+                    {"grade": "D", "min_score": 45, "description": "Fair"},
+                    {"grade": "E", "min_score": 40, "description": "Pass"},
+                    {"grade": "F", "min_score": 0, "description": "Fail"},
+                ]
+            }
+        },
+    )
+
+
+class GradingScaleResponse(BaseModel):
+    """Response model for the active grading scale, highest band first"""
+
+    version: str
+    bands: List[GradingBandBase]
+
+    model_config = ConfigDict(from_attributes=True)
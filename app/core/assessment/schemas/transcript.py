@@ -0,0 +1,54 @@
+from typing import List
+from app.core.shared.schemas.enums import Semester
+from app.core.shared.schemas.common_imports import *
+
+
+class TranscriptTerm(BaseModel):
+    """A student's aggregated results for one semester"""
+
+    academic_session: str
+    semester: Semester
+    class_id: UUID | None = None
+    subject_count: int
+    average: float
+    cumulative_average: float | None = None
+    class_position: int | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TranscriptResponse(BaseModel):
+    """A student's full transcript, oldest term first"""
+
+    student_id: UUID
+    student_name: str
+    cumulative_average: float | None = None
+    terms: List[TranscriptTerm] = []
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "student_id": "00000000-0000-0000-0000-000000000005",
+                "student_name": "Ada Obi",
+                "cumulative_average": 64.5,
+                "terms": [
+                    {
+                        "academic_session": "2025/2026",
+                        "semester": "FIRST",
+                        "class_id": "00000000-0000-0000-0000-000000000007",
+                        "subject_count": 9,
+                        "average": 64.5,
+                        "cumulative_average": 64.5,
+                        "class_position": 3,
+                    }
+                ],
+            }
+        },
+    )
+
+
+class TranscriptRebuildResponse(BaseModel):
+    """Number of transcript rows written by a rebuild"""
+
+    rows: int
@@ -0,0 +1,227 @@
+from uuid import UUID
+from typing import Dict, List, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.assessment.models.assessment import TotalGrade
+from app.core.assessment.services.grading import (
+    DEFAULT_SCALE,
+    GradingScale,
+    get_grading_scale,
+)
+from app.core.curriculum.models.curriculum import StudentSubject
+from app.core.identity.models.student import Student
+from app.core.shared.schemas.enums import Semester
+
+
+class AssessmentAnalyticsService:
+    """
+    Statistics and rankings over total grades.
+
+    Scores are loaded once into NumPy arrays and every statistic (summary figures,
+    percentile ranks, grade distribution and positions) is derived from a single
+    sort of that array rather than row by row.
+    """
+
+    def __init__(self, session: Session, current_user=None):
+        self.session = session
+        self.current_user = current_user
+
+    def load_scores(
+        self,
+        academic_session: str,
+        semester: Semester,
+        academic_level_subject_id: UUID | None = None,
+        class_id: UUID | None = None,
+        level_id: UUID | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load active total grades for a term into arrays.
+        When no subject is given, each student's score is their average across
+        all subjects taken in the term.
+        Args:
+            academic_session: Academic session e.g. 2025/2026
+            semester: Semester to analyse
+            academic_level_subject_id: Restrict to a single subject
+            class_id: Restrict to students in this class
+            level_id: Restrict to students in this academic level
+        Returns:
+            tuple: (student ids, scores) aligned by index
+        """
+        stmt = (
+            select(TotalGrade.student_id, TotalGrade.total_score)
+            .join(StudentSubject, StudentSubject.id == TotalGrade.student_subject_id)
+            .join(Student, Student.id == TotalGrade.student_id)
+            .where(
+                TotalGrade.is_archived == False,
+                StudentSubject.is_archived == False,
+                Student.is_archived == False,
+                StudentSubject.academic_session == academic_session,
+                StudentSubject.semester == semester,
+            )
+            .order_by(TotalGrade.student_id)
+        )
+        if academic_level_subject_id:
+            stmt = stmt.where(
+                StudentSubject.academic_level_subject_id == academic_level_subject_id
+            )
+        if class_id:
+            stmt = stmt.where(Student.class_id == class_id)
+        if level_id:
+            stmt = stmt.where(Student.level_id == level_id)
+
+        rows = self.session.execute(stmt).all()
+        student_ids = np.array([row.student_id for row in rows], dtype=object)
+        scores = np.fromiter(
+            (row.total_score for row in rows), dtype=np.float64, count=len(rows)
+        )
+
+        if academic_level_subject_id:
+            return student_ids, scores
+        return self.average_by_student(student_ids, scores)
+
+    @staticmethod
+    def average_by_student(
+        student_ids: np.ndarray, scores: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Collapse per-subject scores into one average per student.
+        Args:
+            student_ids: Student id for each score, grouped together (sorted)
+            scores: Scores aligned with student_ids
+        Returns:
+            tuple: (unique student ids, average score per student)
+        """
+        if scores.size == 0:
+            return student_ids, scores
+
+        starts = np.flatnonzero(
+            np.concatenate(([True], student_ids[1:] != student_ids[:-1]))
+        )
+        counts = np.diff(np.append(starts, scores.size))
+        totals = np.add.reduceat(scores, starts)
+
+        return student_ids[starts], totals / counts
+
+    @staticmethod
+    def compute_statistics(
+        scores: np.ndarray, scale: GradingScale = DEFAULT_SCALE
+    ) -> Dict:
+        """
+        Compute summary statistics, percentile ranks, grade distribution and
+        positions for an array of scores.
+        Positions use competition ranking, so tied scores share a position and the
+        next position is skipped. Percentile ranks count half of the tied scores.
+        Args:
+            scores: One score per student
+            scale: Grading scale used for gradings and the distribution
+        Returns:
+            dict: Summary figures plus per-score positions, percentile ranks and grades
+        """
+        count = int(scores.size)
+        grades = scale.ordered_grades
+
+        if count == 0:
+            return {
+                "count": 0,
+                "mean": None,
+                "median": None,
+                "std_dev": None,
+                "min": None,
+                "max": None,
+                "grade_distribution": {grade: 0 for grade in grades},
+                "positions": np.empty(0, dtype=np.int64),
+                "percentile_ranks": np.empty(0, dtype=np.float64),
+                "gradings": np.empty(0, dtype=object),
+            }
+
+        # sort once, then derive tie runs from the sorted order instead of searching
+        order = np.argsort(scores, kind="stable")
+        ordered = scores[order]
+        run_starts = np.flatnonzero(
+            np.concatenate(([True], ordered[1:] != ordered[:-1]))
+        )
+        run_lengths = np.diff(np.append(run_starts, count))
+
+        below = np.empty(count, dtype=np.int64)
+        below[order] = np.repeat(run_starts, run_lengths)
+        tied = np.empty(count, dtype=np.int64)
+        tied[order] = np.repeat(run_lengths, run_lengths)
+
+        positions = count - (below + tied) + 1
+        percentile_ranks = (below + tied / 2) / count * 100
+
+        middle = count // 2
+        median = (
+            ordered[middle]
+            if count % 2
+            else (ordered[middle - 1] + ordered[middle]) / 2
+        )
+
+        # ascending band minimums map each score to a band index, lowest band first
+        minimums = np.array(scale.minimums[1:])
+        band_index = np.searchsorted(minimums, scores, side="right")
+        ascending_grades = np.array(scale.grades, dtype=object)
+        band_counts = np.bincount(band_index, minlength=len(grades))
+
+        return {
+            "count": count,
+            "mean": float(ordered.mean()),
+            "median": float(median),
+            "std_dev": float(ordered.std()),
+            "min": float(ordered[0]),
+            "max": float(ordered[-1]),
+            "grade_distribution": {
+                grade: int(band_counts[len(grades) - 1 - index])
+                for index, grade in enumerate(grades)
+            },
+            "positions": positions,
+            "percentile_ranks": percentile_ranks,
+            "gradings": ascending_grades[band_index],
+        }
+
+    def generate_statistics(
+        self,
+        academic_session: str,
+        semester: Semester,
+        academic_level_subject_id: UUID | None = None,
+        class_id: UUID | None = None,
+        level_id: UUID | None = None,
+        include_rankings: bool = True,
+    ) -> Dict:
+        """Load scores for a subject, class or level and compute its statistics."""
+        student_ids, scores = self.load_scores(
+            academic_session, semester, academic_level_subject_id, class_id, level_id
+        )
+        stats = self.compute_statistics(scores, get_grading_scale(self.session))
+
+        rankings: List[Dict] = []
+        if include_rankings:
+            order = np.argsort(stats["positions"], kind="stable")
+            rankings = [
+                {
+                    "student_id": student_ids[index],
+                    "score": round(float(scores[index]), 2),
+                    "position": int(stats["positions"][index]),
+                    "percentile_rank": round(
+                        float(stats["percentile_ranks"][index]), 2
+                    ),
+                    "grading": stats["gradings"][index],
+                }
+                for index in order
+            ]
+
+        return {
+            "academic_session": academic_session,
+            "semester": semester,
+            "count": stats["count"],
+            "mean": stats["mean"],
+            "median": stats["median"],
+            "std_dev": stats["std_dev"],
+            "min": stats["min"],
+            "max": stats["max"],
+            "grade_distribution": stats["grade_distribution"],
+            "rankings": rankings,
+        }
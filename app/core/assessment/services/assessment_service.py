@@ -1,6 +1,9 @@
+from datetime import date
+from itertools import groupby
+from typing import Dict, Iterable, Iterator, List, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, and_
 
 from app.core.curriculum.models.curriculum import (
     StudentSubject,
@@ -10,6 +13,7 @@ from app.core.curriculum.models.curriculum import (
 from app.core.shared.schemas.enums import Semester
 from app.core.assessment.factories.total_grade import TotalGradeFactory
 from app.core.assessment.services.validators import AssessmentValidator
+from app.core.assessment.services.grading import GradingScale, get_grading_scale
 from app.core.assessment.factories.grade import GradeFactory
 from app.core.assessment.models.assessment import TotalGrade
 from app.core.identity.factories.student import StudentFactory
@@ -17,11 +21,21 @@ from app.core.identity.models.student import Student
 from app.core.shared.exceptions.assessment_errors import (
     WeightTooHighError,
     UnableToRecalculateError,
+    InvalidCohortScopeError,
 )
 from app.core.shared.exceptions import InvalidWeightError
 from app.core.assessment.models.assessment import Grade
-from app.core.shared.services.pdf_service.templates.results import ResultPDF
+from app.core.shared.services.pdf_service.batch import (
+    render_in_pool,
+    render_pdf,
+    stream_zip,
+)
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.infra.db.redis_db.result_summaries import result_summary_cache
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 
 
 class AssessmentService:
@@ -35,7 +49,14 @@ class AssessmentService:
             session, TotalGrade, self.current_user
         )
         self.total_grade_repository = SQLAlchemyRepository(TotalGrade, session)
-        self.pdf_service = ResultPDF()
+        self._grading_scale: GradingScale | None = None
+        self.export_service = ExportService(session, current_user)
+
+    @property
+    def grading_scale(self) -> GradingScale:
+        if self._grading_scale is None:
+            self._grading_scale = get_grading_scale(self.session)
+        return self._grading_scale
 
     def validate_grade_weight(self, value: int, student_subject_id: UUID) -> int:
         """Ensure cumulative weight for a semester doesn't exceed 10."""
@@ -161,71 +182,226 @@ class AssessmentService:
     def generate_student_results(
         self, student_id: UUID, academic_session: str, semester: Semester
     ):
+        """
+        Build a student's results for a term. The term's scores are cached per
+        student, term and grading scale version, and dropped when a commit changes
+        the student's enrollments, grades or total grades. Student and subject names
+        are read on every request, so renames show up straight away.
+        """
         student = self.student_factory.get_student(student_id)
-        student_name = f"{student.first_name} {student.last_name}"
+        scale_version = self.grading_scale.version
+        summary, generation = result_summary_cache.get_summary(
+            student_id, scale_version, academic_session, semester.value
+        )
+        if summary is None:
+            summary = self.build_student_summary(student_id, academic_session, semester)
+            result_summary_cache.save_summary(
+                student_id,
+                generation,
+                scale_version,
+                academic_session,
+                semester.value,
+                summary,
+            )
+
+        subjects = self.subject_titles(
+            UUID(subject_id) for subject_id, _ in summary["scores"]
+        )
+        result_list = [
+            self.build_result_row(*subjects[UUID(subject_id)], total_score)
+            for subject_id, total_score in summary["scores"]
+            if UUID(subject_id) in subjects
+        ]
 
-        results = (
-            self.session.query(StudentSubject)
-            .options(
-                joinedload(StudentSubject.subject),
-                joinedload(StudentSubject.total_grade),
+        return {
+            "student_name": f"{student.first_name} {student.last_name}",
+            "semester": semester.value,
+            "academic_session": academic_session,
+            "result_list": sorted(result_list, key=lambda row: row["course_code"]),
+            "date_generated": self.format_generation_date(),
+        }
+
+    def build_student_summary(
+        self, student_id: UUID, academic_session: str, semester: Semester
+    ) -> Dict:
+        """The student's total score in each subject taken in a term, by subject id."""
+        rows = self.session.execute(
+            select(StudentSubject.academic_level_subject_id, TotalGrade.total_score)
+            .outerjoin(
+                TotalGrade,
+                and_(
+                    TotalGrade.student_subject_id == StudentSubject.id,
+                    TotalGrade.is_archived == False,
+                ),
             )
-            .filter(
+            .where(
                 StudentSubject.student_id == student_id,
                 StudentSubject.academic_session == academic_session,
                 StudentSubject.semester == semester,
+                StudentSubject.is_archived == False,
             )
-            .all()
-        )
-
-        result_list = []
-
-        for result in results:
-            subject = result.subject
-            total_score = result.total_grade.total_score if result.total_grade else None
-
-            result_list.append(
-                {
-                    "course_code": subject.code,
-                    "course_title": subject.name,
-                    "total_score": total_score,
-                    "grading": (
-                        self.generate_grading(total_score)
-                        if total_score is not None
-                        else None
-                    ),
-                }
-            )
+        ).all()
 
         return {
-            "student_name": student_name,
-            "semester": semester.value,
-            "academic_session": academic_session,
-            "result_list": result_list,
+            "scores": [
+                [str(subject_id), total_score] for subject_id, total_score in rows
+            ]
         }
 
+    def subject_titles(self, subject_ids: Iterable[UUID]) -> Dict[UUID, Tuple]:
+        """Course code and title for each academic level subject, with one query."""
+        subject_ids = set(subject_ids)
+        if not subject_ids:
+            return {}
+
+        rows = self.session.execute(
+            select(AcademicLevelSubject.id, AcademicLevelSubject.code, Subject.name)
+            .join(Subject, Subject.id == AcademicLevelSubject.subject_id)
+            .where(AcademicLevelSubject.id.in_(subject_ids))
+        ).all()
+        return {subject_id: (code, name) for subject_id, code, name in rows}
+
     def generate_assessment_pdf(
         self, student_id: UUID, academic_session: str, semester: Semester
     ):
-        student = self.student_factory.get_student(student_id)
-        student_name = f"{student.first_name} {student.last_name}"
-        file_name = f"{student_name} {academic_session} {semester} semester results"
-
         data = self.generate_student_results(student_id, academic_session, semester)
+        file_name = f"{data['student_name']} {academic_session} {semester.value} semester results"
+
+        return render_pdf("results", data, file_name)
+
+    def generate_cohort_results(
+        self,
+        academic_session: str,
+        semester: Semester,
+        class_id: UUID | None = None,
+        level_id: UUID | None = None,
+    ) -> List[Tuple[Dict, str]]:
+        """
+        Build result data for every active student in a class or academic level.
+        All enrollments, subjects and total grades are fetched in a single query.
+        Args:
+            academic_session: Academic session e.g. 2025/2026
+            semester: Semester to generate results for
+            class_id: Students in this class
+            level_id: Students in this academic level
+        Returns:
+            list: (result data, file name) pairs, one per student
+        Raises:
+            InvalidCohortScopeError: Unless exactly one of class_id or level_id is given
+        """
+        if bool(class_id) == bool(level_id):
+            raise InvalidCohortScopeError()
+
+        stmt = (
+            select(
+                Student.id,
+                Student.student_id,
+                Student.first_name,
+                Student.last_name,
+                AcademicLevelSubject.code,
+                Subject.name,
+                TotalGrade.total_score,
+            )
+            .join(StudentSubject, StudentSubject.student_id == Student.id)
+            .join(
+                AcademicLevelSubject,
+                AcademicLevelSubject.id == StudentSubject.academic_level_subject_id,
+            )
+            .join(Subject, Subject.id == AcademicLevelSubject.subject_id)
+            .outerjoin(
+                TotalGrade,
+                and_(
+                    TotalGrade.student_subject_id == StudentSubject.id,
+                    TotalGrade.is_archived == False,
+                ),
+            )
+            .where(
+                Student.is_archived == False,
+                StudentSubject.is_archived == False,
+                StudentSubject.academic_session == academic_session,
+                StudentSubject.semester == semester,
+            )
+            .order_by(
+                Student.last_name,
+                Student.first_name,
+                Student.id,
+                AcademicLevelSubject.code,
+            )
+        )
+        if class_id:
+            stmt = stmt.where(Student.class_id == class_id)
+        else:
+            stmt = stmt.where(Student.level_id == level_id)
+
+        rows = self.session.execute(stmt).all()
+        date_generated = self.format_generation_date()
+        cohort = []
+
+        for _, student_rows in groupby(rows, key=lambda row: row.id):
+            student_rows = list(student_rows)
+            first = student_rows[0]
+            student_name = f"{first.first_name} {first.last_name}"
+
+            data = {
+                "student_name": student_name,
+                "semester": semester.value,
+                "academic_session": academic_session,
+                "date_generated": date_generated,
+                "result_list": [
+                    self.build_result_row(row.code, row.name, row.total_score)
+                    for row in student_rows
+                ],
+            }
+            file_name = f"{student_name} {first.student_id} {academic_session} {semester.value} semester results"
+            cohort.append((data, file_name))
+
+        return cohort
+
+    def stream_cohort_results_zip(
+        self,
+        academic_session: str,
+        semester: Semester,
+        class_id: UUID | None = None,
+        level_id: UUID | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Render results PDFs for a whole class or level and stream them as a ZIP archive.
+        Data is gathered eagerly so the archive can be streamed after the request
+        session has closed; rendering happens lazily in the PDF process pool.
+        """
+        cohort = self.generate_cohort_results(
+            academic_session, semester, class_id, level_id
+        )
+        return stream_zip(render_in_pool(cohort, "results"))
 
-        return self.pdf_service.render_pdf(data, file_name)
+    def build_result_row(
+        self, course_code: str, course_title: str, total_score: int | None
+    ) -> Dict:
+        return {
+            "course_code": course_code,
+            "course_title": course_title,
+            "total_score": total_score,
+            "grading": (
+                self.generate_grading(total_score) if total_score is not None else None
+            ),
+        }
 
     @staticmethod
+    def format_generation_date() -> str:
+        today = date.today()
+        return f"{today.day} {today.strftime('%B')} {today.year}"
+
     def generate_grading(self, score: int) -> str:
-        if score >= 70:
-            return "A"
-        elif score >= 60:
-            return "B"
-        elif score >= 50:
-            return "C"
-        elif score >= 45:
-            return "D"
-        elif score >= 40:
-            return "E"
-        else:
-            return "F"
+        return self.grading_scale.grade_for(score)
+
+    def export_grade_audit(self, grade_id: UUID, export_format: str) -> ExportStream:
+        """Export a grade record."""
+        return self.export_service.export_audit(Grade, grade_id, export_format)
+
+    def export_total_grade_audit(
+        self, total_grade_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a total grade record."""
+        return self.export_service.export_audit(
+            TotalGrade, total_grade_id, export_format
+        )
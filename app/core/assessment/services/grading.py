@@ -0,0 +1,104 @@
+"""
+Grading scale shared by result generation and assessment analytics.
+
+Bands are (minimum score, grade) pairs ordered from the highest band down.
+A score falls in the first band whose minimum it meets.
+
+The active scale is stored in the grading_bands table and compiled once into
+sorted minimums so each lookup is a bisect rather than a chain of comparisons.
+Compiled scales are cached per process for GRADING_SCALE_CACHE_SECONDS.
+"""
+
+import hashlib
+import threading
+import time
+from bisect import bisect_right
+from typing import Iterable, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.assessment.models.assessment import GradingBand
+from app.settings import config
+
+GRADE_BANDS = (
+    (70, "A"),
+    (60, "B"),
+    (50, "C"),
+    (45, "D"),
+    (40, "E"),
+    (0, "F"),
+)
+
+
+class GradingScale:
+    """An immutable, precompiled grading scale."""
+
+    __slots__ = ("bands", "minimums", "grades", "version")
+
+    def __init__(self, bands: Iterable[Tuple[float, str]]):
+        ascending = sorted((float(minimum), grade) for minimum, grade in bands)
+        self.minimums = tuple(minimum for minimum, _ in ascending)
+        self.grades = tuple(grade for _, grade in ascending)
+        self.bands = tuple(reversed(ascending))
+
+        fingerprint = ",".join(f"{minimum:g}:{grade}" for minimum, grade in ascending)
+        self.version = hashlib.sha1(fingerprint.encode()).hexdigest()[:12]
+
+    def grade_for(self, score: float) -> str:
+        """Return the grade letter for a total score."""
+        index = bisect_right(self.minimums, score) - 1
+        return self.grades[max(index, 0)]
+
+    @property
+    def ordered_grades(self) -> Tuple[str, ...]:
+        """Grade letters from the highest band down."""
+        return tuple(grade for _, grade in self.bands)
+
+
+DEFAULT_SCALE = GradingScale(GRADE_BANDS)
+
+_cache_lock = threading.Lock()
+_cached_scale: GradingScale | None = None
+_cached_at: float = 0.0
+
+
+def load_grading_scale(session: Session) -> GradingScale:
+    """Compile the grading scale stored in the db, falling back to the default bands."""
+    rows = session.execute(select(GradingBand.min_score, GradingBand.grade)).all()
+    if not rows:
+        return DEFAULT_SCALE
+    return GradingScale((row.min_score, row.grade) for row in rows)
+
+
+def get_grading_scale(session: Session) -> GradingScale:
+    """Return the active grading scale, compiling it at most once per cache window."""
+    global _cached_scale, _cached_at
+
+    scale = _cached_scale
+    if (
+        scale is not None
+        and time.monotonic() - _cached_at < config.GRADING_SCALE_CACHE_SECONDS
+    ):
+        return scale
+
+    with _cache_lock:
+        if (
+            _cached_scale is None
+            or time.monotonic() - _cached_at >= config.GRADING_SCALE_CACHE_SECONDS
+        ):
+            _cached_scale = load_grading_scale(session)
+            _cached_at = time.monotonic()
+        return _cached_scale
+
+
+def invalidate_grading_scale() -> None:
+    """Drop this process's compiled scale so the next lookup reloads it."""
+    global _cached_scale
+    with _cache_lock:
+        _cached_scale = None
+
+
+def grade_for_score(score: float) -> str:
+    """Return the grade letter for a total score on the default scale."""
+    return DEFAULT_SCALE.grade_for(score)
@@ -0,0 +1,77 @@
+from typing import Dict, List
+from uuid import uuid4
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.core.assessment.models.assessment import GradingBand
+from app.core.assessment.services.grading import (
+    GradingScale,
+    get_grading_scale,
+    invalidate_grading_scale,
+)
+from app.core.assessment.services.validators import AssessmentValidator
+
+
+class GradingScaleService:
+    """Reads and replaces the grading scale used for results and analytics."""
+
+    def __init__(self, session: Session, current_user=None):
+        self.session = session
+        self.current_user = current_user
+        self.validator = AssessmentValidator(session)
+
+    def get_scale(self) -> Dict:
+        """Return the active scale, highest band first."""
+        scale = get_grading_scale(self.session)
+        descriptions = dict(
+            self.session.execute(select(GradingBand.grade, GradingBand.description))
+            .tuples()
+            .all()
+        )
+        return self.serialize_scale(scale, descriptions)
+
+    def replace_scale(self, bands: List[Dict]) -> Dict:
+        """
+        Replace every band of the grading scale in one transaction.
+        Cached result summaries are keyed by the scale version, so summaries graded
+        on the old scale are no longer served once the new scale is in use.
+        Args:
+            bands: Dicts with grade, min_score and an optional description
+        Returns:
+            dict: The new scale, highest band first
+        """
+        self.validator.validate_grading_bands(bands)
+        actor_id = self.current_user.id
+
+        self.session.execute(delete(GradingBand))
+        self.session.add_all(
+            GradingBand(
+                id=uuid4(),
+                grade=band["grade"],
+                min_score=band["min_score"],
+                description=band.get("description"),
+                created_by=actor_id,
+                last_modified_by=actor_id,
+            )
+            for band in bands
+        )
+        self.session.commit()
+        invalidate_grading_scale()
+
+        scale = GradingScale((band["min_score"], band["grade"]) for band in bands)
+        descriptions = {band["grade"]: band.get("description") for band in bands}
+        return self.serialize_scale(scale, descriptions)
+
+    @staticmethod
+    def serialize_scale(scale: GradingScale, descriptions: Dict[str, str]) -> Dict:
+        return {
+            "version": scale.version,
+            "bands": [
+                {
+                    "grade": grade,
+                    "min_score": minimum,
+                    "description": descriptions.get(grade),
+                }
+                for minimum, grade in scale.bands
+            ],
+        }
@@ -0,0 +1,42 @@
+"""
+Keeps cached result summaries in step with enrollment, grade and total grade writes.
+
+Services that change enrollments, grades or total grades name the affected students
+through invalidate_after_commit, including set-based writes such as cascade
+archives that the ORM never sees. The students are collected on the session and
+their cached summaries are dropped once the transaction commits. A rollback
+discards the pending set, so summaries are never invalidated for writes that did
+not persist. The commit hooks live here, next to the only function that queues
+students, so they are registered whenever anything is pending.
+"""
+
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.assessment.models.assessment import Grade, TotalGrade
+from app.infra.db.redis_db.result_summaries import result_summary_cache
+
+PENDING_KEY = "result_summary_invalidations"
+RESULT_MODELS = (Grade, TotalGrade)
+
+
+def invalidate_after_commit(session: Session, student_ids: Iterable[UUID]) -> None:
+    """Drop the students' cached summaries once the session's transaction commits."""
+    student_ids = {student_id for student_id in student_ids if student_id is not None}
+    if student_ids:
+        session.info.setdefault(PENDING_KEY, set()).update(student_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_pending_students(session: Session) -> None:
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        result_summary_cache.invalidate_students(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_pending_students(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
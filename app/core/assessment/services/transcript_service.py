@@ -0,0 +1,375 @@
+from typing import Dict, Iterable, List
+from uuid import UUID
+from sqlalchemy import Numeric, case, cast, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.assessment.models.assessment import StudentTranscript, TotalGrade
+from app.core.curriculum.models.curriculum import StudentSubject
+from app.core.identity.factories.student import StudentFactory
+from app.core.identity.models.student import Student
+from app.core.rbac.services.role_service import RBACService
+from app.core.shared.models.enums import UserRoleName
+from app.core.shared.schemas.enums import Semester
+
+
+class TranscriptService:
+    """
+    Maintains the student_transcripts table: one row per student per term holding
+    the subject count, average, cumulative average and class position.
+
+    Rows are refreshed incrementally whenever a total grade changes, so serving a
+    multi-year transcript is a single indexed read on (student_id, session, semester).
+    A row keeps the class the student was in when the term was first written, so
+    promotions and class moves never rewrite past terms or their class positions.
+    """
+
+    def __init__(self, session: Session, current_user=None):
+        self.session = session
+        self.current_user = current_user
+        self.student_factory = StudentFactory(session, Student, current_user)
+
+    def get_transcript(self, student_id: UUID) -> Dict:
+        """Return a student's full transcript in chronological order."""
+        student = self.student_factory.get_student(student_id)
+        terms = (
+            self.session.execute(
+                select(StudentTranscript)
+                .where(StudentTranscript.student_id == student_id)
+                .order_by(
+                    StudentTranscript.academic_session, StudentTranscript.semester
+                )
+            )
+            .scalars()
+            .all()
+        )
+        return {
+            "student_id": student.id,
+            "student_name": f"{student.first_name} {student.last_name}",
+            "cumulative_average": terms[-1].cumulative_average if terms else None,
+            "terms": terms,
+        }
+
+    def refresh_for_student_subject(
+        self, student_id: UUID, student_subject_id: UUID
+    ) -> None:
+        """Refresh the transcript term a student subject belongs to."""
+        term = self.session.execute(
+            select(StudentSubject.academic_session, StudentSubject.semester).where(
+                StudentSubject.id == student_subject_id
+            )
+        ).one_or_none()
+        if term:
+            self.refresh_term(student_id, term.academic_session, term.semester)
+
+    def refresh_term(
+        self, student_id: UUID, academic_session: str, semester: Semester
+    ) -> None:
+        """
+        Recompute one student's row for a term, then the figures that depend on it:
+        the student's cumulative averages and the positions in their class.
+        Args:
+            student_id: Student whose total grades changed
+            academic_session: Academic session of the changed grades
+            semester: Semester of the changed grades
+        """
+        self.session.flush()
+
+        count, total = self.session.execute(
+            select(func.count(TotalGrade.id), func.sum(TotalGrade.total_score))
+            .join(StudentSubject, StudentSubject.id == TotalGrade.student_subject_id)
+            .where(
+                TotalGrade.student_id == student_id,
+                TotalGrade.is_archived == False,
+                StudentSubject.is_archived == False,
+                StudentSubject.academic_session == academic_session,
+                StudentSubject.semester == semester,
+            )
+        ).one()
+
+        term_filter = (
+            StudentTranscript.student_id == student_id,
+            StudentTranscript.academic_session == academic_session,
+            StudentTranscript.semester == semester,
+        )
+        class_id = self.session.scalar(
+            select(StudentTranscript.class_id).where(*term_filter)
+        )
+
+        if count:
+            if class_id is None:
+                class_id = self.session.scalar(
+                    select(Student.class_id).where(Student.id == student_id)
+                )
+            values = {
+                "subject_count": count,
+                "total_score": total,
+                "average": round(total / count, 2),
+            }
+            stmt = insert(StudentTranscript).values(
+                student_id=student_id,
+                academic_session=academic_session,
+                semester=semester,
+                class_id=class_id,
+                **values,
+            )
+            self.session.execute(
+                stmt.on_conflict_do_update(
+                    constraint="uq_student_transcripts_student_term",
+                    set_={**values, "last_modified_at": func.now()},
+                )
+            )
+        else:
+            self.session.execute(delete(StudentTranscript).where(*term_filter))
+
+        self.refresh_cumulative_averages(student_ids=[student_id])
+        self.refresh_class_positions({class_id} - {None}, academic_session, semester)
+
+    def refresh_students(self, student_ids: Iterable[UUID]) -> None:
+        """
+        Bring every term of the given students in line with their total grades,
+        using set-based statements. Only terms whose figures changed are written.
+        Used by bulk archives and restores, which change total grades, enrollments
+        and students without going through the total grade factory. Nothing is committed.
+        Args:
+            student_ids: Students whose grades, enrollments or archive status changed
+        """
+        student_ids = list(set(student_ids))
+        if not student_ids:
+            return
+        self.session.flush()
+
+        class_ids = set(self.remove_ungraded_terms(student_ids))
+        self.write_transcripts(student_ids)
+        class_ids.update(
+            self.session.scalars(
+                select(StudentTranscript.class_id).where(
+                    StudentTranscript.student_id.in_(student_ids)
+                )
+            )
+        )
+
+        self.refresh_cumulative_averages(student_ids=student_ids)
+        self.refresh_class_positions(class_ids - {None})
+
+    def remove_ungraded_terms(
+        self, student_ids: Iterable[UUID] | None = None
+    ) -> List[UUID | None]:
+        """
+        Delete transcript rows for terms with no active total grades left.
+        Args:
+            student_ids: Restrict to these students, or every student when None
+        Returns:
+            list: Class ids of the deleted rows
+        """
+        graded = (
+            select(TotalGrade.id)
+            .join(StudentSubject, StudentSubject.id == TotalGrade.student_subject_id)
+            .where(
+                TotalGrade.student_id == StudentTranscript.student_id,
+                TotalGrade.is_archived == False,
+                StudentSubject.is_archived == False,
+                StudentSubject.academic_session == StudentTranscript.academic_session,
+                StudentSubject.semester == StudentTranscript.semester,
+            )
+        )
+        stmt = delete(StudentTranscript).where(~graded.exists())
+        if student_ids is not None:
+            stmt = stmt.where(StudentTranscript.student_id.in_(list(student_ids)))
+
+        return self.session.scalars(stmt.returning(StudentTranscript.class_id)).all()
+
+    def refresh_cumulative_averages(
+        self, student_ids: Iterable[UUID] | None = None
+    ) -> None:
+        """
+        Recompute running cumulative averages with one windowed UPDATE.
+        The cumulative average is weighted by subject count, so it equals the
+        average of every subject taken up to and including the term.
+        Args:
+            student_ids: Restrict to these students, or every student when None
+        """
+        window = {
+            "partition_by": StudentTranscript.student_id,
+            "order_by": (
+                StudentTranscript.academic_session,
+                StudentTranscript.semester,
+            ),
+        }
+        running = select(
+            StudentTranscript.id,
+            (
+                func.round(
+                    cast(
+                        func.sum(StudentTranscript.total_score).over(**window)
+                        / func.sum(StudentTranscript.subject_count).over(**window),
+                        Numeric,
+                    ),
+                    2,
+                )
+            ).label("cumulative"),
+        )
+        if student_ids is not None:
+            running = running.where(StudentTranscript.student_id.in_(list(student_ids)))
+        running = running.subquery()
+
+        self.session.execute(
+            update(StudentTranscript)
+            .where(
+                StudentTranscript.id == running.c.id,
+                StudentTranscript.cumulative_average.is_distinct_from(
+                    running.c.cumulative
+                ),
+            )
+            .values(cumulative_average=running.c.cumulative)
+            .execution_options(synchronize_session=False)
+        )
+
+    def refresh_class_positions(
+        self,
+        class_ids: Iterable[UUID] | None = None,
+        academic_session: str | None = None,
+        semester: Semester | None = None,
+    ) -> None:
+        """
+        Rank active students within their class per term with one windowed UPDATE.
+        Tied averages share a position; archived students keep their transcript
+        but have no position and do not displace anyone.
+        Args:
+            class_ids: Restrict to these classes, or every class when None
+            academic_session: Restrict to one academic session
+            semester: Restrict to one semester
+        """
+        if class_ids is not None:
+            class_ids = list(class_ids)
+            if not class_ids:
+                return
+
+        active = Student.is_archived == False
+        ranked = (
+            select(
+                StudentTranscript.id,
+                case(
+                    (
+                        active,
+                        func.rank().over(
+                            partition_by=(
+                                StudentTranscript.class_id,
+                                StudentTranscript.academic_session,
+                                StudentTranscript.semester,
+                                Student.is_archived,
+                            ),
+                            order_by=StudentTranscript.average.desc(),
+                        ),
+                    ),
+                ).label("position"),
+            )
+            .join(Student, Student.id == StudentTranscript.student_id)
+            .where(StudentTranscript.class_id.is_not(None))
+        )
+        if class_ids is not None:
+            ranked = ranked.where(StudentTranscript.class_id.in_(class_ids))
+        if academic_session:
+            ranked = ranked.where(
+                StudentTranscript.academic_session == academic_session
+            )
+        if semester:
+            ranked = ranked.where(StudentTranscript.semester == semester)
+        ranked = ranked.subquery()
+
+        self.session.execute(
+            update(StudentTranscript)
+            .where(
+                StudentTranscript.id == ranked.c.id,
+                StudentTranscript.class_position.is_distinct_from(ranked.c.position),
+            )
+            .values(class_position=ranked.c.position)
+            .execution_options(synchronize_session=False)
+        )
+
+    def write_transcripts(self, student_ids: Iterable[UUID] | None = None) -> int:
+        """
+        Upsert transcript rows aggregated from active total grades with one
+        INSERT ... SELECT ... ON CONFLICT. New terms take the student's current
+        class; existing rows keep theirs and are only rewritten if their figures
+        changed.
+        Args:
+            student_ids: Restrict to these students, or every student when None
+        Returns:
+            int: Number of transcript rows inserted or changed
+        """
+        aggregate = (
+            select(
+                func.gen_random_uuid(),
+                TotalGrade.student_id,
+                Student.class_id,
+                StudentSubject.academic_session,
+                StudentSubject.semester,
+                func.count(TotalGrade.id),
+                func.sum(TotalGrade.total_score),
+                func.round(cast(func.avg(TotalGrade.total_score), Numeric), 2),
+            )
+            .join(StudentSubject, StudentSubject.id == TotalGrade.student_subject_id)
+            .join(Student, Student.id == TotalGrade.student_id)
+            .where(
+                TotalGrade.is_archived == False,
+                StudentSubject.is_archived == False,
+            )
+            .group_by(
+                TotalGrade.student_id,
+                Student.class_id,
+                StudentSubject.academic_session,
+                StudentSubject.semester,
+            )
+        )
+        if student_ids is not None:
+            aggregate = aggregate.where(TotalGrade.student_id.in_(list(student_ids)))
+
+        stmt = insert(StudentTranscript).from_select(
+            [
+                "id",
+                "student_id",
+                "class_id",
+                "academic_session",
+                "semester",
+                "subject_count",
+                "total_score",
+                "average",
+            ],
+            aggregate,
+        )
+        figures = ("subject_count", "total_score", "average")
+        result = self.session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_student_transcripts_student_term",
+                set_={
+                    **{name: stmt.excluded[name] for name in figures},
+                    "last_modified_at": func.now(),
+                },
+                where=tuple_(
+                    *(StudentTranscript.__table__.c[name] for name in figures)
+                ).is_distinct_from(tuple_(*(stmt.excluded[name] for name in figures))),
+            )
+        )
+        return result.rowcount
+
+    def rebuild_transcripts(self) -> int:
+        """
+        Bring every transcript row in line with total grades in four set-based
+        statements. Used to backfill the table and to repair it after bulk imports,
+        so it is limited to admins. Rows that already exist keep their class.
+        Returns:
+            int: Number of transcript rows inserted or changed
+        Raises:
+            AccessDenied: If the current user is not an admin or superuser
+        """
+        RBACService(self.session).require_role(
+            self.current_user, UserRoleName.ADMIN, UserRoleName.SUPERUSER
+        )
+        self.remove_ungraded_terms()
+        rows = self.write_transcripts()
+
+        self.refresh_cumulative_averages()
+        self.refresh_class_positions()
+        self.session.commit()
+        return rows
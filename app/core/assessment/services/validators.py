@@ -11,6 +11,7 @@ from app.core.shared.exceptions import (
     SessionYearFormatError,
     FutureYearError,
     InvalidSessionRangeError,
+    InvalidGradingScaleError,
 )
 
 
@@ -42,6 +43,24 @@ class AssessmentValidator:
             raise ScoreExceedsMaxError(entry=value, max_score=max_score)
         return value
 
+    @staticmethod
+    def validate_grading_bands(bands: list) -> list:
+        """Ensure a grading scale covers every score from 0 with distinct bands."""
+        if not bands:
+            raise InvalidGradingScaleError("at least one band is required")
+
+        grades = [band["grade"] for band in bands]
+        minimums = [band["min_score"] for band in bands]
+        if len(set(grades)) != len(grades):
+            raise InvalidGradingScaleError("each grade can only appear once")
+        if len(set(minimums)) != len(minimums):
+            raise InvalidGradingScaleError("each band needs a distinct minimum score")
+        if any(minimum < 0 or minimum > 100 for minimum in minimums):
+            raise InvalidGradingScaleError("minimum scores must be between 0 and 100")
+        if min(minimums) != 0:
+            raise InvalidGradingScaleError("the lowest band must start at 0")
+        return bands
+
     @staticmethod
     def validate_academic_session(value: str) -> str:
         """Ensure session year is current and well-formatted."""
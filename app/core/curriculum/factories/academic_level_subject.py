@@ -21,7 +21,6 @@ from app.core.shared.exceptions import (
     EntityNotFoundError,
     ArchiveDependencyError,
     UniqueViolationError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.maps.error_map import error_map
 
@@ -191,17 +190,9 @@ class AcademicLevelSubjectFactory(BaseFactory):
             academic_level_subject_id (UUID): ID of AcademicLevelSubject to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, academic_level_subject_id
+            self.delete_service.check_safe_delete(
+                self.model, academic_level_subject_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=academic_level_subject_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             return self.repository.delete(academic_level_subject_id)
 
         except EntityNotFoundError as e:
@@ -254,17 +245,9 @@ class AcademicLevelSubjectFactory(BaseFactory):
             academic_level_subject_id: ID of AcademicLevelSubject to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, academic_level_subject_id
+            self.delete_service.check_safe_delete(
+                self.model, academic_level_subject_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=academic_level_subject_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete_archive(academic_level_subject_id)
 
         except EntityNotFoundError as e:
@@ -2,6 +2,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
+from app.core.assessment.services.result_cache import invalidate_after_commit
 from app.core.curriculum.models.curriculum import StudentSubject
 from app.core.curriculum.services.curriculum_service import CurriculumService
 from app.core.curriculum.services.validators import CurriculumValidator
@@ -13,6 +14,10 @@ from app.core.shared.factory.base_factory import BaseFactory
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
 from app.core.shared.services.lifecycle_service.delete_service import DeleteService
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 from app.core.shared.exceptions.decorators.resolve_fk_violation import (
     resolve_fk_on_create,
     resolve_fk_on_delete,
@@ -21,7 +26,6 @@ from app.core.shared.exceptions import (
     EntityNotFoundError,
     UniqueViolationError,
     ArchiveDependencyError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.maps.error_map import error_map
 
@@ -29,6 +33,14 @@ from app.core.shared.exceptions.maps.error_map import error_map
 class StudentSubjectFactory(BaseFactory):
     """Factory class for managing StudentSubject operations."""
 
+    FILTER_FIELDS = [
+        "academic_session",
+        "semester",
+        "is_active",
+        "student_id",
+        "academic_level_subject_id",
+    ]
+
     def __init__(self, session: Session, model=StudentSubject, current_user=None):
         super().__init__(current_user)
         """Initialize factory.
@@ -44,6 +56,7 @@ class StudentSubjectFactory(BaseFactory):
         self.service = CurriculumService(session, current_user)
         self.delete_service = DeleteService(self.model, session)
         self.archive_service = ArchiveService(session, current_user)
+        self.export_service = ExportService(session, current_user)
         self.error_details = error_map.get(self.model)
         self.entity_model, self.display_name = self.error_details
         self.actor_id: UUID = self.get_actor_id()
@@ -57,6 +70,11 @@ class StudentSubjectFactory(BaseFactory):
             display_name=self.display_name,
         )
 
+    def invalidate_results(self, student_subject: StudentSubject | None) -> None:
+        """Drop the cached result summaries affected by an enrollment write."""
+        if student_subject is not None:
+            invalidate_after_commit(self.session, [student_subject.student_id])
+
     @resolve_unique_violation(
         {
             "student_subjects_student_id_academic_level_subject_id_acade_key": (
@@ -100,7 +118,9 @@ class StudentSubjectFactory(BaseFactory):
             created_by=self.actor_id,
             last_modified_by=self.actor_id,
         )
-        return self.repository.create(new_student_subject)
+        student_subject = self.repository.create(new_student_subject)
+        self.invalidate_results(student_subject)
+        return student_subject
 
     def get_student_subject(self, student_subject_id: UUID) -> StudentSubject:
         """Get a specific StudentSubject by ID.
@@ -119,14 +139,23 @@ class StudentSubjectFactory(BaseFactory):
         Returns:
             List[StudentSubject]: List of active StudentSubjects
         """
-        fields = [
-            "academic_session",
-            "semester",
-            "is_active",
-            "student_id",
-            "academic_level_subject_id",
-        ]
-        return self.repository.execute_query(fields, filters)
+        return self.repository.execute_query(self.FILTER_FIELDS, filters)
+
+    def export_student_subjects(
+        self, filters, export_format: str, compress: bool = False
+    ) -> ExportStream:
+        """Export all enrollments matching filters, ignoring pagination.
+        Args:
+            filters: Same filter params as the list endpoint
+            export_format: csv, excel or pdf
+            compress: Gzip the export
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        stmt = self.repository.filtered_query(self.FILTER_FIELDS, filters)
+        return self.export_service.export_set(
+            self.model, stmt, export_format, "Student subjects", compress
+        )
 
     def archive_student_subject(
         self, student_subject_id: UUID, reason
@@ -149,7 +178,11 @@ class StudentSubjectFactory(BaseFactory):
                     display_name=self.display_name,
                     related_entities=", ".join(failed_dependencies),
                 )
-            return self.repository.archive(student_subject_id, self.actor_id, reason)
+            student_subject = self.repository.archive(
+                student_subject_id, self.actor_id, reason
+            )
+            self.invalidate_results(student_subject)
+            return student_subject
 
         except EntityNotFoundError as e:
             self.raise_not_found(student_subject_id, e)
@@ -161,18 +194,12 @@ class StudentSubjectFactory(BaseFactory):
             student_subject_id (UUID): ID of StudentSubject to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, student_subject_id
+            self.delete_service.check_safe_delete(
+                self.model, student_subject_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=student_subject_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
+            student_subject = self.session.get(self.model, student_subject_id)
             self.repository.delete_archive(student_subject_id)
+            self.invalidate_results(student_subject)
 
         except EntityNotFoundError as e:
             self.raise_not_found(student_subject_id, e)
@@ -211,7 +238,9 @@ class StudentSubjectFactory(BaseFactory):
             StudentSubject: Restored StudentSubject record
         """
         try:
-            return self.repository.restore(student_subject_id)
+            student_subject = self.repository.restore(student_subject_id)
+            self.invalidate_results(student_subject)
+            return student_subject
         except EntityNotFoundError as e:
             self.raise_not_found(student_subject_id, e)
 
@@ -222,18 +251,12 @@ class StudentSubjectFactory(BaseFactory):
             student_subject_id: ID of StudentSubject to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, student_subject_id
+            self.delete_service.check_safe_delete(
+                self.model, student_subject_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=student_subject_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
+            student_subject = self.session.get(self.model, student_subject_id)
             self.repository.delete_archive(student_subject_id)
+            self.invalidate_results(student_subject)
 
         except EntityNotFoundError as e:
             self.raise_not_found(student_subject_id, e)
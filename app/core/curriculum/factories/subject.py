@@ -18,7 +18,6 @@ from app.core.shared.exceptions.decorators.resolve_fk_violation import (
 from app.core.shared.exceptions import (
     EntityNotFoundError,
     ArchiveDependencyError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.maps.error_map import error_map
 
@@ -158,18 +157,10 @@ class SubjectFactory(BaseFactory):
             subject_id (UUID): ID of subject to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, subject_id
+            self.delete_service.check_safe_delete(
+                self.model, subject_id, self.display_name
             )
 
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=subject_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
-
             return self.repository.delete(subject_id)
 
         except EntityNotFoundError as e:
@@ -214,17 +205,9 @@ class SubjectFactory(BaseFactory):
             subject_id: ID of subject to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, subject_id
+            self.delete_service.check_safe_delete(
+                self.model, subject_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=subject_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete_archive(subject_id)
 
         except EntityNotFoundError as e:
@@ -152,6 +152,9 @@ class SubjectEducatorFactory(BaseFactory):
             subject_educator_id (UUID): ID of SubjectEducator to delete
         """
         try:
+            self.delete_service.check_safe_delete(
+                self.model, subject_educator_id, self.display_name
+            )
             return self.repository.delete(subject_educator_id)
 
         except EntityNotFoundError as e:
@@ -205,6 +208,9 @@ class SubjectEducatorFactory(BaseFactory):
             subject_educator_id: ID of SubjectEducator to delete
         """
         try:
+            self.delete_service.check_safe_delete(
+                self.model, subject_educator_id, self.display_name
+            )
             self.repository.delete_archive(subject_educator_id)
 
         except EntityNotFoundError as e:
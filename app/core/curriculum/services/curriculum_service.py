@@ -12,7 +12,11 @@ from app.core.identity.models.student import Student
 from app.core.shared.exceptions.curriculum_errors import AcademicLevelMismatchError
 
 from app.core.shared.schemas.enums import Semester
-from app.core.shared.services.pdf_service.templates.course_list import CourseListPDF
+from app.core.shared.services.pdf_service.batch import render_pdf
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 
 
 class CurriculumService:
@@ -20,7 +24,7 @@ class CurriculumService:
         self.session = session
         self.current_user = current_user
         self.student_factory = StudentFactory(session, Student, current_user)
-        self.pdf_service = CourseListPDF()
+        self.export_service = ExportService(session, current_user)
 
     def check_academic_level(
         self, student_id: UUID, level_id: UUID, academic_level_subject_id: UUID
@@ -95,4 +99,18 @@ class CurriculumService:
 
         data = self.generate_enrollment_list(student_id, academic_session, semester)
 
-        return self.pdf_service.render_pdf(data, file_name)
+        return render_pdf("course_list", data, file_name)
+
+    def export_subject_audit(
+        self, subject_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a subject with its academic level assignments."""
+        return self.export_service.export_audit(Subject, subject_id, export_format)
+
+    def export_level_subject_audit(
+        self, level_subject_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export an academic level subject with its enrollments and educators."""
+        return self.export_service.export_audit(
+            AcademicLevelSubject, level_subject_id, export_format
+        )
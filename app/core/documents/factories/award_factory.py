@@ -161,9 +161,13 @@ class AwardFactory(BaseFactory):
         doc_service = DocumentService(self.session, self.current_user)
 
         try:
+            self.delete_service.check_safe_delete(
+                self.model, award_id, self.display_name
+            )
             award = self.get_award(award_id)
-            doc_service.remove_award_file(award)
+            s3_key = award.award_s3_key
             self.repository.delete(award_id)
+            doc_service.release_file(s3_key)
 
         except EntityNotFoundError as e:
             self.raise_not_found(award_id, e)
@@ -208,9 +212,13 @@ class AwardFactory(BaseFactory):
         """
         doc_service = DocumentService(self.session, self.current_user)
         try:
+            self.delete_service.check_safe_delete(
+                self.model, award_id, self.display_name
+            )
             award = self.get_archived_award(award_id)
-            doc_service.remove_award_file(award)
+            s3_key = award.award_s3_key
             self.repository.delete_archive(award_id)
+            doc_service.release_file(s3_key)
 
         except EntityNotFoundError as e:
             self.raise_not_found(award_id, e)
@@ -163,12 +163,16 @@ class DocumentFactory(BaseFactory):
             document_id (UUID): ID of Document to delete
         """
         try:
+            self.delete_service.check_safe_delete(
+                self.model, document_id, self.display_name
+            )
             doc = self.get_document(document_id)
-
-            # remove the s3 file for the document
-            doc_service.remove_document_file(doc)
+            s3_key = doc.document_s3_key
             self.repository.delete(document_id)
 
+            # release the s3 file for the document
+            doc_service.release_file(s3_key)
+
         except EntityNotFoundError as e:
             self.raise_not_found(document_id, e)
 
@@ -214,11 +218,15 @@ class DocumentFactory(BaseFactory):
         doc_service = DocumentService(self.session, self.current_user)
 
         try:
+            self.delete_service.check_safe_delete(
+                self.model, document_id, self.display_name
+            )
             doc = self.get_archived_document(document_id)
-
-            # remove the s3 file for the document
-            doc_service.remove_document_file(doc)
+            s3_key = doc.document_s3_key
             self.repository.delete_archive(document_id)
 
+            # release the s3 file for the document
+            doc_service.release_file(s3_key)
+
         except EntityNotFoundError as e:
             self.raise_not_found(document_id, e)
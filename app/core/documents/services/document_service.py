@@ -1,12 +1,16 @@
-from uuid import uuid4
-import magic
 from sqlalchemy.orm import Session
 
 from app.core.identity.models.student import Student
 from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.core.shared.services.file_storage.blob_storage import BlobStorage
 from app.core.shared.log_service.logger import logger
 from app.settings import config
 from app.core.documents.models.documents import StudentAward, StudentDocument
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
+from uuid import UUID
 
 
 class DocumentService:
@@ -14,6 +18,7 @@ class DocumentService:
         self.session = session
         self.current_user = current_user
         self.upload = S3Upload(session, self.current_user)
+        self.blobs = BlobStorage(session, self.upload)
 
         self.SUPPORTED_DOCUMENT_TYPES = {
             "image/png": "png",
@@ -27,28 +32,7 @@ class DocumentService:
 
         self.MIN_FILE_SIZE = 1 * self.upload.KB
         self.MAX_FILE_SIZE = 10 * self.upload.MB
-
-    @staticmethod
-    def generate_doc_key(
-        student: Student, doc_type: str, s3_folder: str, file_extension: str
-    ) -> str:
-        """
-        Generate a unique filename for the uploaded file.
-        Args:
-            student: Student object
-            s3_folder: S3 folder path (e.g., "student-documents/")
-            doc_type: Type of document being stored
-            file_extension: File extension
-        Returns:
-            str: Unique filename
-        """
-
-        unique_id = str(uuid4())[:8]
-
-        first_name = student.first_name
-        last_name = student.last_name
-
-        return f"{s3_folder}{doc_type}_{first_name}_{last_name}_{unique_id}.{file_extension}"
+        self.export_service = ExportService(session, current_user)
 
     def upload_award_file(self, file, student: Student, award: StudentAward):
         """
@@ -61,23 +45,27 @@ class DocumentService:
             dict: Upload result with success status and file info
         """
         try:
-            contents = self.upload.validate_file_upload(
+            upload = self.upload.validate_file_upload(
                 file,
                 self.MIN_FILE_SIZE,
                 self.MAX_FILE_SIZE,
                 self.SUPPORTED_DOCUMENT_TYPES,
             )
 
-            detected_type = magic.from_buffer(contents, mime=True)
-            file_extension = self.SUPPORTED_DOCUMENT_TYPES[detected_type]
-
             s3_folder = config.STUDENT_AWARDS_FOLDER
-            doc_type = "AWARD"
-
-            s3_key = self.generate_doc_key(student, doc_type, s3_folder, file_extension)
             award_key_column = "award_s3_key"
-
-            self.upload.s3_upload(contents=contents, key=s3_key)
+            previous_key = award.award_s3_key
+
+            stored = self.blobs.store(
+                upload.contents,
+                s3_folder,
+                upload.extension,
+                upload.content_type,
+                sha256=upload.sha256,
+            )
+            s3_key = stored.s3_key
+            # Released even when unchanged: the same bytes were just counted again
+            self.blobs.release(previous_key)
 
             logger.info(f"Award uploaded successfully for award {award.id}: {s3_key}")
 
@@ -85,8 +73,8 @@ class DocumentService:
 
             return {
                 "filename": s3_key.split("/")[-1],
-                "size": len(contents),
-                "file_type": detected_type,
+                "size": upload.size,
+                "file_type": upload.content_type,
             }
 
         except Exception as e:
@@ -101,9 +89,7 @@ class DocumentService:
         """
         try:
             s3_key = award.award_s3_key
-            self.upload.s3_client.delete_object(
-                Bucket=self.upload.AWS_BUCKET_NAME, Key=s3_key
-            )
+            self.blobs.release(s3_key)
 
             award.award_s3_key = None
             award.last_modified_by = self.current_user.id
@@ -127,22 +113,27 @@ class DocumentService:
             dict: Upload result with success status and file info
         """
         try:
-            contents = self.upload.validate_file_upload(
+            upload = self.upload.validate_file_upload(
                 file,
                 self.MIN_FILE_SIZE,
                 self.MAX_FILE_SIZE,
                 self.SUPPORTED_DOCUMENT_TYPES,
             )
 
-            detected_type = magic.from_buffer(contents, mime=True)
-            file_extension = self.SUPPORTED_DOCUMENT_TYPES[detected_type]
-            doc_type = document.document_type.value
-
             s3_folder = config.STUDENT_DOCUMENTS_FOLDER
-            s3_key = self.generate_doc_key(student, doc_type, s3_folder, file_extension)
             document_key_column = "document_s3_key"
-
-            self.upload.s3_upload(contents=contents, key=s3_key)
+            previous_key = document.document_s3_key
+
+            stored = self.blobs.store(
+                upload.contents,
+                s3_folder,
+                upload.extension,
+                upload.content_type,
+                sha256=upload.sha256,
+            )
+            s3_key = stored.s3_key
+            # Released even when unchanged: the same bytes were just counted again
+            self.blobs.release(previous_key)
 
             logger.info(
                 f"Document uploaded successfully for document {document.id}: {s3_key}"
@@ -152,8 +143,8 @@ class DocumentService:
 
             return {
                 "filename": s3_key.split("/")[-1],
-                "size": len(contents),
-                "file_type": detected_type,
+                "size": upload.size,
+                "file_type": upload.content_type,
             }
 
         except Exception as e:
@@ -168,9 +159,7 @@ class DocumentService:
         """
         try:
             s3_key = document.document_s3_key
-            self.upload.s3_client.delete_object(
-                Bucket=self.upload.AWS_BUCKET_NAME, Key=s3_key
-            )
+            self.blobs.release(s3_key)
 
             document.document_s3_key = None
             document.last_modified_by = self.current_user.id
@@ -182,3 +171,23 @@ class DocumentService:
             self.session.rollback()
             logger.error(f"Failed to file for document {document.id}: {str(e)}")
             raise
+
+    def release_file(self, s3_key: str | None) -> None:
+        """
+        Release the file of a record that is being deleted, removing the blob once
+        nothing else references it. Nothing is committed, so the release is part of
+        the same transaction as the deletion.
+        """
+        self.blobs.release(s3_key)
+
+    def export_award_audit(self, award_id: UUID, export_format: str) -> ExportStream:
+        """Export a student award record."""
+        return self.export_service.export_audit(StudentAward, award_id, export_format)
+
+    def export_document_audit(
+        self, document_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a student document record."""
+        return self.export_service.export_audit(
+            StudentDocument, document_id, export_format
+        )
@@ -10,13 +10,16 @@ from app.core.auth.services.password_service import PasswordService
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
 from app.core.shared.services.lifecycle_service.delete_service import DeleteService
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 from app.core.identity.services.validators import IdentityValidator
 from app.core.identity.models.guardian import Guardian
 from app.core.shared.exceptions.maps.error_map import error_map
 from app.core.shared.exceptions import (
     ArchiveDependencyError,
     EntityNotFoundError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.decorators.resolve_unique_violation import (
     resolve_unique_violation,
@@ -31,6 +34,10 @@ from app.core.shared.exceptions.decorators.resolve_fk_violation import (
 class GuardianFactory(BaseFactory):
     """Factory class for managing guardian operations."""
 
+    FILTER_FIELDS = [
+        "name",
+    ]
+
     def __init__(self, session: Session, model=Guardian, current_user=None):  #
         super().__init__(current_user)
         """Initialize factory with db session, model and current actor.
@@ -46,6 +53,7 @@ class GuardianFactory(BaseFactory):
         self.password_service = PasswordService(session)
         self.delete_service = DeleteService(self.model, session)
         self.archive_service = ArchiveService(session, current_user)
+        self.export_service = ExportService(session, current_user)
         self.rbac_service = RBACService(session)
         self.error_details = error_map.get(self.model)
         self.entity_model, self.display_name = self.error_details
@@ -124,8 +132,23 @@ class GuardianFactory(BaseFactory):
         Returns:
             List[guardian]: List of active guardians
         """
-        fields = ["name"]
-        return self.repository.execute_query(fields, filters)
+        return self.repository.execute_query(self.FILTER_FIELDS, filters)
+
+    def export_guardians(
+        self, filters, export_format: str, compress: bool = False
+    ) -> ExportStream:
+        """Export all guardian records matching filters, ignoring pagination.
+        Args:
+            filters: Same filter params as the list endpoint
+            export_format: csv, excel or pdf
+            compress: Gzip the export
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        stmt = self.repository.filtered_query(self.FILTER_FIELDS, filters)
+        return self.export_service.export_set(
+            self.model, stmt, export_format, "Guardians", compress
+        )
 
     @resolve_fk_on_update()
     @resolve_unique_violation(
@@ -206,16 +229,9 @@ class GuardianFactory(BaseFactory):
             guardian_id (UUID): ID of guardian to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, guardian_id
+            self.delete_service.check_safe_delete(
+                self.model, guardian_id, self.display_name
             )
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=guardian_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             return self.repository.delete(guardian_id)
 
         except EntityNotFoundError as e:
@@ -260,16 +276,9 @@ class GuardianFactory(BaseFactory):
             guardian_id: ID of guardian to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, guardian_id
+            self.delete_service.check_safe_delete(
+                self.model, guardian_id, self.display_name
             )
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=guardian_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
 
             self.repository.delete_archive(guardian_id)
 
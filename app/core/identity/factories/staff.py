@@ -9,6 +9,10 @@ from app.core.auth.services.password_service import PasswordService
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
 from app.core.shared.services.lifecycle_service.delete_service import DeleteService
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 from app.core.identity.services.validators import IdentityValidator
 from app.core.identity.models.staff import Staff, Educator, SupportStaff, AdminStaff
 from app.core.rbac.services.role_service import RBACService
@@ -17,7 +21,6 @@ from ...shared.exceptions import (
     ArchiveDependencyError,
     EntityNotFoundError,
     StaffTypeError,
-    DeletionDependencyError,
 )
 from ...shared.exceptions.decorators.resolve_unique_violation import (
     resolve_unique_violation,
@@ -32,6 +35,13 @@ from ...shared.exceptions.decorators.resolve_fk_violation import (
 class StaffFactory(BaseFactory):
     """Factory class for managing staff operations."""
 
+    FILTER_FIELDS = [
+        "name",
+        "staff_type",
+        "department_id",
+        "role_id",
+    ]
+
     def __init__(self, session: Session, model=Staff, current_user=None):
         super().__init__(current_user)
         """Initialize factory with db session, model and current actor.
@@ -48,6 +58,7 @@ class StaffFactory(BaseFactory):
         self.onboarding_service = OnboardingService()
         self.delete_service = DeleteService(self.model, session)
         self.archive_service = ArchiveService(session, current_user)
+        self.export_service = ExportService(session, current_user)
         self.rbac_service = RBACService(session)
         self.error_details = error_map.get(self.model)
         self.entity_model, self.display_name = self.error_details
@@ -142,8 +153,23 @@ class StaffFactory(BaseFactory):
         Returns:
             List[Staff]: List of active staffs
         """
-        fields = ["name", "staff_type", "department_id", "role_id"]
-        return self.repository.execute_query(fields, filters)
+        return self.repository.execute_query(self.FILTER_FIELDS, filters)
+
+    def export_staff(
+        self, filters, export_format: str, compress: bool = False
+    ) -> ExportStream:
+        """Export all staff records matching filters, ignoring pagination.
+        Args:
+            filters: Same filter params as the list endpoint
+            export_format: csv, excel or pdf
+            compress: Gzip the export
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        stmt = self.repository.filtered_query(self.FILTER_FIELDS, filters)
+        return self.export_service.export_set(
+            self.model, stmt, export_format, "Staff", compress
+        )
 
     @resolve_fk_on_update()
     @resolve_unique_violation(
@@ -232,16 +258,7 @@ class StaffFactory(BaseFactory):
             else:
                 model, display_name = Staff, "staff"
 
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                entity_model=model, target_id=staff_id
-            )
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=model,
-                    identifier=staff_id,
-                    display_name=display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
+            self.delete_service.check_safe_delete(model, staff_id, display_name)
 
             return self.repository.delete(staff_id)
 
@@ -296,16 +313,7 @@ class StaffFactory(BaseFactory):
             else:
                 model, display_name = Staff, "staff"
 
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                entity_model=model, target_id=staff_id
-            )
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=model,
-                    identifier=staff_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
+            self.delete_service.check_safe_delete(model, staff_id, display_name)
 
             self.repository.delete_archive(staff_id)
 
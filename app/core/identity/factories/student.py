@@ -7,6 +7,10 @@ from app.core.auth.services.password_service import PasswordService
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
 from app.core.shared.services.lifecycle_service.delete_service import DeleteService
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 from app.core.identity.services.validators import IdentityValidator
 from app.core.identity.models.student import Student
 from app.core.rbac.services.role_service import RBACService
@@ -14,7 +18,6 @@ from ...shared.exceptions.maps.error_map import error_map
 from ...shared.exceptions import (
     ArchiveDependencyError,
     EntityNotFoundError,
-    DeletionDependencyError,
 )
 from ...shared.exceptions.decorators.resolve_unique_violation import (
     resolve_unique_violation,
@@ -30,6 +33,16 @@ from ...shared.schemas.enums import UserRoleName
 class StudentFactory(BaseFactory):
     """Factory class for managing student operations."""
 
+    FILTER_FIELDS = [
+        "name",
+        "student_id",
+        "level_id",
+        "department_id",
+        "is_graduated",
+        "graduation_year",
+        "guardian_id",
+    ]
+
     def __init__(self, session: Session, model=Student, current_user=None):
         super().__init__(current_user)
         """Initialize factory with db session, model and current actor.
@@ -47,6 +60,7 @@ class StudentFactory(BaseFactory):
 
         self.delete_service = DeleteService(model, session)
         self.archive_service = ArchiveService(session, current_user)
+        self.export_service = ExportService(session, current_user)
         self.error_details = error_map.get(model)
         self.entity_model, self.display_name = self.error_details
         self.actor_id: UUID = self.get_actor_id()
@@ -121,16 +135,23 @@ class StudentFactory(BaseFactory):
         Returns:
             List[student]: List of active students
         """
-        fields = [
-            "name",
-            "student_id",
-            "level_id",
-            "department_id",
-            "is_graduated",
-            "graduation_year",
-            "guardian_id",
-        ]
-        return self.repository.execute_query(fields, filters)
+        return self.repository.execute_query(self.FILTER_FIELDS, filters)
+
+    def export_students(
+        self, filters, export_format: str, compress: bool = False
+    ) -> ExportStream:
+        """Export all student records matching filters, ignoring pagination.
+        Args:
+            filters: Same filter params as the list endpoint
+            export_format: csv, excel or pdf
+            compress: Gzip the export
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        stmt = self.repository.filtered_query(self.FILTER_FIELDS, filters)
+        return self.export_service.export_set(
+            self.model, stmt, export_format, "Students", compress
+        )
 
     @resolve_fk_on_update()
     def update_student(self, student_id: UUID, data: dict) -> Student:
@@ -200,16 +221,9 @@ class StudentFactory(BaseFactory):
             student_id (UUID): ID of student to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, student_id
+            self.delete_service.check_safe_delete(
+                self.model, student_id, self.display_name
             )
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=student_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
 
             return self.repository.delete(student_id)
 
@@ -264,16 +278,9 @@ class StudentFactory(BaseFactory):
             student_id: ID of student to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, student_id
+            self.delete_service.check_safe_delete(
+                self.model, student_id, self.display_name
             )
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=student_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete_archive(student_id)
 
         except EntityNotFoundError as e:
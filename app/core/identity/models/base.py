@@ -19,6 +19,7 @@ class UserBase(Base, AuditMixins, TimeStampMixins, ArchiveMixins):
     last_name: Mapped[str] = mapped_column(String(30))
     gender: Mapped[Gender] = mapped_column(Enum(Gender, name="gender"))
     profile_s3_key: Mapped[str] = mapped_column(String(200), nullable=True)
+    profile_thumbnails_ready: Mapped[bool] = mapped_column(Boolean, default=False)
 
     last_login: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     exported: Mapped[bool] = mapped_column(Boolean, default=False)
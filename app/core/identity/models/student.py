@@ -130,6 +130,15 @@ class Student(UserBase):
         return f"Student(name={self.first_name} {self.last_name}, class={self.class_})"
 
 
+class StudentIdCounter(Base):
+    """Last student ID serial allocated for each session start year"""
+
+    __tablename__ = "student_id_counters"
+
+    session_start_year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_serial: Mapped[int] = mapped_column(Integer, default=0)
+
+
 from app.core.documents.models.documents import StudentDocument, StudentAward
 from app.core.identity.models.guardian import Guardian
 from app.core.academic_structure.models import AcademicLevel, Classes, StudentDepartment
@@ -48,6 +48,24 @@ class StudentCreate(StudentBase):
     )
 
 
+class BulkOnboardingFailure(BaseModel):
+    row: int
+    reason: str
+
+
+class OnboardedStudent(BaseModel):
+    row: int
+    id: UUID
+    student_id: str
+
+
+class BulkOnboardingResponse(BaseModel):
+    """Students created by a bulk onboarding, and the rows rejected and why"""
+
+    created: List[OnboardedStudent]
+    failed: List[BulkOnboardingFailure]
+
+
 class StudentUpdate(StudentBase):
     """Used for updating students"""
 
@@ -1,8 +1,13 @@
 from uuid import UUID
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 from app.core.identity.models.guardian import Guardian
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
+from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 
 
 class GuardianService:
@@ -10,21 +15,26 @@ class GuardianService:
         self.session = session
         self.current_user = current_user
         self.repository = SQLAlchemyRepository(Guardian, self.session)
+        self.export_service = ExportService(session, current_user)
+        self.archive_service = ArchiveService(session, current_user)
 
     def archive_orphaned_guardians(self, reason: str):
+        """Archive every active guardian whose wards are all archived, in one transaction."""
         from app.core.identity.models.student import Student
 
-        orphaned_guardians = (
-            self.session.query(Guardian)
-            .filter(
+        orphaned_ids = self.session.execute(
+            select(Guardian.id).where(
                 and_(
                     Guardian.is_archived == False,
                     ~Guardian.wards.any(Student.is_archived == False),
                 )
             )
-            .all()
-        )
+        ).scalars()
 
-        for guardian in orphaned_guardians:
-            guardian.archive(self.current_user, reason)
-            self.session.commit()
+        return self.archive_service.bulk_archive(Guardian, list(orphaned_ids), reason)
+
+    def export_guardian_audit(
+        self, guardian_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a guardian's record together with their wards."""
+        return self.export_service.export_audit(Guardian, guardian_id, export_format)
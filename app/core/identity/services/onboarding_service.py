@@ -0,0 +1,247 @@
+import csv
+import io
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List
+from uuid import uuid4
+
+from openpyxl import load_workbook
+from pydantic import ValidationError
+from sqlalchemy import insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.academic_structure.models import AcademicLevel
+from app.core.auth.services.password_service import PasswordService
+from app.core.identity.models.guardian import Guardian
+from app.core.identity.models.student import Student
+from app.core.identity.schemas.student import StudentCreate
+from app.core.identity.services.student_service import StudentService
+from app.core.identity.services.validators import IdentityValidator
+from app.core.rbac.services.role_service import RBACService
+from app.core.shared.exceptions import (
+    BulkOnboardingError,
+    FileTooLargeError,
+    InvalidOnboardingInputError,
+    KademiaError,
+)
+from app.core.shared.schemas.enums import UserRoleName
+from app.core.shared.services.file_storage.s3_upload import MB
+from app.settings import config
+
+
+class StudentOnboardingService:
+    """
+    Service for creating many students in one request.
+
+    Work that create_student repeats per student is done once per batch: the
+    student role is resolved once, guardians and levels are checked with one
+    query, student IDs are reserved in a block per session year and the rows are
+    inserted together. Passwords are hashed on a thread pool, since bcrypt
+    releases the GIL while hashing.
+    """
+
+    def __init__(self, session: Session, current_user):
+        self.session = session
+        self.current_user = current_user
+        self.validator = IdentityValidator()
+        self.rbac_service = RBACService(session)
+        self.student_service = StudentService(session, current_user)
+
+    @staticmethod
+    def read_upload(stream: BinaryIO) -> bytes:
+        """
+        Read an uploaded file of at most BULK_ONBOARDING_MAX_FILE_MB. A spooled
+        file's size is checked before anything is read, and no more than one byte
+        past the limit is ever read from any other stream.
+        """
+        max_size = config.BULK_ONBOARDING_MAX_FILE_MB * MB
+        threshold = f"{config.BULK_ONBOARDING_MAX_FILE_MB}MB"
+        if stream.seekable():
+            size = stream.seek(0, 2)
+            stream.seek(0)
+            if size > max_size:
+                raise FileTooLargeError(size=size, threshold=threshold)
+
+        contents = stream.read(max_size + 1)
+        if len(contents) > max_size:
+            raise FileTooLargeError(size=len(contents), threshold=threshold)
+        return contents
+
+    @staticmethod
+    def read_rows(filename: str, contents: bytes) -> List[Dict[str, Any]]:
+        """
+        Read student rows from a CSV or XLSX file with a header row.
+        Blank rows are skipped.
+        """
+        suffix = Path(filename or "").suffix.lower()
+        try:
+            if suffix == ".csv":
+                rows = csv.DictReader(io.StringIO(contents.decode("utf-8-sig")))
+                records = [dict(row) for row in rows]
+            elif suffix == ".xlsx":
+                sheet = load_workbook(
+                    io.BytesIO(contents), read_only=True, data_only=True
+                ).active
+                values = sheet.iter_rows(values_only=True)
+                header = [str(cell).strip() for cell in next(values, ()) if cell]
+                records = [dict(zip(header, row)) for row in values]
+            else:
+                raise InvalidOnboardingInputError("expected a .csv or .xlsx file")
+        except (UnicodeDecodeError, csv.Error, OSError, ValueError) as e:
+            raise InvalidOnboardingInputError(f"{filename} could not be read ({e})")
+
+        return [
+            record
+            for record in records
+            if any(value not in (None, "") for value in record.values())
+        ]
+
+    def validate_row(self, record) -> StudentCreate:
+        """Parse one row and apply the same checks as create_student."""
+        data = (
+            record
+            if isinstance(record, StudentCreate)
+            else StudentCreate.model_validate(record)
+        )
+        data.first_name = self.validator.validate_name(data.first_name)
+        data.last_name = self.validator.validate_name(data.last_name)
+        data.date_of_birth = self.validator.validate_date(data.date_of_birth)
+        self.validator.validate_session_start_year(data.session_start_year)
+        return data
+
+    def existing_references(self, rows: Iterable[StudentCreate]) -> set:
+        """
+        Find which of the rows' guardians and levels exist, with one query.
+        Returns:
+            set: ("guardian", id) and ("level", id) pairs that exist
+        """
+        rows = list(rows)
+        guardian_ids = {row.guardian_id for row in rows}
+        level_ids = {row.level_id for row in rows}
+        if not rows:
+            return set()
+
+        return set(
+            self.session.execute(
+                union_all(
+                    select(literal("guardian"), Guardian.id).where(
+                        Guardian.id.in_(guardian_ids), Guardian.is_archived == False
+                    ),
+                    select(literal("level"), AcademicLevel.id).where(
+                        AcademicLevel.id.in_(level_ids)
+                    ),
+                )
+            ).all()
+        )
+
+    @staticmethod
+    def hash_passwords(passwords: List[str]) -> List[str]:
+        with ThreadPoolExecutor(max_workers=config.PASSWORD_HASH_WORKERS) as pool:
+            return list(pool.map(PasswordService.hash_password, passwords))
+
+    def onboard(self, records: List) -> Dict[str, List]:
+        """
+        Create students from parsed rows, reporting rejected rows instead of failing
+        the batch. Rows are numbered from 1 in the order given.
+        Args:
+            records: StudentCreate models or dicts with the same fields
+        Returns:
+            dict: Created students and rejected rows with reasons
+        """
+        if len(records) > config.BULK_ONBOARDING_MAX_ROWS:
+            raise InvalidOnboardingInputError(
+                f"at most {config.BULK_ONBOARDING_MAX_ROWS} students per request"
+            )
+
+        failed, valid = [], []
+        for row_number, record in enumerate(records, start=1):
+            try:
+                valid.append((row_number, self.validate_row(record)))
+            except ValidationError as e:
+                reason = "; ".join(
+                    f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                    for error in e.errors()
+                )
+                failed.append({"row": row_number, "reason": reason})
+            except KademiaError as e:
+                failed.append({"row": row_number, "reason": e.user_message})
+
+        existing = self.existing_references(row for _, row in valid)
+        accepted = []
+        for row_number, row in valid:
+            if ("guardian", row.guardian_id) not in existing:
+                failed.append({"row": row_number, "reason": "Guardian not found"})
+            elif ("level", row.level_id) not in existing:
+                failed.append({"row": row_number, "reason": "Academic level not found"})
+            else:
+                accepted.append((row_number, row))
+
+        failed.sort(key=lambda failure: failure["row"])
+        if not accepted:
+            return {"created": [], "failed": failed}
+
+        return {"created": self.insert_students(accepted), "failed": failed}
+
+    def allocate_student_ids(self, rows: List[StudentCreate]) -> List[str]:
+        """Reserve student IDs for the rows, one block per session start year."""
+        by_year = defaultdict(list)
+        for position, row in enumerate(rows):
+            by_year[row.session_start_year].append(position)
+
+        student_ids = [None] * len(rows)
+        for year, positions in by_year.items():
+            for position, student_id in zip(
+                positions,
+                self.student_service.generate_student_ids(year, len(positions)),
+            ):
+                student_ids[position] = student_id
+        return student_ids
+
+    def insert_students(self, accepted: List) -> List[Dict]:
+        """
+        Hash passwords, allocate IDs and insert the accepted rows together.
+        IDs are allocated last: reserving them locks the year's counter row until
+        commit, which would otherwise hold up every student creation for that
+        year while the batch is hashed.
+        """
+        role_id = self.rbac_service.fetch_role_id(UserRoleName.STUDENT.value)
+        actor_id = self.current_user.id
+
+        password_hashes = self.hash_passwords(
+            [row.last_name.title() for _, row in accepted]
+        )
+        student_ids = self.allocate_student_ids([row for _, row in accepted])
+
+        values = [
+            {
+                "id": uuid4(),
+                "student_id": student_id,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "password_hash": password_hash,
+                "gender": row.gender,
+                "guardian_id": row.guardian_id,
+                "session_start_year": row.session_start_year,
+                "date_of_birth": row.date_of_birth,
+                "level_id": row.level_id,
+                "current_role_id": role_id,
+                "created_by": actor_id,
+                "last_modified_by": actor_id,
+            }
+            for (_, row), student_id, password_hash in zip(
+                accepted, student_ids, password_hashes
+            )
+        ]
+
+        try:
+            self.session.execute(insert(Student), values)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise BulkOnboardingError(str(e))
+
+        return [
+            {"row": row_number, "id": value["id"], "student_id": value["student_id"]}
+            for (row_number, _), value in zip(accepted, values)
+        ]
@@ -1,8 +1,13 @@
-import magic
-from uuid import uuid4
-from typing import Dict, Any
+import redis
+from uuid import UUID, uuid4
+from typing import Dict, Any, List
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.shared.schemas.enums import ThumbnailSize
+from app.core.shared.services.export_service.job_service import ExportJobService
+from app.core.shared.services.export_service.jobs import PROFILE_PICTURE_MODELS
 from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.core.shared.services.file_storage.thumbnails import thumbnail_key
 from app.core.shared.log_service.logger import logger
 from app.settings import config
 
@@ -12,6 +17,7 @@ class ProfilePictureService:
         self.session = session
         self.current_user = current_user
         self.upload = S3Upload(session, current_user=current_user)
+        self.job_service = ExportJobService(session, current_user)
 
         self.SUPPORTED_IMAGE_TYPES = {
             "image/png": "png",
@@ -34,35 +40,92 @@ class ProfilePictureService:
         """
         try:
 
-            contents = self.upload.validate_file_upload(
+            upload = self.upload.validate_file_upload(
                 file, self.MIN_FILE_SIZE, self.MAX_FILE_SIZE, self.SUPPORTED_IMAGE_TYPES
             )
 
-            detected_type = magic.from_buffer(contents, mime=True)
-            file_extension = self.SUPPORTED_IMAGE_TYPES[detected_type]
-
             s3_folder = config.PROFILE_PICTURES_FOLDER
-            s3_key = self.generate_profile_pic_key(user, s3_folder, file_extension)
+            s3_key = self.generate_profile_pic_key(user, s3_folder, upload.extension)
             profile_pic_key_name = "profile_s3_key"
 
-            self.upload.s3_upload(contents=contents, key=s3_key)
+            self.upload.s3_upload(upload.contents, s3_key, upload.content_type)
 
             logger.info(
                 f"Profile picture uploaded successfully for user {user.id}: {s3_key}"
             )
 
+            user.profile_thumbnails_ready = False
             self.upload.save_key_in_db(user, s3_key, profile_pic_key_name)
+            self.queue_thumbnails(s3_key)
 
             return {
                 "filename": s3_key.split("/")[-1],
-                "size": len(contents),
-                "file_type": detected_type,
+                "size": upload.size,
+                "file_type": upload.content_type,
             }
 
         except Exception as e:
             logger.error(f"Profile picture upload failed for user {user.id}: {str(e)}")
             raise
 
+    def queue_thumbnails(self, s3_key: str) -> None:
+        """
+        Have the background workers render the ThumbnailSize variants of a new
+        picture. Until they exist only the original can be served, so a queue
+        outage is logged rather than failing the upload.
+        """
+        try:
+            self.job_service.enqueue("thumbnails", {"s3_key": s3_key})
+        except redis.RedisError as e:
+            logger.warning(f"Failed to queue thumbnails for {s3_key}: {str(e)}")
+
+    def queue_missing_thumbnails(self) -> int:
+        """
+        Queue thumbnails for every profile picture that has none yet, such as
+        pictures uploaded before thumbnails existed or whose job was never queued.
+        Returns:
+            int: Number of pictures queued
+        """
+        s3_keys = set()
+        for model in PROFILE_PICTURE_MODELS:
+            s3_keys.update(
+                self.session.scalars(
+                    select(model.profile_s3_key).where(
+                        model.profile_s3_key.is_not(None),
+                        model.profile_thumbnails_ready == False,
+                    )
+                )
+            )
+        for s3_key in sorted(s3_keys):
+            self.job_service.enqueue("thumbnails", {"s3_key": s3_key})
+        return len(s3_keys)
+
+    @staticmethod
+    def profile_pic_key(user, size: ThumbnailSize | None = None) -> str | None:
+        """
+        Key of a user's profile picture, or of one of its thumbnails once they
+        have been rendered. Until then the original is served at every size.
+        """
+        if size and user.profile_s3_key and user.profile_thumbnails_ready:
+            return thumbnail_key(user.profile_s3_key, size)
+        return user.profile_s3_key
+
+    def profile_pic_urls(
+        self, model, ids: List[UUID], size: ThumbnailSize | None = None
+    ) -> List[Dict]:
+        """
+        Presigned profile picture URLs for many users, fetched in one query.
+        Users without a picture get a null URL; unknown or archived ids are left out.
+        """
+        users = self.session.execute(
+            select(
+                model.id, model.profile_s3_key, model.profile_thumbnails_ready
+            ).where(model.id.in_(ids), model.is_archived == False)
+        ).all()
+        return self.upload.presigned_urls_for_records(
+            (user.id, self.profile_pic_key(user, size)) for user in users
+        )
+
     @staticmethod
     def generate_profile_pic_key(user, s3_folder: str, file_extension: str) -> str:
         """
@@ -91,11 +154,12 @@ class ProfilePictureService:
         """
         try:
             s3_key = user.profile_s3_key
-            self.upload.s3_client.delete_object(
-                Bucket=self.upload.AWS_BUCKET_NAME, Key=s3_key
-            )
+            self.upload.delete_object(s3_key)
+            for size in ThumbnailSize:
+                self.upload.delete_object(thumbnail_key(s3_key, size))
 
             user.profile_s3_key = None
+            user.profile_thumbnails_ready = False
             user.last_modified_by = self.current_user.id
             self.session.commit()
 
@@ -8,6 +8,10 @@ from app.core.identity.models.staff import Staff, Educator
 from app.core.shared.exceptions import CascadeArchivalError
 from app.core.shared.models.enums import StaffAvailability, StaffType
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 
 
 class StaffService:
@@ -16,6 +20,7 @@ class StaffService:
         self.current_user = current_user
         self.factory = StaffFactory(session, Staff, current_user=current_user)
         self.archive_service = ArchiveService(session, current_user=current_user)
+        self.export_service = ExportService(session, current_user)
 
     def unassign_staff_roles(self, staff_id: UUID):
         """Remove staff from manager, mentorship and supervision roles before archival"""
@@ -54,9 +59,11 @@ class StaffService:
             self.unassign_staff_roles(staff_id)
 
             if staff.staff_type == StaffType.EDUCATOR:
-                self.archive_service.cascade_archive_object(Educator, staff, reason)
+                return self.archive_service.cascade_archive_object(
+                    Educator, staff, reason
+                )
             else:
-                self.archive_service.cascade_archive_object(Staff, staff, reason)
+                return self.archive_service.cascade_archive_object(Staff, staff, reason)
 
         except Exception as e:
             self.session.rollback()
@@ -81,3 +88,7 @@ class StaffService:
     ):
         """Update staff availability status."""
         return self.factory.update_staff(staff_id, {"availability": availability.value})
+
+    def export_staff(self, staff_id: UUID, export_format: str) -> ExportStream:
+        """Export a staff member's record together with their role changes."""
+        return self.export_service.export_audit(Staff, staff_id, export_format)
@@ -1,13 +1,20 @@
 from uuid import UUID
+from typing import List
 from sqlalchemy.orm import Session
-from sqlalchemy import func, Integer, update
+from sqlalchemy import func, Integer, select, update
+from sqlalchemy.dialects.postgresql import insert
 
 
 from app.core.identity.factories.student import StudentFactory
-from app.core.identity.models.student import Student
-from app.core.shared.exceptions import CascadeArchivalError
+from app.core.identity.models.student import Student, StudentIdCounter
+from app.core.shared.exceptions import CascadeArchivalError, EmptyBulkSelectionError
 from app.core.shared.exceptions.academic_structure_errors import ClassLevelMismatchError
+from app.core.shared.schemas.shared_models import BulkArchiveRequest, BulkSelection
 from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 
 
 class StudentService:
@@ -18,36 +25,37 @@ class StudentService:
             session=self.session, current_user=self.current_user
         )
         self.archive_service = ArchiveService(session, current_user=current_user)
+        self.export_service = ExportService(session, current_user)
 
-    def unassign_student_roles(self, student_id: UUID):
-        """Remove student from representative  roles before archival"""
+    def unassign_student_roles(self, student_ids: List[UUID]):
+        """Remove students from representative roles before archival"""
         from app.core.academic_structure.models import StudentDepartment, Classes
 
         # set student rep to NULL for any departments they represent
         dep_rep_stmt = (
             update(StudentDepartment)
-            .where(StudentDepartment.student_rep_id == student_id)
+            .where(StudentDepartment.student_rep_id.in_(student_ids))
             .values(student_rep_id=None)
         )
 
         # set assistant student rep to NULL for any departments they represent
         asst_dep_rep_stmt = (
             update(StudentDepartment)
-            .where(StudentDepartment.assistant_rep_id == student_id)
+            .where(StudentDepartment.assistant_rep_id.in_(student_ids))
             .values(assistant_rep_id=None)
         )
 
         # set student rep to NULL for any classes they represent
         cls_rep_stmt = (
             update(Classes)
-            .where(Classes.student_rep_id == student_id)
+            .where(Classes.student_rep_id.in_(student_ids))
             .values(student_rep_id=None)
         )
 
         # set assistant student rep to NULL for any classes they represent
         asst_cls_rep_stmt = (
             update(Classes)
-            .where(Classes.assistant_rep_id == student_id)
+            .where(Classes.assistant_rep_id.in_(student_ids))
             .values(assistant_rep_id=None)
         )
 
@@ -59,43 +67,126 @@ class StudentService:
     def cascade_archive_student(self, student_id: UUID, reason: str):
         student = self.factory.get_student(student_id)
         try:
-            self.unassign_student_roles(student_id)
-            self.archive_service.cascade_archive_object(Student, student, reason)
+            self.unassign_student_roles([student_id])
+            return self.archive_service.cascade_archive_object(Student, student, reason)
 
         except Exception as e:
             self.session.rollback()
             raise CascadeArchivalError(str(e))
 
-    def generate_student_id(self, start_year: int):
+    def select_students(
+        self, selection: BulkSelection, filters, operation: str, archived: bool
+    ) -> List[UUID]:
+        """Ids named in a bulk request, or else those of the students matching filters."""
+        if selection.ids:
+            return selection.ids
+
+        criteria = filters.model_dump(
+            exclude_unset=True, exclude={"limit", "offset", "order_by", "order_dir"}
+        )
+        if not any(value is not None for value in criteria.values()):
+            raise EmptyBulkSelectionError(operation=operation)
+        return self.factory.repository.filtered_ids(
+            self.factory.FILTER_FIELDS, filters, archived=archived
+        )
+
+    def bulk_archive_students(self, payload: BulkArchiveRequest, filters):
         """
-        Generate a unique student ID.
+        Archive many students at once, e.g. a graduating cohort.
+        Students with active records are skipped unless payload.cascade is set,
+        in which case their records are archived too. Archived students are
+        removed from any representative roles they hold.
+        """
+        student_ids = self.select_students(payload, filters, "archive", archived=False)
+        return self.archive_service.bulk_archive(
+            Student,
+            student_ids,
+            payload.reason,
+            cascade=payload.cascade,
+            on_archive=self.unassign_student_roles,
+        )
+
+    def bulk_restore_students(self, selection: BulkSelection, filters):
+        """Restore many archived students at once."""
+        student_ids = self.select_students(selection, filters, "restore", archived=True)
+        return self.archive_service.bulk_restore(Student, student_ids)
+
+    @staticmethod
+    def format_student_id(start_year: int, serial: int) -> str:
+        """Student ID for a serial, e.g. SCH-25-00042 for 2025."""
+        return f"SCH-{str(start_year)[2:]}-{serial:05d}"
+
+    def allocate_serials(self, start_year: int, count: int = 1) -> range:
+        """
+        Reserve a block of student ID serials for a year from its counter row.
+        The increment is a single atomic UPDATE ... RETURNING, so concurrent
+        enrolments never get the same serial. A year's counter row is created on
+        first use, starting after the highest serial already issued.
         Args:
             start_year: Academic year start year
+            count: Number of serials to reserve
+        Returns:
+            range: The reserved serials
         """
-        school_code = "SCH"
-        year_code = str(start_year)[2:]
-        prefix = f"{school_code}-{year_code}-"
-        pattern = f"{prefix}%"
-
-        result = (
-            self.session.query(
-                func.max(
-                    func.cast(
-                        func.substring(Student.student_id, len(prefix) + 1), Integer
+        last_serial = self.session.scalar(
+            update(StudentIdCounter)
+            .where(StudentIdCounter.session_start_year == start_year)
+            .values(last_serial=StudentIdCounter.last_serial + count)
+            .returning(StudentIdCounter.last_serial)
+        )
+
+        if last_serial is None:
+            prefix = self.format_student_id(start_year, 0)[:-5]
+            issued = (
+                select(
+                    func.coalesce(
+                        func.max(
+                            func.cast(
+                                func.substring(Student.student_id, len(prefix) + 1),
+                                Integer,
+                            )
+                        ),
+                        0,
                     )
                 )
+                .where(
+                    Student.student_id.like(f"{prefix}%"),
+                    Student.session_start_year == start_year,
+                )
+                .scalar_subquery()
             )
-            .filter(
-                Student.student_id.like(pattern),
-                Student.session_start_year == start_year,
+            stmt = insert(StudentIdCounter).values(
+                session_start_year=start_year, last_serial=issued + count
             )
-            .scalar()
-        )
+            last_serial = self.session.scalar(
+                stmt.on_conflict_do_update(
+                    index_elements=[StudentIdCounter.session_start_year],
+                    set_={"last_serial": StudentIdCounter.last_serial + count},
+                ).returning(StudentIdCounter.last_serial)
+            )
+
+        return range(last_serial - count + 1, last_serial + 1)
+
+    def generate_student_id(self, start_year: int) -> str:
+        """
+        Generate a unique student ID.
+        Args:
+            start_year: Academic year start year
+        """
+        serial = self.allocate_serials(start_year)[0]
+        return self.format_student_id(start_year, serial)
 
-        next_serial = 1 if result is None else result + 1
-        formatted_serial = f"{next_serial:05d}"
-        student_id = f"{school_code}-{year_code}-{formatted_serial}"
-        return student_id
+    def generate_student_ids(self, start_year: int, count: int) -> List[str]:
+        """
+        Generate unique student IDs for a bulk enrolment in one round trip.
+        Args:
+            start_year: Academic year start year
+            count: Number of IDs needed
+        """
+        return [
+            self.format_student_id(start_year, serial)
+            for serial in self.allocate_serials(start_year, count)
+        ]
 
     def assign_department(self, stu_id: UUID, department_id: UUID | None = None):
         """Assign a student's department"""
@@ -126,3 +217,9 @@ class StudentService:
     def change_guardian(self, stu_id: UUID, guardian_id: UUID):
         """Change a student's guardian"""
         return self.factory.update_student(stu_id, {"guardian_id": guardian_id})
+
+    def export_student_audit(
+        self, student_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a student's record with their enrollments, grades, documents and progression history."""
+        return self.export_service.export_audit(Student, student_id, export_format)
@@ -147,7 +147,9 @@ class PromotionFactory(BaseFactory):
     def delete_promotion(self, promotion_id: UUID, is_archived=False) -> None:
         """Permanently delete a promotion record."""
         try:
-            self.delete_service.check_safe_delete(self.model, promotion_id, is_archived)
+            self.delete_service.check_safe_delete(
+                self.model, promotion_id, self.display_name
+            )
             return self.repository.delete(promotion_id)
 
         except EntityNotFoundError as e:
@@ -176,6 +178,9 @@ class PromotionFactory(BaseFactory):
     def delete_archived_promotion(self, promotion_id: UUID, is_archived=True) -> None:
         """Permanently delete an archived promotion record."""
         try:
+            self.delete_service.check_safe_delete(
+                self.model, promotion_id, self.display_name
+            )
             self.repository.delete_archive(promotion_id)
 
         except EntityNotFoundError as e:
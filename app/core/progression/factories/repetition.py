@@ -146,6 +146,9 @@ class RepetitionFactory(BaseFactory):
     def delete_repetition(self, repetition_id: UUID, is_archived=False) -> None:
         """Permanently delete a repetition record."""
         try:
+            self.delete_service.check_safe_delete(
+                self.model, repetition_id, self.display_name
+            )
             return self.repository.delete(repetition_id)
 
         except EntityNotFoundError as e:
@@ -180,6 +183,9 @@ class RepetitionFactory(BaseFactory):
     def delete_archived_repetition(self, repetition_id: UUID) -> None:
         """Permanently delete an archived repetition record."""
         try:
+            self.delete_service.check_safe_delete(
+                self.model, repetition_id, self.display_name
+            )
             self.repository.delete_archive(repetition_id)
 
         except EntityNotFoundError as e:
@@ -78,6 +78,56 @@ class PromotionDecision(BaseModel):
     )
 
 
+class BatchPromotionCreate(BaseModel):
+    """For promoting every active student in a level or a class"""
+
+    academic_session: str
+    notes: str | None = None
+    level_id: UUID | None = None
+    class_id: UUID | None = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        json_schema_extra={
+            "example": {
+                "academic_session": "2025/2026",
+                "notes": "End of session promotion",
+                "level_id": "00000000-0000-0000-0000-000000000000",
+            }
+        },
+    )
+
+
+class BatchPromotionApproval(BaseModel):
+    """For approving the pending promotions of a level or a class"""
+
+    academic_session: str
+    level_id: UUID | None = None
+    class_id: UUID | None = None
+    decision_reason: str | None = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        json_schema_extra={
+            "example": {
+                "academic_session": "2025/2026",
+                "class_id": "00000000-0000-0000-0000-000000000000",
+                "decision_reason": "Met promotion criteria",
+            }
+        },
+    )
+
+
+class BatchPromotionResponse(BaseModel):
+    """Promotion ids created or approved by a batch, and the records skipped"""
+
+    academic_session: str
+    succeeded: List[UUID]
+    failed: List[BulkFailure]
+
+
 class PromotionResponse(PromotionBase):
     """Response model for student promotions"""
 
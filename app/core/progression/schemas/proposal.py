@@ -0,0 +1,46 @@
+from app.core.shared.schemas.common_imports import *
+from app.core.shared.schemas.shared_models import *
+
+
+class ProgressionProposalRequest(BaseModel):
+    """For proposing promotions and repetitions for a level from session results"""
+
+    academic_session: str
+    level_id: UUID
+    pass_mark: float | None = Field(None, ge=0, le=100)
+    min_subjects: int = Field(1, ge=1)
+    dry_run: bool = True
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        json_schema_extra={
+            "example": {
+                "academic_session": "2025/2026",
+                "level_id": "00000000-0000-0000-0000-000000000000",
+                "pass_mark": 50,
+                "dry_run": True,
+            }
+        },
+    )
+
+
+class ProposedProgression(BaseModel):
+    student_id: UUID
+    average: float | None = None
+    enrolled_count: int
+    graded_count: int
+    target_level_id: UUID | None = None
+    reason: str | None = None
+
+
+class ProgressionProposalReport(BaseModel):
+    """Proposed promotions and repetitions, and the students left for staff to review"""
+
+    academic_session: str
+    level_id: UUID
+    pass_mark: float
+    dry_run: bool
+    promotions: List[ProposedProgression]
+    repetitions: List[ProposedProgression]
+    exceptions: List[ProposedProgression]
@@ -1,10 +1,15 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select
-from uuid import UUID
+from sqlalchemy import insert, select
+from typing import Dict, List
+from uuid import UUID, uuid4
 
 from app.core.progression.factories.promotion import PromotionFactory
 from app.core.progression.models.progression import Repetition, Promotion
+from app.core.shared.models.enums import ApprovalStatus
+from app.core.shared.services.approval_service.batch_decision_service import (
+    BatchDecisionService,
+)
 from app.core.shared.exceptions import (
     StudentToGraduateError,
     EmptyFieldError,
@@ -12,6 +17,8 @@ from app.core.shared.exceptions import (
     LevelNotFinalError,
     EntityNotFoundError,
     NoResultError,
+    InvalidPromotionScopeError,
+    BatchPromotionError,
 )
 
 
@@ -20,6 +27,7 @@ class PromotionService:
         self.session = session
         self.current_user = current_user
         self.factory = PromotionFactory(self.session, Promotion, self.current_user)
+        self.decisions = BatchDecisionService(self.session, self.current_user)
         self.domain = "PROGRESSION"
 
     def generate_promotion_level(self, previous_level_id: UUID):
@@ -146,3 +154,169 @@ class PromotionService:
                     "status_completed_at": datetime.now(),
                 },
             )
+
+    def next_level_map(self) -> Dict[UUID, UUID | None]:
+        """
+        Map every academic level to the level a student is promoted into, from one
+        query over promotion ranks. Final levels and levels without a higher
+        rank map to None.
+        """
+        from app.core.academic_structure.models import AcademicLevel
+
+        levels = self.session.execute(
+            select(
+                AcademicLevel.id, AcademicLevel.promotion_rank, AcademicLevel.is_final
+            )
+        ).all()
+        level_by_rank = {level.promotion_rank: level.id for level in levels}
+
+        return {
+            level.id: (
+                None if level.is_final else level_by_rank.get(level.promotion_rank + 1)
+            )
+            for level in levels
+        }
+
+    @staticmethod
+    def batch_scope(data, student_model):
+        """The student filter of a batch: exactly one of level_id or class_id."""
+        if bool(data.level_id) == bool(data.class_id):
+            raise InvalidPromotionScopeError()
+        if data.level_id:
+            return student_model.level_id == data.level_id
+        return student_model.class_id == data.class_id
+
+    def create_batch_promotion(self, data) -> dict:
+        """
+        Create pending promotions for every active student in a level or class.
+        Next levels are resolved from one rank map and the records are inserted
+        together; students in a final level, without a higher level or with a
+        promotion for the session already are skipped.
+
+        Args:
+            data: Academic session, notes and the level or class to promote
+        Returns:
+            dict: Created promotion ids and the students skipped, with reasons
+        """
+        from app.core.identity.models.student import Student
+
+        students = self.session.execute(
+            select(Student.id, Student.level_id).where(
+                self.batch_scope(data, Student),
+                Student.is_archived == False,
+                Student.is_graduated == False,
+            )
+        ).all()
+        already_promoted = set(
+            self.session.scalars(
+                select(Promotion.student_id).where(
+                    Promotion.student_id.in_([student.id for student in students]),
+                    Promotion.academic_session == data.academic_session,
+                )
+            )
+        )
+        next_levels = self.next_level_map()
+
+        rows, failed = [], []
+        for student in students:
+            promoted_level_id = next_levels.get(student.level_id)
+            if student.id in already_promoted:
+                failed.append(
+                    {
+                        "id": student.id,
+                        "reason": f"Existing promotion record for the {data.academic_session} session",
+                    }
+                )
+            elif promoted_level_id is None:
+                failed.append(
+                    {
+                        "id": student.id,
+                        "reason": "No higher academic level to promote to",
+                    }
+                )
+            else:
+                rows.append(
+                    {
+                        "id": uuid4(),
+                        "student_id": student.id,
+                        "academic_session": data.academic_session,
+                        "notes": data.notes,
+                        "previous_level_id": student.level_id,
+                        "promoted_level_id": promoted_level_id,
+                        "status": ApprovalStatus.PENDING,
+                        "created_by": self.factory.actor_id,
+                        "last_modified_by": self.factory.actor_id,
+                    }
+                )
+
+        if rows:
+            try:
+                self.session.execute(insert(Promotion), rows)
+                self.session.commit()
+            except Exception as e:
+                self.session.rollback()
+                raise BatchPromotionError("creation", str(e))
+
+        return {
+            "academic_session": data.academic_session,
+            "succeeded": [row["id"] for row in rows],
+            "failed": failed,
+        }
+
+    def approve_promotions(
+        self, promotion_ids: List[UUID], decision_reason: str | None = None
+    ) -> dict:
+        """
+        Approve promotions and move their students to the promoted level,
+        with one UPDATE for the promotions and one for the students.
+
+        Args:
+            promotion_ids: IDs of the promotions to approve
+            decision_reason: Reason recorded on every approved promotion
+        Returns:
+            dict: Approved promotion ids and the ids that could not be approved
+        """
+        return self.decisions.decide(
+            Promotion, promotion_ids, ApprovalStatus.APPROVED, decision_reason
+        )
+
+    def action_promotion_records(self, data) -> dict:
+        """
+        Approve or reject many promotions at once.
+        Args:
+            data: Promotion ids, the decision and its reason
+        Returns:
+            dict: Decided promotion ids and failures per id
+        """
+        return self.decisions.decide(
+            Promotion, data.ids, data.status, data.decision_reason
+        )
+
+    def approve_batch_promotion(self, data) -> dict:
+        """
+        Approve every pending promotion of a session for a level or class.
+        Args:
+            data: Academic session, the level or class, and the decision reason
+        Returns:
+            dict: Approved promotion ids and any that could not be approved
+        """
+        from app.core.identity.models.student import Student
+
+        scope = self.batch_scope(data, Student)
+        if data.level_id:
+            scope = Promotion.previous_level_id == data.level_id
+
+        promotion_ids = list(
+            self.session.scalars(
+                select(Promotion.id)
+                .join(Student, Student.id == Promotion.student_id)
+                .where(
+                    scope,
+                    Promotion.academic_session == data.academic_session,
+                    Promotion.status == ApprovalStatus.PENDING,
+                    Promotion.is_archived == False,
+                )
+            )
+        )
+        result = self.approve_promotions(promotion_ids, data.decision_reason)
+        return {"academic_session": data.academic_session, **result}
@@ -0,0 +1,212 @@
+from typing import Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, distinct, func, insert, select, union
+from sqlalchemy.orm import Session
+
+from app.core.assessment.models.assessment import TotalGrade
+from app.core.curriculum.models.curriculum import StudentSubject
+from app.core.identity.models.student import Student
+from app.core.progression.models.progression import Promotion, Repetition
+from app.core.progression.services.promotion_service import PromotionService
+from app.core.shared.exceptions import BatchPromotionError
+from app.core.shared.models.enums import ApprovalStatus
+from app.settings import config
+
+
+class ProgressionProposalService:
+    """
+    Proposes promotions and repetitions for a level from session results.
+
+    Each student's session average comes from one aggregate query over total grades;
+    students at or above the pass mark are proposed for promotion and the rest for
+    repetition. Anything the rules cannot settle, including students with enrolled
+    subjects still ungraded, is reported as an exception for staff to review. Proposals are created as pending records, so every one still
+    goes through the usual approval.
+    """
+
+    def __init__(self, session: Session, current_user):
+        self.session = session
+        self.current_user = current_user
+        self.promotion_service = PromotionService(session, current_user)
+
+    def session_averages(self, level_id: UUID, academic_session: str) -> List:
+        """
+        Average total score for every active student in a level over the subjects
+        taken in a session, with the student's enrolled and graded subject-semester
+        counts. Students without results are included with a None average.
+        """
+        return self.session.execute(
+            select(
+                Student.id.label("student_id"),
+                func.avg(TotalGrade.total_score).label("average"),
+                func.count(distinct(StudentSubject.id)).label("enrolled_count"),
+                func.count(distinct(TotalGrade.student_subject_id)).label(
+                    "graded_count"
+                ),
+            )
+            .select_from(Student)
+            .outerjoin(
+                StudentSubject,
+                and_(
+                    StudentSubject.student_id == Student.id,
+                    StudentSubject.academic_session == academic_session,
+                    StudentSubject.is_archived == False,
+                ),
+            )
+            .outerjoin(
+                TotalGrade,
+                and_(
+                    TotalGrade.student_subject_id == StudentSubject.id,
+                    TotalGrade.is_archived == False,
+                ),
+            )
+            .where(
+                Student.level_id == level_id,
+                Student.is_archived == False,
+                Student.is_graduated == False,
+            )
+            .group_by(Student.id)
+        ).all()
+
+    def students_with_records(
+        self, student_ids: List[UUID], academic_session: str
+    ) -> set:
+        """Students that already have a promotion or repetition for the session."""
+        if not student_ids:
+            return set()
+
+        return set(
+            self.session.scalars(
+                union(
+                    select(Promotion.student_id).where(
+                        Promotion.student_id.in_(student_ids),
+                        Promotion.academic_session == academic_session,
+                    ),
+                    select(Repetition.student_id).where(
+                        Repetition.student_id.in_(student_ids),
+                        Repetition.academic_session == academic_session,
+                    ),
+                )
+            )
+        )
+
+    def propose(self, data) -> Dict:
+        """
+        Propose progression for every active student in a level.
+        Args:
+            data: Session, level, pass mark, minimum graded subject-semesters and dry run flag
+        Returns:
+            dict: Proposed promotions, repetitions and exceptions. Unless dry_run
+                  is set, the proposals are also created as pending records.
+        """
+        pass_mark = (
+            data.pass_mark
+            if data.pass_mark is not None
+            else config.PROGRESSION_PASS_MARK
+        )
+        results = self.session_averages(data.level_id, data.academic_session)
+        decided = self.students_with_records(
+            [result.student_id for result in results], data.academic_session
+        )
+        next_level_id = self.promotion_service.next_level_map().get(data.level_id)
+
+        promotions, repetitions, exceptions = [], [], []
+        for result in results:
+            proposal = {
+                "student_id": result.student_id,
+                "average": (
+                    None if result.average is None else round(float(result.average), 2)
+                ),
+                "enrolled_count": result.enrolled_count,
+                "graded_count": result.graded_count,
+            }
+            if result.student_id in decided:
+                exceptions.append(
+                    {
+                        **proposal,
+                        "reason": "Existing progression record for the session",
+                    }
+                )
+            elif result.graded_count < result.enrolled_count:
+                exceptions.append(
+                    {
+                        **proposal,
+                        "reason": f"Incomplete results: {result.graded_count} of {result.enrolled_count} enrolled subject-semesters graded",
+                    }
+                )
+            elif result.graded_count < data.min_subjects:
+                exceptions.append(
+                    {
+                        **proposal,
+                        "reason": f"Results for {result.graded_count} subject-semesters, fewer than the {data.min_subjects} required",
+                    }
+                )
+            elif proposal["average"] < pass_mark:
+                repetitions.append({**proposal, "target_level_id": data.level_id})
+            elif next_level_id is None:
+                exceptions.append(
+                    {**proposal, "reason": "No higher academic level; graduate instead"}
+                )
+            else:
+                promotions.append({**proposal, "target_level_id": next_level_id})
+
+        if not data.dry_run:
+            self.create_proposals(data, pass_mark, promotions, repetitions)
+
+        return {
+            "academic_session": data.academic_session,
+            "level_id": data.level_id,
+            "pass_mark": pass_mark,
+            "dry_run": data.dry_run,
+            "promotions": promotions,
+            "repetitions": repetitions,
+            "exceptions": exceptions,
+        }
+
+    def create_proposals(
+        self, data, pass_mark: float, promotions: List, repetitions: List
+    ) -> None:
+        """Insert the proposals as pending records, one INSERT per record type."""
+        actor_id = self.current_user.id
+        audit = {
+            "academic_session": data.academic_session,
+            "status": ApprovalStatus.PENDING,
+            "created_by": actor_id,
+            "last_modified_by": actor_id,
+        }
+        try:
+            if promotions:
+                self.session.execute(
+                    insert(Promotion),
+                    [
+                        {
+                            **audit,
+                            "id": uuid4(),
+                            "student_id": proposal["student_id"],
+                            "previous_level_id": data.level_id,
+                            "promoted_level_id": proposal["target_level_id"],
+                            "notes": f"Session average {proposal['average']} meets pass mark {pass_mark}",
+                        }
+                        for proposal in promotions
+                    ],
+                )
+            if repetitions:
+                self.session.execute(
+                    insert(Repetition),
+                    [
+                        {
+                            **audit,
+                            "id": uuid4(),
+                            "student_id": proposal["student_id"],
+                            "failed_level_id": data.level_id,
+                            "repeat_level_id": data.level_id,
+                            "repetition_reason": f"Session average {proposal['average']} below pass mark {pass_mark}",
+                        }
+                        for proposal in repetitions
+                    ],
+                )
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise BatchPromotionError("proposal", str(e))
@@ -11,6 +11,13 @@ from app.core.shared.exceptions import (
     EmptyFieldError,
     ProgressionStatusAlreadySetError,
 )
+from app.core.shared.services.approval_service.batch_decision_service import (
+    BatchDecisionService,
+)
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
 
 
 class RepetitionService:
@@ -19,6 +26,8 @@ class RepetitionService:
         self.current_user = current_user
         self.factory = RepetitionFactory(session, Repetition, self.current_user)
         self.domain = "REPETITION"
+        self.export_service = ExportService(session, current_user)
+        self.decisions = BatchDecisionService(session, current_user)
 
     def validate_repetition_level(self, failed_level_id: UUID, repeat_level_id: UUID):
         """
@@ -111,3 +120,24 @@ class RepetitionService:
                     "status_completed_at": datetime.now(),
                 },
             )
+
+    def action_repetition_records(self, data) -> dict:
+        """
+        Approve or reject many repetitions at once, moving approved students to
+        the repeat level and rejected ones back to the failed level.
+        Args:
+            data: Repetition ids, the decision and its reason
+        Returns:
+            dict: Decided repetition ids and failures per id
+        """
+        return self.decisions.decide(
+            Repetition, data.ids, data.status, data.decision_reason
+        )
+
+    def export_repetition_audit(
+        self, repetition_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a class repetition record."""
+        return self.export_service.export_audit(
+            Repetition, repetition_id, export_format
+        )
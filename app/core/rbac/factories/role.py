@@ -2,9 +2,13 @@ from typing import List
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 from app.core.rbac.models import Role
-from app.core.rbac.services.role_service import RBACService
+from app.core.rbac.services.role_service import (
+    RBACService,
+    invalidate_role_ids_after_commit,
+)
 from app.core.rbac.services.utils import RBACUtils
 from app.core.shared.factory.base_factory import BaseFactory
+from app.core.shared.services.lifecycle_service.delete_service import DeleteService
 from app.core.shared.validators.entity_validators import EntityValidator
 from app.core.shared.validators.entry_validators import EntryValidator
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
@@ -29,7 +33,8 @@ class RoleFactory(BaseFactory):
     violations through decorators that translate database errors into domain exceptions.
 
     Inherits from BaseFactory for common factory patterns including actor resolution
-    for audit fields.
+    for audit fields. Creating, renaming or deleting a role drops this process's
+    role map once the transaction commits.
 
     Attributes:
         session: SQLAlchemy database session.
@@ -59,6 +64,7 @@ class RoleFactory(BaseFactory):
         self.session = session
         self.model = model
         self.repository = SQLAlchemyRepository(self.model, session)
+        self.delete_service = DeleteService(self.model, session)
         self.entry_validator = EntryValidator()
         self.entity_validator = EntityValidator(session)
         self.error_details = error_map.get(self.model)
@@ -120,7 +126,9 @@ class RoleFactory(BaseFactory):
             last_modified_by=self.actor_id,
         )
 
-        return self.repository.create(role)
+        role = self.repository.create(role)
+        invalidate_role_ids_after_commit(self.session)
+        return role
 
     def get_role(self, role_id: UUID) -> Role:
         """Get a specific role by ID."""
@@ -174,7 +182,9 @@ class RoleFactory(BaseFactory):
                 if hasattr(existing, key):
                     setattr(existing, key, value)
 
-            return self.repository.update(role_id, existing, modified_by=self.actor_id)
+            role = self.repository.update(role_id, existing, modified_by=self.actor_id)
+            invalidate_role_ids_after_commit(self.session)
+            return role
 
         except EntityNotFoundError as e:
             self.raise_not_found(role_id, e)
@@ -228,12 +238,15 @@ class RoleFactory(BaseFactory):
 
         Raises:
             EntityNotFoundError: If no role exists with the given ID.
-            ForeignKeyViolationError: If other entities reference this role
-                (e.g., staff members assigned to it). Handled by
-                @resolve_fk_on_delete decorator.
+            DeletionDependencyError: If students or guardians hold this role,
+                or role history refers to it.
         """
         try:
+            self.delete_service.check_safe_delete(
+                self.model, role_id, self.display_name
+            )
             self.repository.delete(role_id)
+            invalidate_role_ids_after_commit(self.session)
 
         except EntityNotFoundError as e:
             self.raise_not_found(role_id, e)
@@ -298,11 +311,15 @@ class RoleFactory(BaseFactory):
 
         Raises:
             EntityNotFoundError: If no archived role exists with the given ID.
-            ForeignKeyViolationError: If other entities still reference this role
-                (handled by @resolve_fk_on_delete decorator).
+            DeletionDependencyError: If students or guardians hold this role,
+                or role history refers to it.
         """
         try:
+            self.delete_service.check_safe_delete(
+                self.model, role_id, self.display_name
+            )
             self.repository.delete_archive(role_id)
+            invalidate_role_ids_after_commit(self.session)
 
         except EntityNotFoundError as e:
             self.raise_not_found(role_id, e)
@@ -109,6 +109,8 @@ class RoleHistoryFactory(BaseFactory):
             EntityNotFoundError: If the staff member doesn't exist.
             RedundantChangeError: If new_role_id matches current role (via
                 service.prevent_redundant_changes).
+            NoMatchingRoleError: If new_role_id is not in the role map (via
+                service.validate_role_id).
             ForeignKeyViolationError: If new_role_id references a non-existent
                 role (handled by @resolve_fk_on_create decorator).
 
@@ -125,7 +127,7 @@ class RoleHistoryFactory(BaseFactory):
             staff_id=staff.id,
             previous_role_id=staff.current_role_id,
             new_role_id=self.service.prevent_redundant_changes(
-                staff.current_role_id, data.new_role_id
+                staff.current_role_id, self.service.validate_role_id(data.new_role_id)
             ),
             change_reason=data.reason,
             changed_at=datetime.now(),
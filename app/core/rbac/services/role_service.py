@@ -1,14 +1,76 @@
+"""
+The role name to id map is cached per process: each worker loads it once and
+reloads it when a lookup misses. Role writes drop the map only after their
+transaction commits, and only in the process that made them. Other workers keep
+their map until they restart, so ids of roles deleted elsewhere can linger there.
+"""
+
+import threading
+from types import MappingProxyType
 from uuid import UUID
-from sqlalchemy.exc import NoResultFound
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session, selectinload
-from typing import List
+from typing import List, Mapping
 from app.core.shared.exceptions import EntityNotFoundError
 from app.core.shared.exceptions.auth_errors import SameRoleError
-from app.core.shared.exceptions import NoMatchingRoleError
+from app.core.shared.exceptions import AccessDenied, NoMatchingRoleError
 from app.core.shared.models.enums import UserRoleName
 from app.core.rbac.models import Role, Permission
 
+ROLE_MAP_KEY = "role_ids_stale"
+
+_role_ids_lock = threading.Lock()
+_role_ids: Mapping[UserRoleName, UUID] | None = None
+_role_ids_generation = 0
+
+
+def load_role_ids(session: Session) -> Mapping[UserRoleName, UUID]:
+    """
+    Read every role's id with one query and make it this process's role map.
+    A load that overlaps an invalidation is returned but not kept, so data read
+    before a role change committed never outlives the invalidation.
+    """
+    global _role_ids
+    generation = _role_ids_generation
+    rows = session.execute(select(Role.name, Role.id)).all()
+    role_ids = MappingProxyType({name: role_id for name, role_id in rows})
+    with _role_ids_lock:
+        if generation == _role_ids_generation:
+            _role_ids = role_ids
+    return role_ids
+
+
+def get_role_ids(session: Session) -> Mapping[UserRoleName, UUID]:
+    """Return the role name to id map, loading it on first use."""
+    role_ids = _role_ids
+    if role_ids is not None:
+        return role_ids
+    return load_role_ids(session)
+
+
+def invalidate_role_ids() -> None:
+    """Drop this process's role map so the next lookup reloads it."""
+    global _role_ids, _role_ids_generation
+    with _role_ids_lock:
+        _role_ids = None
+        _role_ids_generation += 1
+
+
+def invalidate_role_ids_after_commit(session: Session) -> None:
+    """Drop this process's role map once the session's transaction commits."""
+    session.info[ROLE_MAP_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_stale_role_ids(session: Session) -> None:
+    if session.info.pop(ROLE_MAP_KEY, False):
+        invalidate_role_ids()
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_stale_role_ids(session: Session) -> None:
+    session.info.pop(ROLE_MAP_KEY, None)
+
 
 class RBACService:
     """
@@ -59,7 +121,9 @@ class RBACService:
         Look up a role's UUID by its name.
 
         Converts a role name string to the corresponding UserRoleName enum
-        and retrieves the role's UUID from the database.
+        and reads the role's UUID from the process-wide role map. The map is
+        loaded once and reloaded a single time when a name is missing, so
+        roles created since the last load are still found.
 
         Args:
             role_name: The role name as a string (must match a UserRoleName
@@ -74,14 +138,53 @@ class RBACService:
                 given name.
 
         """
-        try:
-            stmt = select(Role).where(Role.name == UserRoleName[role_name])
-            role_obj = self.session.execute(stmt).scalar_one()
-            role_id = role_obj.id
+        name = UserRoleName[role_name]
+        role_id = get_role_ids(self.session).get(name)
+        if role_id is None:
+            role_id = load_role_ids(self.session).get(name)
+        if role_id is None:
+            raise NoMatchingRoleError(role_name, "role is not in the roles table")
+
+        return role_id
+
+    def validate_role_id(self, role_id: UUID) -> UUID:
+        """
+        Check that a role id belongs to an existing role, using the role map.
+
+        Args:
+            role_id: The role UUID to check.
+
+        Returns:
+            UUID: The role_id, unchanged.
+
+        Raises:
+            NoMatchingRoleError: If no role has the given id.
+        """
+        if role_id in get_role_ids(self.session).values():
             return role_id
+        if role_id in load_role_ids(self.session).values():
+            return role_id
+        raise NoMatchingRoleError(str(role_id), "role id is not in the roles table")
+
+    def require_role(self, user, *role_names: UserRoleName) -> None:
+        """
+        Allow an operation only for users currently holding one of the given roles.
+
+        Used for school-wide maintenance operations that are not tied to a single
+        resource, so no permission string applies.
 
-        except NoResultFound as e:
-            raise NoMatchingRoleError(role_name, str(e))
+        Args:
+            user: The user model instance performing the operation.
+            *role_names: Roles allowed to perform it.
+
+        Raises:
+            AccessDenied: If the user's current role is not one of role_names.
+        """
+        role_ids = get_role_ids(self.session)
+        if user.current_role_id not in {role_ids.get(name) for name in role_names}:
+            raise AccessDenied(
+                user.id, None, "+".join(name.value for name in role_names)
+            )
 
     def get_role_permission_strs(self, role_id: UUID) -> List[str]:
         """
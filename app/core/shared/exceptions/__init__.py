@@ -12,6 +12,8 @@ from .lifecycle_errors import (
     CascadeArchivalError,
     ArchiveDependencyError,
     DeletionDependencyError,
+    BulkLifecycleError,
+    EmptyBulkSelectionError,
 )
 
 from .auth_errors import (
@@ -67,6 +69,9 @@ from .export_errors import (
     ExportError,
     ExportFormatError,
     UnimplementedGathererError,
+    ExportJobNotFoundError,
+    ExportJobNotReadyError,
+    PDFRenderTimeoutError,
 )
 
 from .file_errors import (
@@ -75,6 +80,8 @@ from .file_errors import (
     FileTooLargeError,
     UnsupportedFileFormatError,
     EmptyFileError,
+    StoredObjectNotFoundError,
+    InvalidFileSignatureError,
 )
 
 from .entry_validation_errors import (
@@ -120,6 +127,8 @@ from .identity_errors import (
     StaffTypeError,
     DuplicateStudentIDError,
     InvalidSessionYearError,
+    InvalidOnboardingInputError,
+    BulkOnboardingError,
 )
 from .assessment_errors import (
     ScoreExceedsMaxError,
@@ -128,6 +137,8 @@ from .assessment_errors import (
     UnableToRecalculateError,
     WeightTooHighError,
     FileAlreadyExistsError,
+    InvalidGradingScaleError,
+    InvalidCohortScopeError,
 )
 
 from .progression_errors import (
@@ -135,6 +146,10 @@ from .progression_errors import (
     StudentToGraduateError,
     ProgressionStatusAlreadySetError,
     LevelNotFinalError,
+    InvalidPromotionScopeError,
+    BatchPromotionError,
+    InvalidDecisionStatusError,
+    BatchDecisionError,
 )
 
 from .curriculum_errors import (
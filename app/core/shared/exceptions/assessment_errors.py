@@ -53,3 +53,19 @@ class FileAlreadyExistsError(AssessmentError):
             f"Please remove it to upload a new one"
         )
         self.log_message = f"File already exists for object ({obj_id})."
+
+
+class InvalidGradingScaleError(AssessmentError):
+    def __init__(self, detail: str):
+        super().__init__()
+        self.user_message = f"Invalid grading scale: {detail}"
+        self.log_message = f"Rejected grading scale update: {detail}"
+
+
+class InvalidCohortScopeError(AssessmentError):
+    """Raised when cohort results do not name exactly one class or level"""
+
+    def __init__(self):
+        super().__init__()
+        self.user_message = "Select either a class or an academic level for results."
+        self.log_message = "Cohort results requested without a single class or level"
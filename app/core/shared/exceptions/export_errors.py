@@ -23,3 +23,35 @@ class UnimplementedGathererError(ExportError):
         self.log_message = f"No gatherer implemented for {entity}"
 
         super().__init__()
+
+
+class PDFRenderTimeoutError(ExportError):
+    """Raised when a PDF is not rendered within PDF_RENDER_TIMEOUT_SECONDS."""
+
+    def __init__(self, filename, timeout):
+        self.user_message = f"The document took too long to generate. Please try again."
+        self.log_message = f"Rendering {filename} timed out after {timeout}s"
+
+        super().__init__()
+
+
+class ExportJobNotFoundError(ExportError):
+    """Raised when an export job does not exist, has expired or belongs to another user."""
+
+    def __init__(self, job_id):
+        self.user_message = f"Export job not found!"
+        self.log_message = f"Export job {job_id} not found"
+
+        super().__init__()
+
+
+class ExportJobNotReadyError(ExportError):
+    """Raised when the artefact of an unfinished or failed export job is requested."""
+
+    def __init__(self, job_id, job_status):
+        self.user_message = f"Export is not ready for download. Status: {job_status}"
+        self.log_message = (
+            f"Download attempted for export job {job_id} in status {job_status}"
+        )
+
+        super().__init__()
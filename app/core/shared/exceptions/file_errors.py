@@ -50,3 +50,21 @@ class AbsentKeyError(FileError):
         super().__init__()
         self.user_message = "S3 key cannot be found!"
         self.log_message = f"S3 key cannot be found!: {entry}"
+
+
+class StoredObjectNotFoundError(FileError):
+    """Raised when a key has no object in storage."""
+
+    def __init__(self, key: str):
+        super().__init__()
+        self.user_message = "File not found!"
+        self.log_message = f"No stored object for key: {key}"
+
+
+class InvalidFileSignatureError(FileError):
+    """Raised when a signed file URL is forged or has expired."""
+
+    def __init__(self, key: str):
+        super().__init__()
+        self.user_message = "This file link is invalid or has expired"
+        self.log_message = f"Rejected signed URL for key: {key}"
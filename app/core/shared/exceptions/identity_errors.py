@@ -46,3 +46,21 @@ class InvalidSessionYearError(IdentityError):
             f"Session year has to be between {current_year} and {current_year+1}"
         )
         self.log_message = f"Invalid session year entered: {entry}"
+
+
+class InvalidOnboardingInputError(IdentityError):
+    """Raised when bulk onboarding input cannot be read or is too large."""
+
+    def __init__(self, detail: str):
+        super().__init__()
+        self.user_message = f"Invalid onboarding input: {detail}"
+        self.log_message = f"Bulk onboarding input rejected: {detail}"
+
+
+class BulkOnboardingError(IdentityError):
+    """Raised when a bulk onboarding insert fails and is rolled back."""
+
+    def __init__(self, error: str):
+        super().__init__()
+        self.user_message = "Bulk onboarding failed! No students were created."
+        self.log_message = f"Bulk onboarding failed. DETAIL: {error}"
@@ -50,3 +50,21 @@ class DeletionDependencyError(ArchiveAndDeleteError):
             f"Cannot delete {display_name} while linked to {related_entities}."
         )
         self.log_message = f"Deletion blocked: {entity_model}- id: {identifier} is still linked to {related_entities}"
+
+
+class BulkLifecycleError(ArchiveAndDeleteError):
+    """Raised when a bulk archive or restore fails and is rolled back."""
+
+    def __init__(self, operation: str, error: str):
+        super().__init__()
+        self.user_message = f"Bulk {operation} failed! No records were changed."
+        self.log_message = f"Bulk {operation} failed. DETAIL: {error}"
+
+
+class EmptyBulkSelectionError(ArchiveAndDeleteError):
+    """Raised when a bulk operation names neither ids nor filters."""
+
+    def __init__(self, operation: str):
+        super().__init__()
+        self.user_message = f"Select the records to {operation} by id or by filter."
+        self.log_message = f"Bulk {operation} attempted without ids or filters"
@@ -21,7 +21,7 @@ from ....curriculum.models.curriculum import (
     AcademicLevelSubject,
 )
 from ....documents.models.documents import StudentDocument, StudentAward
-from ....rbac.models import RoleHistory
+from ....rbac.models import Role, RoleHistory
 from app.core.staff_management.models import (
     StaffDepartment,
     StaffJobTitle,
@@ -65,6 +65,7 @@ error_map = {
     # Document models
     StudentDocument: (StudentDocument, "document"),
     # Auth models
+    Role: (Role, "role"),
     RoleHistory: (RoleHistory, "role history"),
     # Progression
     Repetition: (Repetition, "repetition record"),
@@ -51,3 +51,43 @@ class LevelNotFinalError(ProgressionError):
             f"Invalid graduation:Student must be in final level to graduate."
         )
         self.log_message = f"Invalid graduation: id {level_id} is not a final level"
+
+
+class InvalidPromotionScopeError(ProgressionError):
+    """Raised when a batch promotion does not name exactly one level or class"""
+
+    def __init__(self):
+        super().__init__()
+        self.user_message = "Select either an academic level or a class to promote."
+        self.log_message = "Batch promotion requested without a single level or class"
+
+
+class BatchPromotionError(ProgressionError):
+    """Raised when a batch promotion fails and is rolled back"""
+
+    def __init__(self, operation: str, error: str):
+        super().__init__()
+        self.user_message = (
+            f"Batch promotion {operation} failed! No records were changed."
+        )
+        self.log_message = f"Batch promotion {operation} failed. DETAIL: {error}"
+
+
+class InvalidDecisionStatusError(ProgressionError):
+    """Raised when a decision neither approves nor rejects"""
+
+    def __init__(self, record_type: str):
+        super().__init__()
+        self.user_message = f"A {record_type} decision must approve or reject."
+        self.log_message = f"Attempted a PENDING decision on {record_type} records"
+
+
+class BatchDecisionError(ProgressionError):
+    """Raised when a batch of approval decisions fails and is rolled back"""
+
+    def __init__(self, record_type: str, error: str):
+        super().__init__()
+        self.user_message = (
+            f"Batch {record_type} decision failed! No records were changed."
+        )
+        self.log_message = f"Batch {record_type} decision failed. DETAIL: {error}"
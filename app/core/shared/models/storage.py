@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger
+
+from app.core.shared.models.common_imports import *
+from app.core.shared.models.mixins import TimeStampMixins
+
+
+class StoredBlob(Base, TimeStampMixins):
+    """
+    Represents a content-addressed file in storage: one row per distinct file
+    content, shared by every record that uploaded the same bytes
+    """
+
+    __tablename__ = "stored_blobs"
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    s3_key: Mapped[str] = mapped_column(String(225), unique=True)
+    sha256: Mapped[str] = mapped_column(String(64))
+    size: Mapped[int] = mapped_column(BigInteger)
+    content_type: Mapped[str] = mapped_column(String(100))
+    ref_count: Mapped[int] = mapped_column(Integer, default=1)
+
+    __table_args__ = (Index("idx_stored_blobs_sha256", "sha256"),)
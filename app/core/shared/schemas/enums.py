@@ -100,6 +100,11 @@ class ArchiveReason(str, Enum):
     ADMINISTRATIVE = "ADMINISTRATIVE"
 
 
+class ThumbnailSize(int, Enum):
+    SMALL = 64
+    MEDIUM = 256
+
+
 class ExportFormat(str, Enum):
     pdf = "pdf"
     csv = "csv"
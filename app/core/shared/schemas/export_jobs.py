@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ExportJobResponse(BaseModel):
+    """Status of a background export job"""
+
+    id: UUID
+    kind: str
+    status: str
+    params: Dict[str, Any]
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    filename: str | None = None
+    size: int | None = None
+    error: str | None = None
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "3f1c9a52-8d8e-4c8e-9d7e-6b1a2f0c4d11",
+                "kind": "students",
+                "status": "completed",
+                "params": {"filters": {}, "export_format": "csv", "compress": True},
+                "created_at": "2025-09-01T08:30:00+00:00",
+                "started_at": "2025-09-01T08:30:01+00:00",
+                "finished_at": "2025-09-01T08:30:09+00:00",
+                "filename": "Students.csv.gz",
+                "size": 481233,
+                "error": None,
+            }
+        }
+    )
+
+
+class ExportJobDownload(BaseModel):
+    """Presigned URL for the artefact of a completed export job"""
+
+    job_id: UUID
+    filename: str
+    url: str
+    expires_in: int
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Literal
-from .enums import ArchiveReason, ExportFormat
+from typing import Dict, List, Literal
+from uuid import UUID
+from .enums import ApprovalStatus, ArchiveReason, ExportFormat
 
 
 class BaseFilterParams(BaseModel):
@@ -14,6 +15,53 @@ class ArchiveRequest(BaseModel):
     reason: ArchiveReason
 
 
+class CascadeArchiveResponse(BaseModel):
+    """Result of a deep archive, with the records archived per dependency."""
+
+    id: UUID
+    archived_entities: Dict[str, int]
+    message: str
+
+
+class BulkSelection(BaseModel):
+    """Records for a bulk operation: the listed ids, or every record matching the filters."""
+
+    ids: List[UUID] | None = Field(None, min_length=1, max_length=5000)
+
+
+class BulkArchiveRequest(BulkSelection):
+    reason: ArchiveReason
+    cascade: bool = False
+
+
+class BulkFailure(BaseModel):
+    id: UUID
+    reason: str
+
+
+class BulkLifecycleResponse(BaseModel):
+    """Outcome of a bulk archive or restore, with the records skipped and why."""
+
+    succeeded: List[UUID]
+    archived_entities: Dict[str, int] = {}
+    failed: List[BulkFailure]
+
+
+class BatchDecision(BaseModel):
+    """One approval decision applied to many pending records."""
+
+    ids: List[UUID] = Field(..., min_length=1, max_length=5000)
+    status: ApprovalStatus
+    decision_reason: str | None = None
+
+
+class BatchDecisionResponse(BaseModel):
+    """Records a batch decision was applied to, and the ones skipped and why."""
+
+    succeeded: List[UUID]
+    failed: List[BulkFailure]
+
+
 class ExportRequest(BaseModel):
     export_format: ExportFormat
 
@@ -24,3 +72,16 @@ class UploadResponse(BaseModel):
     filename: str
     size: int
     file_type: str
+
+
+class PresignedUrlBatchRequest(BaseModel):
+    """Ids of the records to sign file URLs for."""
+
+    ids: List[UUID] = Field(..., min_length=1, max_length=500)
+
+
+class PresignedUrlResponse(BaseModel):
+    """Presigned URL of a record's file, null when the record has no file."""
+
+    id: UUID
+    url: str | None = None
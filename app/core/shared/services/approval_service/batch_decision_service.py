@@ -0,0 +1,153 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Set
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.shared.exceptions import (
+    BatchDecisionError,
+    EmptyFieldError,
+    InvalidDecisionStatusError,
+)
+from app.core.shared.models.enums import ApprovalStatus
+from .decision_config import DECISION_CONFIG
+
+
+class BatchDecisionService:
+    """
+    Service for approving or rejecting many promotions, repetitions or transfers
+    at once. The decision is applied with one conditional UPDATE for the records
+    and one for the students of the records it returns.
+    """
+
+    def __init__(self, session: Session, current_user):
+        self.session = session
+        self.current_user = current_user
+
+    def decide(
+        self,
+        record_model,
+        record_ids: List[UUID],
+        status,
+        decision_reason: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Apply one decision to many records of a type in DECISION CONFIG.
+        A record fails if it is missing, archived or already has the decided status.
+        Args:
+            record_model: Promotion, Repetition or DepartmentTransfer
+            record_ids: IDs of the records to decide
+            status: APPROVED or REJECTED
+            decision_reason: Reason recorded on every record, required on rejection
+
+        Returns:
+            dict: Decided record ids and failures per id
+        """
+        target = DECISION_CONFIG[record_model]
+        status = ApprovalStatus(getattr(status, "value", status))
+        if status == ApprovalStatus.PENDING:
+            raise InvalidDecisionStatusError(target.display_name)
+        if status == ApprovalStatus.REJECTED and not decision_reason:
+            raise EmptyFieldError(entry=decision_reason)
+
+        record_ids = list(dict.fromkeys(record_ids))
+        if not record_ids:
+            return {"succeeded": [], "failed": []}
+
+        decided = self.apply_decision(record_model, record_ids, status, decision_reason)
+
+        undecided = [record_id for record_id in record_ids if record_id not in decided]
+        existing = set()
+        if undecided:
+            existing = set(
+                self.session.scalars(
+                    select(record_model.id).where(
+                        record_model.id.in_(undecided),
+                        record_model.is_archived == False,
+                    )
+                )
+            )
+
+        failed = [
+            (
+                {
+                    "id": record_id,
+                    "reason": f"{target.display_name.capitalize()} has already been {status.value.lower()}",
+                }
+                if record_id in existing
+                else {"id": record_id, "reason": "Not found"}
+            )
+            for record_id in undecided
+        ]
+        return {
+            "succeeded": [
+                record_id for record_id in record_ids if record_id in decided
+            ],
+            "failed": failed,
+        }
+
+    def apply_decision(
+        self, record_model, record_ids: List[UUID], status, decision_reason
+    ) -> Set[UUID]:
+        """
+        Update the records' status and their students in one transaction.
+        Only active records not already holding the status are updated, and the
+        students are moved for exactly the records that UPDATE returns. A decision
+        racing this one waits on the row locks and then finds nothing left to do,
+        so students are never moved twice.
+        Returns:
+            set: IDs of the records decided
+        """
+        from app.core.identity.models.student import Student
+
+        target = DECISION_CONFIG[record_model]
+        student_change = (
+            target.on_approve if status == ApprovalStatus.APPROVED else target.on_reject
+        )
+
+        try:
+            decided = set(
+                self.session.execute(
+                    update(record_model)
+                    .where(
+                        record_model.id.in_(record_ids),
+                        record_model.is_archived == False,
+                        record_model.status != status,
+                    )
+                    .values(
+                        status=status,
+                        decision_reason=decision_reason,
+                        status_completed_by=self.current_user.id,
+                        status_completed_at=datetime.now(timezone.utc),
+                        last_modified_by=self.current_user.id,
+                    )
+                    .returning(record_model.id)
+                    .execution_options(synchronize_session=False)
+                )
+                .scalars()
+                .all()
+            )
+
+            if decided and student_change:
+                student_column, record_column = student_change
+                self.session.execute(
+                    update(Student)
+                    .where(
+                        Student.id == record_model.student_id,
+                        record_model.id.in_(decided),
+                    )
+                    .values(
+                        {
+                            student_column: getattr(record_model, record_column),
+                            "last_modified_by": self.current_user.id,
+                        }
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise BatchDecisionError(target.display_name, str(e))
+
+        return decided
@@ -0,0 +1,35 @@
+from typing import Dict, NamedTuple, Tuple
+
+from app.core.progression.models.progression import Repetition, Promotion
+from app.core.transfer.models.transfer import DepartmentTransfer
+
+
+class DecisionTarget(NamedTuple):
+    """
+    How a decision on a record type is applied to its student.
+    on_approve and on_reject are (student column, record column) pairs: the
+    student column is set to the record column's value, or left alone if None.
+    """
+
+    display_name: str
+    on_approve: Tuple[str, str] | None
+    on_reject: Tuple[str, str] | None
+
+
+DECISION_CONFIG: Dict[type, DecisionTarget] = {
+    Promotion: DecisionTarget(
+        "promotion",
+        on_approve=("level_id", "promoted_level_id"),
+        on_reject=("level_id", "previous_level_id"),
+    ),
+    Repetition: DecisionTarget(
+        "repetition",
+        on_approve=("level_id", "repeat_level_id"),
+        on_reject=("level_id", "failed_level_id"),
+    ),
+    DepartmentTransfer: DecisionTarget(
+        "transfer",
+        on_approve=("department_id", "new_department_id"),
+        on_reject=None,
+    ),
+}
@@ -0,0 +1,255 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Callable, Iterator, List, NamedTuple, Sequence
+from uuid import UUID
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.core.shared.exceptions import EntityNotFoundError, ExportFormatError
+from app.core.shared.exceptions.maps.error_map import error_map
+from app.core.shared.schemas.enums import ExportFormat
+from app.core.shared.services.export_service.writers import (
+    ExportSection,
+    gzip_stream,
+    stream_csv,
+    stream_excel,
+    stream_pdf,
+)
+from app.core.shared.services.lifecycle_service.dependency_config import (
+    DEPENDENCY_CONFIG,
+)
+from app.core.shared.services.pdf_service.reportlab_base import ReportLabService
+from app.infra.db.db_config import SessionFactory
+
+EXCLUDED_COLUMNS = {"password_hash"}
+
+MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv",
+    ExportFormat.excel: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.pdf: "application/pdf",
+}
+
+EXTENSIONS = {
+    ExportFormat.csv: "csv",
+    ExportFormat.excel: "xlsx",
+    ExportFormat.pdf: "pdf",
+}
+
+GZIP_MEDIA_TYPE = "application/gzip"
+
+
+class ExportStream(NamedTuple):
+    """An export ready to be streamed to the client."""
+
+    content: Iterator[bytes]
+    filename: str
+    media_type: str
+
+
+def export_response(export: ExportStream) -> StreamingResponse:
+    """Wrap an export in a StreamingResponse that downloads as an attachment."""
+    return StreamingResponse(
+        export.content,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
+
+
+def format_value(value) -> str | int | float | bool:
+    """Render a column value as a plain cell value for every export format."""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (int, float, bool, str)):
+        return value
+    return str(value)
+
+
+class ExportService:
+    """
+    Shared export engine for ExportFormat (csv, excel, pdf).
+
+    Rows are read through a server-side cursor (yield_per) and written straight into
+    the response stream. Because a StreamingResponse is sent after the request's
+    session has closed, rows are read from a session owned by the stream itself.
+    """
+
+    YIELD_PER = 500
+
+    def __init__(self, session: Session, current_user=None):
+        self.session = session
+        self.current_user = current_user
+
+    @staticmethod
+    def table_columns(model) -> List:
+        return [
+            column
+            for column in model.__table__.columns
+            if column.name not in EXCLUDED_COLUMNS
+        ]
+
+    def stream_rows(self, session: Session, stmt: Select) -> Iterator[Sequence]:
+        """Yield formatted rows from a statement using a server-side cursor."""
+        result = session.execute(stmt.execution_options(yield_per=self.YIELD_PER))
+        for row in result:
+            yield [format_value(value) for value in row]
+
+    def stream_export(
+        self,
+        build_sections: Callable[[Session], Iterator[ExportSection]],
+        export_format: ExportFormat,
+        title: str,
+    ) -> Iterator[bytes]:
+        """
+        Write sections produced by build_sections in the requested format.
+        The stream opens and closes its own db session.
+        """
+        export_format = ExportFormat(export_format)
+        session = SessionFactory()
+        try:
+            sections = build_sections(session)
+            if export_format == ExportFormat.csv:
+                yield from stream_csv(sections)
+            elif export_format == ExportFormat.excel:
+                yield from stream_excel(sections)
+            else:
+                yield from stream_pdf(sections, title)
+        finally:
+            session.close()
+
+    @staticmethod
+    def validate_format(export_format: ExportFormat | str) -> ExportFormat:
+        try:
+            return ExportFormat(export_format)
+        except ValueError:
+            raise ExportFormatError(format_entry=export_format)
+
+    def set_sections(self, model, stmt: Select, title: str) -> Callable:
+        """Build the single section of a set export from a filtered entity query."""
+        columns = self.table_columns(model)
+
+        def build(session: Session) -> Iterator[ExportSection]:
+            yield ExportSection(
+                title=title,
+                headers=[column.name for column in columns],
+                rows=self.stream_rows(session, stmt.with_only_columns(*columns)),
+            )
+
+        return build
+
+    def export_set(
+        self,
+        model,
+        stmt: Select,
+        export_format: ExportFormat | str,
+        title: str,
+        compress: bool = False,
+    ) -> ExportStream:
+        """
+        Stream every record matched by a filtered list query.
+        Pagination is dropped so the whole set is exported, read in chunks of
+        YIELD_PER rows.
+        Args:
+            model: Model class of the records
+            stmt: Filtered and ordered select of model, e.g. from filtered_query
+            export_format: csv, excel or pdf
+            title: Title of the export, also used for the filename
+            compress: Gzip the stream as it is written
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        export_format = self.validate_format(export_format)
+        stmt = stmt.limit(None).offset(None)
+
+        filename = f"{title}.{EXTENSIONS[export_format]}"
+        media_type = MEDIA_TYPES[export_format]
+        content = self.stream_export(
+            self.set_sections(model, stmt, title), export_format, title
+        )
+        if compress:
+            filename += ".gz"
+            media_type = GZIP_MEDIA_TYPE
+            content = gzip_stream(content)
+
+        filename = ReportLabService.slugify_filename(filename)
+        return ExportStream(content, filename, media_type)
+
+    def audit_sections(self, model, entity_id: UUID, dependency_model=None) -> Callable:
+        """
+        Build the sections of an audit export: the record itself as field/value
+        pairs, then every record that references it, one section per dependency.
+        dependency_model selects the DEPENDENCY_CONFIG entry when the record is a
+        polymorphic subtype of model (e.g. an Educator exported as Staff).
+        """
+        dependencies = DEPENDENCY_CONFIG.get(dependency_model or model, [])
+
+        def build(session: Session) -> Iterator[ExportSection]:
+            columns = self.table_columns(model)
+            record = session.execute(
+                select(*columns).where(model.id == entity_id)
+            ).one()
+            yield ExportSection(
+                title=model.__name__,
+                headers=["Field", "Value"],
+                rows=(
+                    [column.name, format_value(value)]
+                    for column, value in zip(columns, record)
+                ),
+            )
+
+            for _, dependent, fk, display_name in dependencies:
+                dependent_columns = self.table_columns(dependent)
+                stmt = select(*dependent_columns).where(
+                    getattr(dependent, fk) == entity_id
+                )
+                if hasattr(dependent, "created_at"):
+                    stmt = stmt.order_by(dependent.created_at)
+                yield ExportSection(
+                    title=display_name.title(),
+                    headers=[column.name for column in dependent_columns],
+                    rows=self.stream_rows(session, stmt),
+                )
+
+        return build
+
+    def export_audit(
+        self, model, entity_id: UUID, export_format: ExportFormat | str
+    ) -> ExportStream:
+        """
+        Stream the audit export of an active or archived record.
+        Args:
+            model: Model class of the record
+            entity_id: ID of the record
+            export_format: csv, excel or pdf
+        Returns:
+            ExportStream: Lazy content stream, filename and media type
+        """
+        export_format = self.validate_format(export_format)
+
+        entity_model, display_name = error_map.get(model, (model, model.__name__))
+        entity = self.session.get(model, entity_id)
+        if entity is None:
+            raise EntityNotFoundError(
+                entity_model=entity_model,
+                identifier=entity_id,
+                error="Object not found",
+                display_name=display_name,
+            )
+
+        title = f"{display_name} {entity_id} audit"
+        filename = ReportLabService.slugify_filename(
+            f"{title}.{EXTENSIONS[export_format]}"
+        )
+        content = self.stream_export(
+            self.audit_sections(model, entity_id, type(entity)),
+            export_format,
+            title,
+        )
+        return ExportStream(content, filename, MEDIA_TYPES[export_format])
@@ -0,0 +1,79 @@
+from typing import Dict
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.core.shared.exceptions import (
+    ExportFormatError,
+    ExportJobNotFoundError,
+    ExportJobNotReadyError,
+)
+from app.core.shared.schemas.enums import ExportFormat
+from app.core.shared.services.export_service.jobs import JOB_HANDLERS, TASK_HANDLERS
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.infra.db.redis_db.export_jobs import export_job_store
+from app.settings import config
+
+
+class ExportJobService:
+    """
+    Queues exports and results reports for the background export workers and
+    reports on their progress. Finished artefacts are kept in storage and handed
+    out through short-lived presigned URLs.
+    """
+
+    def __init__(self, session: Session, current_user=None):
+        self.session = session
+        self.current_user = current_user
+        self.store = export_job_store
+
+    def enqueue(self, kind: str, params: Dict) -> Dict:
+        """
+        Queue a job for the workers.
+        Args:
+            kind: A key of JOB_HANDLERS or TASK_HANDLERS
+            params: JSON serialisable arguments for the job handler
+        Returns:
+            dict: The queued job
+        """
+        if kind not in JOB_HANDLERS and kind not in TASK_HANDLERS:
+            raise ValueError(f"Unknown export job kind: {kind}")
+        if "export_format" in params:
+            try:
+                params["export_format"] = ExportFormat(params["export_format"]).value
+            except ValueError:
+                raise ExportFormatError(format_entry=params["export_format"])
+
+        return self.store.enqueue(
+            uuid4(),
+            kind,
+            params,
+            self.current_user.id,
+            self.current_user.user_type.value,
+        )
+
+    def get_job(self, job_id: UUID) -> Dict:
+        """Return a job queued by the current user."""
+        job = self.store.get_job(job_id)
+        if not job or job["requested_by"] != str(self.current_user.id):
+            raise ExportJobNotFoundError(job_id=job_id)
+        return job
+
+    def get_download(self, job_id: UUID) -> Dict:
+        """Return a presigned URL for the artefact of a completed job."""
+        job = self.get_job(job_id)
+        if job["kind"] in TASK_HANDLERS:
+            raise ExportJobNotFoundError(job_id=job_id)
+        if job["status"] != self.store.COMPLETED:
+            raise ExportJobNotReadyError(job_id=job_id, job_status=job["status"])
+
+        expires_in = config.EXPORT_JOB_URL_EXPIRY_SECONDS
+        url = S3Upload(self.session, self.current_user).generate_presigned_url(
+            job["s3_key"], exp=expires_in
+        )
+        return {
+            "job_id": job["id"],
+            "filename": job["filename"],
+            "url": url,
+            "expires_in": expires_in,
+        }
@@ -0,0 +1,182 @@
+"""
+Job kinds that can run in the background export workers.
+
+Each export kind turns the parameters captured when the job was queued back into
+the same ExportStream the synchronous endpoints produce. Task kinds, such as
+image thumbnails, write their results to storage themselves. Handlers run in a worker
+process with their own db session and the user who queued the job, so
+authorisation and audit fields behave as they would inside the request.
+"""
+
+import io
+from typing import Callable, Dict, NamedTuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.assessment.factories.grade import GradeFactory
+from app.core.assessment.factories.total_grade import TotalGradeFactory
+from app.core.assessment.schemas.grade import GradeFilterParams
+from app.core.assessment.schemas.total_grade import TotalGradeFilterParams
+from app.core.assessment.services.assessment_service import AssessmentService
+from app.core.curriculum.factories.student_subject import StudentSubjectFactory
+from app.core.curriculum.schemas.student_subject import StudentSubjectFilterParams
+from app.core.identity.factories.guardian import GuardianFactory
+from app.core.identity.factories.staff import StaffFactory
+from app.core.identity.factories.student import StudentFactory
+from app.core.identity.models.guardian import Guardian
+from app.core.identity.models.staff import Staff
+from app.core.identity.models.student import Student
+from app.core.identity.schemas.guardian import GuardianFilterParams
+from app.core.identity.schemas.staff import StaffFilterParams
+from app.core.identity.schemas.student import StudentFilterParams
+from app.core.shared.schemas.enums import Semester
+from app.core.shared.services.export_service.export_service import ExportStream
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.core.shared.services.file_storage.thumbnails import (
+    render_thumbnails,
+    thumbnail_key,
+)
+from app.core.shared.services.pdf_service.reportlab_base import ReportLabService
+
+
+class SetExportKind(NamedTuple):
+    """A filter-driven set export and the list endpoint filters it accepts."""
+
+    factory_class: Type
+    filter_params: Type[BaseModel]
+    export_method: str
+
+
+SET_EXPORTS: Dict[str, SetExportKind] = {
+    "students": SetExportKind(StudentFactory, StudentFilterParams, "export_students"),
+    "guardians": SetExportKind(
+        GuardianFactory, GuardianFilterParams, "export_guardians"
+    ),
+    "staff": SetExportKind(StaffFactory, StaffFilterParams, "export_staff"),
+    "grades": SetExportKind(GradeFactory, GradeFilterParams, "export_grades"),
+    "total_grades": SetExportKind(
+        TotalGradeFactory, TotalGradeFilterParams, "export_total_grades"
+    ),
+    "student_subjects": SetExportKind(
+        StudentSubjectFactory, StudentSubjectFilterParams, "export_student_subjects"
+    ),
+}
+
+
+def set_export_params(filters: BaseModel, export_format: str, compress: bool) -> Dict:
+    """Capture set export arguments in a JSON serialisable form."""
+    return {
+        "filters": filters.model_dump(mode="json", exclude_unset=True),
+        "export_format": export_format,
+        "compress": compress,
+    }
+
+
+def run_set_export(kind: str) -> Callable:
+    def handler(session: Session, current_user, params: Dict) -> ExportStream:
+        set_export = SET_EXPORTS[kind]
+        factory = set_export.factory_class(session, current_user=current_user)
+        filters = set_export.filter_params(**params.get("filters", {}))
+        return getattr(factory, set_export.export_method)(
+            filters, params["export_format"], params.get("compress", False)
+        )
+
+    return handler
+
+
+def run_student_results(session: Session, current_user, params: Dict) -> ExportStream:
+    service = AssessmentService(session, current_user)
+    pdf_bytes, filename = service.generate_assessment_pdf(
+        UUID(params["student_id"]),
+        params["academic_session"],
+        Semester(params["semester"]),
+    )
+    return ExportStream(iter([pdf_bytes]), filename, "application/pdf")
+
+
+def run_cohort_results(scope: str) -> Callable:
+    def handler(session: Session, current_user, params: Dict) -> ExportStream:
+        service = AssessmentService(session, current_user)
+        semester = Semester(params["semester"])
+        scope_id = UUID(params[f"{scope}_id"])
+        archive = service.stream_cohort_results_zip(
+            params["academic_session"], semester, **{f"{scope}_id": scope_id}
+        )
+        filename = ReportLabService.slugify_filename(
+            f"{scope} {scope_id} {params['academic_session']} {semester.value} results.zip"
+        )
+        return ExportStream(archive, filename, "application/zip")
+
+    return handler
+
+
+JOB_HANDLERS: Dict[str, Callable[[Session, object, Dict], ExportStream]] = {
+    **{kind: run_set_export(kind) for kind in SET_EXPORTS},
+    "student_results": run_student_results,
+    "class_results": run_cohort_results("class"),
+    "level_results": run_cohort_results("level"),
+}
+
+
+PROFILE_PICTURE_MODELS = (Student, Staff, Guardian)
+
+
+def run_thumbnails(session: Session, current_user, params: Dict) -> Dict:
+    """
+    Render thumbnails of an uploaded image and store them next to it, then mark
+    the users whose profile picture it is, so their thumbnails start being served.
+    """
+    upload = S3Upload(session, current_user)
+    s3_key = params["s3_key"]
+    thumbnails = render_thumbnails(upload.s3_download(s3_key))
+    for size, contents in thumbnails.items():
+        upload.s3_upload(contents, thumbnail_key(s3_key, size), "image/webp")
+
+    for model in PROFILE_PICTURE_MODELS:
+        session.execute(
+            update(model)
+            .where(model.profile_s3_key == s3_key)
+            .values(profile_thumbnails_ready=True)
+            .execution_options(synchronize_session=False)
+        )
+    session.commit()
+    return {"thumbnails": len(thumbnails)}
+
+
+# Tasks do their work in storage directly instead of producing a download.
+TASK_HANDLERS: Dict[str, Callable[[Session, object, Dict], Dict]] = {
+    "thumbnails": run_thumbnails,
+}
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only file object over a stream of byte chunks, for streaming uploads."""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.pending = b""
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Fill buffer completely unless the stream ends, so multipart uploads get
+        full sized parts rather than one part per chunk."""
+        size = 0
+        while size < len(buffer):
+            if not self.pending:
+                chunk = next(self.chunks, None)
+                if chunk is None:
+                    break
+                self.pending = chunk
+                continue
+            take = min(len(buffer) - size, len(self.pending))
+            buffer[size : size + take] = self.pending[:take]
+            self.pending = self.pending[take:]
+            size += take
+        self.bytes_read += size
+        return size
@@ -0,0 +1,148 @@
+"""
+Background export workers.
+
+Run with:  python -m app.core.shared.services.export_service.worker
+
+Starts EXPORT_JOB_WORKERS processes that take jobs from the Redis queue, run
+them with the user who queued them, stream the artefact to storage (or let a
+task write its own output) and record the outcome on the job. Each process
+holds its claimed job on its own processing list and keeps a heartbeat while it
+runs; idle workers requeue the jobs of workers whose heartbeat has lapsed. Only Redis and a
+storage backend are required; with STORAGE_BACKEND=local the workers run
+without S3. The memory backend is per process, so it can't be shared with them.
+"""
+
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+
+import redis
+
+from app.core.auth.services.dependencies.current_user_deps import get_current_user
+from app.core.shared.exceptions import KademiaError
+from app.core.shared.log_service.logger import logger
+from app.core.shared.services.export_service.jobs import (
+    JOB_HANDLERS,
+    TASK_HANDLERS,
+    ChunkReader,
+)
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.infra.db.db_config import SessionFactory
+from app.infra.db.redis_db.export_jobs import export_job_store
+from app.settings import config
+
+
+def artefact_key(job_id: str, filename: str) -> str:
+    return f"{config.EXPORTS_FOLDER}/{job_id}/{filename}"
+
+
+def run_job(job_id: str) -> None:
+    """Run one job to completion, recording its status on the job."""
+    job = export_job_store.get_job(job_id)
+    if job is None:
+        logger.warning(f"Export job {job_id} expired before it ran")
+        return
+
+    export_job_store.update_job(job_id, status=export_job_store.RUNNING)
+    session = SessionFactory()
+    try:
+        token_data = {
+            "identity": {"user_id": job["requested_by"], "user_type": job["user_type"]}
+        }
+        current_user = get_current_user(token_data, session)
+        if job["kind"] in TASK_HANDLERS:
+            result = TASK_HANDLERS[job["kind"]](session, current_user, job["params"])
+            export_job_store.update_job(
+                job_id, status=export_job_store.COMPLETED, **result
+            )
+            logger.info(f"Job {job_id} ({job['kind']}) completed")
+            return
+
+        export = JOB_HANDLERS[job["kind"]](session, current_user, job["params"])
+
+        key = artefact_key(job_id, export.filename)
+        reader = ChunkReader(export.content)
+        S3Upload(session, current_user).s3_upload_stream(reader, key, export.media_type)
+        export_job_store.update_job(
+            job_id,
+            status=export_job_store.COMPLETED,
+            s3_key=key,
+            filename=export.filename,
+            media_type=export.media_type,
+            size=reader.bytes_read,
+        )
+        logger.info(f"Export job {job_id} completed: {key}")
+
+    except Exception as e:
+        session.rollback()
+        message = e.user_message if isinstance(e, KademiaError) else "Export failed"
+        export_job_store.update_job(
+            job_id, status=export_job_store.FAILED, error=message
+        )
+        logger.error(f"Export job {job_id} failed: {str(e)}")
+    finally:
+        session.close()
+
+
+def beat(worker_id: str, stopped: threading.Event) -> None:
+    """Refresh the worker's heartbeat until it stops, including during long jobs."""
+    while not stopped.wait(config.EXPORT_WORKER_HEARTBEAT_SECONDS):
+        try:
+            export_job_store.heartbeat(worker_id)
+        except redis.RedisError as e:
+            logger.warning(f"Export worker {worker_id} heartbeat failed: {e}")
+
+
+def work(stop_event) -> None:
+    """Take and run jobs until stop_event is set."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    export_job_store.register_worker(worker_id)
+    stopped = threading.Event()
+    threading.Thread(target=beat, args=(worker_id, stopped), daemon=True).start()
+
+    try:
+        while not stop_event.is_set():
+            job_id = export_job_store.claim_next(worker_id, timeout=5)
+            if job_id is None:
+                requeued = export_job_store.requeue_stalled()
+                if requeued:
+                    logger.info(f"Requeued {requeued} stalled export jobs")
+                continue
+            try:
+                run_job(job_id)
+            finally:
+                export_job_store.release(worker_id, job_id)
+    finally:
+        stopped.set()
+        export_job_store.retire_worker(worker_id)
+
+
+def main() -> None:
+    requeued = export_job_store.requeue_stalled()
+    if requeued:
+        logger.info(f"Requeued {requeued} stalled export jobs")
+
+    stop_event = multiprocessing.Event()
+    workers = [
+        multiprocessing.Process(target=work, args=(stop_event,), name=f"export-{n}")
+        for n in range(config.EXPORT_JOB_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    logger.info(f"Started {len(workers)} export workers")
+
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Streaming writers for ExportFormat.
+
+Each writer consumes sections lazily and yields encoded chunks, so an export
+holds only the current chunk of rows in memory. Excel and PDF output must be
+finalised before it can be read, so they are written to a spooled temporary
+file that stays in memory while small, spills to disk when large, and is
+removed as soon as it has been streamed.
+"""
+
+import csv
+import io
+import tempfile
+import zlib
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+from openpyxl import Workbook
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+CHUNK_SIZE = 64 * 1024
+SPOOL_SIZE = 8 * 1024 * 1024
+
+
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class ExportSection(NamedTuple):
+    """A titled table of rows within an export."""
+
+    title: str
+    headers: Sequence[str]
+    rows: Iterable[Sequence]
+
+
+def drain_file(file) -> Iterator[bytes]:
+    """Stream a finished file from the start in fixed size chunks, then close it."""
+    try:
+        file.seek(0)
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+    finally:
+        file.close()
+
+
+def stream_csv(sections: Iterable[ExportSection]) -> Iterator[bytes]:
+    """Write sections one after another, each with a title and header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    for index, section in enumerate(sections):
+        if index:
+            writer.writerow([])
+        writer.writerow([section.title])
+        writer.writerow(section.headers)
+
+        for row in section.rows:
+            writer.writerow(row)
+            if buffer.tell() >= CHUNK_SIZE:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def stream_excel(sections: Iterable[ExportSection]) -> Iterator[bytes]:
+    """Write each section to its own sheet of a write-only workbook."""
+    workbook = Workbook(write_only=True)
+
+    for section in sections:
+        sheet = workbook.create_sheet(title=sheet_title(section.title))
+        sheet.append(list(section.headers))
+        for row in section.rows:
+            sheet.append(list(row))
+
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    workbook.save(output)
+    yield from drain_file(output)
+
+
+def sheet_title(title: str) -> str:
+    """Excel sheet titles are limited to 31 characters and can't contain []:*?/\\"""
+    cleaned = "".join(" " if char in "[]:*?/\\" else char for char in title)
+    return cleaned[:31] or "Sheet"
+
+
+class PDFTableWriter:
+    """Draws sections as plain tables, one row at a time, on landscape pages."""
+
+    FONT = "Helvetica"
+    BOLD_FONT = "Helvetica-Bold"
+    FONT_SIZE = 7
+    TITLE_SIZE = 12
+    LINE_HEIGHT = 11
+    MARGIN = 36
+
+    def __init__(self, output, title: str):
+        self.canvas = canvas.Canvas(output, pagesize=landscape(A4))
+        self.canvas.setTitle(title)
+        self.width, self.height = landscape(A4)
+        self.usable_width = self.width - 2 * self.MARGIN
+        self.y = self.height - self.MARGIN
+        self.column_width = self.usable_width
+
+    def new_page(self, headers: Sequence[str] | None = None):
+        self.canvas.showPage()
+        self.y = self.height - self.MARGIN
+        if headers:
+            self.draw_row(headers, bold=True)
+
+    def draw_title(self, title: str):
+        if self.y - 3 * self.LINE_HEIGHT < self.MARGIN:
+            self.new_page()
+        self.y -= self.LINE_HEIGHT
+        self.canvas.setFont(self.BOLD_FONT, self.TITLE_SIZE)
+        self.canvas.drawString(self.MARGIN, self.y, title)
+        self.y -= self.LINE_HEIGHT
+
+    def draw_row(self, values: Sequence, bold: bool = False):
+        font = self.BOLD_FONT if bold else self.FONT
+        self.canvas.setFont(font, self.FONT_SIZE)
+        self.y -= self.LINE_HEIGHT
+        for index, value in enumerate(values):
+            text = self.fit(str(value), font)
+            self.canvas.drawString(
+                self.MARGIN + index * self.column_width, self.y, text
+            )
+
+    def fit(self, text: str, font: str) -> str:
+        """Truncate text to its column width."""
+        limit = self.column_width - 4
+        if stringWidth(text, font, self.FONT_SIZE) <= limit:
+            return text
+        while text and stringWidth(text + "...", font, self.FONT_SIZE) > limit:
+            text = text[:-1]
+        return text + "..."
+
+    def write_section(self, section: ExportSection):
+        self.column_width = self.usable_width / max(len(section.headers), 1)
+        self.draw_title(section.title)
+        self.draw_row(section.headers, bold=True)
+
+        for row in section.rows:
+            if self.y - self.LINE_HEIGHT < self.MARGIN:
+                self.new_page(section.headers)
+            self.draw_row(row)
+
+    def save(self):
+        self.canvas.save()
+
+
+def stream_pdf(sections: Iterable[ExportSection], title: str) -> Iterator[bytes]:
+    """Draw sections as tables in a single PDF document."""
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    writer = PDFTableWriter(output, title)
+    for section in sections:
+        writer.write_section(section)
+    writer.save()
+    yield from drain_file(output)
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a chunk stream into a single gzip member as it is produced."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
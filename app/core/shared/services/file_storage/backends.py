@@ -0,0 +1,299 @@
+"""
+Storage backends for uploaded files and export artefacts.
+
+S3Upload talks to storage only through a StorageBackend, chosen with the
+STORAGE_BACKEND setting:
+    s3:     the configured bucket, through the shared boto3 client
+    local:  files under LOCAL_STORAGE_ROOT, handed out as HMAC signed URLs that
+            the /files route serves with FileResponse
+    memory: a per-process dict, for tests and throwaway environments
+so development and tests run without AWS credentials or a mock S3 endpoint.
+"""
+
+import hashlib
+import hmac
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO, Dict, Iterator
+from urllib.parse import quote, urlencode
+
+from botocore.exceptions import ClientError
+
+from app.core.shared.exceptions.file_errors import (
+    InvalidFileSignatureError,
+    StoredObjectNotFoundError,
+)
+from app.core.shared.log_service.logger import logger
+from app.core.shared.services.file_storage.s3_client import (
+    MB,
+    TRANSFER_CONFIG,
+    get_s3_client,
+)
+from app.settings import config
+
+STREAM_CHUNK_SIZE = 1 * MB
+
+
+class StorageBackend(ABC):
+    """Put, stream, sign and delete objects by key."""
+
+    name: str
+
+    @abstractmethod
+    def put(self, key: str, contents: bytes, content_type: str | None = None) -> None:
+        pass
+
+    @abstractmethod
+    def put_stream(
+        self, key: str, fileobj: BinaryIO, content_type: str | None = None
+    ) -> None:
+        """Store a readable file-like object without loading it into memory."""
+
+    @abstractmethod
+    def get_stream(
+        self, key: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield an object's contents in chunks of at most chunk_size bytes."""
+
+    def get(self, key: str) -> bytes:
+        return b"".join(self.get_stream(key))
+
+    @abstractmethod
+    def presign(self, key: str, exp: int) -> str:
+        """A URL that downloads the object for the next exp seconds."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete an object. Deleting a missing key is not an error."""
+
+
+class S3Backend(StorageBackend):
+    name = "s3"
+
+    def __init__(self, bucket: str):
+        self.bucket = bucket
+
+    @property
+    def client(self):
+        return get_s3_client()
+
+    def put(self, key: str, contents: bytes, content_type: str | None = None) -> None:
+        extra = {"ContentType": content_type} if content_type else {}
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=contents, **extra)
+
+    def put_stream(
+        self, key: str, fileobj: BinaryIO, content_type: str | None = None
+    ) -> None:
+        """Files above the multipart threshold are sent as parallel multipart
+        uploads; smaller ones in a single request."""
+        self.client.upload_fileobj(
+            fileobj,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type} if content_type else None,
+            Config=TRANSFER_CONFIG,
+        )
+
+    def get_stream(
+        self, key: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                raise StoredObjectNotFoundError(key=key)
+            raise
+        yield from response["Body"].iter_chunks(chunk_size)
+
+    def presign(self, key: str, exp: int) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=exp,
+        )
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+
+class LocalBackend(StorageBackend):
+    """
+    Objects are files under root, named by their key. Writes go to a temporary
+    file that is renamed into place, so readers never see a partial file.
+    Reads are memory mapped, and signed URLs are verified by the /files route,
+    which hands the file to FileResponse so the server can sendfile it.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str, base_url: str, signing_key: str):
+        self.root = Path(root).resolve()
+        self.base_url = base_url.rstrip("/")
+        self.signing_key = signing_key.encode()
+
+    def path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root) or path == self.root:
+            raise StoredObjectNotFoundError(key=key)
+        return path
+
+    def _write(self, key: str, write) -> None:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                write(tmp)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def put(self, key: str, contents: bytes, content_type: str | None = None) -> None:
+        self._write(key, lambda tmp: tmp.write(contents))
+
+    def put_stream(
+        self, key: str, fileobj: BinaryIO, content_type: str | None = None
+    ) -> None:
+        self._write(
+            key, lambda tmp: shutil.copyfileobj(fileobj, tmp, STREAM_CHUNK_SIZE)
+        )
+
+    def get_stream(
+        self, key: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        try:
+            file = open(self.path(key), "rb")
+        except FileNotFoundError:
+            raise StoredObjectNotFoundError(key=key)
+
+        with file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for start in range(0, len(mapped), chunk_size):
+                    yield mapped[start : start + chunk_size]
+
+    def get(self, key: str) -> bytes:
+        try:
+            file = open(self.path(key), "rb")
+        except FileNotFoundError:
+            raise StoredObjectNotFoundError(key=key)
+
+        with file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return b""
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:]
+
+    def signature(self, key: str, expires: int) -> str:
+        message = f"{key}\n{expires}".encode()
+        return hmac.new(self.signing_key, message, hashlib.sha256).hexdigest()
+
+    def presign(self, key: str, exp: int) -> str:
+        expires = int(time.time()) + exp
+        query = urlencode(
+            {"expires": expires, "signature": self.signature(key, expires)}
+        )
+        return f"{self.base_url}/{quote(key)}?{query}"
+
+    def verified_path(self, key: str, expires: int, signature: str) -> Path:
+        """
+        Check a signed URL and return the file it points at.
+        Raises:
+            InvalidFileSignatureError: The signature is wrong or has expired
+            StoredObjectNotFoundError: The file no longer exists
+        """
+        if expires < time.time() or not hmac.compare_digest(
+            signature.encode(), self.signature(key, expires).encode()
+        ):
+            raise InvalidFileSignatureError(key=key)
+
+        path = self.path(key)
+        if not path.is_file():
+            raise StoredObjectNotFoundError(key=key)
+        return path
+
+    def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+
+class MemoryBackend(StorageBackend):
+    name = "memory"
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+        self.content_types: Dict[str, str | None] = {}
+        self.lock = Lock()
+
+    def put(self, key: str, contents: bytes, content_type: str | None = None) -> None:
+        with self.lock:
+            self.objects[key] = bytes(contents)
+            self.content_types[key] = content_type
+
+    def put_stream(
+        self, key: str, fileobj: BinaryIO, content_type: str | None = None
+    ) -> None:
+        self.put(key, fileobj.read(), content_type)
+
+    def get(self, key: str) -> bytes:
+        try:
+            return self.objects[key]
+        except KeyError:
+            raise StoredObjectNotFoundError(key=key)
+
+    def get_stream(
+        self, key: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        contents = self.get(key)
+        for start in range(0, len(contents), chunk_size):
+            yield contents[start : start + chunk_size]
+
+    def presign(self, key: str, exp: int) -> str:
+        return f"memory://{quote(key)}?expires={int(time.time()) + exp}"
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self.objects.pop(key, None)
+            self.content_types.pop(key, None)
+
+
+_backend: StorageBackend | None = None
+_backend_lock = Lock()
+
+
+def build_storage_backend(name: str) -> StorageBackend:
+    if name == "s3":
+        return S3Backend(config.AWS_BUCKET_NAME)
+    if name == "local":
+        return LocalBackend(
+            config.LOCAL_STORAGE_ROOT,
+            config.LOCAL_STORAGE_URL,
+            config.LOCAL_STORAGE_SIGNING_KEY or config.JWT_SECRET,
+        )
+    if name == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown storage backend: {name}")
+
+
+def get_storage_backend() -> StorageBackend:
+    """Return the backend selected by STORAGE_BACKEND, creating it on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_storage_backend(config.STORAGE_BACKEND)
+                logger.info(f"Using {_backend.name} storage backend")
+    return _backend
+
+
+def reset_storage_backend() -> None:
+    """Drop the backend so the next call builds it from the current settings."""
+    global _backend
+    _backend = None
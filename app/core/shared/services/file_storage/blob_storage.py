@@ -0,0 +1,196 @@
+import hashlib
+import tempfile
+from typing import BinaryIO, NamedTuple
+
+from sqlalchemy import delete, event, func, literal_column, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.shared.log_service.logger import logger
+from app.core.shared.models.storage import StoredBlob
+from app.core.shared.services.file_storage.s3_upload import MB, S3Upload
+
+HASH_CHUNK_SIZE = 1 * MB
+SPOOL_SIZE = 8 * MB
+PENDING_KEY = "blob_releases"
+
+
+class HashedStream(NamedTuple):
+    """A stream positioned at its start, with the digest and size of its contents."""
+
+    fileobj: BinaryIO
+    sha256: str
+    size: int
+
+
+class StoredFile(NamedTuple):
+    s3_key: str
+    size: int
+    deduplicated: bool
+
+
+def hash_stream(fileobj: BinaryIO) -> HashedStream:
+    """
+    Hash a stream in one pass. Seekable streams are rewound afterwards; streams
+    that can only be read once are copied to a spooled temporary file as they are
+    hashed so they can still be uploaded.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    seekable = fileobj.seekable() if hasattr(fileobj, "seekable") else False
+    spool = None if seekable else tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+
+    while chunk := fileobj.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+        if spool:
+            spool.write(chunk)
+
+    target = spool or fileobj
+    target.seek(0)
+    return HashedStream(target, digest.hexdigest(), size)
+
+
+class BlobStorage:
+    """
+    Content-addressed storage for uploaded files.
+
+    Files are stored under the SHA-256 of their contents, with a stored_blobs row
+    counting the records that point at each object. Uploading bytes that are
+    already stored only increments the count. Releasing the last reference leaves
+    the row at zero and queues the object on the session; once the transaction
+    commits, delete_released_blobs removes the row and the object together, so a
+    rollback keeps both. A concurrent upload of the same bytes either revives the
+    zero row first, and the object is kept, or waits on the row lock until the
+    object is gone and uploads it again.
+    """
+
+    def __init__(self, session: Session, upload: S3Upload):
+        self.session = session
+        self.upload = upload
+
+    @staticmethod
+    def blob_key(folder: str, sha256: str, extension: str) -> str:
+        return f"{folder}{sha256}.{extension}"
+
+    def add_reference(
+        self, s3_key: str, sha256: str, size: int, content_type: str
+    ) -> bool:
+        """
+        Count a new reference to a blob, creating its row if it is new.
+        Returns:
+            bool: True when the blob is new and its contents must be uploaded
+        """
+        stmt = insert(StoredBlob).values(
+            s3_key=s3_key,
+            sha256=sha256,
+            size=size,
+            content_type=content_type,
+            ref_count=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StoredBlob.s3_key],
+            set_={
+                "ref_count": StoredBlob.ref_count + 1,
+                "last_modified_at": func.now(),
+            },
+        ).returning(literal_column("xmax = 0").label("inserted"))
+        return self.session.execute(stmt).scalar_one()
+
+    def store(
+        self,
+        contents: bytes,
+        folder: str,
+        extension: str,
+        content_type: str,
+        sha256: str | None = None,
+    ) -> StoredFile:
+        """
+        Store an in-memory file, skipping the upload if its bytes are already stored.
+        Pass sha256 when the digest is already known, e.g. from a ValidatedUpload.
+        """
+        sha256 = sha256 or hashlib.sha256(contents).hexdigest()
+        s3_key = self.blob_key(folder, sha256, extension)
+
+        is_new = self.add_reference(s3_key, sha256, len(contents), content_type)
+        if is_new:
+            self.upload.s3_upload(contents, s3_key, content_type)
+        else:
+            logger.info(f"Reusing stored blob {s3_key}")
+        return StoredFile(s3_key, len(contents), not is_new)
+
+    def store_stream(
+        self, fileobj: BinaryIO, folder: str, extension: str, content_type: str
+    ) -> StoredFile:
+        """Store a file stream, skipping the upload if its bytes are already stored."""
+        hashed = hash_stream(fileobj)
+        s3_key = self.blob_key(folder, hashed.sha256, extension)
+
+        is_new = self.add_reference(s3_key, hashed.sha256, hashed.size, content_type)
+        if is_new:
+            self.upload.s3_upload_stream(hashed.fileobj, s3_key, content_type)
+        else:
+            logger.info(f"Reusing stored blob {s3_key}")
+        return StoredFile(s3_key, hashed.size, not is_new)
+
+    def release(self, s3_key: str | None) -> None:
+        """
+        Drop one reference to a blob and queue it for deletion once nothing points
+        at it. Keys stored before content addressing have no row and are deleted
+        after the commit as before.
+        """
+        if not s3_key:
+            return
+
+        remaining = self.session.execute(
+            update(StoredBlob)
+            .where(StoredBlob.s3_key == s3_key)
+            .values(ref_count=StoredBlob.ref_count - 1)
+            .returning(StoredBlob.ref_count)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+
+        if remaining is None or remaining <= 0:
+            pending = self.session.info.setdefault(PENDING_KEY, {})
+            pending[s3_key] = (self.upload, remaining is not None)
+
+
+def delete_released_blob(
+    session: Session, upload: S3Upload, s3_key: str, counted: bool
+) -> None:
+    """
+    Delete a released blob unless it gained a reference since its release.
+    The row stays locked until the object is gone, so an upload of the same bytes
+    waits and then stores them afresh.
+    """
+    with session.begin():
+        if counted:
+            deleted = session.execute(
+                delete(StoredBlob)
+                .where(StoredBlob.s3_key == s3_key, StoredBlob.ref_count <= 0)
+                .returning(StoredBlob.s3_key)
+            ).scalar_one_or_none()
+            if deleted is None:
+                logger.info(f"Keeping blob {s3_key}: referenced again")
+                return
+        upload.delete_object(s3_key)
+    logger.info(f"Deleted blob {s3_key}: no references left")
+
+
+@event.listens_for(Session, "after_commit")
+def delete_released_blobs(session: Session) -> None:
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+
+    with Session(bind=session.get_bind()) as cleanup:
+        for s3_key, (upload, counted) in pending.items():
+            try:
+                delete_released_blob(cleanup, upload, s3_key, counted)
+            except Exception as e:
+                logger.error(f"Failed to delete released blob {s3_key}: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_released_blobs(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
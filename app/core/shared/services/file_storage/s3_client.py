@@ -0,0 +1,67 @@
+"""
+Process-wide S3 client.
+
+boto3 clients are thread safe and expensive to build (credential resolution,
+endpoint and service model loading), so one client is shared by every request in
+a process instead of being created per S3Upload. It is built on first use, which
+keeps imports free of AWS calls, and dropped in forked children so worker
+processes never share their parent's connection pool.
+"""
+
+import os
+from threading import Lock
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+from app.settings import config
+
+MB = 1024 * 1024
+
+_client = None
+_client_lock = Lock()
+
+
+def client_config() -> Config:
+    return Config(
+        region_name=config.AWS_DEFAULT_REGION,
+        max_pool_connections=config.S3_MAX_POOL_CONNECTIONS,
+        connect_timeout=config.S3_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=config.S3_READ_TIMEOUT_SECONDS,
+        retries={"max_attempts": config.S3_MAX_RETRY_ATTEMPTS, "mode": "standard"},
+        tcp_keepalive=True,
+    )
+
+
+def get_s3_client():
+    """Return the shared S3 client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.session.Session().client(
+                    "s3",
+                    aws_access_key_id=config.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
+                    endpoint_url=config.AWS_S3_ENDPOINT_URL,
+                    config=client_config(),
+                )
+    return _client
+
+
+def reset_s3_client() -> None:
+    """Drop the shared client so the next call builds a new one."""
+    global _client
+    _client = None
+
+
+os.register_at_fork(after_in_child=reset_s3_client)
+
+
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=config.S3_MULTIPART_THRESHOLD_MB * MB,
+    multipart_chunksize=config.S3_MULTIPART_CHUNKSIZE_MB * MB,
+    max_concurrency=config.S3_UPLOAD_CONCURRENCY,
+    use_threads=True,
+)
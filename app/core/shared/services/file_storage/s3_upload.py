@@ -1,5 +1,9 @@
-import boto3
+import hashlib
 import magic
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from botocore.exceptions import ClientError
 from app.core.shared.exceptions import FileTooLargeError
@@ -10,14 +14,78 @@ from app.core.shared.exceptions.file_errors import (
 )
 from app.core.shared.exceptions.file_errors import AbsentKeyError
 from app.core.shared.log_service.logger import logger
+from app.core.shared.services.file_storage.backends import (
+    STREAM_CHUNK_SIZE,
+    get_storage_backend,
+)
+from app.core.shared.services.file_storage.s3_client import get_s3_client
+from app.infra.db.redis_db.presigned_urls import presigned_url_cache
 from app.settings import config
 
+KB = 1024
+MB = 1024 * KB
+SNIFF_SIZE = 8 * KB
+
+
+class SizeLimitedReader:
+    """
+    Read-only stream that replays an already sniffed header before the rest of the
+    underlying stream and raises FileTooLargeError as soon as more than max_size
+    bytes have been read. Used when the upload size can't be known up front.
+    """
+
+    def __init__(self, stream: BinaryIO, max_size: int, prefix: bytes = b""):
+        self.stream = stream
+        self.max_size = max_size
+        self.prefix = prefix
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            chunk = self.prefix + self.stream.read()
+            self.prefix = b""
+        else:
+            chunk = self.prefix[:size]
+            self.prefix = self.prefix[size:]
+            if len(chunk) < size:
+                chunk += self.stream.read(size - len(chunk))
+
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self.max_size:
+            raise FileTooLargeError(
+                size=self.bytes_read, threshold=f"{self.max_size // MB}MB"
+            )
+        return chunk
+
+    def readable(self) -> bool:
+        return True
+
+
+class StreamedUpload(NamedTuple):
+    """A validated upload ready to be streamed to storage."""
 
-s3 = boto3.resource("s3")
-bucket = s3.Bucket(config.AWS_BUCKET_NAME)
+    fileobj: BinaryIO
+    content_type: str
+    extension: str
+    size: int | None
+
+
+class ValidatedUpload(NamedTuple):
+    """A validated upload held in memory, with everything storage needs to know."""
+
+    contents: bytes
+    content_type: str
+    extension: str
+    size: int
+    sha256: str
 
 
 class S3Upload:
+    """
+    Validates uploads and moves files in and out of storage. Despite the name,
+    storage is whichever StorageBackend STORAGE_BACKEND selects.
+    """
+
     def __init__(self, session: Session, current_user):
         self.AWS_ACCESS_KEY_ID = config.AWS_ACCESS_KEY_ID
         self.AWS_SECRET_ACCESS_KEY = config.AWS_SECRET_ACCESS_KEY
@@ -26,69 +94,145 @@ class S3Upload:
         self.session = session
         self.current_user = current_user
 
-        self.s3_resource = boto3.resource(
-            "s3",
-            aws_access_key_id=self.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=self.AWS_SECRET_ACCESS_KEY,
-            region_name=self.AWS_DEFAULT_REGION,
-        )
+        self.KB = KB
+        self.MB = MB
+        self.storage = get_storage_backend()
 
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=self.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=self.AWS_SECRET_ACCESS_KEY,
-            region_name=self.AWS_DEFAULT_REGION,
-        )
-        self.bucket = self.s3_resource.Bucket(self.AWS_BUCKET_NAME)
-        self.KB = 1024
-        self.MB = 1024 * self.KB
-
-        if not self.AWS_ACCESS_KEY_ID or not self.AWS_SECRET_ACCESS_KEY:
+        if self.storage.name == "s3" and (
+            not self.AWS_ACCESS_KEY_ID or not self.AWS_SECRET_ACCESS_KEY
+        ):
             logger.error("AWS credentials not found in environment variables")
             raise ValueError("AWS credentials are required but not found in .env file")
 
-        logger.info(
-            f"S3Upload initialized for bucket: {self.AWS_BUCKET_NAME} in region: {self.AWS_DEFAULT_REGION}"
-        )
+    @property
+    def s3_client(self):
+        return get_s3_client()
 
-    def s3_upload(self, contents: bytes, key: str) -> str:
+    def s3_upload(
+        self, contents: bytes, key: str, content_type: str | None = None
+    ) -> str:
         """
-        Upload file to S3 with proper folder structure.
+        Upload file to storage with proper folder structure.
         Args:
             contents: File contents as bytes
             key: File name/key (folder path will be prepended)
+            content_type: MIME type stored on the object, if known
         """
 
-        logger.info(f"Uploading {key} to s3")
+        logger.info(f"Uploading {key} to {self.storage.name} storage")
         try:
-            self.bucket.put_object(Key=key, Body=contents)
+            self.storage.put(key, contents, content_type)
             return key
 
         except Exception as e:
             logger.error(f"Failed to upload {key}: {str(e)}")
             raise
 
+    def s3_upload_stream(self, fileobj: BinaryIO, key: str, content_type: str) -> str:
+        """
+        Stream a file-like object to storage without reading it into memory.
+        Args:
+            fileobj: Readable file-like object positioned at the start of the file
+            key: Object key
+            content_type: MIME type stored on the object
+        """
+        logger.info(f"Streaming {key} to {self.storage.name} storage")
+        try:
+            self.storage.put_stream(key, fileobj, content_type)
+            return key
+
+        except Exception as e:
+            logger.error(f"Failed to upload {key}: {str(e)}")
+            raise
+
+    def validate_file_stream(
+        self, file, min_size, max_size, supported_types: dict
+    ) -> StreamedUpload:
+        """
+        Validate an uploaded file without reading it into memory.
+        Only the first few KB are read to sniff the MIME type. The size comes from
+        the spooled file when it is seekable; otherwise it is enforced while the
+        file is streamed to storage.
+        Args:
+            file: The uploaded file
+            min_size: Minimum file size in bytes
+            max_size: Maximum file size in bytes
+            supported_types: Dict of supported MIME types and extensions
+        Returns:
+            StreamedUpload: Stream positioned at the start, MIME type and size
+        """
+        if not file or not file.filename:
+            raise EmptyFileError(entry=str(file))
+
+        stream = file.file
+        header = stream.read(SNIFF_SIZE)
+
+        if stream.seekable():
+            size = stream.seek(0, 2)
+            stream.seek(0)
+            fileobj = stream
+        else:
+            size = len(header) if len(header) < SNIFF_SIZE else None
+            fileobj = SizeLimitedReader(stream, max_size, prefix=header)
+
+        if size is not None:
+            self.check_size(size, min_size, max_size)
+
+        detected_type, extension = self.sniff_type(header, supported_types)
+
+        logger.info(
+            f"File validation successful: {file.filename}, size: {size} bytes, type: {detected_type}"
+        )
+        return StreamedUpload(fileobj, detected_type, extension, size)
+
     def validate_file_upload(
         self, file, min_size, max_size, supported_types: dict
-    ) -> bytes:
+    ) -> ValidatedUpload:
         """
-        Validate uploaded file for size, type, and content.
+        Validate an uploaded file and read it into memory in one pass.
+        A spooled file's size is checked before anything is read, the MIME type
+        is sniffed from the first SNIFF_SIZE bytes only, and the digest is taken
+        over the same bytes that are returned for storage.
         Args:
             file: The uploaded file
             min_size: Minimum file size in bytes
             max_size: Maximum file size in bytes
             supported_types: Dict of supported MIME types and extensions
         Returns:
-            bytes: File contents if valid
+            ValidatedUpload: Contents, MIME type, extension, size and SHA-256
         """
 
         if not file or not file.filename:
             raise EmptyFileError(entry=str(file))
 
-        contents = file.file.read()
-        file.file.seek(0)
+        stream = file.file
+        seekable = stream.seekable()
+        if seekable:
+            self.check_size(stream.seek(0, 2), min_size, max_size)
+            stream.seek(0)
+
+        contents = stream.read(max_size + 1)
+        if seekable:
+            stream.seek(0)
 
         size = len(contents)
+        self.check_size(size, min_size, max_size)
+        detected_type, extension = self.sniff_type(
+            contents[:SNIFF_SIZE], supported_types
+        )
+
+        logger.info(
+            f"File validation successful: {file.filename}, size: {size} bytes, type: {detected_type}"
+        )
+        return ValidatedUpload(
+            contents,
+            detected_type,
+            extension,
+            size,
+            hashlib.sha256(contents).hexdigest(),
+        )
+
+    def check_size(self, size: int, min_size: int, max_size: int) -> None:
         if size < min_size:
             raise FileTooSmallError(
                 size=size,
@@ -101,17 +245,20 @@ class S3Upload:
                 threshold=f"{max_size // self.MB}MB",
             )
 
-        detected_type = magic.from_buffer(contents, mime=True)
+    @staticmethod
+    def sniff_type(header: bytes, supported_types: dict) -> tuple[str, str]:
+        """
+        Detect the MIME type from the start of a file.
+        Returns:
+            tuple: The MIME type and the extension supported_types maps it to
+        """
+        detected_type = magic.from_buffer(header, mime=True)
         if detected_type not in supported_types:
             acceptable_formats = ", ".join(supported_types.keys())
             raise UnsupportedFileFormatError(
                 file_type=detected_type, acceptable_types=acceptable_formats
             )
-
-        logger.info(
-            f"File validation successful: {file.filename}, size: {size} bytes, type: {detected_type}"
-        )
-        return contents
+        return detected_type, supported_types[detected_type]
 
     def save_key_in_db(self, obj, s3_key: str, key_col_name: str):
         """
@@ -136,25 +283,89 @@ class S3Upload:
             )
             raise
 
-    def generate_presigned_url(self, s3_key: str, exp: int = 3600 * 24) -> str:
-        """
-        Generate presigned URL for secure, temporary access.
-        Default: 1 hour expiration
-        """
-        try:
-            if not s3_key or not s3_key.strip():
-                raise AbsentKeyError(entry=s3_key)
+    def s3_download(self, key: str) -> bytes:
+        """Read a whole object into memory."""
+        return self.storage.get(key)
 
-            url = self.s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": self.AWS_BUCKET_NAME, "Key": s3_key},
-                ExpiresIn=exp,
-            )
+    def stream_object(
+        self, key: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield an object in chunks, for responses that shouldn't buffer it."""
+        return self.storage.get_stream(key, chunk_size)
+
+    def delete_object(self, s3_key: str) -> None:
+        """Delete an object and drop any cached presigned URLs for it."""
+        self.storage.delete(s3_key)
+        presigned_url_cache.invalidate(s3_key)
 
-            logger.info(f"Generated presigned URL for {s3_key} (expires in {exp}s)")
-            return url
+    def sign_url(self, s3_key: str, exp: int) -> str:
+        try:
+            return self.storage.presign(s3_key, exp)
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             logger.error(f"Error generating presigned URL for {s3_key}: {error_code}")
             raise
+
+    def generate_presigned_url(self, s3_key: str, exp: int | None = None) -> str:
+        """
+        Generate presigned URL for secure, temporary access.
+        URLs are cached per key and expiry and reused until close to expiry.
+        Default: PRESIGNED_URL_EXPIRY_SECONDS (24 hours)
+        """
+        if not s3_key or not s3_key.strip():
+            raise AbsentKeyError(entry=s3_key)
+
+        return self.generate_presigned_urls([s3_key], exp)[s3_key]
+
+    def generate_presigned_urls(
+        self, s3_keys: Iterable[str], exp: int | None = None
+    ) -> Dict[str, str]:
+        """
+        Presigned URLs for many keys, looked up in the cache in one round trip.
+        Only keys missing from the cache are signed.
+        Returns:
+            dict: URL per S3 key
+        """
+        exp = exp or config.PRESIGNED_URL_EXPIRY_SECONDS
+        s3_keys = list(dict.fromkeys(s3_keys))
+
+        urls = presigned_url_cache.get_urls(s3_keys, exp)
+        signed = {
+            s3_key: self.sign_url(s3_key, exp)
+            for s3_key in s3_keys
+            if s3_key not in urls
+        }
+        if signed:
+            presigned_url_cache.save_urls(signed, exp)
+            logger.info(f"Generated {len(signed)} presigned URLs (expire in {exp}s)")
+        return {**urls, **signed}
+
+    def presigned_urls_for(
+        self, model, key_col_name: str, ids: List[UUID], exp: int | None = None
+    ) -> List[Dict]:
+        """
+        Presigned URLs for the files of many records, fetched in one query.
+        Records without a file get a null URL; unknown or archived ids are left out.
+        Args:
+            model: Model class holding the S3 key
+            key_col_name: Name of the S3 key column
+            ids: Record ids
+        """
+        key_column = getattr(model, key_col_name)
+        stmt = select(model.id, key_column).where(model.id.in_(ids))
+        if hasattr(model, "is_archived"):
+            stmt = stmt.where(model.is_archived == False)
+        return self.presigned_urls_for_records(self.session.execute(stmt).all(), exp)
+
+    def presigned_urls_for_records(
+        self, records: Iterable[Tuple[UUID, str | None]], exp: int | None = None
+    ) -> List[Dict]:
+        """Presigned URLs for (record id, S3 key) pairs, signing each key once."""
+        records = list(records)
+        urls = self.generate_presigned_urls(
+            [s3_key for _, s3_key in records if s3_key], exp
+        )
+        return [
+            {"id": record_id, "url": urls.get(s3_key)} for record_id, s3_key in records
+        ]
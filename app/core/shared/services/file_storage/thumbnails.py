@@ -0,0 +1,45 @@
+"""
+WebP thumbnails for uploaded images.
+
+Thumbnails are stored next to the original under a key derived from it, so
+callers can address any size from the original key alone and removing an
+image removes its thumbnails with it.
+"""
+
+import io
+from typing import Dict
+
+from PIL import Image, ImageOps
+
+from app.core.shared.schemas.enums import ThumbnailSize
+
+WEBP_QUALITY = 80
+
+
+def thumbnail_key(s3_key: str, size: ThumbnailSize | int) -> str:
+    """e.g. profile_pictures/student_ada_1f2e_profile.png -> ..._profile_64.webp"""
+    base = s3_key.rsplit(".", 1)[0] if "." in s3_key.rsplit("/", 1)[-1] else s3_key
+    return f"{base}_{int(size)}.webp"
+
+
+def render_thumbnails(contents: bytes) -> Dict[ThumbnailSize, bytes]:
+    """
+    Render every ThumbnailSize from an image, largest first, each as WebP.
+    Each size is downscaled from the previous one, and JPEGs are decoded at a
+    reduced scale, so large photos are never fully decoded more than needed.
+    """
+    sizes = sorted(ThumbnailSize, key=int, reverse=True)
+    largest = int(sizes[0])
+
+    with Image.open(io.BytesIO(contents)) as image:
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+        thumbnails = {}
+        for size in sizes:
+            image.thumbnail((int(size), int(size)), Image.Resampling.LANCZOS)
+            output = io.BytesIO()
+            image.save(output, format="WEBP", quality=WEBP_QUALITY, method=4)
+            thumbnails[size] = output.getvalue()
+    return thumbnails
@@ -1,10 +1,17 @@
-from sqlalchemy import select, exists
+from datetime import datetime, timezone
+from sqlalchemy import Column, Table, inspect, select, update
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Callable, Dict, Iterable, List
 from uuid import UUID
-from sqlalchemy.orm.collections import InstrumentedList
+from app.core.assessment.services.result_cache import (
+    RESULT_MODELS,
+    invalidate_after_commit,
+)
+from app.core.curriculum.models.curriculum import StudentSubject
+from app.core.identity.models.student import Student
 from .dependency_config import DEPENDENCY_CONFIG
-from ...exceptions import CascadeArchivalError
+from .dependency_checks import find_dependencies, find_dependencies_for_many
+from ...exceptions import BulkLifecycleError, CascadeArchivalError
 
 
 class ArchiveService:
@@ -27,7 +34,8 @@ class ArchiveService:
         self, entity_model, target_id: UUID, is_archived_field: str = "is_archived"
     ) -> List[str]:
         """
-        Check if any active entities are referencing the target entity using DEPENDENCY CONFIG
+        Check if any active entities are referencing the target entity using DEPENDENCY CONFIG.
+        All dependencies are checked in one query.
         Args:
             entity_model: SQLAlchemy model class for the entity type being checked
             target_id (UUID): The ID of the entity to check for dependencies
@@ -37,58 +45,129 @@ class ArchiveService:
             List[str]: Display names of entity types that have active dependencies
                        on the target entity. Empty list if no dependencies exist.
         """
-        dependencies = DEPENDENCY_CONFIG.get(entity_model)
-        failed = []
+        return find_dependencies(
+            self.session, entity_model, target_id, is_archived_field
+        )
 
-        for _, model_class, fk_field, display_name in dependencies:
-            # fk based check
-            table = model_class.__table__
-            stmt = select(
-                exists().where(
-                    table.c[fk_field] == target_id, table.c[is_archived_field] == False
-                )
-            )
+    @staticmethod
+    def lifecycle_table(entity_model) -> Table:
+        """The table holding an entity's archive columns, the base table for joined inheritance."""
+        return next(
+            table for table in inspect(entity_model).tables if "is_archived" in table.c
+        )
 
-            if self.session.execute(stmt).scalar_one():
-                failed.append(display_name)
+    def archive_values(self, table: Table, reason: str, archived_at: datetime) -> Dict:
+        values = {
+            "is_archived": True,
+            "archived_at": archived_at,
+            "archive_reason": reason,
+        }
+        if "last_modified_by" in table.c:
+            values["last_modified_by"] = self.current_user.id
+        return values
 
-        return failed
+    @staticmethod
+    def student_column(entity_model, table: Table) -> Column | None:
+        """The column naming the students whose results an entity feeds, if any."""
+        if entity_model is Student:
+            return table.c.id
+        if entity_model in RESULT_MODELS or entity_model is StudentSubject:
+            return table.c.student_id
+        return None
 
-    def cascade_archive_object(self, entity_model, target_obj, reason: str) -> None:
-        dependencies = DEPENDENCY_CONFIG.get(entity_model)
+    def refresh_student_results(self, student_ids: Iterable[UUID]) -> None:
+        """
+        Bring the transcripts of students touched by a set-based write up to date
+        and drop their cached result summaries once the transaction commits.
+        """
+        student_ids = set(student_ids) - {None}
+        if not student_ids:
+            return
+        from app.core.assessment.services.transcript_service import TranscriptService
 
-        for relationship_title, _, _, _ in dependencies:
-            if not relationship_title:
-                continue
+        invalidate_after_commit(self.session, student_ids)
+        TranscriptService(self.session, self.current_user).refresh_students(student_ids)
 
+    def archive_dependents(
+        self,
+        entity_model,
+        target_ids: List[UUID],
+        reason: str,
+        archived_at: datetime,
+    ) -> Dict[str, int]:
+        """
+        Archive the active records that depend on the targets per DEPENDENCY CONFIG,
+        with one UPDATE per dependent table. Nothing is committed; students whose
+        grades, enrollments or records are archived have their transcripts refreshed
+        and their cached result summaries dropped on commit.
+        Returns:
+            dict: Number of records archived per dependency display name
+        """
+        archived_entities = {}
+        student_ids = set()
+
+        for _, model_class, fk_field, display_name in DEPENDENCY_CONFIG.get(
+            entity_model, []
+        ):
+            table = model_class.__table__
+            stmt = (
+                update(table)
+                .where(
+                    table.c[fk_field].in_(target_ids),
+                    table.c.is_archived == False,
+                )
+                .values(**self.archive_values(table, reason, archived_at))
+            )
+            student_column = self.student_column(model_class, table)
+            if student_column is not None:
+                stmt = stmt.returning(student_column)
             try:
-                relationship_prop = getattr(
-                    type(target_obj), relationship_title
-                ).property
-                backref = relationship_prop.back_populates
+                result = self.session.execute(stmt)
+            except Exception as e:
+                self.session.rollback()
+                raise CascadeArchivalError(f"[{display_name}] Cascade failed: {e}")
 
-                if not backref:
-                    raise ValueError(
-                        f"Relationship '{relationship_title}' must define back_populates."
-                    )
+            if student_column is not None:
+                archived_students = result.scalars().all()
+                student_ids.update(archived_students)
+                archived_count = len(archived_students)
+            else:
+                archived_count = result.rowcount
 
-                related_attr = getattr(target_obj, relationship_title)
+            archived_entities[display_name] = (
+                archived_entities.get(display_name, 0) + archived_count
+            )
 
-                if isinstance(related_attr, InstrumentedList):
-                    for item in related_attr:
-                        item.archive(self.current_user, reason)
+        self.refresh_student_results(student_ids)
+        return archived_entities
 
-                elif related_attr is not None:
-                    related_attr.archive(self.current_user, reason)
+    def cascade_archive_object(
+        self, entity_model, target_obj, reason: str
+    ) -> Dict[str, Any]:
+        """
+        Archive an entity and every active record that depends on it per DEPENDENCY CONFIG.
+        Dependents are archived with one UPDATE per dependent table rather than by
+        loading them, and everything is committed in a single transaction.
+        Args:
+            entity_model: SQLAlchemy model class for the entity type being archived
+            target_obj: The entity to archive
+            reason: Archive reason applied to the entity and its dependents
 
-            except Exception as e:
-                self.session.rollback()
-                raise CascadeArchivalError(
-                    f"[{relationship_title}] Cascade failed: {e}"
-                )
+        Returns:
+            dict: The entity id and the number of records archived per dependency
+        """
+        archived_at = datetime.now(timezone.utc)
+        archived_entities = self.archive_dependents(
+            entity_model, [target_obj.id], reason, archived_at
+        )
+        student_column = self.student_column(
+            entity_model, self.lifecycle_table(entity_model)
+        )
 
         try:
-            target_obj.archive(self.current_user, reason)
+            target_obj.archive(self.current_user.id, reason)
+            if student_column is not None:
+                self.refresh_student_results([getattr(target_obj, student_column.key)])
             self.session.commit()
         except Exception as e:
             self.session.rollback()
@@ -96,13 +175,148 @@ class ArchiveService:
                 f"[{entity_model}] Failed to archive main object: {e}"
             )
 
+        return {
+            "id": target_obj.id,
+            "archived_entities": archived_entities,
+            "message": "Deep archive completed successfully",
+        }
+
+    def bulk_archive(
+        self,
+        entity_model,
+        target_ids: List[UUID],
+        reason: str,
+        cascade: bool = False,
+        on_archive: Callable[[List[UUID]], None] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Archive many entities in one transaction.
+        Without cascade, targets still referenced by active records are skipped;
+        the dependencies of all targets are found with a single grouped query.
+        With cascade, those records are archived along with the targets.
+        Args:
+            entity_model: SQLAlchemy model class for the entity type being archived
+            target_ids: IDs of the entities to archive
+            reason: Archive reason applied to every archived record
+            cascade: Archive dependent records too
+            on_archive: Called in the same transaction with the IDs being archived
+
+        Returns:
+            dict: Archived ids, records archived per dependency and failures per id
+        """
+        table = self.lifecycle_table(entity_model)
+        target_ids = list(dict.fromkeys(target_ids))
+        if not target_ids:
+            return {"succeeded": [], "archived_entities": {}, "failed": []}
+
+        active_ids = set(
+            self.session.execute(
+                select(table.c.id).where(
+                    table.c.id.in_(target_ids), table.c.is_archived == False
+                )
+            ).scalars()
+        )
+
+        failed = [
+            {"id": target_id, "reason": "Not found or already archived"}
+            for target_id in target_ids
+            if target_id not in active_ids
+        ]
+        archivable = [target_id for target_id in target_ids if target_id in active_ids]
+
+        if not cascade:
+            blocked = find_dependencies_for_many(
+                self.session, entity_model, archivable, "is_archived"
+            )
+            failed += [
+                {
+                    "id": target_id,
+                    "reason": f"Linked to active {', '.join(related_entities)}",
+                }
+                for target_id, related_entities in blocked.items()
+            ]
+            archivable = [
+                target_id for target_id in archivable if target_id not in blocked
+            ]
+
+        archived_entities = {}
+        if archivable:
+            archived_at = datetime.now(timezone.utc)
+            if cascade:
+                archived_entities = self.archive_dependents(
+                    entity_model, archivable, reason, archived_at
+                )
+            stmt = (
+                update(table)
+                .where(table.c.id.in_(archivable))
+                .values(**self.archive_values(table, reason, archived_at))
+            )
+            student_column = self.student_column(entity_model, table)
+            try:
+                if on_archive:
+                    on_archive(archivable)
+                if student_column is None:
+                    self.session.execute(stmt)
+                else:
+                    archived_students = self.session.execute(
+                        stmt.returning(student_column)
+                    ).scalars()
+                    self.refresh_student_results(archived_students.all())
+                self.session.commit()
+            except Exception as e:
+                self.session.rollback()
+                raise BulkLifecycleError("archive", f"[{entity_model}] {e}")
+
+        return {
+            "succeeded": archivable,
+            "archived_entities": archived_entities,
+            "failed": failed,
+        }
+
+    def bulk_restore(self, entity_model, target_ids: List[UUID]) -> Dict[str, Any]:
+        """
+        Restore many archived entities with a single UPDATE. Restoring students,
+        enrollments or total grades refreshes the affected transcripts.
+        Returns:
+            dict: Restored ids and failures per id
+        """
+        table = self.lifecycle_table(entity_model)
+        target_ids = list(dict.fromkeys(target_ids))
+        if not target_ids:
+            return {"succeeded": [], "archived_entities": {}, "failed": []}
+
+        values = {"is_archived": False, "archived_at": None, "archive_reason": None}
+        if "last_modified_by" in table.c:
+            values["last_modified_by"] = self.current_user.id
+
+        student_column = self.student_column(entity_model, table)
+        returning = [table.c.id]
+        if student_column is not None:
+            returning.append(student_column)
+
+        try:
+            rows = self.session.execute(
+                update(table)
+                .where(table.c.id.in_(target_ids), table.c.is_archived == True)
+                .values(**values)
+                .returning(*returning)
+            ).all()
+            restored = {row[0] for row in rows}
+            if student_column is not None:
+                self.refresh_student_results(row[-1] for row in rows)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise BulkLifecycleError("restore", f"[{entity_model}] {e}")
 
-# return {
-#         "student_id": student_id,
-#         "archived_entities": {
-#             "grades": result.get('grades_count', 0),
-#             "documents": result.get('documents_count', 0),
-#             "awards": result.get('awards_count', 0),
-#         },
-#         "message": "Deep archive completed successfully"
-#     }
+        return {
+            "succeeded": [
+                target_id for target_id in target_ids if target_id in restored
+            ],
+            "archived_entities": {},
+            "failed": [
+                {"id": target_id, "reason": "Not found or not archived"}
+                for target_id in target_ids
+                if target_id not in restored
+            ],
+        }
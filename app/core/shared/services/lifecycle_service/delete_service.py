@@ -1,11 +1,14 @@
+from functools import lru_cache
 from uuid import UUID
-from typing import List
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-from sqlalchemy import select, exists
+from typing import FrozenSet, Tuple
+from sqlalchemy import Select, bindparam, exists, inspect, select
+from sqlalchemy.orm import RelationshipDirection, Session
 from app.settings import config
+from app.core.shared.exceptions import DeletionDependencyError
+from app.core.shared.models.common_imports import Base
 from app.infra.db.repositories.sqlalchemy_repos.base_repo import SQLAlchemyRepository
 from .dependency_config import DEPENDENCY_CONFIG
+from .fk_rules import fk_rules_for_revision, get_fk_rules
 
 
 class DeleteService:
@@ -33,61 +36,117 @@ class DeleteService:
         self.repository = SQLAlchemyRepository(model, session)
         self.anonymous_user = UUID(config.ANONYMIZED_ID)
 
-    def check_active_dependencies_exists(
-        self, entity_model, target_id: UUID
-    ) -> List[str]:
+    def get_fk_delete_rules(self, table_name: str) -> dict:
         """
-        Check if any active entities are referencing the target entity using DEPENDENCY CONFIG
+        Returns a mapping of FK constraint names to their delete rules
+        for a given table. Rules come from the FK rule map of the current
+        schema revision, so no catalog query is made.
+
         Args:
-            entity_model: SQLAlchemy model class for the entity type being checked
-            target_id (UUID): The ID of the entity to check for dependencies
+            table_name (str): Name of the table to inspect
 
         Returns:
-            List[str]: Display names of entity types that have active dependencies
-                       on the target entity. Empty list if no dependencies exist.
+            dict: Mapping {constraint_name: delete_rule}
         """
-        dependencies = DEPENDENCY_CONFIG.get(entity_model)
-        failed = []
-
-        for _, model_class, fk_field, display_name in dependencies:
-            # fk based check
-            table = model_class.__table__
-            stmt = select(
-                exists().where(
-                    table.c[fk_field] == target_id,
-                )
+        return get_fk_rules().delete_rules(table_name)
+
+    def check_safe_delete(
+        self, entity_model, target_id: UUID, display_name: str | None = None
+    ) -> None:
+        """
+        Check that the target can be hard deleted. Every hard delete goes through
+        this check: rows listed for the model in DEPENDENCY_CONFIG, archived or not,
+        block the deletion, as do rows referencing the target through a foreign key
+        whose delete rule in the FK rule map would refuse it. References with CASCADE
+        or SET NULL rules are left to the database, and references the ORM deletes
+        or nulls itself are left to the ORM. All of it is checked in one query.
+        Args:
+            entity_model: SQLAlchemy model class for the entity type being deleted
+            target_id (UUID): The ID of the entity to delete
+            display_name (str): Name of the entity in the error message
+
+        Raises:
+            DeletionDependencyError: If any blocking references exist
+        """
+        blocking = blocking_reference_statement(entity_model, get_fk_rules().revision)
+        if blocking is None:
+            return
+
+        stmt, blocker_names = blocking
+        flags = self.session.execute(stmt, {"target_id": target_id}).one()
+        blocked_by = [name for name, found in zip(blocker_names, flags) if found]
+        if blocked_by:
+            raise DeletionDependencyError(
+                entity_model=entity_model.__name__,
+                identifier=target_id,
+                display_name=display_name or entity_model.__name__.lower(),
+                related_entities=", ".join(dict.fromkeys(blocked_by)),
             )
 
-            if self.session.execute(stmt).scalar_one():
-                failed.append(display_name)
 
-        return failed
+def orm_managed_references(entity_model) -> FrozenSet[Tuple[str, str]]:
+    """
+    (table, column) pairs of the references the ORM clears itself when an entity
+    is deleted through the session: children of delete-cascading relationships,
+    nullable foreign keys of other one-to-many relationships, which it sets to
+    NULL, and rows of many-to-many association tables.
+    """
+    managed = set()
+    for relationship in inspect(entity_model).relationships:
+        if relationship.viewonly:
+            continue
+        if relationship.direction is RelationshipDirection.MANYTOMANY:
+            managed.update(
+                (relationship.secondary.name, column.name)
+                for _, column in relationship.synchronize_pairs
+            )
+        elif (
+            relationship.direction is RelationshipDirection.ONETOMANY
+            and not relationship.passive_deletes
+        ):
+            remote = relationship.remote_side
+            if relationship.cascade.delete or all(c.nullable for c in remote):
+                managed.update((column.table.name, column.name) for column in remote)
+    return frozenset(managed)
 
-    def get_fk_delete_rules_from_info_schema(self, table_name: str) -> dict:
-        """
-        Returns a mapping of FK constraint names to their delete rules
-        for a given table using information_schema.
 
-        Args:
-            table_name (str): Name of the table to inspect
+@lru_cache(maxsize=None)
+def blocking_reference_statement(
+    entity_model, revision: str
+) -> Tuple[Select, Tuple[str, ...]] | None:
+    """
+    One SELECT with an EXISTS column per DEPENDENCY_CONFIG entry of the model and
+    per other blocking foreign key reference to its tables, along with the display
+    name of each column. Built once per model and schema revision.
+    """
+    rules = fk_rules_for_revision(revision)
+    columns, names = [], []
 
-        Returns:
-            dict: Mapping {constraint_name: delete_rule}
-        """
-        query = text(
-            """
-               SELECT
-                   tc.constraint_name,
-                   rc.delete_rule
-               FROM
-                   information_schema.table_constraints tc
-               JOIN
-                   information_schema.referential_constraints rc
-                   ON tc.constraint_name = rc.constraint_name
-               WHERE
-                   tc.constraint_type = 'FOREIGN KEY'
-                   AND tc.table_name = :table_name
-           """
+    def add(table, column_name: str, name: str) -> None:
+        columns.append(
+            exists()
+            .where(table.c[column_name] == bindparam("target_id"))
+            .label(f"reference_{len(columns)}")
         )
-        result = self.session.execute(query, {"table_name": table_name}).fetchall()
-        return {row.constraint_name: row.delete_rule.upper() for row in result}
+        names.append(name)
+
+    covered = set(orm_managed_references(entity_model))
+    for _, model_class, fk_field, display_name in DEPENDENCY_CONFIG.get(
+        entity_model, ()
+    ):
+        add(model_class.__table__, fk_field, display_name)
+        covered.add((model_class.__table__.name, fk_field))
+
+    own_tables = inspect(entity_model).tables
+    for table in own_tables:
+        for rule in rules.blocking_references(table.name):
+            if len(rule.columns) != 1 or (rule.table, rule.columns[0]) in covered:
+                continue
+            referencing = Base.metadata.tables[rule.table]
+            if referencing in own_tables and rule.columns[0] in referencing.primary_key:
+                continue
+            add(referencing, rule.columns[0], rule.table.replace("_", " "))
+
+    if not columns:
+        return None
+    return select(*columns), tuple(names)
@@ -0,0 +1,128 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy import (
+    CompoundSelect,
+    Select,
+    bindparam,
+    exists,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from .dependency_config import DEPENDENCY_CONFIG
+
+
+@lru_cache(maxsize=None)
+def dependency_check_statement(
+    entity_model, is_archived_field: str | None = None
+) -> Select | None:
+    """
+    Build one SELECT returning a boolean column per DEPENDENCY_CONFIG entry of a
+    model, so every dependency is checked in a single round trip. Statements are
+    built once per model and reused, which also lets SQLAlchemy reuse their
+    compiled form; the target id is bound at execution as :target_id.
+    Args:
+        entity_model: SQLAlchemy model class for the entity type being checked
+        is_archived_field: When set, only rows where this field is False count
+    Returns:
+        Select | None: The statement, or None if the model has no dependencies
+    """
+    dependencies = DEPENDENCY_CONFIG.get(entity_model)
+    if not dependencies:
+        return None
+
+    columns = []
+    for position, (_, model_class, fk_field, _) in enumerate(dependencies):
+        table = model_class.__table__
+        conditions = [table.c[fk_field] == bindparam("target_id")]
+        if is_archived_field:
+            conditions.append(table.c[is_archived_field] == False)
+        columns.append(exists().where(*conditions).label(f"dependency_{position}"))
+
+    return select(*columns)
+
+
+def find_dependencies(
+    session: Session,
+    entity_model,
+    target_id: UUID,
+    is_archived_field: str | None = None,
+) -> List[str]:
+    """
+    Display names of the DEPENDENCY_CONFIG entries with rows referencing target_id,
+    in config order.
+    """
+    stmt = dependency_check_statement(entity_model, is_archived_field)
+    if stmt is None:
+        return []
+
+    flags = session.execute(stmt, {"target_id": target_id}).one()
+    return [
+        display_name
+        for (_, _, _, display_name), found in zip(
+            DEPENDENCY_CONFIG[entity_model], flags
+        )
+        if found
+    ]
+
+
+@lru_cache(maxsize=None)
+def grouped_dependency_statement(
+    entity_model, is_archived_field: str | None = None
+) -> CompoundSelect | None:
+    """
+    Build one UNION ALL query listing, for many targets at once, which
+    DEPENDENCY_CONFIG entries reference each of them. Each row is a target id and
+    the position of a dependency in the config; target ids are bound at
+    execution as the expanding :target_ids parameter.
+    """
+    dependencies = DEPENDENCY_CONFIG.get(entity_model)
+    if not dependencies:
+        return None
+
+    selects = []
+    for position, (_, model_class, fk_field, _) in enumerate(dependencies):
+        fk_column = model_class.__table__.c[fk_field]
+        conditions = [fk_column.in_(bindparam("target_ids", expanding=True))]
+        if is_archived_field:
+            conditions.append(model_class.__table__.c[is_archived_field] == False)
+        selects.append(
+            select(
+                fk_column.label("target_id"),
+                literal_column(str(position)).label("dependency"),
+            )
+            .where(*conditions)
+            .group_by(fk_column)
+        )
+
+    return union_all(*selects)
+
+
+def find_dependencies_for_many(
+    session: Session,
+    entity_model,
+    target_ids: List[UUID],
+    is_archived_field: str | None = None,
+) -> Dict[UUID, List[str]]:
+    """
+    Display names of the dependencies referencing each target, in config order.
+    Targets without dependencies are left out.
+    """
+    stmt = grouped_dependency_statement(entity_model, is_archived_field)
+    if stmt is None or not target_ids:
+        return {}
+
+    dependencies = DEPENDENCY_CONFIG[entity_model]
+    found = defaultdict(list)
+    for target_id, position in session.execute(stmt, {"target_ids": list(target_ids)}):
+        found[target_id].append(position)
+
+    return {
+        target_id: [dependencies[position][3] for position in sorted(positions)]
+        for target_id, positions in found.items()
+    }
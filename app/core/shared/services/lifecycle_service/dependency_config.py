@@ -36,7 +36,7 @@ DEPENDENCY_CONFIG = {
     ],
     Classes: [("students", Student, "class_id", "students")],
     # Staff Organization
-    StaffJobTitle: [("staff_members", Staff, "title_id", "staff members")],
+    StaffJobTitle: [("staff_members", Staff, "job_title_id", "staff members")],
     StaffDepartment: [("staff_members", Staff, "department_id", "staff members")],
     # Users
     Guardian: [("wards", Student, "guardian_id", "wards")],
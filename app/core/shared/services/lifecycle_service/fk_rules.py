@@ -0,0 +1,109 @@
+import re
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Tuple
+
+from sqlalchemy import MetaData
+
+from app.core.shared.models.common_imports import Base
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[4] / "infra" / "db" / "migrations"
+BLOCKING_RULES = frozenset({"RESTRICT", "NO ACTION"})
+
+_REVISION = re.compile(r"^revision(?:\s*:[^=]+)?\s*=\s*['\"](\w+)['\"]", re.M)
+_DOWN_REVISION = re.compile(r"^down_revision(?:\s*:[^=]+)?\s*=\s*(.+)$", re.M)
+
+
+class ForeignKeyRule(NamedTuple):
+    constraint_name: str
+    table: str
+    columns: Tuple[str, ...]
+    referred_table: str
+    delete_rule: str
+
+
+class FKRuleMap(NamedTuple):
+    """
+    Read-only FK delete rules for one schema revision.
+    outgoing maps a table to the foreign keys declared on it; incoming maps a
+    table to the foreign keys of other tables that reference it.
+    """
+
+    revision: str
+    outgoing: Mapping[str, Tuple[ForeignKeyRule, ...]]
+    incoming: Mapping[str, Tuple[ForeignKeyRule, ...]]
+
+    def delete_rules(self, table_name: str) -> dict:
+        """Mapping {constraint_name: delete_rule} for the foreign keys on a table"""
+        return {
+            rule.constraint_name: rule.delete_rule
+            for rule in self.outgoing.get(table_name, ())
+        }
+
+    def blocking_references(self, table_name: str) -> Tuple[ForeignKeyRule, ...]:
+        """Foreign keys that will refuse the deletion of a referenced row"""
+        return tuple(
+            rule
+            for rule in self.incoming.get(table_name, ())
+            if rule.delete_rule in BLOCKING_RULES
+        )
+
+
+def build_fk_rule_map(metadata: MetaData, revision: str) -> FKRuleMap:
+    """
+    Build the FK rule map from SQLAlchemy metadata. Unnamed constraints get
+    Postgres' default name and a foreign key without an ondelete option gets
+    Postgres' default rule, NO ACTION.
+    """
+    outgoing, incoming = {}, {}
+    for table in metadata.tables.values():
+        for constraint in table.foreign_key_constraints:
+            columns = tuple(column.name for column in constraint.columns)
+            rule = ForeignKeyRule(
+                constraint_name=constraint.name
+                or f"{table.name}_{'_'.join(columns)}_fkey",
+                table=table.name,
+                columns=columns,
+                referred_table=constraint.referred_table.name,
+                delete_rule=(constraint.ondelete or "NO ACTION").upper(),
+            )
+            outgoing.setdefault(rule.table, []).append(rule)
+            incoming.setdefault(rule.referred_table, []).append(rule)
+
+    return FKRuleMap(
+        revision=revision,
+        outgoing=MappingProxyType({k: tuple(v) for k, v in outgoing.items()}),
+        incoming=MappingProxyType({k: tuple(v) for k, v in incoming.items()}),
+    )
+
+
+@lru_cache(maxsize=None)
+def schema_revision(migrations_dir: Path = MIGRATIONS_DIR) -> str:
+    """
+    Head Alembic revision of the migration scripts. The scripts are read as text
+    rather than imported, so this works without a configured Alembic env.
+    """
+    revisions, parents = set(), set()
+    for script in (migrations_dir / "versions").glob("*.py"):
+        source = script.read_text()
+        revision = _REVISION.search(source)
+        if not revision:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION.search(source)
+        if down_revision:
+            parents.update(re.findall(r"['\"](\w+)['\"]", down_revision.group(1)))
+
+    heads = sorted(revisions - parents)
+    return "+".join(heads) or "base"
+
+
+@lru_cache(maxsize=None)
+def fk_rules_for_revision(revision: str) -> FKRuleMap:
+    return build_fk_rule_map(Base.metadata, revision)
+
+
+def get_fk_rules() -> FKRuleMap:
+    """The FK rule map of the current schema revision, built on first use."""
+    return fk_rules_for_revision(schema_revision())
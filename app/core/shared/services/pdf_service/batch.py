@@ -0,0 +1,191 @@
+"""
+PDF rendering pool and batch helpers.
+
+Rendering is CPU bound, so documents are rendered in a process pool shared by the
+whole application process rather than on the request thread. Workers are spawned
+rather than forked, so they never inherit the server's threads, locks or database
+and Redis connections. Workers build every
+template and render a throwaway page when they start, so the first real document
+does not pay for ReportLab's imports and font setup. Batch results are consumed
+through a bounded window of in-flight jobs and written straight into a streamed
+ZIP archive, so a batch never holds more than a handful of rendered documents in
+memory at once.
+"""
+
+import multiprocessing
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError, wait
+from threading import Lock
+from typing import Dict, Iterable, Iterator, Tuple, Type
+
+from app.core.shared.exceptions import PDFRenderTimeoutError
+from app.core.shared.services.pdf_service.reportlab_base import ReportLabService
+from app.core.shared.services.pdf_service.templates.course_list import CourseListPDF
+from app.core.shared.services.pdf_service.templates.results import ResultPDF
+from app.settings import config
+
+
+TEMPLATES: Dict[str, Type[ReportLabService]] = {
+    "results": ResultPDF,
+    "course_list": CourseListPDF,
+}
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = Lock()
+_templates: Dict[str, ReportLabService] = {}
+
+
+def get_template(template: str) -> ReportLabService:
+    """Return this process's instance of a template, creating it on first use."""
+    if template not in _templates:
+        _templates[template] = TEMPLATES[template]()
+    return _templates[template]
+
+
+def _warm_worker() -> None:
+    """Pool initializer: build the templates and render one small document."""
+    for template in TEMPLATES:
+        get_template(template)
+    get_template("results").render_pdf({"result_list": []}, "warmup")
+
+
+def _worker_ready() -> bool:
+    return True
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for PDF rendering, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=config.PDF_RENDER_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+    return _pool
+
+
+def warm_render_pool() -> None:
+    """Start every pool worker now instead of on the first render requests."""
+    pool = get_render_pool()
+    wait([pool.submit(_worker_ready) for _ in range(config.PDF_RENDER_WORKERS)])
+
+
+def shutdown_render_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def render_template_pdf(template: str, data: Dict, filename: str) -> Tuple[bytes, str]:
+    """Render one document with a template. Runs inside a pool worker."""
+    return get_template(template).render_pdf(data, filename)
+
+
+def render_pdf(template: str, data: Dict, filename: str) -> Tuple[bytes, str]:
+    """
+    Render one document in the pool and wait for it, for at most
+    PDF_RENDER_TIMEOUT_SECONDS.
+
+    Args:
+        template: A key of TEMPLATES
+        data: Data accepted by the template's render_pdf
+        filename: Base filename for the PDF
+
+    Returns:
+        tuple: (pdf_bytes, sanitized_filename)
+
+    Raises:
+        PDFRenderTimeoutError: If the document is not ready in time
+    """
+    if template not in TEMPLATES:
+        raise ValueError(f"Unknown PDF template: {template}")
+
+    timeout = config.PDF_RENDER_TIMEOUT_SECONDS
+    future = get_render_pool().submit(render_template_pdf, template, data, filename)
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        future.cancel()
+        raise PDFRenderTimeoutError(filename, timeout)
+
+
+def render_in_pool(
+    jobs: Iterable[Tuple[Dict, str]],
+    template: str = "results",
+    window: int | None = None,
+) -> Iterator[Tuple[bytes, str]]:
+    """
+    Render documents in the process pool, yielding them in submission order.
+
+    Args:
+        jobs: Iterable of (data, filename) pairs accepted by the template's render_pdf
+        template: A key of TEMPLATES
+        window: Maximum number of documents rendering or waiting to be consumed
+
+    Yields:
+        tuple: (pdf_bytes, sanitized_filename)
+    """
+    pool = get_render_pool()
+    window = window or config.PDF_RENDER_WORKERS * 2
+    in_flight = deque()
+
+    for data, filename in jobs:
+        in_flight.append(pool.submit(render_template_pdf, template, data, filename))
+        if len(in_flight) >= window:
+            yield in_flight.popleft().result()
+
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
+class _StreamBuffer:
+    """Write-only file object that hands written bytes back to a generator."""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_zip(documents: Iterable[Tuple[bytes, str]]) -> Iterator[bytes]:
+    """
+    Stream (content, filename) pairs as a ZIP archive.
+
+    The archive is written to an unseekable buffer, so each entry is emitted as soon
+    as it has been compressed and only the central directory is kept until the end.
+    """
+    buffer = _StreamBuffer()
+    seen = set()
+
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for content, filename in documents:
+            if filename in seen:
+                stem, _, extension = filename.rpartition(".")
+                filename = f"{stem}_{len(seen)}.{extension}"
+            seen.add(filename)
+
+            archive.writestr(filename, content)
+            yield buffer.drain()
+
+    yield buffer.drain()
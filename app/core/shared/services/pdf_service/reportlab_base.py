@@ -1,51 +1,82 @@
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.platypus import TableStyle
 import re
 
 
-class ReportLabService:
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
-
-    def setup_custom_styles(self):
-        """Create custom styles for our document"""
-        # Title style
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomTitle",
-                parent=self.styles["Title"],
-                fontSize=18,
-                spaceAfter=12,
-                alignment=TA_CENTER,
-                textColor=colors.black,
-            )
+def build_styles() -> StyleSheet1:
+    """Create the sample stylesheet with the custom styles for our documents"""
+    styles = getSampleStyleSheet()
+
+    # Title style
+    styles.add(
+        ParagraphStyle(
+            name="CustomTitle",
+            parent=styles["Title"],
+            fontSize=18,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            textColor=colors.black,
         )
+    )
 
-        # Subtitle style
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomSubtitle",
-                parent=self.styles["Normal"],
-                fontSize=14,
-                spaceAfter=20,
-                alignment=TA_CENTER,
-                textColor=colors.black,
-            )
+    # Subtitle style
+    styles.add(
+        ParagraphStyle(
+            name="CustomSubtitle",
+            parent=styles["Normal"],
+            fontSize=14,
+            spaceAfter=20,
+            alignment=TA_CENTER,
+            textColor=colors.black,
         )
+    )
 
-        # Footer style
-        self.styles.add(
-            ParagraphStyle(
-                name="Footer",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                spaceBefore=30,
-                alignment=TA_CENTER,
-                textColor=colors.grey,
-            )
+    # Footer style
+    styles.add(
+        ParagraphStyle(
+            name="Footer",
+            parent=styles["Normal"],
+            fontSize=10,
+            spaceBefore=30,
+            alignment=TA_CENTER,
+            textColor=colors.grey,
         )
+    )
+    return styles
+
+
+# Styles are only read while rendering, so one copy per process is shared by
+# every template instance instead of being rebuilt per request.
+STYLES = build_styles()
+
+DATA_TABLE_STYLE = TableStyle(
+    [
+        # Header styling
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 12),
+        # Body styling
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 10),
+        # Borders and grid
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        # Padding
+        ("LEFTPADDING", (0, 0), (-1, -1), 8),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
+
+
+class ReportLabService:
+    def __init__(self):
+        self.styles = STYLES
 
     @staticmethod
     def slugify_filename(name: str) -> str:
@@ -1,10 +1,12 @@
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
-from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Table
 from typing import Dict, List
 import io
-from app.core.shared.services.pdf_service.reportlab_base import ReportLabService
+from app.core.shared.services.pdf_service.reportlab_base import (
+    DATA_TABLE_STYLE,
+    ReportLabService,
+)
 
 
 class ResultPDF(ReportLabService):
@@ -28,29 +30,7 @@ class ResultPDF(ReportLabService):
 
         table = Table(data, colWidths=[1.5 * inch, 3 * inch, 1.25 * inch, 1 * inch])
 
-        table.setStyle(
-            TableStyle(
-                [
-                    # Header styling
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 12),
-                    # Body styling
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 10),
-                    # Borders and grid
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    # Padding
-                    ("LEFTPADDING", (0, 0), (-1, -1), 8),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                    ("TOPPADDING", (0, 0), (-1, -1), 6),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ]
-            )
-        )
+        table.setStyle(DATA_TABLE_STYLE)
 
         return table
 
@@ -172,6 +172,9 @@ class QualificationFactory(BaseFactory):
             qualification_id: ID of qualification to delete
         """
         try:
+            self.delete_service.check_safe_delete(
+                self.model, qualification_id, self.display_name
+            )
             self.repository.delete(qualification_id)
         except EntityNotFoundError as e:
             self.raise_not_found(qualification_id, e)
@@ -218,6 +221,9 @@ class QualificationFactory(BaseFactory):
             qualification_id: ID of qualification to delete
         """
         try:
+            self.delete_service.check_safe_delete(
+                self.model, qualification_id, self.display_name
+            )
             self.repository.delete_archive(qualification_id)
         except EntityNotFoundError as e:
             self.raise_not_found(qualification_id, e)
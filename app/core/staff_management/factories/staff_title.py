@@ -19,7 +19,6 @@ from app.core.shared.exceptions.decorators.resolve_fk_violation import (
 from app.core.shared.exceptions import (
     EntityNotFoundError,
     ArchiveDependencyError,
-    DeletionDependencyError,
 )
 from app.core.shared.exceptions.maps.error_map import error_map
 
@@ -159,18 +158,10 @@ class StaffTitleFactory(BaseFactory):
             title_id: id of title to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, title_id
+            self.delete_service.check_safe_delete(
+                self.model, title_id, self.display_name
             )
 
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=title_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
-
             return self.repository.delete(title_id)
 
         except EntityNotFoundError as e:
@@ -216,17 +207,9 @@ class StaffTitleFactory(BaseFactory):
             title_id: id of title to delete
         """
         try:
-            failed_dependencies = self.delete_service.check_active_dependencies_exists(
-                self.model, title_id
+            self.delete_service.check_safe_delete(
+                self.model, title_id, self.display_name
             )
-
-            if failed_dependencies:
-                raise DeletionDependencyError(
-                    entity_model=self.entity_model,
-                    identifier=title_id,
-                    display_name=self.display_name,
-                    related_entities=", ".join(failed_dependencies),
-                )
             self.repository.delete_archive(title_id)
 
         except EntityNotFoundError as e:
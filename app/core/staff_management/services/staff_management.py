@@ -2,6 +2,11 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 from app.core.shared.validators.entity_validators import EntityValidator
 from app.core.staff_management.factories.department import StaffDepartmentFactory
+from app.core.shared.services.export_service.export_service import (
+    ExportService,
+    ExportStream,
+)
+from app.core.staff_management.models import StaffDepartment, EducatorQualification
 
 
 class StaffManagementService:
@@ -9,6 +14,7 @@ class StaffManagementService:
         self.session = session
         self.factory = StaffDepartmentFactory(session, current_user=current_user)
         self.entity_validator = EntityValidator(session)
+        self.export_service = ExportService(session, current_user)
 
     def assign_manager(self, department_id: UUID, manager_id: UUID | None = None):
         department = self.factory.get_staff_department(department_id)
@@ -24,3 +30,19 @@ class StaffManagementService:
         return self.factory.update_staff_department(
             department_id, {"manager_id": validated_manager_id}
         )
+
+    def export_department(
+        self, department_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export a staff department together with its staff members."""
+        return self.export_service.export_audit(
+            StaffDepartment, department_id, export_format
+        )
+
+    def export_qualification_audit(
+        self, qualification_id: UUID, export_format: str
+    ) -> ExportStream:
+        """Export an educator qualification record."""
+        return self.export_service.export_audit(
+            EducatorQualification, qualification_id, export_format
+        )
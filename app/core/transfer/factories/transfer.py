@@ -151,6 +151,9 @@ class TransferFactory(BaseFactory):
     @resolve_fk_on_delete(display="Transfer Record")
     def delete_transfer(self, transfer_id: UUID):
         try:
+            self.delete_service.check_safe_delete(
+                self.model, transfer_id, self.display_name
+            )
             return self.repository.delete(transfer_id)
         except EntityNotFoundError as e:
             self.raise_not_found(transfer_id, e)
@@ -181,6 +184,9 @@ class TransferFactory(BaseFactory):
     @resolve_fk_on_delete(display="Transfer record")
     def delete_archived_transfer(self, transfer_id: UUID):
         try:
+            self.delete_service.check_safe_delete(
+                self.model, transfer_id, self.display_name
+            )
             self.repository.delete_archive(transfer_id)
         except EntityNotFoundError as e:
             self.raise_not_found(transfer_id, e)
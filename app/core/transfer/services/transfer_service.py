@@ -8,6 +8,9 @@ from app.core.shared.exceptions import (
     EmptyFieldError,
     DepartmentNotSetError,
 )
+from app.core.shared.services.approval_service.batch_decision_service import (
+    BatchDecisionService,
+)
 from app.core.transfer.factories.transfer import TransferFactory
 from app.core.transfer.models.transfer import DepartmentTransfer
 
@@ -20,6 +23,7 @@ class TransferService:
             self.session, DepartmentTransfer, self.current_user
         )
         self.domain = "TRANSFER"
+        self.decisions = BatchDecisionService(self.session, self.current_user)
 
     def check_student_has_department(self, student_id: UUID):
         """Check if a student is assigned to a department before attempting transfer."""
@@ -88,3 +92,16 @@ class TransferService:
                     "status_completed_at": datetime.now(),
                 },
             )
+
+    def action_transfer_records(self, data) -> dict:
+        """
+        Approve or reject many transfers at once, moving approved students to
+        their new department.
+        Args:
+            data: Transfer ids, the decision and its reason
+        Returns:
+            dict: Decided transfer ids and failures per id
+        """
+        return self.decisions.decide(
+            DepartmentTransfer, data.ids, data.status, data.decision_reason
+        )
@@ -0,0 +1,151 @@
+from .config import r
+import json
+from datetime import datetime, timezone
+from typing import Dict
+from uuid import UUID
+
+from app.settings import config
+
+
+class ExportJobStore:
+    """
+    Queue and status store for background export jobs.
+
+    Each job is a hash holding its status and parameters, kept for
+    EXPORT_JOB_TTL_SECONDS after its last update. Queued job ids sit in a list
+    that each worker pops with BLMOVE onto its own processing list. Workers
+    refresh a heartbeat key while they run; once a worker's heartbeat lapses, the
+    jobs on its processing list are put back on the queue. Jobs held by live
+    workers are never requeued.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.key_pref = "export_job:"
+        self.queue_key = "export_jobs:queue"
+        self.processing_pref = "export_jobs:processing:"
+        self.heartbeat_pref = "export_jobs:heartbeat:"
+        self.workers_key = "export_jobs:workers"
+        self.ttl = config.EXPORT_JOB_TTL_SECONDS
+        self.heartbeat_ttl = config.EXPORT_WORKER_HEARTBEAT_SECONDS * 3
+
+    def _key(self, job_id: UUID | str) -> str:
+        return f"{self.key_pref}{job_id}"
+
+    def _processing_key(self, worker_id: str) -> str:
+        return f"{self.processing_pref}{worker_id}"
+
+    def _heartbeat_key(self, worker_id: str) -> str:
+        return f"{self.heartbeat_pref}{worker_id}"
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    def enqueue(
+        self, job_id: UUID, kind: str, params: Dict, requested_by: UUID, user_type: str
+    ) -> Dict:
+        job = {
+            "id": str(job_id),
+            "kind": kind,
+            "params": json.dumps(params),
+            "status": self.QUEUED,
+            "requested_by": str(requested_by),
+            "user_type": user_type,
+            "created_at": self._now(),
+        }
+        key = self._key(job_id)
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping=job)
+        pipe.expire(key, self.ttl)
+        pipe.lpush(self.queue_key, str(job_id))
+        pipe.execute()
+        return self.decode(job)
+
+    def register_worker(self, worker_id: str) -> None:
+        pipe = self.redis.pipeline()
+        pipe.sadd(self.workers_key, worker_id)
+        pipe.set(self._heartbeat_key(worker_id), self._now(), ex=self.heartbeat_ttl)
+        pipe.execute()
+
+    def heartbeat(self, worker_id: str) -> None:
+        self.redis.set(
+            self._heartbeat_key(worker_id), self._now(), ex=self.heartbeat_ttl
+        )
+
+    def retire_worker(self, worker_id: str) -> int:
+        """Requeue anything a stopping worker still holds and forget the worker."""
+        count = self._requeue(worker_id)
+        pipe = self.redis.pipeline()
+        pipe.srem(self.workers_key, worker_id)
+        pipe.delete(self._heartbeat_key(worker_id))
+        pipe.execute()
+        return count
+
+    def claim_next(self, worker_id: str, timeout: int = 5) -> str | None:
+        """Block until a job is queued and move it onto the worker's processing list."""
+        return self.redis.blmove(
+            self.queue_key, self._processing_key(worker_id), timeout, "RIGHT", "LEFT"
+        )
+
+    def release(self, worker_id: str, job_id: UUID | str) -> None:
+        self.redis.lrem(self._processing_key(worker_id), 0, str(job_id))
+
+    def _requeue(self, worker_id: str) -> int:
+        count = 0
+        while self.redis.lmove(
+            self._processing_key(worker_id), self.queue_key, "RIGHT", "RIGHT"
+        ):
+            count += 1
+        return count
+
+    def requeue_stalled(self) -> int:
+        """Return jobs held by workers whose heartbeat has lapsed to the queue."""
+        count = 0
+        for worker_id in self.redis.smembers(self.workers_key):
+            if self.redis.exists(self._heartbeat_key(worker_id)):
+                continue
+            count += self._requeue(worker_id)
+            self.redis.srem(self.workers_key, worker_id)
+        return count
+
+    def get_job(self, job_id: UUID | str) -> Dict | None:
+        job = self.redis.hgetall(self._key(job_id))
+        return self.decode(job) if job else None
+
+    def update_job(self, job_id: UUID | str, **fields) -> bool:
+        """
+        Update a job's fields and restart its expiry. A job that has already
+        expired is not recreated.
+        Returns:
+            bool: Whether the job still existed
+        """
+        key = self._key(job_id)
+        if not self.redis.exists(key):
+            return False
+
+        if fields.get("status") in (self.COMPLETED, self.FAILED):
+            fields["finished_at"] = self._now()
+        elif fields.get("status") == self.RUNNING:
+            fields["started_at"] = self._now()
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping={k: str(v) for k, v in fields.items() if v is not None})
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+        return True
+
+    @staticmethod
+    def decode(job: Dict) -> Dict:
+        job = dict(job)
+        job["params"] = json.loads(job.get("params") or "{}")
+        if "size" in job:
+            job["size"] = int(job["size"])
+        return job
+
+
+export_job_store = ExportJobStore(r)
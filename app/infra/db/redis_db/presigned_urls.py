@@ -0,0 +1,79 @@
+from .config import r
+import time
+from typing import Dict, Iterable
+
+import redis
+
+from app.settings import config
+from app.core.shared.log_service.logger import logger
+
+
+class PresignedUrlCache:
+    """
+    Caches presigned GET URLs in one hash per S3 key, with a field per expiry
+    bucket (the lifetime the URL was signed for). A URL is reused until it has
+    less than a quarter of its lifetime, or PRESIGNED_URL_MIN_REMAINING_SECONDS,
+    left, so cached URLs always outlive the page that requested them.
+    Redis errors are treated as cache misses and URLs are signed as before.
+    """
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.key_pref = "presigned_url:"
+
+    def _key(self, s3_key: str) -> str:
+        return f"{self.key_pref}{s3_key}"
+
+    @staticmethod
+    def reuse_seconds(exp: int) -> int:
+        """How long a URL signed for exp seconds may be handed out again."""
+        return exp - max(config.PRESIGNED_URL_MIN_REMAINING_SECONDS, exp // 4)
+
+    def get_urls(self, s3_keys: Iterable[str], exp: int) -> Dict[str, str]:
+        """Return cached URLs that are still fresh, keyed by S3 key."""
+        s3_keys = list(s3_keys)
+        if not s3_keys or self.reuse_seconds(exp) <= 0:
+            return {}
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for s3_key in s3_keys:
+                pipe.hget(self._key(s3_key), str(exp))
+            cached = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Presigned URL cache read failed: {e}")
+            return {}
+
+        now = time.time()
+        urls = {}
+        for s3_key, entry in zip(s3_keys, cached):
+            if entry:
+                reuse_until, url = entry.split("|", 1)
+                if float(reuse_until) > now:
+                    urls[s3_key] = url
+        return urls
+
+    def save_urls(self, urls: Dict[str, str], exp: int) -> None:
+        reuse_seconds = self.reuse_seconds(exp)
+        if not urls or reuse_seconds <= 0:
+            return
+        reuse_until = time.time() + reuse_seconds
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for s3_key, url in urls.items():
+                key = self._key(s3_key)
+                pipe.hset(key, str(exp), f"{reuse_until}|{url}")
+                pipe.expire(key, reuse_seconds)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Presigned URL cache write failed: {e}")
+
+    def invalidate(self, s3_key: str | None) -> None:
+        if not s3_key:
+            return
+        try:
+            self.redis.delete(self._key(s3_key))
+        except redis.RedisError as e:
+            logger.warning(f"Presigned URL cache invalidation failed: {e}")
+
+
+presigned_url_cache = PresignedUrlCache(r)
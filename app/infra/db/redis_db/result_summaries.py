@@ -0,0 +1,116 @@
+from .config import r
+import json
+from typing import Dict, Iterable, Tuple
+from uuid import UUID
+
+import redis
+
+from app.settings import config
+from app.core.shared.log_service.logger import logger
+
+
+class ResultSummaryCache:
+    """
+    Caches each student's term scores in one hash per student, with a field per
+    (generation, grading scale version, session, semester). Names are not cached;
+    readers join them in, so renames never leave stale summaries behind.
+
+    Invalidating a student bumps their generation counter and drops the hash. A
+    summary built from data read before an invalidation is saved under the old
+    generation, so readers never see it even when the save lands after the
+    invalidation. Generation counters do not expire, so there is one small counter
+    key per student whose results have changed. Redis errors are logged and treated
+    as cache misses so results are still served from the db when the cache is
+    unavailable.
+    """
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.key_pref = "result_summary:"
+        self.generation_pref = "result_summary_generation:"
+        self.ttl = config.RESULT_SUMMARY_TTL_SECONDS
+
+    def _key(self, student_id: UUID) -> str:
+        return f"{self.key_pref}{student_id}"
+
+    def _generation_key(self, student_id: UUID) -> str:
+        return f"{self.generation_pref}{student_id}"
+
+    @staticmethod
+    def _field(
+        generation: int, scale_version: str, academic_session: str, semester: str
+    ) -> str:
+        return f"{generation}:{scale_version}:{academic_session}:{semester}"
+
+    def get_summary(
+        self, student_id: UUID, scale_version: str, academic_session: str, semester: str
+    ) -> Tuple[Dict | None, int | None]:
+        """
+        Look up a cached summary with one round trip.
+        Returns:
+            tuple: The summary or None, and the student's current generation, which
+                   must be passed to save_summary. The generation is None when the
+                   cache could not be read.
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(self._generation_key(student_id))
+            pipe.hgetall(self._key(student_id))
+            generation, fields = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Result summary cache read failed: {e}")
+            return None, None
+
+        generation = int(generation or 0)
+        cached = fields.get(
+            self._field(generation, scale_version, academic_session, semester)
+        )
+        return (json.loads(cached) if cached else None), generation
+
+    def save_summary(
+        self,
+        student_id: UUID,
+        generation: int | None,
+        scale_version: str,
+        academic_session: str,
+        semester: str,
+        summary: Dict,
+    ) -> None:
+        if generation is None:
+            return
+        key = self._key(student_id)
+        try:
+            pipe = self.redis.pipeline()
+            pipe.hset(
+                key,
+                self._field(generation, scale_version, academic_session, semester),
+                json.dumps(summary),
+            )
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Result summary cache write failed: {e}")
+
+    def invalidate_students(self, student_ids: Iterable[UUID]) -> None:
+        student_ids = list(student_ids)
+        if not student_ids:
+            return
+        try:
+            pipe = self.redis.pipeline()
+            for student_id in student_ids:
+                pipe.incr(self._generation_key(student_id))
+            pipe.delete(*(self._key(student_id) for student_id in student_ids))
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Result summary cache invalidation failed: {e}")
+
+    def invalidate_all(self) -> None:
+        try:
+            keys = list(self.redis.scan_iter(match=f"{self.key_pref}*", count=1000))
+            for start in range(0, len(keys), 1000):
+                self.redis.delete(*keys[start : start + 1000])
+        except redis.RedisError as e:
+            logger.warning(f"Result summary cache flush failed: {e}")
+
+
+result_summary_cache = ResultSummaryCache(r)
@@ -127,26 +127,39 @@ class SQLAlchemyRepository(BaseRepository[T]):
         return stmt
 
     @handle_read_errors()
-    def execute_query(self, fields, filters) -> List[T]:
-        """Execute a query for active entities with sorting and pagination."""
-        stmt = self.active_query()
-        stmt = self.apply_filters(stmt, fields, filters)
-
+    def apply_ordering(self, stmt: Select, filters) -> Select:
+        """Order a query by the order_by and order_dir of a filter object."""
         order_by = getattr(filters, "order_by", "created_at")
         order_dir = getattr(filters, "order_dir", "asc")
 
         order_func = desc if order_dir == "desc" else asc
 
         if order_by == "full_name":
-            stmt = stmt.order_by(
+            return stmt.order_by(
                 order_func(self.model.first_name), order_func(self.model.last_name)
             )
 
         elif hasattr(self.model, order_by):
             order_column = getattr(self.model, order_by)
-            stmt = stmt.order_by(order_func(order_column))
-        else:
-            stmt = stmt.order_by(order_func(self.model.created_at))
+            return stmt.order_by(order_func(order_column))
+        return stmt.order_by(order_func(self.model.created_at))
+
+    def filtered_query(self, fields, filters) -> Select:
+        """Build the sorted, unpaginated query for active entities matching filters."""
+        stmt = self.active_query()
+        stmt = self.apply_filters(stmt, fields, filters)
+        return self.apply_ordering(stmt, filters)
+
+    @handle_read_errors()
+    def filtered_ids(self, fields, filters, archived: bool = False) -> List[UUID]:
+        """IDs of the active (or archived) entities matching filters, ignoring pagination."""
+        stmt = select(self.model.id).where(self.model.is_archived == archived)
+        stmt = self.apply_filters(stmt, fields, filters)
+        return list(self.session.execute(stmt).scalars())
+
+    def execute_query(self, fields, filters) -> List[T]:
+        """Execute a query for active entities with sorting and pagination."""
+        stmt = self.filtered_query(fields, filters)
 
         limit = getattr(filters, "limit", 100)
         offset = getattr(filters, "offset", 0)
@@ -191,6 +204,7 @@ class SQLAlchemyRepository(BaseRepository[T]):
                 )
 
         entity.archive(archived_by_id, reason)
+        self.session.flush()
         self.session.refresh(entity)
         return entity
 
@@ -264,7 +278,7 @@ class SQLAlchemyRepository(BaseRepository[T]):
                 )
 
         entity.restore()
-
+        self.session.flush()
         self.session.refresh(entity)
         return entity
 
@@ -5,10 +5,9 @@ current_dir = Path(__file__).resolve().parent
 env_path = current_dir / ".env"
 load_dotenv(dotenv_path=env_path)
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
-app = FastAPI()
-
 
 from app.api.staff_management import staff_departments_archive
 from app.api.staff_management import qualifications, staff_departments, staff_titles
@@ -22,8 +21,17 @@ from app.api.progression import (
     repetition,
 )
 from app.api.transfer import department_transfer
-from app.api.assessment import total_grade, grade
+from app.api.assessment import (
+    total_grade,
+    grade,
+    results,
+    analytics,
+    grading_scale,
+    transcripts,
+)
 from app.api.documents import award, document
+from app.api.exports import export_jobs
+from app.api.files import files
 
 from app.api.identity import student, guardian, staff, educator
 from app.api.auth import password
@@ -31,11 +39,32 @@ from app.api.auth import auth
 from app.api.rbac import role_change, roles
 
 from app.middleware.exception_handler import ExceptionMiddleware
+from app.core.shared.services.pdf_service.batch import (
+    shutdown_render_pool,
+    warm_render_pool,
+)
+from app.core.shared.services.lifecycle_service.fk_rules import get_fk_rules
+from app.core.rbac.services.role_service import load_role_ids
+from app.infra.db.db_config import SessionFactory
+from app.settings import config
 from app.core.shared.log_service.logger import logger
 
 version = "v1"
 
-app = FastAPI(version=version, title="Kademia")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_fk_rules()
+    if config.ROLE_IDS_PREWARM:
+        with SessionFactory() as session:
+            load_role_ids(session)
+    if config.PDF_RENDER_PREWARM:
+        warm_render_pool()
+    yield
+    shutdown_render_pool()
+
+
+app = FastAPI(version=version, title="Kademia", lifespan=lifespan)
 
 app.add_middleware(ExceptionMiddleware)
 
@@ -142,6 +171,26 @@ app.include_router(
     prefix=f"/api/{version}/students/assessment/total-grades",
     tags=["Assessment", "Admin"],
 )
+app.include_router(
+    results.router,
+    prefix=f"/api/{version}/students/assessment/results",
+    tags=["Assessment", "Admin"],
+)
+app.include_router(
+    analytics.router,
+    prefix=f"/api/{version}/students/assessment/analytics",
+    tags=["Assessment", "Admin"],
+)
+app.include_router(
+    grading_scale.router,
+    prefix=f"/api/{version}/students/assessment/grading-scale",
+    tags=["Assessment", "Admin"],
+)
+app.include_router(
+    transcripts.router,
+    prefix=f"/api/{version}/students/assessment/transcripts",
+    tags=["Assessment", "Admin"],
+)
 
 # Progression
 app.include_router(
@@ -175,6 +224,11 @@ app.include_router(
     tags=["Progression", "Admin"],
 )
 
+app.include_router(
+    export_jobs.router, prefix=f"/api/{version}/export-jobs", tags=["Exports"]
+)
+app.include_router(files.router, prefix=f"/api/{version}/files", tags=["Files"])
+
 
 @app.get("/")
 async def root():
@@ -48,10 +48,12 @@ class ExceptionMiddleware(BaseHTTPMiddleware):
         RelationshipErrorOnDelete: status.HTTP_500_INTERNAL_SERVER_ERROR,
         # File errors
         FileTooSmallError: status.HTTP_400_BAD_REQUEST,
-        FileTooLargeError: status.HTTP_400_BAD_REQUEST,
+        FileTooLargeError: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
         EmptyFileError: status.HTTP_400_BAD_REQUEST,
         UnsupportedFileFormatError: status.HTTP_400_BAD_REQUEST,
         AbsentKeyError: status.HTTP_400_BAD_REQUEST,
+        StoredObjectNotFoundError: status.HTTP_404_NOT_FOUND,
+        InvalidFileSignatureError: status.HTTP_403_FORBIDDEN,
         # Generic input validation exceptions
         EmptyFieldError: status.HTTP_400_BAD_REQUEST,
         SessionYearFormatError: status.HTTP_400_BAD_REQUEST,
@@ -87,24 +89,37 @@ class ExceptionMiddleware(BaseHTTPMiddleware):
         WeightTooHighError: status.HTTP_400_BAD_REQUEST,
         InvalidWeightError: status.HTTP_400_BAD_REQUEST,
         FileAlreadyExistsError: status.HTTP_400_BAD_REQUEST,
+        InvalidGradingScaleError: status.HTTP_400_BAD_REQUEST,
+        InvalidCohortScopeError: status.HTTP_400_BAD_REQUEST,
         UnableToRecalculateError: status.HTTP_500_INTERNAL_SERVER_ERROR,
         # Progression exceptions
         StudentToGraduateError: status.HTTP_400_BAD_REQUEST,
         InvalidRepetitionLevelError: status.HTTP_400_BAD_REQUEST,
         ProgressionStatusAlreadySetError: status.HTTP_400_BAD_REQUEST,
         LevelNotFinalError: status.HTTP_400_BAD_REQUEST,
+        InvalidPromotionScopeError: status.HTTP_400_BAD_REQUEST,
+        BatchPromotionError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+        InvalidDecisionStatusError: status.HTTP_400_BAD_REQUEST,
+        BatchDecisionError: status.HTTP_500_INTERNAL_SERVER_ERROR,
         # User profile exceptions (Staff/Student/Guardian)
         StaffTypeError: status.HTTP_400_BAD_REQUEST,
         InvalidSessionYearError: status.HTTP_400_BAD_REQUEST,
         DuplicateStudentIDError: status.HTTP_409_CONFLICT,
+        InvalidOnboardingInputError: status.HTTP_400_BAD_REQUEST,
+        BulkOnboardingError: status.HTTP_500_INTERNAL_SERVER_ERROR,
         # Export exceptions
         UnimplementedGathererError: status.HTTP_500_INTERNAL_SERVER_ERROR,
         ExportFormatError: status.HTTP_400_BAD_REQUEST,
+        ExportJobNotFoundError: status.HTTP_404_NOT_FOUND,
+        ExportJobNotReadyError: status.HTTP_409_CONFLICT,
+        PDFRenderTimeoutError: status.HTTP_503_SERVICE_UNAVAILABLE,
         # Archive/delete exceptions
         CascadeDeletionError: status.HTTP_500_INTERNAL_SERVER_ERROR,
         CascadeArchivalError: status.HTTP_500_INTERNAL_SERVER_ERROR,
         ArchiveDependencyError: status.HTTP_409_CONFLICT,
         DeletionDependencyError: status.HTTP_409_CONFLICT,
+        BulkLifecycleError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+        EmptyBulkSelectionError: status.HTTP_400_BAD_REQUEST,
         # Transfer exceptions
         TransferStatusAlreadySetError: status.HTTP_400_BAD_REQUEST,
         DepartmentNotSetError: status.HTTP_400_BAD_REQUEST,
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 from pydantic import EmailStr
@@ -26,15 +28,44 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
 
     EXPORT_DIR: str
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_PREWARM: bool = True
+    PDF_RENDER_TIMEOUT_SECONDS: int = 30
+    ROLE_IDS_PREWARM: bool = True
+    GRADING_SCALE_CACHE_SECONDS: int = 60
+    RESULT_SUMMARY_TTL_SECONDS: int = 86400
+    PROGRESSION_PASS_MARK: float = 50.0
+    PASSWORD_HASH_WORKERS: int = 4
+    BULK_ONBOARDING_MAX_ROWS: int = 5000
+    BULK_ONBOARDING_MAX_FILE_MB: int = 5
+    EXPORT_JOB_WORKERS: int = 2
+    EXPORT_JOB_TTL_SECONDS: int = 3 * 86400
+    EXPORT_WORKER_HEARTBEAT_SECONDS: int = 10
+    EXPORT_JOB_URL_EXPIRY_SECONDS: int = 3600
 
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
     AWS_DEFAULT_REGION: str
     AWS_BUCKET_NAME: str
+    AWS_S3_ENDPOINT_URL: str | None = None
+    S3_MULTIPART_THRESHOLD_MB: int = 8
+    S3_MULTIPART_CHUNKSIZE_MB: int = 8
+    S3_UPLOAD_CONCURRENCY: int = 4
+    S3_MAX_POOL_CONNECTIONS: int = 50
+    S3_MAX_RETRY_ATTEMPTS: int = 5
+    S3_CONNECT_TIMEOUT_SECONDS: int = 5
+    S3_READ_TIMEOUT_SECONDS: int = 60
+    PRESIGNED_URL_EXPIRY_SECONDS: int = 86400
+    PRESIGNED_URL_MIN_REMAINING_SECONDS: int = 3600
+    STORAGE_BACKEND: Literal["s3", "local", "memory"] = "s3"
+    LOCAL_STORAGE_ROOT: str = "storage"
+    LOCAL_STORAGE_URL: str = "http://localhost:8000/api/v1/files"
+    LOCAL_STORAGE_SIGNING_KEY: str | None = None
     PROFILE_PICTURES_FOLDER: str
     STUDENT_DOCUMENTS_FOLDER: str
     STUDENT_AWARDS_FOLDER: str
     ASSESSMENTS_FOLDER: str
+    EXPORTS_FOLDER: str = "exports"
 
     model_config = SettingsConfigDict(
         env_file="../.env",
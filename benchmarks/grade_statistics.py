@@ -0,0 +1,73 @@
+"""
+Benchmark for AssessmentAnalyticsService over one million total grades.
+
+Run from the repository root:
+    python -m benchmarks.grade_statistics
+"""
+
+import time
+from uuid import uuid4
+
+import numpy as np
+
+from app.core.assessment.services.analytics_service import AssessmentAnalyticsService
+from app.core.assessment.services.grading import grade_for_score
+
+GRADES = 1_000_000
+SUBJECTS_PER_STUDENT = 10
+REPEATS = 5
+
+
+def python_statistics(scores):
+    """Row-by-row baseline equivalent to AssessmentAnalyticsService.compute_statistics."""
+    ordered = sorted(scores)
+    count = len(ordered)
+    mean = sum(ordered) / count
+    std_dev = (sum((score - mean) ** 2 for score in ordered) / count) ** 0.5
+    first_index = {}
+    last_index = {}
+    for index, score in enumerate(ordered):
+        first_index.setdefault(score, index)
+        last_index[score] = index + 1
+    positions = [count - last_index[score] + 1 for score in scores]
+    distribution = {}
+    for score in scores:
+        grade = grade_for_score(score)
+        distribution[grade] = distribution.get(grade, 0) + 1
+    return mean, std_dev, positions, distribution
+
+
+def best_of(func, *args):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    rng = np.random.default_rng(42)
+    students = GRADES // SUBJECTS_PER_STUDENT
+    student_ids = np.repeat(
+        np.array([uuid4() for _ in range(students)], dtype=object),
+        SUBJECTS_PER_STUDENT,
+    )
+    scores = rng.integers(0, 101, size=GRADES).astype(np.float64)
+
+    service = AssessmentAnalyticsService
+    subject_stats = best_of(service.compute_statistics, scores)
+    averaging = best_of(service.average_by_student, student_ids, scores)
+    _, averages = service.average_by_student(student_ids, scores)
+    class_stats = best_of(service.compute_statistics, averages)
+    baseline = best_of(python_statistics, scores.tolist())
+
+    print(f"{GRADES:,} grades, {students:,} students, best of {REPEATS}")
+    print(f"  statistics over all grades (numpy):   {subject_stats * 1000:8.1f} ms")
+    print(f"  statistics over all grades (python):  {baseline * 1000:8.1f} ms")
+    print(f"  per-student averages (numpy):         {averaging * 1000:8.1f} ms")
+    print(f"  statistics over student averages:     {class_stats * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
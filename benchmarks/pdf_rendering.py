@@ -0,0 +1,113 @@
+"""
+Benchmark of results PDF throughput.
+
+Compares rendering on the request thread with a template built per request, as
+the services used to, against the module-level styles and the warm process
+pool, for single documents and for a class-sized batch.
+
+Run from the repository root:
+    python -m benchmarks.pdf_rendering
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.shared.services.pdf_service.batch import (
+    get_render_pool,
+    render_in_pool,
+    render_pdf,
+    shutdown_render_pool,
+    warm_render_pool,
+)
+from app.core.shared.services.pdf_service.reportlab_base import build_styles
+from app.core.shared.services.pdf_service.templates.results import ResultPDF
+from app.settings import config
+
+DOCUMENTS = 200
+CONCURRENT_REQUESTS = 8
+
+
+def result_data(n: int):
+    return {
+        "student_name": f"Student {n}",
+        "semester": "FIRST",
+        "academic_session": "2025/2026",
+        "date_generated": "19 Oct 2026",
+        "result_list": [
+            {
+                "course_code": f"SUB{row:03}",
+                "course_title": f"Subject {row}",
+                "total_score": 40 + row * 5,
+                "grading": "B",
+            }
+            for row in range(10)
+        ],
+    }
+
+
+JOBS = [(result_data(n), f"student {n} results") for n in range(DOCUMENTS)]
+
+
+def per_request_template():
+    """Baseline: styles rebuilt for every request, rendered on the request thread."""
+    for data, filename in JOBS:
+        template = ResultPDF()
+        template.styles = build_styles()
+        template.render_pdf(data, filename)
+
+
+def cached_template():
+    for data, filename in JOBS:
+        ResultPDF().render_pdf(data, filename)
+
+
+def pool_sequential():
+    for data, filename in JOBS:
+        render_pdf("results", data, filename)
+
+
+def pool_concurrent():
+    with ThreadPoolExecutor(max_workers=CONCURRENT_REQUESTS) as requests:
+        list(requests.map(lambda job: render_pdf("results", *job), JOBS))
+
+
+def pool_batch():
+    for _ in render_in_pool(JOBS, "results"):
+        pass
+
+
+def pdfs_per_second(func) -> float:
+    start = time.perf_counter()
+    func()
+    return DOCUMENTS / (time.perf_counter() - start)
+
+
+def main():
+    cold_start = time.perf_counter()
+    get_render_pool()
+    render_pdf("results", *JOBS[0])
+    cold = (time.perf_counter() - cold_start) * 1000
+    shutdown_render_pool()
+
+    warm_render_pool()
+    warm_start = time.perf_counter()
+    render_pdf("results", *JOBS[0])
+    warm = (time.perf_counter() - warm_start) * 1000
+
+    print(f"{DOCUMENTS} results PDFs, {config.PDF_RENDER_WORKERS} pool workers")
+    print(f"  first render, cold pool:             {cold:8.1f} ms")
+    print(f"  first render, warm pool:             {warm:8.1f} ms")
+    for label, func in [
+        ("template per request, in process", per_request_template),
+        ("cached styles, in process", cached_template),
+        ("pool, one request at a time", pool_sequential),
+        (f"pool, {CONCURRENT_REQUESTS} concurrent requests", pool_concurrent),
+        ("pool, batch", pool_batch),
+    ]:
+        print(f"  {label:36} {pdfs_per_second(func):8.1f} PDFs/s")
+
+    shutdown_render_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark of the per-request cost of preparing S3 access.
+
+Compares building a boto3 resource and client for every S3Upload, as each
+request used to, with S3Upload over the shared client. Presigning is included
+since it is what most requests do with the client; nothing is sent to AWS.
+
+Run from the repository root:
+    python -m benchmarks.s3_client_overhead
+"""
+
+import time
+
+import boto3
+
+from app.core.shared.services.file_storage.s3_client import (
+    get_s3_client,
+    reset_s3_client,
+)
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.settings import config
+
+REQUESTS = 200
+KEY = "profile_pictures/student/benchmark.webp"
+
+
+def per_request_clients():
+    """Baseline: a resource and a client built for every request."""
+    credentials = {
+        "aws_access_key_id": config.AWS_ACCESS_KEY_ID,
+        "aws_secret_access_key": config.AWS_SECRET_ACCESS_KEY,
+        "region_name": config.AWS_DEFAULT_REGION,
+        "endpoint_url": config.AWS_S3_ENDPOINT_URL,
+    }
+    boto3.resource("s3", **credentials).Bucket(config.AWS_BUCKET_NAME)
+    client = boto3.client("s3", **credentials)
+    client.generate_presigned_url(
+        "get_object", Params={"Bucket": config.AWS_BUCKET_NAME, "Key": KEY}
+    )
+
+
+def shared_client():
+    S3Upload(session=None, current_user=None).generate_presigned_url(KEY)
+
+
+def per_request_ms(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        func()
+    return (time.perf_counter() - start) * 1000 / REQUESTS
+
+
+def main():
+    baseline = per_request_ms(per_request_clients)
+
+    reset_s3_client()
+    start = time.perf_counter()
+    get_s3_client()
+    first_use = (time.perf_counter() - start) * 1000
+    shared = per_request_ms(shared_client)
+
+    print(f"{REQUESTS} requests")
+    print(f"  resource + client per request:  {baseline:8.2f} ms/request")
+    print(f"  shared client (first use):      {first_use:8.2f} ms once")
+    print(f"  shared client:                  {shared:8.2f} ms/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,10 @@ import pytest
 import os
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
-from ..tests.utils.db_utils import create_test_tables, drop_test_tables
-from ..tests.utils.pytest_utils import pytest_collection_modifyitems
+from .utils.db_utils import create_test_tables, drop_test_tables
+from .utils.pytest_utils import pytest_collection_modifyitems
 from .test_db import TEST_DB_URL
 
-from app import System
-from app import (
-    Gender,
-    AccessLevel,
-    UserType,
-    StaffType,
-    EmploymentStatus,
-    StaffAvailability,
-)
-from uuid import UUID
-
 
 @pytest.fixture(scope="session")
 def test_engine():
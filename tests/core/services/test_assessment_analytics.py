@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from app.core.assessment.services.analytics_service import AssessmentAnalyticsService
+
+
+@pytest.fixture
+def service():
+    return AssessmentAnalyticsService
+
+
+class TestComputeStatistics:
+    """Tests for the compute_statistics method"""
+
+    def test_summary_figures(self, service):
+        """Test mean, median, spread and bounds"""
+        result = service.compute_statistics(np.array([50.0, 75.0, 60.0, 75.0, 39.0]))
+        assert result["count"] == 5
+        assert result["mean"] == pytest.approx(59.8)
+        assert result["median"] == 60.0
+        assert result["std_dev"] == pytest.approx(np.std([50, 75, 60, 75, 39]))
+        assert result["min"] == 39.0
+        assert result["max"] == 75.0
+
+    def test_tied_scores_share_position(self, service):
+        """Test competition ranking and percentile ranks for ties"""
+        result = service.compute_statistics(np.array([50.0, 75.0, 60.0, 75.0, 39.0]))
+        assert result["positions"].tolist() == [4, 1, 3, 1, 5]
+        assert result["percentile_ranks"].tolist() == [30.0, 80.0, 50.0, 80.0, 10.0]
+
+    def test_grade_distribution_uses_band_minimums(self, service):
+        """Test that scores on a band minimum fall into that band"""
+        result = service.compute_statistics(
+            np.array([70.0, 60.0, 50.0, 45.0, 40.0, 39.9])
+        )
+        assert result["grade_distribution"] == {
+            "A": 1,
+            "B": 1,
+            "C": 1,
+            "D": 1,
+            "E": 1,
+            "F": 1,
+        }
+        assert result["gradings"].tolist() == ["A", "B", "C", "D", "E", "F"]
+
+    def test_empty_scores(self, service):
+        """Test statistics for a group without grades"""
+        result = service.compute_statistics(np.array([]))
+        assert result["count"] == 0
+        assert result["mean"] is None
+        assert sum(result["grade_distribution"].values()) == 0
+
+
+class TestAverageByStudent:
+    """Tests for the average_by_student method"""
+
+    def test_average_per_student(self, service):
+        """Test that grouped scores collapse to one average per student"""
+        ids = np.array(["a", "a", "b", "c", "c", "c"], dtype=object)
+        scores = np.array([40.0, 60.0, 55.0, 70.0, 80.0, 90.0])
+
+        student_ids, averages = service.average_by_student(ids, scores)
+        assert student_ids.tolist() == ["a", "b", "c"]
+        assert averages.tolist() == [50.0, 55.0, 80.0]
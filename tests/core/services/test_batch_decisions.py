@@ -0,0 +1,130 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.progression.models.progression import Promotion, Repetition
+from app.core.shared.exceptions import (
+    BatchDecisionError,
+    EmptyFieldError,
+    InvalidDecisionStatusError,
+)
+from app.core.shared.models.enums import ApprovalStatus
+from app.core.shared.services.approval_service.batch_decision_service import (
+    BatchDecisionService,
+)
+from app.core.transfer.models.transfer import DepartmentTransfer
+
+
+class DecisionSession:
+    """
+    Returns the decidable ids from the conditional UPDATE, answers the lookup of
+    undecided ids with the existing ones and records every UPDATE
+    """
+
+    def __init__(self, decidable, existing=(), fail_updates=False):
+        self.decidable = list(decidable)
+        self.existing = list(existing)
+        self.fail_updates = fail_updates
+        self.updates = []
+        self.committed = False
+        self.rolled_back = False
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        if self.fail_updates:
+            raise RuntimeError("serialization failure")
+        self.updates.append(sql)
+        return SimpleNamespace(
+            rowcount=len(self.decidable),
+            scalars=lambda: SimpleNamespace(all=lambda: self.decidable),
+        )
+
+    def scalars(self, stmt, params=None):
+        return iter(self.existing)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def decide(session, model, ids, status, reason="Reviewed"):
+    service = BatchDecisionService(session, SimpleNamespace(id=uuid4()))
+    return service.decide(model, ids, status, reason)
+
+
+class TestBatchDecisions:
+    """Tests for set-based approval decisions"""
+
+    def test_reports_outcome_per_record(self):
+        """Test that missing and already-decided records fail, the rest are decided"""
+        pending, approved, missing = uuid4(), uuid4(), uuid4()
+        session = DecisionSession([pending], existing=[approved])
+
+        result = decide(
+            session, Promotion, [pending, approved, missing], ApprovalStatus.APPROVED
+        )
+
+        assert result["succeeded"] == [pending]
+        assert result["failed"] == [
+            {"id": approved, "reason": "Promotion has already been approved"},
+            {"id": missing, "reason": "Not found"},
+        ]
+        assert len(session.updates) == 2
+        assert "promotions.status != " in session.updates[0]
+        assert session.updates[0].endswith("RETURNING promotions.id")
+        assert session.committed
+
+    def test_students_move_only_with_decided_records(self):
+        """Test that students are left alone when no record was still undecided"""
+        record = uuid4()
+        session = DecisionSession([], existing=[record])
+
+        result = decide(session, Promotion, [record], ApprovalStatus.APPROVED)
+
+        assert result["succeeded"] == []
+        assert len(session.updates) == 1
+        assert session.updates[0].startswith("UPDATE promotions")
+
+    def test_rejection_restores_previous_level(self):
+        """Test that rejecting repetitions moves students back in one UPDATE"""
+        record = uuid4()
+        session = DecisionSession([record])
+
+        decide(session, Repetition, [record], ApprovalStatus.REJECTED)
+
+        assert session.updates[0].startswith("UPDATE repetitions")
+        assert session.updates[1].startswith(
+            "UPDATE students SET level_id=repetitions.failed_level_id"
+        )
+
+    def test_rejected_transfers_leave_students_alone(self):
+        """Test that only the transfer records change when transfers are rejected"""
+        record = uuid4()
+        session = DecisionSession([record])
+
+        decide(session, DepartmentTransfer, [record], ApprovalStatus.REJECTED)
+
+        assert len(session.updates) == 1
+        assert session.updates[0].startswith("UPDATE department_transfers")
+
+    def test_invalid_decisions(self):
+        """Test that pending decisions and reasonless rejections are refused"""
+        session = DecisionSession([])
+        with pytest.raises(InvalidDecisionStatusError):
+            decide(session, Promotion, [uuid4()], ApprovalStatus.PENDING)
+        with pytest.raises(EmptyFieldError):
+            decide(session, Promotion, [uuid4()], ApprovalStatus.REJECTED, None)
+
+    def test_failed_update_rolls_back(self):
+        """Test that a failed decision leaves every record and student unchanged"""
+        record = uuid4()
+        session = DecisionSession([record], fail_updates=True)
+
+        with pytest.raises(BatchDecisionError):
+            decide(session, Promotion, [record], ApprovalStatus.APPROVED)
+
+        assert session.rolled_back and not session.committed
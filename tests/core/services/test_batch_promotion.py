@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.progression.schemas.promotion import (
+    BatchPromotionApproval,
+    BatchPromotionCreate,
+)
+from app.core.progression.services.promotion_service import PromotionService
+from app.core.shared.exceptions import InvalidPromotionScopeError
+
+
+class ScriptedSession:
+    """Returns queued results in order and records every statement"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.committed = False
+
+    def _next(self, stmt, params):
+        self.statements.append(
+            (str(stmt.compile(dialect=postgresql.dialect())), params)
+        )
+        return self.results.pop(0) if self.results else []
+
+    def execute(self, stmt, params=None):
+        rows = self._next(stmt, params)
+        return SimpleNamespace(
+            all=lambda: rows, scalars=lambda: SimpleNamespace(all=lambda: rows)
+        )
+
+    def scalars(self, stmt, params=None):
+        return iter(self._next(stmt, params))
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+def level(rank, is_final=False):
+    return SimpleNamespace(id=uuid4(), promotion_rank=rank, is_final=is_final)
+
+
+@pytest.fixture
+def levels():
+    return [level(1), level(2), level(3, is_final=True)]
+
+
+def service(session):
+    return PromotionService(session, SimpleNamespace(id=uuid4()))
+
+
+class TestBatchPromotion:
+    """Tests for the batch promotion engine"""
+
+    def test_next_level_map_from_one_query(self, levels):
+        """Test that next levels come from promotion ranks, with final levels unmapped"""
+        session = ScriptedSession(levels)
+        next_levels = service(session).next_level_map()
+
+        assert next_levels == {
+            levels[0].id: levels[1].id,
+            levels[1].id: levels[2].id,
+            levels[2].id: None,
+        }
+        assert len(session.statements) == 1
+
+    def test_batch_creates_promotions_in_one_insert(self, levels):
+        """Test that eligible students get promotions in one insert, others are skipped"""
+        promoted, existing, final = (
+            SimpleNamespace(id=uuid4(), level_id=levels[0].id),
+            SimpleNamespace(id=uuid4(), level_id=levels[0].id),
+            SimpleNamespace(id=uuid4(), level_id=levels[2].id),
+        )
+        session = ScriptedSession([promoted, existing, final], [existing.id], levels)
+        data = BatchPromotionCreate(academic_session="2025/2026", level_id=uuid4())
+
+        result = service(session).create_batch_promotion(data)
+
+        insert_sql, rows = session.statements[-1]
+        assert insert_sql.startswith("INSERT INTO promotions")
+        assert [row["student_id"] for row in rows] == [promoted.id]
+        assert rows[0]["promoted_level_id"] == levels[1].id
+        assert result["succeeded"] == [rows[0]["id"]]
+        assert [failure["id"] for failure in result["failed"]] == [
+            existing.id,
+            final.id,
+        ]
+        assert len(session.statements) == 4
+        assert session.committed
+
+    def test_scope_needs_exactly_one_level_or_class(self):
+        """Test that a batch must name a level or a class, not both or neither"""
+        data = BatchPromotionCreate(
+            academic_session="2025/2026", level_id=uuid4(), class_id=uuid4()
+        )
+        with pytest.raises(InvalidPromotionScopeError):
+            service(ScriptedSession()).create_batch_promotion(data)
+
+    def test_batch_approval_decides_pending_promotions(self):
+        """Test that the run's pending promotions are approved through batch decisions"""
+        pending, decided = uuid4(), uuid4()
+        session = ScriptedSession([pending, decided], [pending], [], [])
+        data = BatchPromotionApproval(academic_session="2025/2026", class_id=uuid4())
+
+        result = service(session).approve_batch_promotion(data)
+
+        statements = [sql for sql, _ in session.statements]
+        assert "promotions.status = %(status_1)s" in statements[0]
+        assert statements[1].startswith("UPDATE promotions")
+        assert statements[2].startswith(
+            "UPDATE students SET level_id=promotions.promoted_level_id"
+        )
+        assert result["succeeded"] == [pending]
+        assert result["failed"] == [{"id": decided, "reason": "Not found"}]
@@ -0,0 +1,34 @@
+import hashlib
+import io
+
+from app.core.shared.services.file_storage.blob_storage import BlobStorage, hash_stream
+from app.core.shared.services.file_storage.s3_upload import SizeLimitedReader
+
+DATA = b"%PDF-1.7 " + bytes(range(256)) * 12_000
+
+
+class TestHashStream:
+    """Tests for single pass hashing of uploads"""
+
+    def test_seekable_stream_is_rewound(self):
+        """Test that a seekable stream is hashed in place and left at its start"""
+        stream = io.BytesIO(DATA)
+        hashed = hash_stream(stream)
+        assert hashed.fileobj is stream
+        assert hashed.sha256 == hashlib.sha256(DATA).hexdigest()
+        assert hashed.size == len(DATA)
+        assert stream.read() == DATA
+
+    def test_one_shot_stream_is_spooled(self):
+        """Test that a forward-only stream can still be uploaded after hashing"""
+        reader = SizeLimitedReader(io.BytesIO(DATA[8:]), len(DATA), prefix=DATA[:8])
+        hashed = hash_stream(reader)
+        assert hashed.sha256 == hashlib.sha256(DATA).hexdigest()
+        assert hashed.fileobj.read() == DATA
+
+    def test_identical_contents_share_a_key(self):
+        """Test that keys depend only on folder, contents and extension"""
+        sha256 = hashlib.sha256(DATA).hexdigest()
+        assert BlobStorage.blob_key("student-documents/", sha256, "pdf") == (
+            f"student-documents/{sha256}.pdf"
+        )
@@ -0,0 +1,145 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.assessment.services.transcript_service import TranscriptService
+from app.core.identity.models.student import Student
+from app.core.shared.exceptions import BulkLifecycleError
+from app.core.shared.schemas.enums import ArchiveReason
+from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
+from app.core.shared.services.lifecycle_service.dependency_checks import (
+    grouped_dependency_statement,
+)
+from app.core.shared.services.lifecycle_service.dependency_config import (
+    DEPENDENCY_CONFIG,
+)
+
+
+class BulkSession:
+    """Answers the active-id lookup and the grouped dependency query, records updates"""
+
+    def __init__(self, active_ids, dependency_rows=(), fail_updates=False):
+        self.active_ids = active_ids
+        self.dependency_rows = list(dependency_rows)
+        self.fail_updates = fail_updates
+        self.updates = []
+        self.queries = 0
+        self.info = {}
+        self.committed = False
+        self.rolled_back = False
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        if sql.startswith("UPDATE"):
+            if self.fail_updates:
+                raise RuntimeError("lock timeout")
+            self.updates.append(sql)
+            student_ids = [uuid4(), uuid4()]
+            return SimpleNamespace(
+                rowcount=2, scalars=lambda: SimpleNamespace(all=lambda: student_ids)
+            )
+        self.queries += 1
+        if "UNION ALL" in sql:
+            return iter(self.dependency_rows)
+        return SimpleNamespace(scalars=lambda: iter(self.active_ids))
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+@pytest.fixture
+def service():
+    return lambda session: ArchiveService(session, SimpleNamespace(id=uuid4()))
+
+
+@pytest.fixture(autouse=True)
+def refreshed(monkeypatch):
+    """Records the students whose transcripts are refreshed, per call"""
+    calls = []
+    monkeypatch.setattr(
+        TranscriptService,
+        "refresh_students",
+        lambda self, student_ids: calls.append(set(student_ids)),
+    )
+    return calls
+
+
+class TestBulkLifecycle:
+    """Tests for bulk archival and the grouped dependency check"""
+
+    def test_grouped_statement_binds_ids_once(self):
+        """Test that all dependencies are checked in one UNION ALL over one id list"""
+        sql = str(
+            grouped_dependency_statement(Student, "is_archived").compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert sql.count("UNION ALL") == len(DEPENDENCY_CONFIG[Student]) - 1
+        assert sql.count("is_archived = false") == len(DEPENDENCY_CONFIG[Student])
+        assert grouped_dependency_statement(Student, "is_archived") is (
+            grouped_dependency_statement(Student, "is_archived")
+        )
+
+    def test_reports_missing_and_blocked_ids(self, service):
+        """Test that only unblocked active targets are archived, in one UPDATE"""
+        free, blocked, missing = uuid4(), uuid4(), uuid4()
+        session = BulkSession([free, blocked], dependency_rows=[(blocked, 3)])
+
+        result = service(session).bulk_archive(
+            Student, [free, blocked, missing, free], ArchiveReason.GRADUATED
+        )
+
+        assert result["succeeded"] == [free]
+        assert {failure["id"]: failure["reason"] for failure in result["failed"]} == {
+            missing: "Not found or already archived",
+            blocked: "Linked to active grades",
+        }
+        assert session.queries == 2
+        assert len(session.updates) == 1
+        assert session.committed
+
+    def test_on_archive_gets_only_archived_ids(self, service):
+        """Test that the archive hook is called with the targets actually archived"""
+        free, blocked = uuid4(), uuid4()
+        session = BulkSession([free, blocked], dependency_rows=[(blocked, 3)])
+        archiving = []
+
+        service(session).bulk_archive(
+            Student,
+            [free, blocked, uuid4()],
+            ArchiveReason.GRADUATED,
+            on_archive=archiving.append,
+        )
+
+        assert archiving == [[free]]
+
+    def test_cascade_skips_dependency_check(self, service):
+        """Test that cascading archives dependents instead of blocking on them"""
+        targets = [uuid4(), uuid4()]
+        session = BulkSession(targets)
+
+        result = service(session).bulk_archive(
+            Student, targets, ArchiveReason.GRADUATED, cascade=True
+        )
+
+        assert result["succeeded"] == targets
+        assert session.queries == 1
+        assert len(session.updates) == len(DEPENDENCY_CONFIG[Student]) + 1
+        assert set(result["archived_entities"]) == {
+            display_name for *_, display_name in DEPENDENCY_CONFIG[Student]
+        }
+
+    def test_failed_update_rolls_back(self, service):
+        """Test that a failed bulk update is rolled back and reported"""
+        target = uuid4()
+        session = BulkSession([target], fail_updates=True)
+
+        with pytest.raises(BulkLifecycleError):
+            service(session).bulk_archive(Student, [target], ArchiveReason.GRADUATED)
+
+        assert session.rolled_back and not session.committed
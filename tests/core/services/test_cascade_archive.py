@@ -0,0 +1,127 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.assessment.services.result_cache import PENDING_KEY
+from app.core.assessment.services.transcript_service import TranscriptService
+from app.core.identity.models.student import Student
+from app.core.shared.exceptions import CascadeArchivalError
+from app.core.shared.schemas.enums import ArchiveReason
+from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
+from app.core.shared.services.lifecycle_service.dependency_config import (
+    DEPENDENCY_CONFIG,
+)
+
+
+class UpdateSession:
+    """Reports a fixed row count for every UPDATE and records the statements"""
+
+    def __init__(self, rowcount=3, fail_on=None):
+        self.rowcount = rowcount
+        self.fail_on = fail_on
+        self.statements = []
+        self.info = {}
+        self.committed = False
+        self.rolled_back = False
+
+    def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError("deadlock detected")
+        self.statements.append(sql)
+        student_ids = [uuid4() for _ in range(self.rowcount)]
+        return SimpleNamespace(
+            rowcount=self.rowcount,
+            scalars=lambda: SimpleNamespace(all=lambda: student_ids),
+        )
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class ArchivableStudent:
+    def __init__(self):
+        self.id = uuid4()
+        self.archived_with = None
+
+    def archive(self, archived_by, reason):
+        self.archived_with = (archived_by, reason)
+
+
+@pytest.fixture
+def current_user():
+    return SimpleNamespace(id=uuid4())
+
+
+@pytest.fixture(autouse=True)
+def refreshed(monkeypatch):
+    """Records the students whose transcripts are refreshed, per call"""
+    calls = []
+    monkeypatch.setattr(
+        TranscriptService,
+        "refresh_students",
+        lambda self, student_ids: calls.append(set(student_ids)),
+    )
+    return calls
+
+
+class TestCascadeArchive:
+    """Tests for set-based cascade archival"""
+
+    def test_one_update_per_dependent_table(self, current_user):
+        """Test that each dependency is archived with one UPDATE and counted"""
+        session = UpdateSession(rowcount=3)
+        student = ArchivableStudent()
+
+        result = ArchiveService(session, current_user).cascade_archive_object(
+            Student, student, ArchiveReason.GRADUATED
+        )
+
+        dependencies = DEPENDENCY_CONFIG[Student]
+        assert len(session.statements) == len(dependencies)
+        assert all(sql.startswith("UPDATE") for sql in session.statements)
+        assert all("is_archived = false" in sql for sql in session.statements)
+        assert result["id"] == student.id
+        assert result["archived_entities"] == {
+            display_name: 3 for *_, display_name in dependencies
+        }
+        assert student.archived_with == (current_user.id, ArchiveReason.GRADUATED)
+        assert session.committed
+
+    def test_result_cascades_refresh_students(self, current_user, refreshed):
+        """Test that students with archived results are refreshed and queued for invalidation"""
+        session = UpdateSession(rowcount=2)
+        student = ArchivableStudent()
+
+        ArchiveService(session, current_user).cascade_archive_object(
+            Student, student, ArchiveReason.GRADUATED
+        )
+
+        returning = [sql for sql in session.statements if "RETURNING" in sql]
+        assert [sql.split()[1] for sql in returning] == [
+            "student_subjects",
+            "grades",
+            "total_grades",
+        ]
+        assert all(sql.endswith(".student_id") for sql in returning)
+        assert [len(students) for students in refreshed] == [6, 1]
+        assert refreshed[1] == {student.id}
+        assert session.info[PENDING_KEY] == refreshed[0] | refreshed[1]
+
+    def test_failure_rolls_back_everything(self, current_user):
+        """Test that a failed table update rolls back and leaves the target untouched"""
+        session = UpdateSession(fail_on="UPDATE grades")
+        student = ArchivableStudent()
+
+        with pytest.raises(CascadeArchivalError):
+            ArchiveService(session, current_user).cascade_archive_object(
+                Student, student, ArchiveReason.GRADUATED
+            )
+
+        assert session.rolled_back and not session.committed
+        assert student.archived_with is None
@@ -0,0 +1,126 @@
+import io
+import zipfile
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.assessment.services.assessment_service import AssessmentService
+from app.core.assessment.services.grading import DEFAULT_SCALE
+from app.core.shared.exceptions import InvalidCohortScopeError
+from app.core.shared.schemas.enums import Semester
+from app.core.shared.services.pdf_service.batch import (
+    shutdown_render_pool,
+    stream_zip,
+)
+
+
+class CohortSession:
+    """Returns the given result rows and records the statement issued"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+def result_row(student, code, score):
+    student_id, first_name, last_name = student
+    return SimpleNamespace(
+        id=student_id,
+        student_id=f"SCH-25-{str(student_id)[:5]}",
+        first_name=first_name,
+        last_name=last_name,
+        code=code,
+        name=f"{code} title",
+        total_score=score,
+    )
+
+
+def service(session):
+    assessment_service = AssessmentService(session, SimpleNamespace(id=uuid4()))
+    assessment_service._grading_scale = DEFAULT_SCALE
+    return assessment_service
+
+
+ADA = (uuid4(), "Ada", "Bello")
+CHI = (uuid4(), "Chi", "Okoro")
+ROWS = [
+    result_row(ADA, "ENG101", 55),
+    result_row(ADA, "MTH101", 81),
+    result_row(CHI, "MTH101", None),
+]
+
+
+class TestCohortResults:
+    """Tests for class and level-wide results"""
+
+    @pytest.mark.parametrize("scope", [{}, {"class_id": uuid4(), "level_id": uuid4()}])
+    def test_requires_one_class_or_level(self, scope):
+        """Test that a cohort must be exactly one class or one level"""
+        session = CohortSession(ROWS)
+        with pytest.raises(InvalidCohortScopeError):
+            service(session).generate_cohort_results(
+                "2025/2026", Semester.FIRST, **scope
+            )
+        assert session.statements == []
+
+    def test_groups_rows_per_student(self):
+        """Test that one query's rows are grouped into one result set per student"""
+        session = CohortSession(ROWS)
+        class_id = uuid4()
+
+        cohort = service(session).generate_cohort_results(
+            "2025/2026", Semester.FIRST, class_id=class_id
+        )
+
+        assert [data["student_name"] for data, _ in cohort] == [
+            "Ada Bello",
+            "Chi Okoro",
+        ]
+        ada, chi = (data["result_list"] for data, _ in cohort)
+        assert [row["course_code"] for row in ada] == ["ENG101", "MTH101"]
+        assert chi == [
+            {
+                "course_code": "MTH101",
+                "course_title": "MTH101 title",
+                "total_score": None,
+                "grading": None,
+            }
+        ]
+        assert "Ada Bello SCH-25-" in cohort[0][1]
+        assert len(session.statements) == 1
+        assert "students.class_id = " in session.statements[0]
+        assert "students.level_id = " not in session.statements[0]
+
+    def test_streams_one_pdf_per_student(self):
+        """Test that the cohort archive holds a rendered PDF for each student"""
+        try:
+            archive = b"".join(
+                service(CohortSession(ROWS)).stream_cohort_results_zip(
+                    "2025/2026", Semester.FIRST, level_id=uuid4()
+                )
+            )
+        finally:
+            shutdown_render_pool()
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as opened:
+            names = opened.namelist()
+            assert len(names) == 2
+            assert names[0].startswith("Ada_Bello")
+            assert all(opened.read(name).startswith(b"%PDF") for name in names)
+
+    def test_zip_stream_renames_duplicates(self):
+        """Test that the streamed archive is valid and keeps repeated filenames apart"""
+        chunks = list(
+            stream_zip([(b"one", "a.pdf"), (b"two", "a.pdf"), (b"three", "b.pdf")])
+        )
+
+        assert len(chunks) == 4
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as opened:
+            assert opened.namelist() == ["a.pdf", "a_1.pdf", "b.pdf"]
+            assert opened.read("a_1.pdf") == b"two"
@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.identity.models.student import Student
+from app.core.progression.models.progression import Promotion
+from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
+from app.core.shared.services.lifecycle_service.dependency_checks import (
+    dependency_check_statement,
+)
+from app.core.shared.services.lifecycle_service.dependency_config import (
+    DEPENDENCY_CONFIG,
+)
+
+
+class RecordingSession:
+    """Answers every query with a fixed row and records what was executed"""
+
+    def __init__(self, row):
+        self.row = row
+        self.executed = []
+
+    def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        return self
+
+    def one(self):
+        return self.row
+
+
+class TestDependencyChecks:
+    """Tests for single-query dependency checks"""
+
+    def test_one_exists_column_per_dependency(self):
+        """Test that every dependency is an EXISTS in one SELECT bound to one id"""
+        stmt = dependency_check_statement(Student, "is_archived")
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert sql.count("EXISTS") == len(DEPENDENCY_CONFIG[Student])
+        assert sql.count("SELECT") == len(DEPENDENCY_CONFIG[Student]) + 1
+        assert sql.count("is_archived = false") == len(DEPENDENCY_CONFIG[Student])
+        assert "%(target_id)s" in sql
+
+    def test_statements_are_cached_per_model_and_mode(self):
+        """Test that statements are built once per model and archive filter"""
+        active = dependency_check_statement(Student, "is_archived")
+        assert dependency_check_statement(Student, "is_archived") is active
+        assert dependency_check_statement(Student) is not active
+        assert dependency_check_statement(Promotion) is None
+
+    def test_reports_dependencies_from_one_round_trip(self):
+        """Test that flagged columns map back to display names in config order"""
+        flags = [False] * len(DEPENDENCY_CONFIG[Student])
+        flags[0] = flags[3] = True
+        session = RecordingSession(tuple(flags))
+        target_id = uuid4()
+
+        failed = ArchiveService(session, None).check_active_dependencies_exists(
+            Student, target_id
+        )
+
+        assert failed == ["documents", "grades"]
+        assert len(session.executed) == 1
+        assert session.executed[0][1] == {"target_id": target_id}
@@ -0,0 +1,110 @@
+import gzip
+from uuid import uuid4
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.core.shared.services.export_service.jobs import ChunkReader
+from app.core.shared.services.export_service.writers import (
+    ExportSection,
+    gzip_stream,
+    stream_csv,
+)
+from app.core.shared.services.file_storage.s3_client import reset_s3_client
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.infra.db.redis_db.export_jobs import ExportJobStore
+from app.settings import config
+from tests.utils.redis_utils import MemoryRedis
+
+
+@pytest.fixture
+def upload():
+    with mock_aws():
+        reset_s3_client()
+        boto3.client("s3", region_name=config.AWS_DEFAULT_REGION).create_bucket(
+            Bucket=config.AWS_BUCKET_NAME
+        )
+        yield S3Upload(session=None, current_user=None)
+    reset_s3_client()
+
+
+def make_export():
+    rows = ([n, f"student number {n:08d}", n % 100] for n in range(400_000))
+    return stream_csv([ExportSection("Students", ["id", "name", "score"], rows)])
+
+
+class TestChunkReader:
+    """Tests for streaming export chunks into storage"""
+
+    def test_reads_across_chunk_boundaries(self):
+        """Test that reads of any size return the chunks in order"""
+        reader = ChunkReader([b"abc", b"", b"defgh", b"ij"])
+        assert reader.read(2) == b"ab"
+        assert reader.read(4) == b"cdef"
+        assert reader.read() == b"ghij"
+        assert reader.read() == b""
+        assert reader.bytes_read == 10
+
+    def test_export_is_streamed_to_s3(self, upload):
+        """Test that a multipart sized export is uploaded without being spooled"""
+        plain = b"".join(make_export())
+        assert len(plain) > config.S3_MULTIPART_THRESHOLD_MB * upload.MB
+
+        reader = ChunkReader(make_export())
+        upload.s3_upload_stream(reader, "exports/job/students.csv", "text/csv")
+        stored = upload.s3_client.get_object(
+            Bucket=config.AWS_BUCKET_NAME, Key="exports/job/students.csv"
+        )
+        assert reader.bytes_read == len(plain)
+        assert stored["Body"].read() == plain
+
+    def test_compressed_export_round_trips(self, upload):
+        """Test that a gzipped export decompresses to the original csv"""
+        reader = ChunkReader(gzip_stream(make_export()))
+        upload.s3_upload_stream(
+            reader, "exports/job/students.csv.gz", "application/gzip"
+        )
+        stored = upload.s3_client.get_object(
+            Bucket=config.AWS_BUCKET_NAME, Key="exports/job/students.csv.gz"
+        )
+        assert gzip.decompress(stored["Body"].read()) == b"".join(make_export())
+
+
+@pytest.fixture
+def store():
+    return ExportJobStore(MemoryRedis())
+
+
+def queue_job(store):
+    job = store.enqueue(uuid4(), "students", {}, uuid4(), "STAFF")
+    return job["id"]
+
+
+class TestExportJobStore:
+    """Tests for the export job queue and status store"""
+
+    def test_expired_jobs_are_not_recreated(self, store):
+        """Test that updating a job whose hash has expired leaves no key behind"""
+        job_id = queue_job(store)
+        assert store.update_job(job_id, status=store.RUNNING)
+
+        store.redis.delete(store._key(job_id))
+
+        assert not store.update_job(job_id, status=store.COMPLETED)
+        assert store.get_job(job_id) is None
+
+    def test_only_jobs_of_lapsed_workers_are_requeued(self, store):
+        """Test that jobs held by live workers stay with them on requeue"""
+        first, second = queue_job(store), queue_job(store)
+        store.register_worker("live")
+        store.register_worker("crashed")
+        assert store.claim_next("live") == first
+        assert store.claim_next("crashed") == second
+
+        store.redis.delete(store._heartbeat_key("crashed"))
+
+        assert store.requeue_stalled() == 1
+        assert store.claim_next("live") == second
+        assert store.redis.smembers(store.workers_key) == {"live"}
+        assert store.requeue_stalled() == 0
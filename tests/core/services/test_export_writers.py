@@ -0,0 +1,82 @@
+import gzip
+import io
+import re
+from datetime import datetime, timezone
+from uuid import UUID
+
+from openpyxl import load_workbook
+
+from app.core.shared.models.enums import Semester
+from app.core.shared.services.export_service.export_service import format_value
+from app.core.shared.services.export_service.writers import (
+    ExportSection,
+    gzip_stream,
+    sheet_title,
+    stream_csv,
+    stream_excel,
+    stream_pdf,
+)
+
+
+def make_sections():
+    return [
+        ExportSection("Student", ["Field", "Value"], iter([["first_name", "Ada"]])),
+        ExportSection(
+            "Grades",
+            ["score", "semester"],
+            ([score, "FIRST"] for score in range(5000)),
+        ),
+    ]
+
+
+class TestExportWriters:
+    """Tests for the streaming export writers"""
+
+    def test_csv_streams_sections_in_chunks(self):
+        """Test that large sections are flushed in several chunks"""
+        chunks = list(stream_csv(make_sections()))
+        text = b"".join(chunks).decode()
+        lines = text.splitlines()
+        assert lines[:3] == ["Student", "Field,Value", "first_name,Ada"]
+        assert lines[4:6] == ["Grades", "score,semester"]
+        assert lines[-1] == "4999,FIRST"
+
+    def test_excel_writes_one_sheet_per_section(self):
+        """Test that each section becomes a sheet with a header row"""
+        workbook = load_workbook(io.BytesIO(b"".join(stream_excel(make_sections()))))
+        assert workbook.sheetnames == ["Student", "Grades"]
+        grades = workbook["Grades"]
+        assert grades.max_row == 5001
+        assert [cell.value for cell in grades[1]] == ["score", "semester"]
+
+    def test_pdf_is_written(self):
+        """Test that sections spanning several pages produce a PDF"""
+        pdf = b"".join(stream_pdf(make_sections(), "Student audit"))
+        assert pdf.startswith(b"%PDF")
+        assert len(re.findall(rb"/Type /Page\b(?!s)", pdf)) > 1
+
+    def test_gzip_stream_round_trips(self):
+        """Test that a compressed csv stream decompresses to the original"""
+        plain = b"".join(stream_csv(make_sections()))
+        compressed = b"".join(gzip_stream(stream_csv(make_sections())))
+        assert len(compressed) < len(plain)
+        assert gzip.decompress(compressed) == plain
+
+    def test_sheet_title_is_sanitised(self):
+        """Test that invalid characters and long titles are cleaned"""
+        assert sheet_title("Grades [2025/2026]") == "Grades  2025 2026 "
+        assert len(sheet_title("x" * 40)) == 31
+
+
+class TestFormatValue:
+    """Tests for the format_value helper"""
+
+    def test_values_become_plain_cells(self):
+        """Test enums, dates, ids and nulls"""
+        moment = datetime(2025, 9, 1, 8, 30, tzinfo=timezone.utc)
+        identifier = UUID("00000000-0000-0000-0000-000000000005")
+        assert format_value(None) == ""
+        assert format_value(Semester.FIRST) == "FIRST"
+        assert format_value(moment) == "2025-09-01T08:30:00+00:00"
+        assert format_value(identifier) == str(identifier)
+        assert format_value(72.5) == 72.5
@@ -0,0 +1,90 @@
+import pytest
+
+from app.core.identity.models.student import Student
+from app.core.progression.models.progression import Promotion
+from app.core.rbac.models import Role
+from app.core.shared.exceptions import DeletionDependencyError
+from app.core.shared.services.lifecycle_service.delete_service import (
+    DeleteService,
+    blocking_reference_statement,
+    orm_managed_references,
+)
+from app.core.shared.services.lifecycle_service.dependency_config import (
+    DEPENDENCY_CONFIG,
+)
+from app.core.shared.services.lifecycle_service.fk_rules import (
+    fk_rules_for_revision,
+    get_fk_rules,
+    schema_revision,
+)
+
+
+class RecordingSession:
+    """Answers every query with a fixed row and records what was executed"""
+
+    def __init__(self, row=()):
+        self.row = row
+        self.executed = []
+
+    def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        return self
+
+    def one(self):
+        return self.row
+
+
+class TestFKRules:
+    """Tests for the cached FK delete-rule map"""
+
+    def test_rules_come_from_metadata(self):
+        """Test that delete rules are read from model metadata, not the catalog"""
+        session = RecordingSession()
+        rules = DeleteService(Student, session).get_fk_delete_rules("students")
+
+        assert rules["fk_students_guardians_guardian_id"] == "RESTRICT"
+        assert rules["fk_students_classes_class_id"] == "SET NULL"
+        assert session.executed == []
+
+    def test_map_is_built_once_per_revision(self):
+        """Test that the map is keyed by the migration head and is read-only"""
+        rules = get_fk_rules()
+
+        assert rules.revision == schema_revision() == "81bad024489d"
+        assert get_fk_rules() is rules is fk_rules_for_revision(rules.revision)
+        with pytest.raises(TypeError):
+            rules.outgoing["students"] = ()
+
+    def test_blocking_references_prevent_delete(self):
+        """Test that rows behind RESTRICT references block deletion in one query"""
+        _, names = blocking_reference_statement(Role, get_fk_rules().revision)
+        session = RecordingSession(row=tuple(name == "students" for name in names))
+
+        with pytest.raises(DeletionDependencyError) as exc:
+            DeleteService(Role, session).check_safe_delete(Role, "role-id", "role")
+
+        assert exc.value.user_message == "Cannot delete role while linked to students."
+        assert len(session.executed) == 1
+
+    def test_dependency_config_is_checked_in_the_same_query(self):
+        """Test that DEPENDENCY_CONFIG entries come first, under their display names"""
+        _, names = blocking_reference_statement(Student, get_fk_rules().revision)
+
+        assert names[: len(DEPENDENCY_CONFIG[Student])] == tuple(
+            display_name for *_, display_name in DEPENDENCY_CONFIG[Student]
+        )
+
+    def test_references_the_orm_clears_are_skipped(self):
+        """Test that references nulled by the ORM on delete are not checked"""
+        _, names = blocking_reference_statement(Student, get_fk_rules().revision)
+
+        assert ("student_departments", "student_rep_id") in orm_managed_references(
+            Student
+        )
+        assert "student departments" not in names and "classes" not in names
+
+    def test_unreferenced_models_skip_the_query(self):
+        """Test that models nothing blocks on are deleted without a pre-check"""
+        session = RecordingSession()
+        DeleteService(Promotion, session).check_safe_delete(Promotion, "promotion-id")
+        assert session.executed == []
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from app.core.assessment.services.analytics_service import AssessmentAnalyticsService
+from app.core.assessment.services.grading import DEFAULT_SCALE, GradingScale
+from app.core.assessment.services.validators import AssessmentValidator
+from app.core.shared.exceptions import InvalidGradingScaleError
+
+
+class TestGradingScale:
+    """Tests for the compiled grading scale"""
+
+    def test_band_minimums_are_inclusive(self):
+        """Test that a score on a band minimum falls into that band"""
+        scores = [100, 70, 69.99, 60, 50, 45, 40, 39.9, 0]
+        grades = [DEFAULT_SCALE.grade_for(score) for score in scores]
+        assert grades == ["A", "A", "B", "B", "C", "D", "E", "F", "F"]
+
+    def test_scores_below_lowest_band_get_lowest_grade(self):
+        """Test that out of range scores are clamped to the lowest band"""
+        assert DEFAULT_SCALE.grade_for(-5) == "F"
+
+    def test_band_order_does_not_matter(self):
+        """Test that bands are compiled the same regardless of input order"""
+        scale = GradingScale([(0, "F"), (50, "P"), (75, "D")])
+        shuffled = GradingScale([(75, "D"), (0, "F"), (50, "P")])
+        assert scale.ordered_grades == ("D", "P", "F")
+        assert scale.version == shuffled.version
+        assert scale.grade_for(74) == "P"
+
+    def test_version_changes_with_bands(self):
+        """Test that a different scale gets a different version"""
+        assert GradingScale([(0, "F"), (50, "P")]).version != DEFAULT_SCALE.version
+
+    def test_statistics_use_custom_scale(self):
+        """Test that analytics grade against the scale they are given"""
+        scale = GradingScale([(0, "F"), (50, "P"), (75, "D")])
+        result = AssessmentAnalyticsService.compute_statistics(
+            np.array([80.0, 75.0, 60.0, 49.0]), scale
+        )
+        assert result["grade_distribution"] == {"D": 2, "P": 1, "F": 1}
+        assert result["gradings"].tolist() == ["D", "D", "P", "F"]
+
+
+class TestValidateGradingBands:
+    """Tests for the validate_grading_bands method"""
+
+    @pytest.mark.parametrize(
+        "bands",
+        [
+            [],
+            [{"grade": "A", "min_score": 50}, {"grade": "A", "min_score": 0}],
+            [{"grade": "A", "min_score": 50}, {"grade": "B", "min_score": 50}],
+            [{"grade": "A", "min_score": 120}, {"grade": "F", "min_score": 0}],
+            [{"grade": "A", "min_score": 50}, {"grade": "F", "min_score": 10}],
+        ],
+    )
+    def test_rejects_invalid_scales(self, bands):
+        """Test empty, duplicate, out of range and gapped scales"""
+        with pytest.raises(InvalidGradingScaleError):
+            AssessmentValidator.validate_grading_bands(bands)
+
+    def test_accepts_valid_scale(self):
+        """Test that a complete scale is returned unchanged"""
+        bands = [{"grade": "P", "min_score": 50}, {"grade": "F", "min_score": 0}]
+        assert AssessmentValidator.validate_grading_bands(bands) == bands
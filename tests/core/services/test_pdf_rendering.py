@@ -0,0 +1,66 @@
+import pytest
+
+from app.core.shared.exceptions import PDFRenderTimeoutError
+from app.core.shared.services.pdf_service.batch import (
+    get_render_pool,
+    render_in_pool,
+    render_pdf,
+    shutdown_render_pool,
+    warm_render_pool,
+)
+from app.core.shared.services.pdf_service.templates.course_list import CourseListPDF
+from app.core.shared.services.pdf_service.templates.results import ResultPDF
+from app.settings import config
+
+
+@pytest.fixture
+def pool():
+    warm_render_pool()
+    yield
+    shutdown_render_pool()
+
+
+def result_data(name: str):
+    return {
+        "student_name": name,
+        "result_list": [{"course_code": "MTH101", "total_score": 70, "grading": "A"}],
+    }
+
+
+class TestPdfRendering:
+    """Tests for cached template styles and the PDF render pool"""
+
+    def test_templates_share_module_styles(self):
+        """Test that styles are built once per process, not per template"""
+        assert ResultPDF().styles is CourseListPDF().styles
+        assert "CustomTitle" in ResultPDF().styles
+
+    def test_renders_single_documents_in_pool(self, pool):
+        """Test that each template renders through the pool"""
+        pdf_bytes, filename = render_pdf("results", result_data("Ada"), "Ada results")
+        assert pdf_bytes.startswith(b"%PDF")
+        assert filename == "Ada_results.pdf"
+
+        pdf_bytes, _ = render_pdf("course_list", {"enrollment_list": []}, "courses")
+        assert pdf_bytes.startswith(b"%PDF")
+
+    def test_batch_keeps_submission_order(self, pool):
+        """Test that batch results come back in the order they were submitted"""
+        jobs = [(result_data(f"S{n}"), f"student {n}") for n in range(7)]
+        filenames = [name for _, name in render_in_pool(jobs, "results", window=2)]
+        assert filenames == [f"student_{n}.pdf" for n in range(7)]
+
+    def test_unknown_template(self):
+        """Test that unknown templates are rejected before reaching the pool"""
+        with pytest.raises(ValueError):
+            render_pdf("timetable", {}, "x")
+
+    def test_workers_are_spawned(self, pool):
+        """Test that workers start fresh instead of forking the server process"""
+        assert get_render_pool()._mp_context.get_start_method() == "spawn"
+
+    def test_single_render_times_out(self, pool, monkeypatch):
+        """Test that a render that is not ready in time raises instead of blocking"""
+        monkeypatch.setattr(config, "PDF_RENDER_TIMEOUT_SECONDS", 0)
+        with pytest.raises(PDFRenderTimeoutError):
+            render_pdf("results", result_data("Ada"), "Ada results")
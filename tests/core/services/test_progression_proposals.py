@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.progression.schemas.proposal import ProgressionProposalRequest
+from app.core.progression.services.proposal_service import ProgressionProposalService
+
+
+class ScriptedSession:
+    """Returns queued results in order and records every statement"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.committed = False
+
+    def _next(self, stmt, params):
+        self.statements.append(
+            (str(stmt.compile(dialect=postgresql.dialect())), params)
+        )
+        return self.results.pop(0) if self.results else []
+
+    def execute(self, stmt, params=None):
+        rows = self._next(stmt, params)
+        return SimpleNamespace(all=lambda: rows)
+
+    def scalars(self, stmt, params=None):
+        return iter(self._next(stmt, params))
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+def result(average, graded_count=8, enrolled_count=None):
+    return SimpleNamespace(
+        student_id=uuid4(),
+        average=average,
+        graded_count=graded_count,
+        enrolled_count=graded_count if enrolled_count is None else enrolled_count,
+    )
+
+
+def levels(*ranks):
+    return [
+        SimpleNamespace(id=uuid4(), promotion_rank=rank, is_final=False)
+        for rank in ranks
+    ]
+
+
+class TestProgressionProposals:
+    """Tests for rule-based progression proposals"""
+
+    def test_dry_run_classifies_students_without_writing(self):
+        """Test that a dry run sorts students by the pass mark and writes nothing"""
+        passed, failed, ungraded, incomplete, decided = (
+            result(72.5),
+            result(41.0),
+            result(None, 0),
+            result(90.0, 1, 8),
+            result(80.0),
+        )
+        current, following = levels(1, 2)
+        session = ScriptedSession(
+            [passed, failed, ungraded, incomplete, decided],
+            [decided.student_id],
+            [current, following],
+        )
+        data = ProgressionProposalRequest(
+            academic_session="2025/2026", level_id=current.id, pass_mark=50
+        )
+
+        report = ProgressionProposalService(
+            session, SimpleNamespace(id=uuid4())
+        ).propose(data)
+
+        assert [p["student_id"] for p in report["promotions"]] == [passed.student_id]
+        assert report["promotions"][0]["target_level_id"] == following.id
+        assert [r["student_id"] for r in report["repetitions"]] == [failed.student_id]
+        assert report["repetitions"][0]["target_level_id"] == current.id
+        assert {e["student_id"]: e["reason"] for e in report["exceptions"]} == {
+            ungraded.student_id: "Results for 0 subject-semesters, fewer than the 1 required",
+            incomplete.student_id: "Incomplete results: 1 of 8 enrolled subject-semesters graded",
+            decided.student_id: "Existing progression record for the session",
+        }
+        assert "GROUP BY students.id" in session.statements[0][0]
+        assert "UNION" in session.statements[1][0]
+        assert len(session.statements) == 3
+        assert not session.committed
+
+    def test_applied_run_inserts_pending_records_in_bulk(self):
+        """Test that applied proposals are inserted with one INSERT per record type"""
+        passed, failed_a, failed_b = result(65.0), result(30.0), result(49.99)
+        current, following = levels(3, 4)
+        session = ScriptedSession(
+            [passed, failed_a, failed_b], [], [current, following]
+        )
+        data = ProgressionProposalRequest(
+            academic_session="2025/2026", level_id=current.id, dry_run=False
+        )
+
+        ProgressionProposalService(session, SimpleNamespace(id=uuid4())).propose(data)
+
+        inserts = [(sql, rows) for sql, rows in session.statements if rows]
+        assert [sql.split("(")[0].strip() for sql, _ in inserts] == [
+            "INSERT INTO promotions",
+            "INSERT INTO repetitions",
+        ]
+        assert len(inserts[1][1]) == 2
+        assert all(row["status"] == "PENDING" for _, rows in inserts for row in rows)
+        assert session.committed
@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.assessment.services import result_cache
+from app.core.assessment.services.assessment_service import AssessmentService
+from app.core.assessment.services.grading import DEFAULT_SCALE
+from app.core.shared.schemas.enums import Semester
+from app.infra.db.redis_db import result_summaries
+from app.infra.db.redis_db.result_summaries import ResultSummaryCache
+from tests.utils.redis_utils import MemoryRedis
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    summary_cache = ResultSummaryCache(MemoryRedis())
+    monkeypatch.setattr(result_summaries, "result_summary_cache", summary_cache)
+    monkeypatch.setattr(result_cache, "result_summary_cache", summary_cache)
+    monkeypatch.setattr(
+        "app.core.assessment.services.assessment_service.result_summary_cache",
+        summary_cache,
+    )
+    return summary_cache
+
+
+TERM = ("v1", "2025/2026", "FIRST")
+
+
+class TestResultSummaries:
+    """Tests for cached result summaries and their invalidation"""
+
+    def test_summaries_are_built_once(self, cache, monkeypatch):
+        """Test that a student's term scores are built once and then served from cache"""
+        service = AssessmentService(SimpleNamespace(), SimpleNamespace(id=uuid4()))
+        service._grading_scale = DEFAULT_SCALE
+        subject_id = uuid4()
+        builds = []
+
+        def build_student_summary(student_id, academic_session, semester):
+            builds.append(student_id)
+            return {"scores": [[str(subject_id), 72]]}
+
+        monkeypatch.setattr(service, "build_student_summary", build_student_summary)
+        monkeypatch.setattr(
+            service.student_factory,
+            "get_student",
+            lambda student_id: SimpleNamespace(first_name="Ada", last_name="Bello"),
+        )
+        monkeypatch.setattr(
+            service,
+            "subject_titles",
+            lambda ids: {subject_id: ("MTH101", "Mathematics")},
+        )
+        student_id = uuid4()
+
+        first = service.generate_student_results(
+            student_id, "2025/2026", Semester.FIRST
+        )
+        second = service.generate_student_results(
+            student_id, "2025/2026", Semester.FIRST
+        )
+
+        assert first == second
+        assert first["student_name"] == "Ada Bello"
+        assert first["result_list"][0]["course_code"] == "MTH101"
+        assert builds == [student_id]
+
+    def test_invalidation_drops_every_term(self, cache):
+        """Test that invalidating a student drops all of their cached terms"""
+        student_id = uuid4()
+        _, generation = cache.get_summary(student_id, *TERM)
+        cache.save_summary(student_id, generation, *TERM, {"result_list": [1]})
+        cache.save_summary(student_id, generation, "v1", "2025/2026", "SECOND", {})
+
+        cache.invalidate_students([student_id])
+
+        assert cache.get_summary(student_id, *TERM)[0] is None
+        assert cache.get_summary(student_id, "v1", "2025/2026", "SECOND")[0] is None
+
+    def test_summary_read_before_a_write_is_never_served(self, cache):
+        """Test that a summary saved after a racing invalidation is ignored"""
+        student_id = uuid4()
+        _, generation = cache.get_summary(student_id, *TERM)
+
+        cache.invalidate_students([student_id])
+        cache.save_summary(student_id, generation, *TERM, {"result_list": ["stale"]})
+
+        summary, current = cache.get_summary(student_id, *TERM)
+        assert summary is None
+        assert current == generation + 1
+
+    def test_invalidation_waits_for_commit(self, cache):
+        """Test that queued students are invalidated on commit and dropped on rollback"""
+        student_id = uuid4()
+        _, generation = cache.get_summary(student_id, *TERM)
+        cache.save_summary(student_id, generation, *TERM, {"result_list": []})
+        session = Session(create_engine("sqlite://"))
+
+        session.execute(text("SELECT 1"))
+        result_cache.invalidate_after_commit(session, [student_id, None])
+        session.rollback()
+        assert result_cache.PENDING_KEY not in session.info
+        assert cache.get_summary(student_id, *TERM)[0] is not None
+
+        result_cache.invalidate_after_commit(session, [student_id])
+        assert cache.get_summary(student_id, *TERM)[0] is not None
+        session.commit()
+        assert cache.get_summary(student_id, *TERM)[0] is None
+        assert result_cache.PENDING_KEY not in session.info
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.rbac.services.role_service import RBACService, invalidate_role_ids
+from app.core.shared.exceptions import NoMatchingRoleError
+from app.core.shared.models.enums import UserRoleName
+
+
+class RolesSession:
+    """Serves the roles table from memory and counts the queries made"""
+
+    def __init__(self, *names):
+        self.roles = {UserRoleName[name]: uuid4() for name in names}
+        self.queries = 0
+
+    def execute(self, stmt):
+        self.queries += 1
+        rows = list(self.roles.items())
+        return SimpleNamespace(all=lambda: rows)
+
+
+@pytest.fixture(autouse=True)
+def fresh_role_ids():
+    invalidate_role_ids()
+    yield
+    invalidate_role_ids()
+
+
+class TestRoleIds:
+    """Tests for the memoised role name to id map"""
+
+    def test_lookups_share_one_query(self):
+        """Test that repeated lookups for any role are served by one load"""
+        session = RolesSession("STUDENT", "GUARDIAN", "INACTIVE")
+        service = RBACService(session)
+
+        for _ in range(50):
+            for name in ("STUDENT", "GUARDIAN", "INACTIVE"):
+                assert service.fetch_role_id(name) == session.roles[UserRoleName[name]]
+
+        assert session.queries == 1
+
+    def test_invalidation_and_misses_reload(self):
+        """Test that invalidating, or asking for a role not yet loaded, reloads the map"""
+        session = RolesSession("STUDENT")
+        service = RBACService(session)
+        service.fetch_role_id("STUDENT")
+
+        session.roles[UserRoleName.STUDENT] = uuid4()
+        invalidate_role_ids()
+        assert service.fetch_role_id("STUDENT") == session.roles[UserRoleName.STUDENT]
+
+        session.roles[UserRoleName.ADMIN] = uuid4()
+        assert service.fetch_role_id("ADMIN") == session.roles[UserRoleName.ADMIN]
+        assert session.queries == 3
+
+    def test_unknown_roles_raise(self):
+        """Test that names and ids missing after a reload are reported"""
+        service = RBACService(RolesSession("STUDENT"))
+
+        with pytest.raises(NoMatchingRoleError):
+            service.fetch_role_id("ADMIN")
+        with pytest.raises(NoMatchingRoleError):
+            service.validate_role_id(uuid4())
+
+    def test_load_overlapping_an_invalidation_is_not_kept(self):
+        """Test that a map read before a role change committed is not cached after it"""
+        session = RolesSession("STUDENT")
+        execute = session.execute
+
+        def invalidated_mid_load(stmt):
+            result = execute(stmt)
+            invalidate_role_ids()
+            return result
+
+        session.execute = invalidated_mid_load
+        service = RBACService(session)
+
+        service.fetch_role_id("STUDENT")
+        session.execute = execute
+        service.fetch_role_id("STUDENT")
+        service.fetch_role_id("STUDENT")
+
+        assert session.queries == 2
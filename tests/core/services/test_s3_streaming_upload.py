@@ -0,0 +1,187 @@
+import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+import magic
+from moto import mock_aws
+from starlette.datastructures import UploadFile
+
+from app.core.shared.exceptions import FileTooLargeError
+from app.core.shared.exceptions.file_errors import UnsupportedFileFormatError
+from app.core.shared.services.file_storage.s3_client import (
+    get_s3_client,
+    reset_s3_client,
+)
+from app.core.shared.services.file_storage.s3_upload import (
+    SNIFF_SIZE,
+    S3Upload,
+    SizeLimitedReader,
+)
+from app.infra.db.redis_db.presigned_urls import PresignedUrlCache
+from app.settings import config
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 16
+SUPPORTED_TYPES = {"image/png": "png"}
+
+
+class NonSeekableStream(io.RawIOBase):
+    """Stream that can only be read forwards, like a raw request body"""
+
+    def __init__(self, data: bytes):
+        self.buffer = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def read(self, size=-1):
+        return self.buffer.read(size)
+
+
+@pytest.fixture
+def upload():
+    with mock_aws():
+        reset_s3_client()
+        boto3.client("s3", region_name=config.AWS_DEFAULT_REGION).create_bucket(
+            Bucket=config.AWS_BUCKET_NAME
+        )
+        yield S3Upload(session=None, current_user=None)
+    reset_s3_client()
+
+
+def make_file(data: bytes, stream=None) -> UploadFile:
+    return UploadFile(file=stream or io.BytesIO(data), filename="scan.png")
+
+
+class TestStreamingUpload:
+    """Tests for validate_file_stream and s3_upload_stream"""
+
+    def test_streams_file_to_s3(self, upload):
+        """Test that a validated file is uploaded unchanged with its content type"""
+        data = PNG_HEADER + b"x" * (3 * upload.MB)
+        validated = upload.validate_file_stream(
+            make_file(data), upload.KB, 5 * upload.MB, SUPPORTED_TYPES
+        )
+        assert validated.content_type == "image/png"
+        assert validated.size == len(data)
+
+        upload.s3_upload_stream(validated.fileobj, "grades/scan.png", "image/png")
+        stored = upload.s3_client.get_object(
+            Bucket=config.AWS_BUCKET_NAME, Key="grades/scan.png"
+        )
+        assert stored["ContentType"] == "image/png"
+        assert stored["Body"].read() == data
+
+    def test_rejects_oversized_file_before_upload(self, upload):
+        """Test that seekable files are size checked without being read"""
+        data = PNG_HEADER + b"x" * (2 * upload.MB)
+        with pytest.raises(FileTooLargeError):
+            upload.validate_file_stream(
+                make_file(data), upload.KB, upload.MB, SUPPORTED_TYPES
+            )
+
+    def test_rejects_unsupported_type_from_header(self, upload):
+        """Test that the MIME type is sniffed from the header"""
+        data = b"%PDF-1.7\n" + b"x" * (2 * upload.KB)
+        with pytest.raises(UnsupportedFileFormatError):
+            upload.validate_file_stream(
+                make_file(data), upload.KB, upload.MB, SUPPORTED_TYPES
+            )
+
+    def test_non_seekable_stream_enforces_limit_while_streaming(self, upload):
+        """Test that the size limit is enforced as an unsized stream is read"""
+        data = PNG_HEADER + b"x" * (2 * upload.MB)
+        validated = upload.validate_file_stream(
+            make_file(data, NonSeekableStream(data)),
+            upload.KB,
+            upload.MB,
+            SUPPORTED_TYPES,
+        )
+        assert validated.size is None
+        with pytest.raises(FileTooLargeError):
+            upload.s3_upload_stream(validated.fileobj, "grades/big.png", "image/png")
+
+
+class TestValidatedUpload:
+    """Tests for single-pass validate_file_upload"""
+
+    def test_returns_everything_storage_needs(self, upload, monkeypatch):
+        """Test that type, extension, size and digest come from one sniff of the header"""
+        sniffed = []
+        from_buffer = magic.from_buffer
+
+        def recording_from_buffer(buffer, mime=False):
+            sniffed.append(len(buffer))
+            return from_buffer(buffer, mime=mime)
+
+        monkeypatch.setattr(magic, "from_buffer", recording_from_buffer)
+        data = PNG_HEADER + b"x" * (2 * upload.MB)
+        validated = upload.validate_file_upload(
+            make_file(data), upload.KB, 5 * upload.MB, SUPPORTED_TYPES
+        )
+
+        assert validated.contents == data
+        assert validated.content_type == "image/png"
+        assert validated.extension == "png"
+        assert validated.size == len(data)
+        assert validated.sha256 == hashlib.sha256(data).hexdigest()
+        assert sniffed == [SNIFF_SIZE]
+
+    def test_rejects_oversized_file(self, upload):
+        """Test that files over the limit are rejected"""
+        data = PNG_HEADER + b"x" * (2 * upload.MB)
+        with pytest.raises(FileTooLargeError):
+            upload.validate_file_upload(
+                make_file(data), upload.KB, upload.MB, SUPPORTED_TYPES
+            )
+
+
+class TestSizeLimitedReader:
+    """Tests for the SizeLimitedReader stream"""
+
+    def test_replays_prefix_before_stream(self):
+        """Test that sniffed bytes are returned before the rest of the stream"""
+        reader = SizeLimitedReader(io.BytesIO(b"world"), 100, prefix=b"hello ")
+        assert reader.read(3) + reader.read() == b"hello world"
+        assert reader.bytes_read == 11
+
+
+class TestSharedClient:
+    """Tests for the process-wide S3 client"""
+
+    def test_client_is_shared_across_uploads_and_threads(self, upload):
+        """Test that every S3Upload and thread gets the same client"""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = set(pool.map(lambda _: id(get_s3_client()), range(32)))
+        assert clients == {id(upload.s3_client)}
+        assert S3Upload(session=None, current_user=None).s3_client is upload.s3_client
+
+    def test_client_uses_tuned_config(self, upload):
+        """Test that pooling and retries come from settings"""
+        client_config = upload.s3_client.meta.config
+        assert client_config.max_pool_connections == config.S3_MAX_POOL_CONNECTIONS
+        retries = client_config.retries
+        assert retries["total_max_attempts"] == config.S3_MAX_RETRY_ATTEMPTS + 1
+
+
+class TestPresignedUrls:
+    """Tests for presigned URL batching and cache lifetimes"""
+
+    def test_batch_signs_each_key_once(self, upload):
+        """Test that duplicate keys are signed once and every key gets a URL"""
+        keys = ["documents/a.pdf", "documents/b.pdf", "documents/a.pdf"]
+        urls = upload.generate_presigned_urls(keys)
+        assert set(urls) == {"documents/a.pdf", "documents/b.pdf"}
+        assert all(key in url for key, url in urls.items())
+
+    def test_cached_urls_keep_a_safe_lifetime(self):
+        """Test that URLs are reused for at most three quarters of their lifetime"""
+        assert PresignedUrlCache.reuse_seconds(86400) == 86400 - 21600
+        assert (
+            PresignedUrlCache.reuse_seconds(config.PRESIGNED_URL_MIN_REMAINING_SECONDS)
+            <= 0
+        )
@@ -0,0 +1,192 @@
+import io
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.files import files
+from app.core.shared.exceptions import (
+    InvalidFileSignatureError,
+    StoredObjectNotFoundError,
+)
+from app.core.shared.services.file_storage import backends
+from app.core.shared.services.file_storage.backends import (
+    LocalBackend,
+    MemoryBackend,
+    get_storage_backend,
+    reset_storage_backend,
+)
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.settings import config
+
+BASE_URL = "http://testserver/files"
+
+
+class OneWayStream(io.RawIOBase):
+    """Stream that can only be read forwards, like a raw request body"""
+
+    def __init__(self, data: bytes):
+        self.buffer = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, buffer):
+        return self.buffer.readinto(buffer)
+
+
+@pytest.fixture
+def local(tmp_path):
+    return LocalBackend(str(tmp_path), BASE_URL, "signing-key")
+
+
+def signed_query(url: str) -> tuple[str, int, str]:
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    key = parsed.path.removeprefix("/files/")
+    return key, int(query["expires"][0]), query["signature"][0]
+
+
+class TestLocalBackend:
+    """Tests for the local filesystem backend"""
+
+    def test_put_and_get(self, local):
+        """Test that stored bytes are read back through the memory map"""
+        local.put("docs/a.pdf", b"%PDF-1.4 contents")
+        assert local.get("docs/a.pdf") == b"%PDF-1.4 contents"
+
+    def test_put_stream_and_chunked_get(self, local):
+        """Test that a one-way stream is stored and read back in fixed chunks"""
+        data = bytes(range(256)) * 40
+        local.put_stream("exports/big.csv", OneWayStream(data), "text/csv")
+
+        chunks = list(local.get_stream("exports/big.csv", chunk_size=4096))
+        assert b"".join(chunks) == data
+        assert [len(chunk) for chunk in chunks] == [4096, 4096, 2048]
+
+    def test_empty_file(self, local):
+        """Test that empty files, which can't be memory mapped, read as empty"""
+        local.put("empty.txt", b"")
+        assert local.get("empty.txt") == b""
+        assert list(local.get_stream("empty.txt")) == []
+
+    def test_failed_write_leaves_no_file(self, local, tmp_path):
+        """Test that an interrupted stream neither creates the file nor leaves a temp file"""
+
+        class Broken(io.RawIOBase):
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                raise OSError("connection reset")
+
+        with pytest.raises(OSError):
+            local.put_stream("docs/partial.pdf", Broken())
+        assert list((tmp_path / "docs").iterdir()) == []
+
+    def test_missing_and_deleted_keys(self, local):
+        """Test that missing keys raise and deleting them twice is harmless"""
+        local.put("a.txt", b"x")
+        local.delete("a.txt")
+        local.delete("a.txt")
+        with pytest.raises(StoredObjectNotFoundError):
+            local.get("a.txt")
+
+    def test_keys_cannot_escape_root(self, local):
+        """Test that keys resolving outside the storage root are rejected"""
+        with pytest.raises(StoredObjectNotFoundError):
+            local.put("../outside.txt", b"x")
+
+    def test_signed_url_round_trip(self, local):
+        """Test that a presigned URL verifies and points at the stored file"""
+        local.put("pics/me.png", b"png")
+        key, expires, signature = signed_query(local.presign("pics/me.png", 60))
+
+        assert key == "pics/me.png"
+        assert local.verified_path(key, expires, signature).read_bytes() == b"png"
+
+    def test_tampered_or_expired_signatures_are_rejected(self, local):
+        """Test that another key, a changed expiry or a past expiry fail verification"""
+        local.put("pics/me.png", b"png")
+        local.put("pics/you.png", b"png")
+        key, expires, signature = signed_query(local.presign("pics/me.png", 60))
+
+        with pytest.raises(InvalidFileSignatureError):
+            local.verified_path("pics/you.png", expires, signature)
+        with pytest.raises(InvalidFileSignatureError):
+            local.verified_path(key, expires + 3600, signature)
+
+        past = int(time.time()) - 1
+        with pytest.raises(InvalidFileSignatureError):
+            local.verified_path(key, past, local.signature(key, past))
+
+
+class TestMemoryBackend:
+    """Tests for the in-memory backend"""
+
+    def test_round_trip(self):
+        """Test put, chunked reads and delete"""
+        memory = MemoryBackend()
+        memory.put_stream("a/b.bin", io.BytesIO(b"abcdef"), "application/pdf")
+
+        assert list(memory.get_stream("a/b.bin", chunk_size=4)) == [b"abcd", b"ef"]
+        memory.delete("a/b.bin")
+        with pytest.raises(StoredObjectNotFoundError):
+            memory.get("a/b.bin")
+
+
+class TestBackendSelection:
+    """Tests for choosing the backend from settings"""
+
+    @pytest.fixture
+    def use_backend(self, monkeypatch, tmp_path):
+        def select(name):
+            monkeypatch.setattr(config, "STORAGE_BACKEND", name)
+            monkeypatch.setattr(config, "LOCAL_STORAGE_ROOT", str(tmp_path))
+            monkeypatch.setattr(config, "LOCAL_STORAGE_URL", BASE_URL)
+            reset_storage_backend()
+            return get_storage_backend()
+
+        yield select
+        reset_storage_backend()
+
+    def test_s3_upload_uses_selected_backend(self, use_backend):
+        """Test that S3Upload stores, reads and deletes through the backend"""
+        backend = use_backend("memory")
+        upload = S3Upload(session=None, current_user=None)
+
+        upload.s3_upload(b"contents", "docs/a.pdf", "application/pdf")
+        assert backend.objects["docs/a.pdf"] == b"contents"
+        assert upload.s3_download("docs/a.pdf") == b"contents"
+        assert b"".join(upload.stream_object("docs/a.pdf", 3)) == b"contents"
+
+        upload.delete_object("docs/a.pdf")
+        assert "docs/a.pdf" not in backend.objects
+
+    def test_local_files_are_served_from_signed_urls(self, use_backend):
+        """Test that the files route serves a presigned local file and rejects bad links"""
+        backend = use_backend("local")
+        backend.put("pics/me.png", b"\x89PNG image")
+        url = backend.presign("pics/me.png", 60)
+
+        app = FastAPI()
+        app.include_router(files.router, prefix="/files")
+        client = TestClient(app)
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.content == b"\x89PNG image"
+        assert response.headers["content-type"] == "image/png"
+
+        with pytest.raises(InvalidFileSignatureError):
+            client.get(url.replace("signature=", "signature=0"))
+
+    def test_unknown_backend(self):
+        """Test that a misconfigured backend name fails loudly"""
+        with pytest.raises(ValueError):
+            backends.build_storage_backend("ftp")
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.identity.services.student_service import StudentService
+
+
+class CounterSession:
+    """Keeps per-year counters in memory and records the statements issued"""
+
+    def __init__(self, counters=None, issued=0):
+        self.counters = dict(counters or {})
+        self.issued = issued
+        self.statements = []
+
+    def scalar(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        params = stmt.compile().params
+        year = next(v for k, v in params.items() if k.startswith("session_start_year"))
+        count = next(v for k, v in params.items() if k.startswith("last_serial"))
+
+        if sql.startswith("UPDATE"):
+            if year not in self.counters:
+                return None
+            self.counters[year] += count
+        else:
+            self.counters[year] = self.issued + count
+        return self.counters[year]
+
+
+def service(session):
+    return StudentService(session, SimpleNamespace(id=uuid4()))
+
+
+class TestStudentIdAllocation:
+    """Tests for counter-based student ID allocation"""
+
+    def test_allocates_with_one_statement(self):
+        """Test that an existing counter serves an ID with a single UPDATE"""
+        session = CounterSession({2025: 41})
+
+        student_id = service(session).generate_student_id(2025)
+
+        assert student_id == "SCH-25-00042"
+        assert len(session.statements) == 1
+        assert "RETURNING student_id_counters.last_serial" in session.statements[0]
+
+    def test_first_use_continues_after_issued_ids(self):
+        """Test that a new year's counter is seeded from IDs already issued"""
+        session = CounterSession(issued=7)
+
+        assert service(session).generate_student_id(2024) == "SCH-24-00008"
+        assert session.statements[1].startswith("INSERT INTO student_id_counters")
+        assert "ON CONFLICT (session_start_year) DO UPDATE" in session.statements[1]
+
+    def test_block_allocation(self):
+        """Test that a block of IDs is reserved in one round trip without overlap"""
+        session = CounterSession({2025: 100})
+        allocator = service(session)
+
+        block = allocator.generate_student_ids(2025, 1000)
+        following = allocator.generate_student_id(2025)
+
+        assert block[0] == "SCH-25-00101" and block[-1] == "SCH-25-01100"
+        assert len(set(block)) == 1000
+        assert following == "SCH-25-01101"
+        assert len(session.statements) == 2
@@ -0,0 +1,165 @@
+import io
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from openpyxl import Workbook
+from sqlalchemy.dialects import postgresql
+
+from app.core.identity.services.onboarding_service import StudentOnboardingService
+from app.core.rbac.services.role_service import invalidate_role_ids
+from app.core.shared.exceptions import FileTooLargeError, InvalidOnboardingInputError
+from app.core.shared.models.enums import UserRoleName
+from app.core.shared.services.file_storage.s3_upload import MB
+from app.settings import config
+
+YEAR = datetime.now().year
+GUARDIAN, LEVEL = uuid4(), uuid4()
+HEADER = [
+    "first_name",
+    "last_name",
+    "gender",
+    "date_of_birth",
+    "session_start_year",
+    "level_id",
+    "guardian_id",
+]
+
+
+def row(first_name="Ada", guardian_id=GUARDIAN, date_of_birth="2012-03-04"):
+    return {
+        "first_name": first_name,
+        "last_name": "Obi",
+        "gender": "FEMALE",
+        "date_of_birth": date_of_birth,
+        "session_start_year": YEAR,
+        "level_id": str(LEVEL),
+        "guardian_id": str(guardian_id),
+    }
+
+
+class OnboardingSession:
+    """Answers reference, role and counter lookups and records the rest"""
+
+    def __init__(self):
+        self.role_id = uuid4()
+        self.statements = []
+        self.inserted = None
+        self.committed = False
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if sql.startswith("INSERT INTO students"):
+            self.inserted = params
+            return None
+        if "FROM roles" in sql:
+            return SimpleNamespace(all=lambda: [(UserRoleName.STUDENT, self.role_id)])
+        return SimpleNamespace(all=lambda: [("guardian", GUARDIAN), ("level", LEVEL)])
+
+    def scalar(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return 10 + stmt.compile().params["last_serial_1"]
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+def service(session):
+    return StudentOnboardingService(session, SimpleNamespace(id=uuid4()))
+
+
+class TestStudentOnboarding:
+    """Tests for bulk student onboarding"""
+
+    def test_reads_csv_and_xlsx(self):
+        """Test that both file formats give the same rows and skip blank lines"""
+        csv_file = ",".join(HEADER) + "\n" + ",".join(map(str, row().values()))
+        csv_file += "\n,,,,,,\n"
+
+        workbook = Workbook()
+        workbook.active.append(HEADER)
+        workbook.active.append(list(row().values()))
+        workbook.active.append([None] * len(HEADER))
+        xlsx_file = io.BytesIO()
+        workbook.save(xlsx_file)
+
+        csv_rows = StudentOnboardingService.read_rows("a.csv", csv_file.encode())
+        xlsx_rows = StudentOnboardingService.read_rows("a.xlsx", xlsx_file.getvalue())
+
+        assert len(csv_rows) == len(xlsx_rows) == 1
+        assert csv_rows[0]["first_name"] == xlsx_rows[0]["first_name"] == "Ada"
+
+    def test_rejects_other_file_types(self):
+        """Test that only CSV and XLSX uploads are accepted"""
+        with pytest.raises(InvalidOnboardingInputError):
+            StudentOnboardingService.read_rows("students.pdf", b"%PDF")
+
+    def test_oversized_uploads_are_refused(self, monkeypatch):
+        """Test that files over the limit are rejected without being read in full"""
+        monkeypatch.setattr(config, "BULK_ONBOARDING_MAX_FILE_MB", 1)
+        oversized = b"x" * (2 * MB)
+
+        class OneShot(io.RawIOBase):
+            def __init__(self):
+                self.stream = io.BytesIO(oversized)
+                self.requested = []
+
+            def read(self, size=-1):
+                self.requested.append(size)
+                return self.stream.read(size)
+
+        one_shot = OneShot()
+        for stream in (io.BytesIO(oversized), one_shot):
+            with pytest.raises(FileTooLargeError):
+                StudentOnboardingService.read_upload(stream)
+
+        assert one_shot.requested == [MB + 1]
+        assert StudentOnboardingService.read_upload(io.BytesIO(b"a,b")) == b"a,b"
+
+    def test_onboards_valid_rows_in_one_insert(self, monkeypatch):
+        """Test that valid rows share one role lookup, one ID block and one insert"""
+        invalidate_role_ids()
+        session = OnboardingSession()
+        records = [
+            row("Ada"),
+            row("Bola", guardian_id=uuid4()),
+            row("Chi", date_of_birth="not a date"),
+            row("Dayo"),
+        ]
+        hash_passwords = StudentOnboardingService.hash_passwords
+
+        def hash_and_record(passwords):
+            session.statements.append("HASH PASSWORDS")
+            return hash_passwords(passwords)
+
+        monkeypatch.setattr(
+            StudentOnboardingService, "hash_passwords", staticmethod(hash_and_record)
+        )
+
+        result = service(session).onboard(records)
+
+        assert [s["student_id"] for s in result["created"]] == [
+            f"SCH-{str(YEAR)[2:]}-00011",
+            f"SCH-{str(YEAR)[2:]}-00012",
+        ]
+        assert [s["row"] for s in result["created"]] == [1, 4]
+        assert [f["row"] for f in result["failed"]] == [2, 3]
+        assert result["failed"][0]["reason"] == "Guardian not found"
+
+        assert len(session.inserted) == 2
+        assert {r["current_role_id"] for r in session.inserted} == {session.role_id}
+        assert all(r["password_hash"].startswith("$2") for r in session.inserted)
+        counters = [
+            n
+            for n, sql in enumerate(session.statements)
+            if "student_id_counters" in sql
+        ]
+        assert len(counters) == 1
+        assert session.statements.index("HASH PASSWORDS") < counters[0]
+        assert sum("FROM roles" in sql for sql in session.statements) == 1
+        assert session.committed
@@ -0,0 +1,39 @@
+import io
+
+import pytest
+from PIL import Image
+
+from app.core.shared.schemas.enums import ThumbnailSize
+from app.core.shared.services.file_storage.thumbnails import (
+    render_thumbnails,
+    thumbnail_key,
+)
+
+
+def make_image(image_format: str, size=(1600, 1200), mode="RGB") -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, size, color=(200, 120, 40)).save(output, format=image_format)
+    return output.getvalue()
+
+
+class TestThumbnails:
+    """Tests for WebP thumbnail rendering"""
+
+    def test_thumbnail_key_sits_next_to_original(self):
+        """Test that the extension is replaced by the size and .webp"""
+        key = "profile_pictures/student_ada_lovelace_1a2b3c4d_profile.png"
+        assert thumbnail_key(key, ThumbnailSize.SMALL) == (
+            "profile_pictures/student_ada_lovelace_1a2b3c4d_profile_64.webp"
+        )
+
+    @pytest.mark.parametrize(
+        "image_format, mode", [("JPEG", "RGB"), ("PNG", "RGBA"), ("WEBP", "RGB")]
+    )
+    def test_every_size_is_rendered_as_webp(self, image_format, mode):
+        """Test that each size fits its box and keeps the aspect ratio"""
+        thumbnails = render_thumbnails(make_image(image_format, mode=mode))
+        assert set(thumbnails) == set(ThumbnailSize)
+        for size, contents in thumbnails.items():
+            with Image.open(io.BytesIO(contents)) as image:
+                assert image.format == "WEBP"
+                assert image.size == (int(size), int(size) * 3 // 4)
@@ -0,0 +1,225 @@
+from datetime import date
+from decimal import Decimal
+from itertools import count
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.academic_structure.models import AcademicLevel, Classes
+from app.core.assessment.models.assessment import TotalGrade
+from app.core.assessment.services import assessment_service, result_cache
+from app.core.curriculum.models.curriculum import (
+    AcademicLevelSubject,
+    StudentSubject,
+    Subject,
+)
+from app.core.identity.models.guardian import Guardian
+from app.core.identity.models.staff import System
+from app.core.identity.models.student import Student
+from app.core.rbac.models import Role
+from app.core.rbac.services.role_service import invalidate_role_ids
+from app.core.shared.models.enums import (
+    Gender,
+    StaffType,
+    Title,
+    UserRoleName,
+    UserType,
+)
+from app.core.shared.schemas.enums import Semester
+from app.infra.db.redis_db.result_summaries import ResultSummaryCache
+from tests.utils.redis_utils import MemoryRedis
+
+
+@pytest.fixture(autouse=True)
+def summary_cache(monkeypatch):
+    """Keeps result summaries in memory so commits can invalidate them without Redis"""
+    cache = ResultSummaryCache(MemoryRedis())
+    monkeypatch.setattr(result_cache, "result_summary_cache", cache)
+    monkeypatch.setattr(assessment_service, "result_summary_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def db(test_engine, db_session):
+    """
+    A session for one test. Commits made by the code under test release savepoints
+    inside an outer transaction that is rolled back afterwards.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    invalidate_role_ids()
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+    invalidate_role_ids()
+
+
+class SchoolBuilder:
+    """Adds the minimum rows a service needs, in dependency order"""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.serial = count(1)
+        self.roles = {}
+        self.system = self.add_system_user()
+        self.actor = SimpleNamespace(id=self.system.id)
+        self.guardian = self.add_guardian()
+
+    def audit(self) -> dict:
+        return {"created_by": self.system.id, "last_modified_by": self.system.id}
+
+    def add(self, obj):
+        self.session.add(obj)
+        self.session.flush()
+        return obj
+
+    def add_system_user(self) -> System:
+        system_id = uuid4()
+        role = self.add(
+            Role(id=uuid4(), name=UserRoleName.SYSTEM, description="System")
+        )
+        self.roles[UserRoleName.SYSTEM] = role
+        return self.add(
+            System(
+                id=system_id,
+                password_hash="x",
+                first_name="Kademia",
+                last_name="System",
+                gender=Gender.SYSTEM,
+                current_role_id=role.id,
+                user_type=UserType.SYSTEM,
+                staff_type=StaffType.SYSTEM,
+                email_address=f"system-{system_id}@kademia.test",
+                phone="00000000110",
+                address="System",
+                date_joined=date(2020, 1, 1),
+                created_by=system_id,
+                last_modified_by=system_id,
+            )
+        )
+
+    def add_role(self, name: UserRoleName) -> Role:
+        if name not in self.roles:
+            self.roles[name] = self.add(
+                Role(id=uuid4(), name=name, description=name.value, **self.audit())
+            )
+        return self.roles[name]
+
+    def add_guardian(self) -> Guardian:
+        n = next(self.serial)
+        return self.add(
+            Guardian(
+                id=uuid4(),
+                title=Title.Mrs,
+                first_name="Grace",
+                last_name=f"Guardian{n}",
+                gender=Gender.FEMALE,
+                password_hash="x",
+                email_address=f"guardian{n}-{uuid4()}@kademia.test",
+                address="Lagos",
+                phone=f"080{n:08d}",
+                current_role_id=self.add_role(UserRoleName.GUARDIAN).id,
+                **self.audit(),
+            )
+        )
+
+    def add_level(self, rank: int, is_final: bool = False) -> AcademicLevel:
+        n = next(self.serial)
+        return self.add(
+            AcademicLevel(
+                id=uuid4(),
+                name=f"Level {n}",
+                description=f"Level {n}",
+                display_order=n,
+                promotion_rank=rank,
+                is_final=is_final,
+                **self.audit(),
+            )
+        )
+
+    def add_class(self, level: AcademicLevel) -> Classes:
+        n = next(self.serial)
+        return self.add(
+            Classes(
+                id=uuid4(),
+                level_id=level.id,
+                code="A",
+                order=n,
+                **self.audit(),
+            )
+        )
+
+    def add_subject(self, level: AcademicLevel) -> AcademicLevelSubject:
+        n = next(self.serial)
+        subject = self.add(Subject(id=uuid4(), name=f"Subject {n}", **self.audit()))
+        return self.add(
+            AcademicLevelSubject(
+                id=uuid4(),
+                level_id=level.id,
+                subject_id=subject.id,
+                code=f"SUB{n:03d}",
+                **self.audit(),
+            )
+        )
+
+    def add_student(
+        self, level: AcademicLevel, school_class: Classes | None = None, **values
+    ) -> Student:
+        n = next(self.serial)
+        values = {
+            "id": uuid4(),
+            "student_id": f"SCH-25-{n:05d}",
+            "first_name": "Student",
+            "last_name": f"Number{n}",
+            "gender": Gender.FEMALE,
+            "password_hash": "x",
+            "date_of_birth": date(2012, 1, 1),
+            "session_start_year": 2025,
+            "guardian_id": self.guardian.id,
+            "level_id": level.id,
+            "class_id": school_class.id if school_class else None,
+            "current_role_id": self.add_role(UserRoleName.STUDENT).id,
+            **self.audit(),
+            **values,
+        }
+        return self.add(Student(**values))
+
+    def enroll(
+        self,
+        student: Student,
+        subject: AcademicLevelSubject,
+        academic_session: str = "2025/2026",
+        semester: Semester = Semester.FIRST,
+    ) -> StudentSubject:
+        return self.add(
+            StudentSubject(
+                id=uuid4(),
+                student_id=student.id,
+                academic_level_subject_id=subject.id,
+                academic_session=academic_session,
+                semester=semester,
+                **self.audit(),
+            )
+        )
+
+    def add_total_grade(self, enrollment: StudentSubject, score) -> TotalGrade:
+        return self.add(
+            TotalGrade(
+                id=uuid4(),
+                student_id=enrollment.student_id,
+                student_subject_id=enrollment.id,
+                total_score=Decimal(str(score)),
+                **self.audit(),
+            )
+        )
+
+
+@pytest.fixture
+def school(db) -> SchoolBuilder:
+    return SchoolBuilder(db)
@@ -0,0 +1,66 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.identity.models.student import Student
+from app.core.progression.models.progression import Promotion
+from app.core.progression.schemas.promotion import BatchPromotionCreate
+from app.core.progression.services.promotion_service import PromotionService
+from app.core.shared.models.enums import ApprovalStatus
+from app.core.shared.services.approval_service.batch_decision_service import (
+    BatchDecisionService,
+)
+
+
+@pytest.fixture
+def promotions(db, school):
+    """Pending JSS1 to JSS2 promotions for two students"""
+    jss1, jss2 = school.add_level(1), school.add_level(2)
+    for _ in range(2):
+        school.add_student(jss1)
+    created = PromotionService(db, school.actor).create_batch_promotion(
+        BatchPromotionCreate(academic_session="2025/2026", level_id=jss1.id)
+    )
+    return created["succeeded"], jss1, jss2
+
+
+def student_levels(db):
+    return set(db.scalars(select(Student.level_id)))
+
+
+class TestBatchDecisions:
+    """Tests for set-based approval decisions against Postgres"""
+
+    def test_decision_reports_outcome_per_record(self, db, school, promotions):
+        """Test that pending records are decided once, with their students moved"""
+        ids, _, jss2 = promotions
+        service = BatchDecisionService(db, school.actor)
+        missing = uuid4()
+
+        first = service.decide(Promotion, ids[:1], ApprovalStatus.APPROVED)
+        second = service.decide(Promotion, [*ids, missing], ApprovalStatus.APPROVED)
+
+        assert first == {"succeeded": ids[:1], "failed": []}
+        assert second["succeeded"] == ids[1:]
+        assert second["failed"] == [
+            {"id": ids[0], "reason": "Promotion has already been approved"},
+            {"id": missing, "reason": "Not found"},
+        ]
+        assert student_levels(db) == {jss2.id}
+
+    def test_losing_a_race_moves_nobody(self, db, school, promotions):
+        """Test that a decision whose status check raced another applies nothing"""
+        ids, jss1, _ = promotions
+        service = BatchDecisionService(db, school.actor)
+        service.decide(Promotion, ids, ApprovalStatus.APPROVED)
+        db.execute(update(Student).values(level_id=jss1.id))
+
+        decided = service.apply_decision(
+            Promotion, ids, ApprovalStatus.APPROVED, "Second approval"
+        )
+
+        assert decided == set()
+        assert student_levels(db) == {jss1.id}
+        reasons = db.scalars(select(Promotion.decision_reason)).all()
+        assert reasons == [None, None]
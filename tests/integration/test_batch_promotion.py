@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from app.core.identity.models.student import Student
+from app.core.progression.models.progression import Promotion
+from app.core.progression.schemas.promotion import (
+    BatchPromotionApproval,
+    BatchPromotionCreate,
+)
+from app.core.progression.services.promotion_service import PromotionService
+from app.core.shared.models.enums import ApprovalStatus
+
+SESSION = "2025/2026"
+
+
+@pytest.fixture
+def cohort(school):
+    """Two students in a JSS1 class, one in the final level"""
+    jss1, jss2, final = (
+        school.add_level(1),
+        school.add_level(2),
+        school.add_level(3, is_final=True),
+    )
+    jss1_a = school.add_class(jss1)
+    return SimpleNamespace(
+        jss1=jss1,
+        jss2=jss2,
+        final=final,
+        jss1_a=jss1_a,
+        students=[school.add_student(jss1, jss1_a) for _ in range(2)],
+        leaver=school.add_student(final),
+    )
+
+
+class TestBatchPromotion:
+    """Tests for the batch promotion engine against Postgres"""
+
+    def test_batch_inserts_pending_promotions_once(self, db, school, cohort):
+        """Test that a level's students get one pending promotion each per session"""
+        service = PromotionService(db, school.actor)
+        data = BatchPromotionCreate(academic_session=SESSION, level_id=cohort.jss1.id)
+
+        created = service.create_batch_promotion(data)
+        repeated = service.create_batch_promotion(data)
+
+        promotions = db.scalars(select(Promotion)).all()
+        assert sorted(created["succeeded"]) == sorted(p.id for p in promotions)
+        assert {p.student_id for p in promotions} == {s.id for s in cohort.students}
+        assert all(
+            (p.status, p.previous_level_id, p.promoted_level_id)
+            == (ApprovalStatus.PENDING, cohort.jss1.id, cohort.jss2.id)
+            for p in promotions
+        )
+        assert repeated["succeeded"] == []
+        assert len(repeated["failed"]) == 2
+
+    def test_final_level_has_nowhere_to_go(self, db, school, cohort):
+        """Test that students in a final level are reported rather than promoted"""
+        result = PromotionService(db, school.actor).create_batch_promotion(
+            BatchPromotionCreate(academic_session=SESSION, level_id=cohort.final.id)
+        )
+
+        assert result["succeeded"] == []
+        assert result["failed"] == [
+            {"id": cohort.leaver.id, "reason": "No higher academic level to promote to"}
+        ]
+
+    def test_class_approval_moves_students(self, db, school, cohort):
+        """Test that approving a class's promotions moves its students up a level"""
+        service = PromotionService(db, school.actor)
+        service.create_batch_promotion(
+            BatchPromotionCreate(academic_session=SESSION, class_id=cohort.jss1_a.id)
+        )
+
+        result = service.approve_batch_promotion(
+            BatchPromotionApproval(
+                academic_session=SESSION,
+                class_id=cohort.jss1_a.id,
+                decision_reason="End of session",
+            )
+        )
+
+        assert len(result["succeeded"]) == 2
+        levels = db.scalars(
+            select(Student.level_id).where(
+                Student.id.in_([s.id for s in cohort.students])
+            )
+        ).all()
+        assert levels == [cohort.jss2.id, cohort.jss2.id]
+        statuses = db.scalars(select(Promotion.status)).all()
+        assert statuses == [ApprovalStatus.APPROVED] * 2
@@ -0,0 +1,177 @@
+import hashlib
+import io
+from uuid import uuid4
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+from sqlalchemy import select
+from starlette.datastructures import UploadFile
+
+from app.core.documents.factories.award_factory import AwardFactory
+from app.core.documents.models.documents import StudentAward
+from app.core.documents.services.document_service import DocumentService
+from app.core.shared.models.storage import StoredBlob
+from app.core.shared.services.file_storage.blob_storage import BlobStorage
+from app.core.shared.services.file_storage.s3_client import reset_s3_client
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.settings import config
+from tests.core.services.test_blob_storage import DATA
+
+FOLDER = "student-documents/"
+
+
+@pytest.fixture
+def bucket():
+    with mock_aws():
+        reset_s3_client()
+        client = boto3.client("s3", region_name=config.AWS_DEFAULT_REGION)
+        client.create_bucket(Bucket=config.AWS_BUCKET_NAME)
+        yield client
+    reset_s3_client()
+
+
+@pytest.fixture
+def blobs(db, bucket):
+    return BlobStorage(db, S3Upload(db, current_user=None))
+
+
+def stored(bucket, s3_key) -> bool:
+    try:
+        bucket.head_object(Bucket=config.AWS_BUCKET_NAME, Key=s3_key)
+        return True
+    except ClientError:
+        return False
+
+
+def ref_count(db, s3_key):
+    return db.scalar(select(StoredBlob.ref_count).where(StoredBlob.s3_key == s3_key))
+
+
+def pdf(contents: bytes = DATA) -> UploadFile:
+    return UploadFile(file=io.BytesIO(contents), filename="certificate.pdf")
+
+
+class TestBlobStorage:
+    """Tests for reference counted, content-addressed storage against Postgres"""
+
+    def test_add_reference_counts_uploads(self, db, blobs):
+        """Test that only the first reference to a key reports a new blob"""
+        sha256 = hashlib.sha256(DATA).hexdigest()
+        s3_key = blobs.blob_key(FOLDER, sha256, "pdf")
+
+        assert blobs.add_reference(s3_key, sha256, len(DATA), "application/pdf")
+        assert not blobs.add_reference(s3_key, sha256, len(DATA), "application/pdf")
+        assert ref_count(db, s3_key) == 2
+
+    def test_identical_bytes_are_uploaded_once(self, db, blobs, bucket):
+        """Test that storing the same contents again skips the upload"""
+        first = blobs.store(DATA, FOLDER, "pdf", "application/pdf")
+        bucket.delete_object(Bucket=config.AWS_BUCKET_NAME, Key=first.s3_key)
+
+        second = blobs.store(DATA, FOLDER, "pdf", "application/pdf")
+
+        assert second.s3_key == first.s3_key
+        assert (first.deduplicated, second.deduplicated) == (False, True)
+        assert not stored(bucket, second.s3_key)
+        assert ref_count(db, first.s3_key) == 2
+
+    def test_last_release_deletes_the_blob(self, db, blobs, bucket):
+        """Test that a blob survives until its last reference is released"""
+        s3_key = blobs.store(DATA, FOLDER, "pdf", "application/pdf").s3_key
+        blobs.store(DATA, FOLDER, "pdf", "application/pdf")
+
+        blobs.release(s3_key)
+        db.commit()
+        assert ref_count(db, s3_key) == 1 and stored(bucket, s3_key)
+
+        blobs.release(s3_key)
+        assert stored(bucket, s3_key)
+        db.commit()
+        assert ref_count(db, s3_key) is None
+        assert not stored(bucket, s3_key)
+
+    def test_rolled_back_release_keeps_the_blob(self, db, blobs, bucket):
+        """Test that releasing the last reference in a rolled back transaction keeps it"""
+        s3_key = blobs.store(DATA, FOLDER, "pdf", "application/pdf").s3_key
+        db.commit()
+
+        blobs.release(s3_key)
+        db.rollback()
+        db.commit()
+
+        assert ref_count(db, s3_key) == 1
+        assert stored(bucket, s3_key)
+
+    def test_blob_referenced_again_before_commit_is_kept(self, db, blobs, bucket):
+        """Test that re-storing released bytes in the same transaction keeps the object"""
+        s3_key = blobs.store(DATA, FOLDER, "pdf", "application/pdf").s3_key
+
+        blobs.release(s3_key)
+        assert blobs.store(DATA, FOLDER, "pdf", "application/pdf").deduplicated
+        db.commit()
+
+        assert ref_count(db, s3_key) == 1
+        assert stored(bucket, s3_key)
+
+    def test_keys_without_a_row_are_deleted(self, db, blobs, bucket):
+        """Test that files stored before content addressing are deleted on release"""
+        legacy_key = f"{FOLDER}legacy_upload.pdf"
+        blobs.upload.s3_upload(b"legacy", legacy_key)
+
+        blobs.release(legacy_key)
+        db.commit()
+
+        assert not stored(bucket, legacy_key)
+
+
+class TestDocumentBlobs:
+    """Tests for award files sharing blobs"""
+
+    @pytest.fixture
+    def awards(self, db, school):
+        student = school.add_student(school.add_level(1))
+        return [
+            school.add(
+                StudentAward(
+                    id=uuid4(),
+                    student_id=student.id,
+                    title=f"Award {n}",
+                    academic_session="2025/2026",
+                    **school.audit(),
+                )
+            )
+            for n in range(2)
+        ]
+
+    def test_reupload_of_same_bytes_keeps_one_reference(
+        self, db, school, bucket, awards
+    ):
+        """Test that re-uploading a record's file does not leak a reference"""
+        service = DocumentService(db, school.actor)
+        award = awards[0]
+
+        service.upload_award_file(pdf(), None, award)
+        service.upload_award_file(pdf(), None, award)
+
+        assert ref_count(db, award.award_s3_key) == 1
+        assert stored(bucket, award.award_s3_key)
+
+    def test_deleting_awards_releases_their_blob(self, db, school, bucket, awards):
+        """Test that a shared blob is deleted with the last award pointing at it"""
+        service = DocumentService(db, school.actor)
+        for award in awards:
+            service.upload_award_file(pdf(), None, award)
+        s3_key = awards[0].award_s3_key
+        factory = AwardFactory(db, current_user=school.actor)
+
+        factory.delete_award(awards[0].id)
+        db.commit()
+        assert ref_count(db, s3_key) == 1 and stored(bucket, s3_key)
+
+        factory.delete_award(awards[1].id)
+        db.commit()
+        assert ref_count(db, s3_key) is None
+        assert not stored(bucket, s3_key)
+        assert db.scalar(select(StudentAward.id)) is None
@@ -0,0 +1,33 @@
+from app.core.academic_structure.models import Classes
+from app.core.identity.services.student_service import StudentService
+from app.core.shared.schemas.enums import ArchiveReason
+from app.core.shared.schemas.shared_models import BulkArchiveRequest
+
+
+class TestBulkStudentArchive:
+    """Tests for bulk student archives against Postgres"""
+
+    def test_archived_reps_are_unassigned_without_cascade(self, db, school):
+        """Test that only the students actually archived lose their class roles"""
+        level = school.add_level(1)
+        school_class = school.add_class(level)
+        rep = school.add_student(level, school_class)
+        assistant = school.add_student(level, school_class)
+        school.enroll(assistant, school.add_subject(level))
+        school_class.student_rep_id = rep.id
+        school_class.assistant_rep_id = assistant.id
+        db.commit()
+
+        result = StudentService(db, school.actor).bulk_archive_students(
+            BulkArchiveRequest(
+                ids=[rep.id, assistant.id], reason=ArchiveReason.GRADUATED
+            ),
+            filters=None,
+        )
+
+        assert result["succeeded"] == [rep.id]
+        assert [failure["id"] for failure in result["failed"]] == [assistant.id]
+        db.expire_all()
+        school_class = db.get(Classes, school_class.id)
+        assert school_class.student_rep_id is None
+        assert school_class.assistant_rep_id == assistant.id
@@ -0,0 +1,95 @@
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.core.identity.models.student import Student
+from app.core.identity.services.profile_picture_service import ProfilePictureService
+from app.core.shared.schemas.enums import ThumbnailSize
+from app.core.shared.services.export_service.jobs import run_thumbnails
+from app.core.shared.services.file_storage.s3_client import reset_s3_client
+from app.core.shared.services.file_storage.s3_upload import S3Upload
+from app.core.shared.services.file_storage.thumbnails import thumbnail_key
+from app.settings import config
+from tests.core.services.test_thumbnails import make_image
+
+
+@pytest.fixture
+def upload(db):
+    with mock_aws():
+        reset_s3_client()
+        boto3.client("s3", region_name=config.AWS_DEFAULT_REGION).create_bucket(
+            Bucket=config.AWS_BUCKET_NAME
+        )
+        yield S3Upload(session=db, current_user=None)
+    reset_s3_client()
+
+
+@pytest.fixture
+def pictured(school, upload):
+    """A student whose picture was uploaded before thumbnails were rendered"""
+    s3_key = f"{config.PROFILE_PICTURES_FOLDER}student_ada_bello_1a2b3c4d_profile.jpg"
+    upload.s3_upload(make_image("JPEG"), s3_key, "image/jpeg")
+    return school.add_student(school.add_level(1), profile_s3_key=s3_key)
+
+
+class TestProfileThumbnails:
+    """Tests for serving profile picture thumbnails only once they exist"""
+
+    def test_original_is_served_until_thumbnails_exist(self, db, upload, pictured):
+        """Test that the task stores every size and only then switches the key"""
+        s3_key = pictured.profile_s3_key
+        small = ThumbnailSize.SMALL
+        assert ProfilePictureService.profile_pic_key(pictured, small) == s3_key
+
+        result = run_thumbnails(db, None, {"s3_key": s3_key})
+
+        assert result == {"thumbnails": len(ThumbnailSize)}
+        for size in ThumbnailSize:
+            stored = upload.s3_client.get_object(
+                Bucket=config.AWS_BUCKET_NAME, Key=thumbnail_key(s3_key, size)
+            )
+            assert stored["ContentType"] == "image/webp"
+        db.refresh(pictured)
+        assert pictured.profile_thumbnails_ready
+        assert ProfilePictureService.profile_pic_key(pictured, small) == (
+            thumbnail_key(s3_key, small)
+        )
+
+    def test_batch_urls_fall_back_to_the_original(self, db, school, pictured):
+        """Test that batch URLs sign thumbnails only for users that have them"""
+        rendered = school.add_student(
+            school.add_level(2),
+            profile_s3_key="profile_pictures/rendered.png",
+            profile_thumbnails_ready=True,
+        )
+        bare = school.add_student(school.add_level(3))
+        service = ProfilePictureService(db, school.actor)
+
+        urls = {
+            row["id"]: row["url"]
+            for row in service.profile_pic_urls(
+                Student, [pictured.id, rendered.id, bare.id], ThumbnailSize.MEDIUM
+            )
+        }
+
+        assert "student_ada_bello_1a2b3c4d_profile.jpg" in urls[pictured.id]
+        assert "rendered_256.webp" in urls[rendered.id]
+        assert urls[bare.id] is None
+
+    def test_backfill_queues_pictures_without_thumbnails(
+        self, db, school, pictured, monkeypatch
+    ):
+        """Test that only pictures still missing thumbnails are queued"""
+        school.add_student(
+            school.add_level(2),
+            profile_s3_key="profile_pictures/rendered.png",
+            profile_thumbnails_ready=True,
+        )
+        service = ProfilePictureService(db, school.actor)
+        queued = []
+        monkeypatch.setattr(
+            service.job_service, "enqueue", lambda kind, params: queued.append(params)
+        )
+
+        assert service.queue_missing_thumbnails() == 1
+        assert queued == [{"s3_key": pictured.profile_s3_key}]
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from app.core.progression.models.progression import Promotion, Repetition
+from app.core.progression.schemas.proposal import ProgressionProposalRequest
+from app.core.progression.services.proposal_service import ProgressionProposalService
+from app.core.shared.models.enums import ApprovalStatus
+
+SESSION = "2025/2026"
+
+
+@pytest.fixture
+def cohort(school):
+    """JSS1 students enrolled in three subjects, graded to different extents"""
+    jss1, jss2 = school.add_level(1), school.add_level(2)
+    subjects = [school.add_subject(jss1) for _ in range(3)]
+    cohort = SimpleNamespace(jss1=jss1, jss2=jss2)
+    for name, scores in {
+        "passed": [70, 80, 90],
+        "failed": [30, 40, 50],
+        "partial": [95, None, None],
+    }.items():
+        student = school.add_student(jss1)
+        for subject, score in zip(subjects, scores):
+            enrollment = school.enroll(student, subject)
+            if score is not None:
+                school.add_total_grade(enrollment, score)
+        setattr(cohort, name, student)
+    cohort.unenrolled = school.add_student(jss1)
+    return cohort
+
+
+class TestProgressionProposals:
+    """Tests for rule-based progression proposals against Postgres"""
+
+    def test_proposals_need_every_enrolled_subject_graded(self, db, school, cohort):
+        """Test that only fully graded students are proposed, and as pending records"""
+        report = ProgressionProposalService(db, school.actor).propose(
+            ProgressionProposalRequest(
+                academic_session=SESSION,
+                level_id=cohort.jss1.id,
+                pass_mark=50,
+                dry_run=False,
+            )
+        )
+
+        assert [p["student_id"] for p in report["promotions"]] == [cohort.passed.id]
+        assert report["promotions"][0]["average"] == 80.0
+        assert [r["student_id"] for r in report["repetitions"]] == [cohort.failed.id]
+        exceptions = {e["student_id"]: e for e in report["exceptions"]}
+        assert exceptions.keys() == {cohort.partial.id, cohort.unenrolled.id}
+        assert (
+            exceptions[cohort.partial.id]["enrolled_count"],
+            exceptions[cohort.partial.id]["graded_count"],
+        ) == (3, 1)
+        assert exceptions[cohort.partial.id]["reason"].startswith("Incomplete results")
+
+        promotion = db.scalars(select(Promotion)).one()
+        assert (promotion.student_id, promotion.promoted_level_id) == (
+            cohort.passed.id,
+            cohort.jss2.id,
+        )
+        repetition = db.scalars(select(Repetition)).one()
+        assert repetition.student_id == cohort.failed.id
+        assert {promotion.status, repetition.status} == {ApprovalStatus.PENDING}
@@ -0,0 +1,62 @@
+import pytest
+
+from app.core.assessment.services.assessment_service import AssessmentService
+from app.core.curriculum.factories.student_subject import StudentSubjectFactory
+from app.core.curriculum.models.curriculum import Subject
+from app.core.shared.models.enums import ArchiveReason
+from app.core.shared.schemas.enums import Semester
+
+SESSION = "2025/2026"
+
+
+@pytest.fixture
+def graded(school):
+    """A student graded in two subjects and enrolled in a third"""
+    level = school.add_level(1)
+    student = school.add_student(level, first_name="Ada", last_name="Bello")
+    subjects = [school.add_subject(level) for _ in range(2)]
+    enrollments = [school.enroll(student, subject) for subject in subjects]
+    for enrollment, score in zip(enrollments, (70, 45)):
+        school.add_total_grade(enrollment, score)
+    ungraded = school.add_subject(level)
+    return student, subjects, school.enroll(student, ungraded)
+
+
+def results(db, school, student):
+    return AssessmentService(db, school.actor).generate_student_results(
+        student.id, SESSION, Semester.FIRST
+    )
+
+
+class TestResultSummaries:
+    """Tests for cached result summaries against Postgres"""
+
+    def test_renames_are_served_from_a_cached_summary(self, db, school, graded):
+        """Test that student and subject names are read fresh on every request"""
+        student, subjects, _ = graded
+        first = results(db, school, student)
+        assert first["student_name"] == "Ada Bello"
+
+        student.last_name = "Okafor"
+        db.get(Subject, subjects[0].subject_id).name = "Further Maths"
+        db.commit()
+
+        second = results(db, school, student)
+        assert second["student_name"] == "Ada Okafor"
+        assert [row["course_title"] for row in second["result_list"]][0] == (
+            "Further Maths"
+        )
+        assert [row["total_score"] for row in second["result_list"]] == [70, 45, None]
+
+    def test_enrollment_writes_drop_the_summary(self, db, school, graded):
+        """Test that archiving an enrollment removes it from cached results"""
+        student, subjects, ungraded = graded
+        assert len(results(db, school, student)["result_list"]) == 3
+
+        StudentSubjectFactory(db, current_user=school.actor).archive_student_subject(
+            ungraded.id, ArchiveReason.WITHDRAWN
+        )
+        db.commit()
+
+        rows = results(db, school, student)["result_list"]
+        assert [row["course_code"] for row in rows] == [s.code for s in subjects]
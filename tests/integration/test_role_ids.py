@@ -0,0 +1,34 @@
+from app.core.rbac.factories.role import RoleFactory
+from app.core.rbac.schemas.roles import RoleCreate
+from app.core.rbac.services.role_service import get_role_ids
+from app.core.shared.models.enums import UserRoleName
+
+
+class TestRoleIdInvalidation:
+    """Tests for dropping the role map when role writes commit"""
+
+    def test_map_is_dropped_only_once_the_write_commits(self, db, school):
+        """Test that a new role is invisible to the cached map until its commit"""
+        school.add_role(UserRoleName.STUDENT)
+        before = get_role_ids(db)
+        factory = RoleFactory(db, current_user=school.actor)
+
+        role = factory.create_role(
+            RoleCreate(name=UserRoleName.ADMIN, description="School admins", rank=2)
+        )
+        assert get_role_ids(db) is before
+
+        db.commit()
+        assert get_role_ids(db)[UserRoleName.ADMIN] == role.id
+
+    def test_rolled_back_writes_keep_the_map(self, db, school):
+        """Test that a role delete that never commits leaves the map in place"""
+        student = school.add_role(UserRoleName.STUDENT)
+        before = get_role_ids(db)
+
+        RoleFactory(db, current_user=school.actor).delete_role(student.id)
+        db.rollback()
+        db.commit()
+
+        assert get_role_ids(db) is before
+        assert before[UserRoleName.STUDENT] == student.id
@@ -0,0 +1,39 @@
+import pytest
+
+from app.core.academic_structure.models import Classes
+from app.core.identity.factories.student import StudentFactory
+from app.core.identity.models.student import Student
+from app.core.rbac.factories.role import RoleFactory
+from app.core.rbac.models import Role
+from app.core.shared.exceptions import DeletionDependencyError
+from app.core.shared.models.enums import UserRoleName
+
+
+class TestSafeDelete:
+    """Tests for hard deletes checked against the FK rule map in Postgres"""
+
+    def test_restricted_references_block_the_delete(self, db, school):
+        """Test that a role still held by students is refused before the DELETE"""
+        student = school.add_student(school.add_level(1))
+        role = school.roles[UserRoleName.STUDENT]
+
+        with pytest.raises(DeletionDependencyError) as exc:
+            RoleFactory(db, current_user=school.actor).delete_role(role.id)
+
+        assert "students" in exc.value.user_message
+        assert db.get(Role, role.id) is not None
+        assert db.get(Student, student.id).current_role_id == role.id
+
+    def test_references_the_orm_clears_do_not_block(self, db, school):
+        """Test that a class rep can be deleted, since the ORM unsets the rep first"""
+        level = school.add_level(1)
+        school_class = school.add_class(level)
+        rep = school.add_student(level)
+        school_class.student_rep_id = rep.id
+        db.commit()
+
+        StudentFactory(db, current_user=school.actor).delete_student(rep.id)
+        db.commit()
+
+        assert db.get(Student, rep.id) is None
+        assert db.get(Classes, school_class.id).student_rep_id is None
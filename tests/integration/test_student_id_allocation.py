@@ -0,0 +1,72 @@
+from sqlalchemy import insert, select
+
+from app.core.identity.models.student import StudentIdCounter
+from app.core.identity.services.student_service import StudentService
+
+
+def counters(db) -> dict:
+    return dict(
+        db.execute(
+            select(StudentIdCounter.session_start_year, StudentIdCounter.last_serial)
+        ).all()
+    )
+
+
+class TestStudentIdAllocation:
+    """Tests for allocating student IDs from per-year counter rows in Postgres"""
+
+    def test_first_use_creates_the_counter_row(self, db, school):
+        """Test that a year without a counter row starts at serial one"""
+        service = StudentService(db, school.actor)
+
+        assert service.generate_student_id(2026) == "SCH-26-00001"
+        assert service.generate_student_id(2026) == "SCH-26-00002"
+        assert counters(db) == {2026: 2}
+
+    def test_counter_is_seeded_from_issued_ids(self, db, school):
+        """Test that a new counter row continues after the year's highest issued ID"""
+        level = school.add_level(1)
+        school.add_student(level, student_id="SCH-25-00041")
+        school.add_student(level, student_id="SCH-24-00900", session_start_year=2024)
+
+        assert (
+            StudentService(db, school.actor).generate_student_id(2025) == "SCH-25-00042"
+        )
+        assert counters(db) == {2025: 42}
+
+    def test_blocks_are_reserved_without_overlap(self, db, school):
+        """Test that bulk allocations take consecutive blocks from the counter"""
+        service = StudentService(db, school.actor)
+
+        first = service.generate_student_ids(2025, 3)
+        single = service.generate_student_id(2025)
+        second = service.generate_student_ids(2025, 2)
+
+        assert first == ["SCH-25-00001", "SCH-25-00002", "SCH-25-00003"]
+        assert single == "SCH-25-00004"
+        assert second == ["SCH-25-00005", "SCH-25-00006"]
+        assert counters(db) == {2025: 6}
+
+    def test_counter_row_created_concurrently_is_incremented(
+        self, db, school, monkeypatch
+    ):
+        """Test that the insert increments a counter row created after the update missed it"""
+        scalar = db.scalar
+
+        def race(stmt, *args, **kwargs):
+            result = scalar(stmt, *args, **kwargs)
+            if result is None:
+                db.execute(
+                    insert(StudentIdCounter).values(
+                        session_start_year=2025, last_serial=10
+                    )
+                )
+            return result
+
+        monkeypatch.setattr(db, "scalar", race)
+
+        assert StudentService(db, school.actor).generate_student_ids(2025, 2) == [
+            "SCH-25-00011",
+            "SCH-25-00012",
+        ]
+        assert counters(db) == {2025: 12}
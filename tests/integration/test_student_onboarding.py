@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.core.identity.models.student import Student, StudentIdCounter
+from app.core.identity.services.onboarding_service import StudentOnboardingService
+from app.core.shared.models.enums import UserRoleName
+
+YEAR = datetime.now().year
+
+
+class TestStudentOnboarding:
+    """Tests for bulk student onboarding against Postgres"""
+
+    def test_rows_are_created_or_reported_individually(self, db, school):
+        """Test that bad rows are reported by number while the rest are inserted"""
+        level = school.add_level(1)
+        role = school.add_role(UserRoleName.STUDENT)
+
+        def row(first_name, **values):
+            return {
+                "first_name": first_name,
+                "last_name": "Obi",
+                "gender": "FEMALE",
+                "date_of_birth": "2012-03-04",
+                "session_start_year": YEAR,
+                "level_id": str(level.id),
+                "guardian_id": str(school.guardian.id),
+                **values,
+            }
+
+        records = [
+            row("Ada"),
+            {"first_name": "Bola"},
+            row("Chi", level_id=str(school.guardian.id)),
+            row("Dayo"),
+        ]
+
+        result = StudentOnboardingService(db, school.actor).onboard(records)
+
+        prefix = f"SCH-{str(YEAR)[2:]}-"
+        assert [(s["row"], s["student_id"]) for s in result["created"]] == [
+            (1, f"{prefix}00001"),
+            (4, f"{prefix}00002"),
+        ]
+        assert [f["row"] for f in result["failed"]] == [2, 3]
+        assert "last_name" in result["failed"][0]["reason"]
+        assert result["failed"][1]["reason"] == "Academic level not found"
+
+        students = db.scalars(select(Student).order_by(Student.student_id)).all()
+        assert [s.first_name for s in students] == ["Ada", "Dayo"]
+        assert {s.current_role_id for s in students} == {role.id}
+        assert all(s.password_hash.startswith("$2") for s in students)
+        assert db.get(StudentIdCounter, YEAR).last_serial == 2
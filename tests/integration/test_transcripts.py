@@ -0,0 +1,184 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.assessment.models.assessment import StudentTranscript, TotalGrade
+from app.core.assessment.services.transcript_service import TranscriptService
+from app.core.identity.models.student import Student
+from app.core.progression.models.progression import Promotion
+from app.core.shared.exceptions import AccessDenied
+from app.core.shared.models.enums import ApprovalStatus, UserRoleName
+from app.core.shared.schemas.enums import ArchiveReason, Semester
+from app.core.shared.services.approval_service.batch_decision_service import (
+    BatchDecisionService,
+)
+from app.core.shared.services.lifecycle_service.archive_service import ArchiveService
+
+
+def transcripts(session, student):
+    return (
+        session.execute(
+            select(StudentTranscript)
+            .where(StudentTranscript.student_id == student.id)
+            .order_by(StudentTranscript.academic_session, StudentTranscript.semester)
+        )
+        .scalars()
+        .all()
+    )
+
+
+@pytest.fixture
+def term(school):
+    """A class of three students graded in two subjects for the first semester"""
+    level = school.add_level(1)
+    school_class = school.add_class(level)
+    subjects = [school.add_subject(level), school.add_subject(level)]
+    scores = {"ada": (80, 70), "chi": (60, 50), "ebo": (90, 90)}
+    students = {}
+    for name, student_scores in scores.items():
+        student = school.add_student(level, school_class)
+        for subject, score in zip(subjects, student_scores):
+            school.add_total_grade(school.enroll(student, subject), score)
+        students[name] = student
+
+    TranscriptService(school.session, school.actor).refresh_students(
+        [student.id for student in students.values()]
+    )
+    return SimpleNamespace(level=level, school_class=school_class, **students)
+
+
+class TestTranscripts:
+    """Tests for the transcript table against Postgres"""
+
+    def test_refresh_writes_term_and_positions(self, db, term):
+        """Test that a term row holds the subject count, average and class position"""
+        (ada,) = transcripts(db, term.ada)
+
+        assert (ada.subject_count, float(ada.average)) == (2, 75.0)
+        assert float(ada.cumulative_average) == 75.0
+        assert ada.class_id == term.school_class.id
+        ranking = (term.ebo, term.ada, term.chi)
+        positions = [transcripts(db, s)[0].class_position for s in ranking]
+        assert positions == [1, 2, 3]
+
+    def test_cumulative_average_spans_terms(self, db, school, term):
+        """Test that a later term's cumulative average is weighted by subject count"""
+        subject = school.add_subject(term.level)
+        enrollment = school.enroll(term.ada, subject, semester=Semester.SECOND)
+        school.add_total_grade(enrollment, 45)
+
+        TranscriptService(db, school.actor).refresh_for_student_subject(
+            term.ada.id, enrollment.id
+        )
+
+        first, second = transcripts(db, term.ada)
+        assert float(second.average) == 45.0
+        assert float(second.cumulative_average) == 65.0
+        assert second.class_position == 1
+
+    def test_archived_students_are_not_ranked(self, db, school, term):
+        """Test that archived students keep their transcript but hold no position"""
+        db.execute(
+            update(Student).where(Student.id == term.ebo.id).values(is_archived=True)
+        )
+
+        TranscriptService(db, school.actor).refresh_class_positions(
+            [term.school_class.id]
+        )
+
+        assert transcripts(db, term.ebo)[0].class_position is None
+        assert transcripts(db, term.ada)[0].class_position == 1
+        assert transcripts(db, term.chi)[0].class_position == 2
+
+    def test_bulk_archive_and_restore_refresh_transcripts(self, db, school, term):
+        """Test that set-based archives and restores of total grades update transcripts"""
+        archive_service = ArchiveService(db, school.actor)
+        grade_ids = db.scalars(
+            select(TotalGrade.id).where(
+                TotalGrade.student_id == term.ebo.id, TotalGrade.total_score == 90
+            )
+        ).all()
+
+        archive_service.bulk_archive(
+            TotalGrade, grade_ids[:1], ArchiveReason.ADMINISTRATIVE
+        )
+        (ebo,) = transcripts(db, term.ebo)
+        assert ebo.subject_count == 1
+
+        archive_service.bulk_archive(
+            TotalGrade, grade_ids[1:], ArchiveReason.ADMINISTRATIVE
+        )
+        assert transcripts(db, term.ebo) == []
+        assert transcripts(db, term.ada)[0].class_position == 1
+
+        archive_service.bulk_restore(TotalGrade, grade_ids)
+        assert transcripts(db, term.ebo)[0].subject_count == 2
+        assert transcripts(db, term.ada)[0].class_position == 2
+
+    def test_cascade_archive_of_student_reranks_class(self, db, school, term):
+        """Test that cascading a student's archive removes them from the class ranking"""
+        ArchiveService(db, school.actor).cascade_archive_object(
+            Student, term.ada, ArchiveReason.GRADUATED
+        )
+
+        assert transcripts(db, term.ada) == []
+        assert transcripts(db, term.chi)[0].class_position == 2
+
+    def test_rebuild_is_limited_to_admins(self, db, school, term):
+        """Test that only admins can rebuild, and that a rebuild reproduces the rows"""
+        teacher = SimpleNamespace(
+            id=school.system.id,
+            current_role_id=school.add_role(UserRoleName.EDUCATOR).id,
+        )
+        admin = SimpleNamespace(
+            id=school.system.id,
+            current_role_id=school.add_role(UserRoleName.ADMIN).id,
+        )
+        db.execute(
+            update(StudentTranscript)
+            .where(StudentTranscript.student_id == term.ada.id)
+            .values(average=0, class_position=None)
+        )
+
+        with pytest.raises(AccessDenied):
+            TranscriptService(db, teacher).rebuild_transcripts()
+
+        assert TranscriptService(db, admin).rebuild_transcripts() == 1
+        db.expire_all()
+        (ada,) = transcripts(db, term.ada)
+        assert (float(ada.average), ada.class_position) == (75.0, 2)
+        assert transcripts(db, term.ebo)[0].class_position == 1
+
+    def test_past_terms_keep_their_class(self, db, school, term):
+        """Test that a promotion and class move leave earlier terms in their class"""
+        jss2 = school.add_level(2)
+        promotion = school.add(
+            Promotion(
+                id=uuid4(),
+                student_id=term.ada.id,
+                academic_session="2025/2026",
+                previous_level_id=term.level.id,
+                promoted_level_id=jss2.id,
+                **school.audit(),
+            )
+        )
+        BatchDecisionService(db, school.actor).decide(
+            Promotion, [promotion.id], ApprovalStatus.APPROVED
+        )
+        new_class = school.add_class(jss2)
+        db.execute(
+            update(Student)
+            .where(Student.id == term.ada.id)
+            .values(class_id=new_class.id)
+        )
+        subject = school.add_subject(jss2)
+        enrollment = school.enroll(term.ada, subject, "2026/2027")
+        school.add_total_grade(enrollment, 40)
+
+        TranscriptService(db, school.actor).refresh_students([term.ada.id])
+
+        first, second = transcripts(db, term.ada)
+        assert (first.class_id, first.class_position) == (term.school_class.id, 2)
+        assert (second.class_id, second.class_position) == (new_class.id, 1)
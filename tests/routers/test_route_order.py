@@ -0,0 +1,37 @@
+import pytest
+from starlette.routing import Match
+
+from app.main import app
+
+
+def resolve(method: str, path: str):
+    """The route Starlette dispatches a request to, first full match wins"""
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    for route in app.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route
+
+
+STATIC_ROUTES = [
+    (method, route)
+    for route in app.routes
+    if getattr(route, "methods", None) and "{" not in route.path
+    for method in sorted(route.methods)
+]
+
+
+@pytest.mark.parametrize(
+    "method, route",
+    STATIC_ROUTES,
+    ids=[f"{method} {route.path}" for method, route in STATIC_ROUTES],
+)
+def test_static_paths_are_not_shadowed(method, route):
+    """Test that fixed paths such as /students/export are registered before /{id} routes"""
+    assert resolve(method, route.path) is route
+
+
+def test_student_export_route():
+    """Test that the student set export is reachable"""
+    route = resolve("GET", "/api/v1/students/export")
+    assert route.endpoint.__name__ == "export_students"
@@ -1,5 +1,17 @@
 from sqlalchemy import create_engine, MetaData
-from app import Base
+from app.core.shared.models.common_imports import Base
+
+# every model module, so Base.metadata holds all tables
+from app.core.academic_structure import models as academic_structure_models
+from app.core.assessment.models import assessment
+from app.core.curriculum.models import curriculum
+from app.core.documents.models import documents
+from app.core.identity.models import guardian, staff, student
+from app.core.progression.models import progression
+from app.core.rbac import models as rbac_models
+from app.core.shared.models import storage
+from app.core.staff_management import models as staff_management_models
+from app.core.transfer.models import transfer
 
 
 def create_test_tables(engine):
@@ -0,0 +1,85 @@
+class MemoryRedis:
+    """The Redis commands the caches and the export job store use, kept in a dict"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    def exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        fields = self.data.setdefault(key, {})
+        if field is not None:
+            fields[field] = value
+        fields.update(mapping or {})
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def lpush(self, key, *values):
+        items = self.data.setdefault(key, [])
+        for value in values:
+            items.insert(0, value)
+        return len(items)
+
+    def lrem(self, key, count, value):
+        items = self.data.get(key, [])
+        self.data[key] = [item for item in items if item != value]
+        return len(items) - len(self.data[key])
+
+    def lmove(self, source, destination, src="RIGHT", dest="LEFT"):
+        items = self.data.get(source)
+        if not items:
+            return None
+        value = items.pop() if src == "RIGHT" else items.pop(0)
+        target = self.data.setdefault(destination, [])
+        target.append(value) if dest == "RIGHT" else target.insert(0, value)
+        return value
+
+    def blmove(self, source, destination, timeout, src="RIGHT", dest="LEFT"):
+        return self.lmove(source, destination, src, dest)
+
+    def sadd(self, key, *values):
+        self.data.setdefault(key, set()).update(values)
+
+    def srem(self, key, *values):
+        self.data.get(key, set()).difference_update(values)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+
+class MemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    def execute(self):
+        return [
+            getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]